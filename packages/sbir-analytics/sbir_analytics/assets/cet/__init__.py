@@ -11,6 +11,7 @@ Module Structure:
 - utils: Shared utilities (Dagster shims, I/O functions, metrics serialization)
 - taxonomy: Taxonomy loading, validation, and checks
 - classifications: Award and patent classification assets
+- classification_cache: Content-hash keyed cache of classification results
 - training: Classifier training and dataset generation assets
 - analytics: Analytics computation and aggregation assets
 - validation: Human sampling, IAA reports, and drift detection
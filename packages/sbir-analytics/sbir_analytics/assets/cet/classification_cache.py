@@ -0,0 +1,182 @@
+"""Content-addressed cache of CET classification results.
+
+The award and patent classification assets used to re-classify the full
+corpus on every materialization even though a weekly refresh only adds a
+small delta. ``CETClassificationCache`` stores each flattened classification
+row under ``(content hash, model version, taxonomy version)``:
+
+- the content hash covers exactly the text the classifier (and evidence
+  extractor) reads, so an unchanged document is never classified twice and an
+  edited one always is;
+- the model version combines the artifact's declared ``model_version`` with a
+  digest of the artifact file, so retraining without bumping the version
+  still invalidates;
+- the taxonomy version combines the taxonomy version with a digest of the
+  classification config (thresholds and evidence settings shape the rows).
+
+Entries recorded under any other model or taxonomy version are dropped when
+the cache is loaded, so a model or taxonomy change invalidates the whole cache
+without manual cleanup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from sbir_etl.utils.cache.fingerprint import file_sha256
+
+
+DEFAULT_CACHE_DIR = "data/cache/cet_classifications"
+CACHE_DIR_ENV = "SBIR_ETL__CET__CLASSIFICATION__CACHE_DIR"
+
+_CACHE_COLUMNS = ["content_hash", "model_version", "taxonomy_version", "payload"]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, np.generic | np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def content_hash(*parts: Any) -> str:
+    """Stable SHA-256 of the classifier-visible text parts of a document."""
+    encoded = json.dumps(list(parts), ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """Short SHA-256 digest of a file, or ``"missing"`` if it cannot be read."""
+    try:
+        return file_sha256(path)[:16]
+    except OSError:
+        return "missing"
+
+
+def config_digest(config: Any) -> str:
+    """Short digest of a classification config (dict or Pydantic model)."""
+    if hasattr(config, "model_dump"):
+        config = config.model_dump()
+    encoded = json.dumps(config, sort_keys=True, default=_json_default)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class CETClassificationCache:
+    """Persistent map of content hash -> classification row for one model/taxonomy."""
+
+    def __init__(self, path: Path, *, model_version: str, taxonomy_version: str):
+        """Load the cache file, keeping only entries for the given versions.
+
+        Args:
+            path: Parquet file backing the cache (created on first save)
+            model_version: Model identity (declared version plus artifact digest)
+            taxonomy_version: Taxonomy identity (version plus config digest)
+        """
+        self.path = path
+        self.model_version = model_version
+        self.taxonomy_version = taxonomy_version
+        self._entries: dict[str, str] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        if not path.exists():
+            return
+        try:
+            frame = pd.read_parquet(path, columns=_CACHE_COLUMNS)
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable CET classification cache {path}: {exc}")
+            self._dirty = True
+            return
+        current = frame["model_version"].eq(model_version) & frame["taxonomy_version"].eq(
+            taxonomy_version
+        )
+        self._entries = dict(
+            zip(frame.loc[current, "content_hash"], frame.loc[current, "payload"], strict=True)
+        )
+        stale = int((~current).sum())
+        if stale:
+            # Rewrite on save so superseded model/taxonomy entries are purged.
+            self._dirty = True
+            logger.info(
+                f"Invalidated {stale:,} cached CET classifications from another "
+                f"model/taxonomy version in {path}"
+            )
+
+    @classmethod
+    def for_kind(
+        cls,
+        kind: str,
+        *,
+        model_version: str,
+        taxonomy_version: str,
+        cache_dir: Path | str | None = None,
+    ) -> CETClassificationCache:
+        """Open the cache for ``kind`` (``"awards"`` or ``"patents"``).
+
+        The directory defaults to ``SBIR_ETL__CET__CLASSIFICATION__CACHE_DIR`` or
+        ``data/cache/cet_classifications``.
+        """
+        base = Path(cache_dir or os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+        return cls(
+            base / f"{kind}.parquet",
+            model_version=model_version,
+            taxonomy_version=taxonomy_version,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def split(self, hashes: Sequence[str]) -> tuple[dict[int, dict[str, Any]], list[int]]:
+        """Partition documents into cached rows and positions still to classify.
+
+        Returns:
+            ``(cached, missing)`` where ``cached`` maps a position in ``hashes``
+            to its cached row and ``missing`` lists the uncached positions
+        """
+        cached: dict[int, dict[str, Any]] = {}
+        missing: list[int] = []
+        for position, key in enumerate(hashes):
+            payload = self._entries.get(key)
+            if payload is None:
+                missing.append(position)
+            else:
+                cached[position] = json.loads(payload)
+        self.hits += len(cached)
+        self.misses += len(missing)
+        return cached, missing
+
+    def put(self, key: str, row: dict[str, Any]) -> None:
+        """Record the classification row for a content hash."""
+        self._entries[key] = json.dumps(row, default=_json_default)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Atomically rewrite the cache file if anything changed."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        frame = pd.DataFrame(
+            {
+                "content_hash": list(self._entries),
+                "model_version": self.model_version,
+                "taxonomy_version": self.taxonomy_version,
+                "payload": list(self._entries.values()),
+            },
+            columns=_CACHE_COLUMNS,
+        )
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        frame.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
@@ -18,6 +18,7 @@ from loguru import logger
 
 from sbir_ml.ml.config.taxonomy_loader import TaxonomyLoader
 
+from .classification_cache import CETClassificationCache, config_digest, content_hash, file_digest
 from .utils import (
     AssetCheckResult,
     AssetCheckSeverity,
@@ -127,6 +128,85 @@ def cet_award_classifications_quality_check(context) -> AssetCheckResult:
     return AssetCheckResult(passed=passed, severity=severity, description=desc, metadata=metadata)  # type: ignore[arg-type]
 
 
+def _read_parquet_columns(path: Path, columns: tuple[str, ...]):
+    """Read only the named columns that exist in a parquet file."""
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    available = set(pq.read_schema(path).names)
+    return pd.read_parquet(path, columns=[c for c in columns if c in available])
+
+
+def _award_classification_row(cls_list: list[Any], model: Any, taxonomy: Any) -> dict[str, Any]:
+    """Flatten one award's classifications (without its id) into an output row."""
+    if not cls_list:
+        return {
+            "primary_cet": None,
+            "primary_score": None,
+            "supporting_cets": [],
+            "evidence": [],
+            "classified_at": None,
+            "taxonomy_version": model.taxonomy_version if model else taxonomy.version,
+        }
+
+    primary = cls_list[0]
+    supporting = cls_list[1:4] if len(cls_list) > 1 else []
+    return {
+        "primary_cet": primary.cet_id,
+        "primary_score": primary.score,
+        "supporting_cets": [
+            {
+                "cet_id": s.cet_id,
+                "score": s.score,
+                "classification": s.classification.value
+                if hasattr(s.classification, "value")
+                else str(s.classification),
+            }
+            for s in supporting
+        ],
+        "evidence": [
+            {
+                "excerpt": e.excerpt,
+                "source": e.source_location,
+                "rationale": e.rationale_tag,
+            }
+            for e in primary.evidence
+        ]
+        if getattr(primary, "evidence", None)
+        else [],
+        "classified_at": primary.classified_at,
+        "taxonomy_version": primary.taxonomy_version,
+    }
+
+
+def _patent_classification_row(
+    cls_list: list[Any], classifier: Any, taxonomy: Any
+) -> dict[str, Any]:
+    """Flatten one patent's classifications (without its id) into an output row."""
+    if not cls_list:
+        return {
+            "primary_cet": None,
+            "primary_score": None,
+            "supporting_cets": [],
+            "classified_at": None,
+            "taxonomy_version": classifier.taxonomy_version
+            if classifier
+            else (taxonomy.version if taxonomy else None),
+        }
+
+    primary = cls_list[0]
+    supporting = cls_list[1:4] if len(cls_list) > 1 else []
+    return {
+        "primary_cet": primary.cet_id,
+        "primary_score": primary.score,
+        "supporting_cets": [{"cet_id": s.cet_id, "score": s.score} for s in supporting],
+        "classified_at": getattr(primary, "classified_at", None),
+        "taxonomy_version": getattr(
+            primary, "taxonomy_version", classifier.taxonomy_version if classifier else None
+        ),
+    }
+
+
 @asset(
     name="enriched_cet_award_classifications",
     key_prefix=["ml"],
@@ -189,11 +269,11 @@ def enriched_cet_award_classifications() -> Output:
     awards: list[dict] = []
     try:
         if awards_parquet.exists():
-            import pandas as pd
-
-            df_awards = pd.read_parquet(awards_parquet)
+            df_awards = _read_parquet_columns(
+                awards_parquet, ("award_id", "id", "title", "abstract", "keywords")
+            )
             # Expect dataframe with at least award_id/title/abstract/keywords
-            for _, row in df_awards.iterrows():
+            for row in df_awards.to_dict(orient="records"):
                 awards.append(
                     {
                         "award_id": str(row.get("award_id") or row.get("id") or ""),
@@ -262,19 +342,6 @@ def enriched_cet_award_classifications() -> Output:
         else 1000
     )
 
-    # Perform batch classification.
-    try:
-        classifications_by_award = list(model.classify_batch(texts, batch_size=batch_size))
-    except Exception as exc:
-        raise RuntimeError("CET award batch classification failed") from exc
-
-    if len(classifications_by_award) != len(awards):
-        raise ValueError(
-            "CET award classifier returned "
-            f"{len(classifications_by_award)} results for {len(awards)} source rows"
-        )
-
-    # Attach evidence if extractor available
     doc_parts_list = [
         {
             "abstract": str(a.get("abstract", "")),
@@ -283,74 +350,69 @@ def enriched_cet_award_classifications() -> Output:
         }
         for a in awards
     ]
-    try:
-        classifications_with_evidence = list(
-            extractor.extract_batch_evidence(classifications_by_award, doc_parts_list)
-        )
-    except Exception as exc:
-        raise RuntimeError("CET award evidence extraction failed") from exc
 
-    if len(classifications_with_evidence) != len(awards):
-        raise ValueError(
-            "CET award evidence extractor returned "
-            f"{len(classifications_with_evidence)} results for {len(awards)} source rows"
-        )
+    # Only documents whose text has not been classified by this model and
+    # taxonomy are sent to the classifier; the rest reuse their cached rows.
+    cache = CETClassificationCache.for_kind(
+        "awards",
+        model_version=f"{getattr(model, 'model_version', None)}@{file_digest(model_path)}",
+        taxonomy_version=f"{taxonomy.version}@{config_digest(classification_config)}",
+    )
+    content_hashes = [
+        content_hash(parts["title"], parts["abstract"], parts["keywords"])
+        for parts in doc_parts_list
+    ]
+    cached_rows, missing = cache.split(content_hashes)
+    logger.info(
+        f"CET award classification cache: {len(cached_rows):,} cached, {len(missing):,} to classify"
+    )
 
-    # Flatten classification results into a DataFrame (one row per award)
-    import pandas as pd
+    classifications_with_evidence: list[Any] = []
+    if missing:
+        # Perform batch classification.
+        try:
+            classifications_by_award = list(
+                model.classify_batch([texts[i] for i in missing], batch_size=batch_size)
+            )
+        except Exception as exc:
+            raise RuntimeError("CET award batch classification failed") from exc
 
-    rows: list[Any] = []
-    for aid, cls_list in zip(award_ids, classifications_with_evidence, strict=True):
-        if not cls_list:
-            rows.append(
-                {
-                    "award_id": aid,
-                    "primary_cet": None,
-                    "primary_score": None,
-                    "supporting_cets": [],
-                    "evidence": [],
-                    "classified_at": None,
-                    "taxonomy_version": model.taxonomy_version if model else taxonomy.version,
-                }
+        if len(classifications_by_award) != len(missing):
+            raise ValueError(
+                "CET award classifier returned "
+                f"{len(classifications_by_award)} results for {len(missing)} source rows"
             )
-            continue
 
-        primary = cls_list[0]
-        supporting = cls_list[1:4] if len(cls_list) > 1 else []
-        rows.append(
-            {
-                "award_id": aid,
-                "primary_cet": primary.cet_id,
-                "primary_score": primary.score,
-                "supporting_cets": [
-                    {
-                        "cet_id": s.cet_id,
-                        "score": s.score,
-                        "classification": s.classification.value
-                        if hasattr(s.classification, "value")
-                        else str(s.classification),
-                    }
-                    for s in supporting
-                ],
-                "evidence": [
-                    {
-                        "excerpt": e.excerpt,
-                        "source": e.source_location,
-                        "rationale": e.rationale_tag,
-                    }
-                    for e in primary.evidence
-                ]
-                if getattr(primary, "evidence", None)
-                else [],
-                "classified_at": primary.classified_at,
-                "taxonomy_version": primary.taxonomy_version,
-            }
-        )
+        # Attach evidence if extractor available
+        try:
+            classifications_with_evidence = list(
+                extractor.extract_batch_evidence(
+                    classifications_by_award, [doc_parts_list[i] for i in missing]
+                )
+            )
+        except Exception as exc:
+            raise RuntimeError("CET award evidence extraction failed") from exc
+
+        if len(classifications_with_evidence) != len(missing):
+            raise ValueError(
+                "CET award evidence extractor returned "
+                f"{len(classifications_with_evidence)} results for {len(missing)} source rows"
+            )
+
+    # Flatten classification results into a DataFrame (one row per award)
+    import pandas as pd
+
+    for i, cls_list in zip(missing, classifications_with_evidence, strict=True):
+        row = _award_classification_row(cls_list, model, taxonomy)
+        cache.put(content_hashes[i], row)
+        cached_rows[i] = row
+    rows: list[Any] = [{"award_id": aid, **cached_rows[i]} for i, aid in enumerate(award_ids)]
 
     df_out = pd.DataFrame(rows)
 
     # Persist classifications (parquet preferred, NDJSON fallback)
     artifact_path = save_dataframe_parquet(df_out, output_path)
+    cache.save()
 
     # Build checks: coverage, high-confidence rate, evidence coverage
     num_awards = len(rows)
@@ -390,6 +452,8 @@ def enriched_cet_award_classifications() -> Output:
         "taxonomy_version": taxonomy.version,
         "model_version": getattr(model, "model_version", None),
         "checks_path": str(checks_path),
+        "cache_hits": len(award_ids) - len(missing),
+        "classified_rows": len(missing),
     }
 
     logger.info(
@@ -537,11 +601,11 @@ def enriched_cet_patent_classifications() -> Output:
     patents: list[dict] = []
     try:
         if patents_parquet.exists():
-            import pandas as pd
-
-            df_patents = pd.read_parquet(patents_parquet)
+            df_patents = _read_parquet_columns(
+                patents_parquet, ("patent_id", "id", "title", "assignee")
+            )
             # Expect dataframe with at least patent_id/title/assignee
-            for _, row in df_patents.iterrows():
+            for row in df_patents.to_dict(orient="records"):
                 patents.append(
                     {
                         "patent_id": str(row.get("patent_id") or row.get("id") or ""),
@@ -629,58 +693,55 @@ def enriched_cet_patent_classifications() -> Output:
         else 1000
     )
 
-    try:
-        classifications_by_patent = list(
-            classifier.classify_batch(titles, assignees, batch_size=batch_size)
-        )
-    except Exception as exc:
-        raise RuntimeError("CET patent batch classification failed") from exc
+    cache = CETClassificationCache.for_kind(
+        "patents",
+        model_version=f"{getattr(classifier, 'model_version', None)}@{file_digest(model_path)}",
+        taxonomy_version=(
+            f"{getattr(taxonomy, 'version', None)}@{config_digest(classification_config)}"
+        ),
+    )
+    content_hashes = [
+        content_hash(title, assignee) for title, assignee in zip(titles, assignees, strict=True)
+    ]
+    cached_rows, missing = cache.split(content_hashes)
+    logger.info(
+        f"CET patent classification cache: {len(cached_rows):,} cached, "
+        f"{len(missing):,} to classify"
+    )
 
-    if len(classifications_by_patent) != len(patents):
-        raise ValueError(
-            "CET patent classifier returned "
-            f"{len(classifications_by_patent)} results for {len(patents)} source rows"
-        )
+    classifications_by_patent: list[Any] = []
+    if missing:
+        try:
+            classifications_by_patent = list(
+                classifier.classify_batch(
+                    [titles[i] for i in missing],
+                    [assignees[i] for i in missing],
+                    batch_size=batch_size,
+                )
+            )
+        except Exception as exc:
+            raise RuntimeError("CET patent batch classification failed") from exc
+
+        if len(classifications_by_patent) != len(missing):
+            raise ValueError(
+                "CET patent classifier returned "
+                f"{len(classifications_by_patent)} results for {len(missing)} source rows"
+            )
 
     # Flatten classification results into a DataFrame (one row per patent)
     import pandas as pd
 
-    rows: list[Any] = []
-    for pid, cls_list in zip(patent_ids, classifications_by_patent, strict=True):
-        if not cls_list:
-            rows.append(
-                {
-                    "patent_id": pid,
-                    "primary_cet": None,
-                    "primary_score": None,
-                    "supporting_cets": [],
-                    "classified_at": None,
-                    "taxonomy_version": classifier.taxonomy_version
-                    if classifier
-                    else (taxonomy.version if taxonomy else None),
-                }
-            )
-            continue
-
-        primary = cls_list[0]
-        supporting = cls_list[1:4] if len(cls_list) > 1 else []
-        rows.append(
-            {
-                "patent_id": pid,
-                "primary_cet": primary.cet_id,
-                "primary_score": primary.score,
-                "supporting_cets": [{"cet_id": s.cet_id, "score": s.score} for s in supporting],
-                "classified_at": getattr(primary, "classified_at", None),
-                "taxonomy_version": getattr(
-                    primary, "taxonomy_version", classifier.taxonomy_version if classifier else None
-                ),
-            }
-        )
+    for i, cls_list in zip(missing, classifications_by_patent, strict=True):
+        row = _patent_classification_row(cls_list, classifier, taxonomy)
+        cache.put(content_hashes[i], row)
+        cached_rows[i] = row
+    rows: list[Any] = [{"patent_id": pid, **cached_rows[i]} for i, pid in enumerate(patent_ids)]
 
     df_out = pd.DataFrame(rows)
 
     # Persist classifications (parquet preferred, NDJSON fallback)
     artifact_path = save_dataframe_parquet(df_out, output_path)
+    cache.save()
 
     # Build checks: coverage and counts
     num_patents = len(rows)
@@ -702,6 +763,8 @@ def enriched_cet_patent_classifications() -> Output:
         "taxonomy_version": taxonomy.version if taxonomy else None,
         "model_version": getattr(classifier, "model_version", None),
         "checks_path": str(checks_path),
+        "cache_hits": len(patent_ids) - len(missing),
+        "classified_rows": len(missing),
     }
 
     logger.info(
@@ -277,10 +277,12 @@ def transformed_cet_company_profiles() -> Output:
 # Neo4j loader imports (import-safe)
 try:
     from sbir_graph.loaders.neo4j import LoadMetrics, Neo4jClient, Neo4jConfig
+    from sbir_graph.loaders.neo4j.bulk_import import bulk_import_client_from_env
 except Exception:  # pragma: no cover
     Neo4jClient = None  # type: ignore
     Neo4jConfig = None  # type: ignore
     LoadMetrics = None  # type: ignore
+    bulk_import_client_from_env = None  # type: ignore
 
 try:
     from sbir_graph.loaders.neo4j import CETLoader, CETLoaderConfig
@@ -309,6 +311,12 @@ DEFAULT_OUTPUT_DIR = Path(os.environ.get("SBIR_ETL__CET__NEO4J_OUTPUT_DIR", "dat
 
 def _get_neo4j_client():
     """Get Neo4j client with error handling."""
+    # NEO4J_LOAD_MODE=bulk stages writes for an offline neo4j-admin rebuild.
+    if bulk_import_client_from_env is not None:
+        bulk_client = bulk_import_client_from_env("cet")
+        if bulk_client is not None:
+            return bulk_client
+
     # Check if Neo4j loading is explicitly skipped
     skip_neo4j = neo4j_skip_requested()
 
@@ -21,7 +21,7 @@ from dagster import (
 )
 
 from sbir_etl.config.loader import get_config
-from sbir_etl.enrichers.company_categorization import retrieve_company_contracts
+from sbir_etl.enrichers.company_categorization import batch_retrieve_company_contracts
 from sbir_etl.extractors.usaspending import DuckDBUSAspendingExtractor
 from sbir_etl.transformers.company_categorization import aggregate_company_classification
 
@@ -99,6 +99,11 @@ def enriched_sbir_companies_with_categorization(
 
         context.log.info(f"Identified {len(companies)} unique companies to categorize")
 
+        # Retrieve every company's contracts in one scan of the USAspending table
+        contracts_by_uei = batch_retrieve_company_contracts(
+            extractor, companies, uei_col="company_uei", table_name=usaspending_table
+        )
+
         # Track statistics
         results = []
         companies_processed = 0
@@ -123,10 +128,7 @@ def enriched_sbir_companies_with_categorization(
                     f"({companies_with_contracts} with contracts, {total_contracts_retrieved} total contracts)"
                 )
 
-            # Retrieve contracts from USAspending
-            contracts_df = retrieve_company_contracts(
-                extractor, uei=uei, table_name=usaspending_table
-            )
+            contracts_df = contracts_by_uei.get(str(uei), pd.DataFrame())
 
             companies_processed += 1
 
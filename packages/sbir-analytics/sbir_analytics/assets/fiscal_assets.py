@@ -31,6 +31,7 @@ from sbir_etl.transformers.fiscal import (
     FiscalComponentCalculator,
     FiscalParameterSweep,
     FiscalROICalculator,
+    FiscalScenarioEngine,
     FiscalShockAggregator,
     FiscalTaxEstimator,
     FiscalUncertaintyQuantifier,
@@ -351,10 +352,7 @@ def economic_shocks(
             chunk_size=chunk_arg,
         )
 
-    shocks_list = aggregator.aggregate_shocks(
-        awards_df=bea_mapped_sbir_awards, chunk_size=chunk_arg
-    )
-    stats = aggregator.get_aggregation_statistics(shocks_list)
+    stats = aggregator.get_frame_aggregation_statistics(shocks_df)
 
     context.log.info(
         "Economic shock aggregation complete",
@@ -990,16 +988,17 @@ def uncertainty_analysis(
         },
     )
 
-    # Placeholder: apply parameter variations to a baseline rather than re-running the
-    # full pipeline per scenario. Full implementation would recompute downstream assets.
-    scenario_results = sensitivity_scenarios.copy()
-    baseline_tax = float(federal_tax_estimates["total_tax_receipt"].sum())
-    if "economic_multiplier" in scenario_results.columns:
-        scenario_results["total_tax_receipt"] = (
-            baseline_tax * scenario_results["economic_multiplier"] / 2.0
-        )
-    else:
-        scenario_results["total_tax_receipt"] = baseline_tax
+    # Re-run shocks -> Leontief -> components -> taxes for every scenario.
+    performance = getattr(config.fiscal_analysis.sensitivity_parameters, "performance", None)
+    max_workers = (
+        int(performance.get("max_scenarios_parallel", 1)) if isinstance(performance, dict) else 1
+    )
+    with performance_monitor.monitor_block("scenario_evaluation"):
+        # Probe with the same estimator federal_tax_estimates used so the
+        # scenario chain reproduces the baseline rates.
+        estimator = FiscalTaxEstimator(config=config.fiscal_analysis)
+        engine = FiscalScenarioEngine.from_tax_estimates(federal_tax_estimates, estimator=estimator)
+        scenario_results = engine.evaluate(sensitivity_scenarios, max_workers=max_workers)
 
     quantifier = FiscalUncertaintyQuantifier(config=config.fiscal_analysis)
     with performance_monitor.monitor_block("uncertainty_quantification"):
@@ -19,3 +19,13 @@ nih_reporter_iterative_enrichment_job = define_asset_job(
         "NIH/HHS awards and refresh exact project_num + FY lookups"
     ),
 )
+
+
+nih_reporter_awards_compaction_job = define_asset_job(
+    name="nih_reporter_awards_compaction_job",
+    selection=AssetSelection.keys("nih_reporter_awards_compaction"),
+    description=(
+        "Merge the partitioned NIH RePORTER project table back to one part file "
+        "per bucket, migrating a single-file table if one is found"
+    ),
+)
@@ -14,6 +14,7 @@ from pydantic import Field
 
 from sbir_etl.config.loader import get_config
 from sbir_etl.enrichers.nih_reporter.adapter import NIHReporterSourceAdapter
+from sbir_etl.enrichers.nih_reporter.persist import compact_nih_reporter_awards
 from sbir_etl.enrichers.nih_reporter.requests import (
     build_nih_reporter_requests,
     frame_to_nih_requests,
@@ -147,7 +148,7 @@ def nih_reporter_refresh_batch(
     batch_size = config.batch_size or refresh_config.batch_size
     requests = requests[:batch_size]
 
-    store = FreshnessStore()
+    store = FreshnessStore(commit_every=refresh_config.checkpoint_interval)
     adapter = build_nih_reporter_adapter(freshness=store)
     metrics_collector = EnrichmentMetricsCollector()
     runner = SourceRefreshRunner(
@@ -156,6 +157,8 @@ def nih_reporter_refresh_batch(
         metrics=metrics_collector,
         partition_id="nih-reporter-default",
         checkpoint_interval=refresh_config.checkpoint_interval,
+        concurrency=refresh_config.max_concurrent_requests,
+        requests_per_minute=refresh_config.rate_limit_per_minute,
     )
     stats = runner.refresh_records(adapter, requests).as_dict()
     context.log.info(
@@ -168,3 +171,19 @@ def nih_reporter_refresh_batch(
     except Exception as e:
         logger.warning(f"Failed to emit metrics: {e}")
     return Output(value=stats, metadata={k: v for k, v in stats.items() if k != "errors"})
+
+
+@asset(
+    description="Merge the NIH RePORTER project table's part files, one per bucket",
+    group_name="enrichment",
+    compute_kind="pyarrow",
+)
+def nih_reporter_awards_compaction(context: AssetExecutionContext) -> Output[dict[str, int]]:
+    """Compact the partitioned RePORTER project table written by refresh passes."""
+
+    stats = compact_nih_reporter_awards()
+    context.log.info(
+        f"Compacted {stats['buckets']} NIH RePORTER buckets "
+        f"({stats['files_removed']} part files merged, {stats['rows']} rows)"
+    )
+    return Output(value=stats, metadata=dict(stats))
@@ -7,9 +7,16 @@ imports this boundary, so it must never gain inference.
 
 from __future__ import annotations
 
+import shutil
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
 
 from sbir_etl.utils.award_identity import award_key_series
 
@@ -309,20 +316,21 @@ def _prepare_contracts(contracts: pd.DataFrame) -> pd.DataFrame:
     return _legacy_s1_targets(_prepare_contract_transactions(contracts))
 
 
-def build_uei_pairs(
-    prior_awards: pd.DataFrame,
-    contracts: pd.DataFrame,
-    *,
-    columns: Sequence[str] | None = None,
-) -> pd.DataFrame:
-    """Build normalized, nonblank exact-UEI pairs at target-transaction grain.
+# Agency hierarchy levels in ascending precedence: a later level that matches
+# overrides an earlier one.
+_AGENCY_LEVELS: tuple[tuple[str, str, str], ...] = (
+    ("agency", "prior_agency", "target_agency"),
+    ("sub_tier", "prior_sub_agency", "target_sub_agency"),
+    ("office", "prior_office", "target_office"),
+)
+
+# Free-text columns repeated on every pair row of a UEI. The partitioned build
+# carries them through the join as integer references into per-column tables of
+# distinct values and only decodes them for the rows being written.
+_TEXT_COLUMNS: tuple[str, ...] = ("prior_title", "prior_abstract", "target_description")
 
-    This shared boundary applies no coded-status or agency gate. It carries the
-    source transaction and award identifiers plus every field needed by either
-    the label-free criteria or legacy S1. Callers may project the shared schema
-    before the merge; omitting columns never changes the pair universe.
-    """
 
+def _validate_pair_columns(columns: Sequence[str] | None) -> list[str]:
     output_columns = list(PAIR_COLUMNS if columns is None else columns)
     unknown_columns = sorted(set(output_columns) - set(PAIR_COLUMNS))
     if unknown_columns or len(output_columns) != len(set(output_columns)):
@@ -330,59 +338,230 @@ def build_uei_pairs(
             "Requested pair columns must be unique members of PAIR_COLUMNS; "
             f"unknown={unknown_columns}"
         )
+    return output_columns
+
+
+def _pair_sides(
+    prior_awards: pd.DataFrame,
+    contracts: pd.DataFrame,
+    output_columns: list[str],
+    *,
+    text_references: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, pd.Index]] | None:
+    """Project both join sides to the requested columns plus join keys.
+
+    Each side carries ``_uei`` and, when ``agency_match_level`` is requested,
+    one ``_agency_<level>`` integer code per hierarchy level. Codes are
+    assigned jointly over both sides from the normalized value, with ``-1``
+    for blanks, so the per-pair comparison is an integer equality instead of a
+    ``_normalize`` call per cell. Returns None when no pair can exist.
+    """
 
     priors = _prepare_priors(prior_awards)
     targets = _prepare_contract_transactions(contracts)
     if priors.empty or targets.empty:
-        return pd.DataFrame(columns=output_columns)
+        return None
 
     priors = priors.assign(_uei=priors["prior_recipient_uei"].map(_normalize))
     targets = targets.assign(_uei=targets["target_recipient_uei"].map(_normalize))
-    priors = priors.loc[priors["_uei"] != ""].copy()
-    targets = targets.loc[targets["_uei"] != ""].copy()
+    priors = priors.loc[priors["_uei"] != ""].reset_index(drop=True)
+    targets = targets.loc[targets["_uei"] != ""].reset_index(drop=True)
     if priors.empty or targets.empty:
-        return pd.DataFrame(columns=output_columns)
+        return None
 
-    merge_columns = set(output_columns)
-    if "agency_match_level" in merge_columns:
-        merge_columns.update(
-            {
-                "prior_agency",
-                "prior_sub_agency",
-                "prior_office",
-                "target_agency",
-                "target_sub_agency",
-                "target_office",
-            }
-        )
-    prior_columns = [
-        column for column in priors.columns if column == "_uei" or column in merge_columns
-    ]
-    target_columns = [
-        column for column in targets.columns if column == "_uei" or column in merge_columns
-    ]
+    prior_side = priors.loc[:, ["_uei", *(c for c in priors.columns if c in output_columns)]]
+    target_side = targets.loc[:, ["_uei", *(c for c in targets.columns if c in output_columns)]]
 
-    merged = priors.loc[:, prior_columns].merge(
-        targets.loc[:, target_columns], on="_uei", how="inner", suffixes=("", "_t")
-    )
-    if merged.empty:
-        return pd.DataFrame(columns=output_columns)
+    if "agency_match_level" in output_columns:
+        for level, prior_column, target_column in _AGENCY_LEVELS:
+            normalized = pd.concat(
+                [priors[prior_column].map(_normalize), targets[target_column].map(_normalize)],
+                ignore_index=True,
+            )
+            codes, _ = pd.factorize(normalized)
+            codes[normalized.eq("").to_numpy()] = -1
+            prior_side[f"_agency_{level}"] = codes[: len(priors)]
+            target_side[f"_agency_{level}"] = codes[len(priors) :]
+
+    text_tables: dict[str, pd.Index] = {}
+    if text_references:
+        for side in (prior_side, target_side):
+            for column in _TEXT_COLUMNS:
+                if column in side.columns:
+                    codes, uniques = pd.factorize(side[column])
+                    side[column] = codes
+                    text_tables[column] = uniques
+    return prior_side, target_side, text_tables
+
+
+def _finish_pairs(
+    merged: pd.DataFrame,
+    output_columns: list[str],
+    text_tables: Mapping[str, pd.Index],
+) -> pd.DataFrame:
+    """Derive ``agency_match_level``, decode text references, and project."""
 
     if "agency_match_level" in output_columns:
         levels = pd.Series(None, index=merged.index, dtype="object")
-        for level, prior_column, target_column in (
-            ("agency", "prior_agency", "target_agency"),
-            ("sub_tier", "prior_sub_agency", "target_sub_agency"),
-            ("office", "prior_office", "target_office"),
-        ):
-            prior_values = merged[prior_column].map(_normalize)
-            target_values = merged[target_column].map(_normalize)
-            matches = prior_values.ne("") & target_values.ne("") & prior_values.eq(target_values)
-            levels.loc[matches] = level
+        for level, _, _ in _AGENCY_LEVELS:
+            prior_codes = merged[f"_agency_{level}"].to_numpy()
+            target_codes = merged[f"_agency_{level}_t"].to_numpy()
+            levels.loc[(prior_codes >= 0) & (prior_codes == target_codes)] = level
         merged["agency_match_level"] = levels
+    for column, uniques in text_tables.items():
+        if column in output_columns:
+            # ``-1`` marks a missing source value and decodes back to null.
+            merged[column] = pd.array(uniques).take(merged[column].to_numpy(), allow_fill=True)
     return merged.loc[:, output_columns].reset_index(drop=True)
 
 
+def build_uei_pairs(
+    prior_awards: pd.DataFrame,
+    contracts: pd.DataFrame,
+    *,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Build normalized, nonblank exact-UEI pairs at target-transaction grain.
+
+    This shared boundary applies no coded-status or agency gate. It carries the
+    source transaction and award identifiers plus every field needed by either
+    the label-free criteria or legacy S1. Callers may project the shared schema
+    before the merge; omitting columns never changes the pair universe.
+
+    The whole pair table is held in memory; use
+    :func:`build_uei_pairs_partitioned` when prolific firms make the
+    prior × transaction product too large for that.
+    """
+
+    output_columns = _validate_pair_columns(columns)
+    sides = _pair_sides(prior_awards, contracts, output_columns)
+    if sides is None:
+        return pd.DataFrame(columns=output_columns)
+    prior_side, target_side, text_tables = sides
+
+    merged = prior_side.merge(target_side, on="_uei", how="inner", suffixes=("", "_t"))
+    if merged.empty:
+        return pd.DataFrame(columns=output_columns)
+    return _finish_pairs(merged, output_columns, text_tables)
+
+
+@dataclass(frozen=True)
+class PartitionedPairs:
+    """Pair files written by :func:`build_uei_pairs_partitioned`."""
+
+    root: Path
+    files: list[Path]
+    row_count: int
+    columns: list[str]
+
+
+def _uei_partitions(uei: pd.Series, partitions: int) -> np.ndarray:
+    # ``hash_pandas_object`` uses a fixed hash key, so a UEI lands in the same
+    # partition on both sides and across runs.
+    return (pd.util.hash_pandas_object(uei, index=False).to_numpy() % partitions).astype(np.int64)
+
+
+def _pair_schema(
+    prior_side: pd.DataFrame,
+    target_side: pd.DataFrame,
+    text_tables: Mapping[str, pd.Index],
+    output_columns: list[str],
+) -> pa.Schema:
+    """Arrow schema inferred once from the full sides, shared by every batch."""
+
+    fields = []
+    for column in output_columns:
+        if column == "agency_match_level":
+            fields.append(pa.field(column, pa.string()))
+            continue
+        side = prior_side if column.startswith("prior_") else target_side
+        values = text_tables[column] if column in text_tables else side[column]
+        arrow_type = pa.Array.from_pandas(pd.Series(values, dtype=values.dtype)).type
+        fields.append(pa.field(column, pa.string() if pa.types.is_null(arrow_type) else arrow_type))
+    return pa.schema(fields)
+
+
+def build_uei_pairs_partitioned(
+    prior_awards: pd.DataFrame,
+    contracts: pd.DataFrame,
+    output_dir: Path | str,
+    *,
+    columns: Sequence[str] | None = None,
+    partitions: int = 16,
+    batch_rows: int = 500_000,
+) -> PartitionedPairs:
+    """Stream the :func:`build_uei_pairs` pair universe to partitioned Parquet.
+
+    Both sides are hash-partitioned by normalized UEI and each partition is
+    joined in prior-row slices sized so that no slice produces more than
+    ``batch_rows`` pairs (a single prior row may exceed it). Agency codes are
+    normalized before the join and free-text columns travel as integer
+    references, so peak memory is bounded by one batch rather than by the
+    prior × transaction product of the most prolific firm.
+
+    Files are written as ``<output_dir>/partition=NNNNN/part-0.parquet``;
+    existing ``partition=*`` directories under ``output_dir`` are replaced.
+    The rows are the same as :func:`build_uei_pairs` produces for the same
+    inputs, ordered by partition instead of globally.
+
+    Args:
+        prior_awards: Prior-award frame (as accepted by ``build_uei_pairs``)
+        contracts: Contract transaction frame
+        output_dir: Directory receiving the partition files
+        columns: Output projection; defaults to ``PAIR_COLUMNS``
+        partitions: Number of UEI hash partitions
+        batch_rows: Approximate maximum pair rows materialized at once
+
+    Returns:
+        PartitionedPairs listing the files written and the total pair count
+    """
+
+    output_columns = _validate_pair_columns(columns)
+    if partitions < 1 or batch_rows < 1:
+        raise ValueError("partitions and batch_rows must be positive")
+
+    root = Path(output_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    for stale in root.glob("partition=*"):
+        shutil.rmtree(stale) if stale.is_dir() else stale.unlink()
+
+    sides = _pair_sides(prior_awards, contracts, output_columns, text_references=True)
+    if sides is None:
+        return PartitionedPairs(root=root, files=[], row_count=0, columns=output_columns)
+    prior_side, target_side, text_tables = sides
+    schema = _pair_schema(prior_side, target_side, text_tables, output_columns)
+
+    prior_parts = _uei_partitions(prior_side["_uei"], partitions)
+    target_parts = _uei_partitions(target_side["_uei"], partitions)
+    files: list[Path] = []
+    row_count = 0
+    for partition in range(partitions):
+        part_targets = target_side.loc[target_parts == partition]
+        if part_targets.empty:
+            continue
+        part_priors = prior_side.loc[prior_parts == partition]
+        fanout = part_priors["_uei"].map(part_targets["_uei"].value_counts()).fillna(0)
+        part_priors = part_priors.loc[fanout.gt(0).to_numpy()]
+        if part_priors.empty:
+            continue
+        # Slice consecutive prior rows so each slice joins to <= batch_rows pairs.
+        cumulative = fanout.loc[part_priors.index].astype(np.int64).cumsum().to_numpy()
+        slice_ids = (cumulative - 1) // batch_rows
+
+        path = root / f"partition={partition:05d}" / "part-0.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with pq.ParquetWriter(path, schema) as writer:
+            for _, chunk in part_priors.groupby(slice_ids, sort=True):
+                merged = chunk.merge(part_targets, on="_uei", how="inner", suffixes=("", "_t"))
+                pairs = _finish_pairs(merged, output_columns, text_tables)
+                writer.write_table(pa.Table.from_pandas(pairs, schema=schema, preserve_index=False))
+                row_count += len(pairs)
+        files.append(path)
+
+    logger.info(f"Wrote {row_count:,} UEI pairs across {len(files)} partition files under {root}")
+    return PartitionedPairs(root=root, files=files, row_count=row_count, columns=output_columns)
+
+
 def pair_filter_s1(
     prior_awards: pd.DataFrame,
     contracts: pd.DataFrame,
@@ -444,6 +623,8 @@ def pair_filter_s1(
 __all__ = [
     "PAIR_COLUMNS",
     "PAIR_S1_COLUMNS",
+    "PartitionedPairs",
     "build_uei_pairs",
+    "build_uei_pairs_partitioned",
     "pair_filter_s1",
 ]
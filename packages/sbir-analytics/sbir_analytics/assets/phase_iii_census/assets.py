@@ -23,6 +23,7 @@ from sbir_analytics.assets.phase_transition.sbir_gov_source import (
 )
 from sbir_etl.exceptions import ConfigurationError
 from sbir_etl.quality.study_manifest import load_study_manifest
+from sbir_etl.utils.cache.fingerprint import file_sha256
 
 from .criteria import (
     CensusInputError,
@@ -294,11 +295,7 @@ def _load_contracts() -> tuple[pd.DataFrame, Path]:
             or any(character not in "0123456789abcdef" for character in value.lower())
         ):
             raise CensusInputError(f"Contract provenance manifest has an invalid {key} fingerprint")
-    digest = hashlib.sha256()
-    with path.open("rb") as file:
-        for chunk in iter(lambda: file.read(1024 * 1024), b""):
-            digest.update(chunk)
-    if source.get("output_sha256") != digest.hexdigest():
+    if source.get("output_sha256") != file_sha256(path):
         raise CensusInputError("Contract parquet checksum does not match its provenance manifest")
     try:
         return pd.read_parquet(path, columns=list(CENSUS_CONTRACT_COLUMNS)), path
@@ -20,6 +20,7 @@ import pandas as pd
 from sbir_etl.extractors.contract_extractor import ArchiveSchemaError, SourceDataError
 
 from sbir_etl.identity.exact_awards import IdentityRecoveryError
+from sbir_etl.utils.cache.fingerprint import file_sha256 as _file_sha256
 from .source_keys import (
     USA_FAIN_ADAPTER,
     USA_PIID_ADAPTER,
@@ -219,14 +220,6 @@ def _text(value: Any) -> str:
     return "" if normalized.upper() in _NULL_TEXT else normalized
 
 
-def _file_sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as source:
-        for chunk in iter(lambda: source.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _copy_value(value: str) -> str | None:
     if value == r"\N":
         return None
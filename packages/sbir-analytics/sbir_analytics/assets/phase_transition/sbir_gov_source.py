@@ -13,6 +13,8 @@ from typing import Any
 
 import pandas as pd
 
+from sbir_etl.utils.cache.fingerprint import file_sha256 as sha256_file
+
 
 SBIR_GOV_SOURCE_COLUMNS: tuple[str, ...] = (
     "Company",
@@ -134,14 +136,6 @@ def _row_sha256(values: list[str | None]) -> str:
     return hashlib.sha256(_row_json(values).encode("utf-8")).hexdigest()
 
 
-def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as file:
-        for chunk in iter(lambda: file.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def ordered_columns_sha256(columns: tuple[str, ...] | list[str]) -> str:
     payload = json.dumps(list(columns), ensure_ascii=False, separators=(",", ":"))
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -26,12 +26,18 @@ from sbir_etl.utils.text_normalization import normalize_name
 
 try:
     from sbir_graph.loaders.neo4j import LoadMetrics, Neo4jClient, Neo4jConfig
+    from sbir_graph.loaders.neo4j.bulk_import import (
+        BulkImportClient,
+        bulk_import_client_from_env,
+    )
     from sbir_graph.loaders.neo4j.organizations import OrganizationLoader
 except ImportError:
     LoadMetrics = None  # type: ignore[assignment, misc]
     Neo4jClient = None  # type: ignore[assignment, misc]
     Neo4jConfig = None  # type: ignore[assignment, misc]
     OrganizationLoader = None  # type: ignore[assignment, misc]
+    BulkImportClient = None  # type: ignore[assignment, misc]
+    bulk_import_client_from_env = None  # type: ignore[assignment]
 
 
 # ---------------------------------------------------------------------------
@@ -84,7 +90,16 @@ def _created_since(metrics: Any, label: str, previous: int = 0) -> tuple[int, in
 
 
 def _get_neo4j_client() -> "Neo4jClient | None":
-    """Open a Neo4j connection from config; return None when SKIP_NEO4J_LOADING is set."""
+    """Open a Neo4j connection from config; return None when SKIP_NEO4J_LOADING is set.
+
+    With ``NEO4J_LOAD_MODE=bulk`` no connection is opened: the returned client
+    stages writes for an offline ``neo4j-admin`` rebuild instead.
+    """
+    if bulk_import_client_from_env is not None:
+        bulk_client = bulk_import_client_from_env("sbir_awards")
+        if bulk_client is not None:
+            return bulk_client  # type: ignore[return-value]
+
     skip_neo4j = os.getenv("SKIP_NEO4J_LOADING", "false").lower() in ("true", "1", "yes")
     try:
         neo4j_config = get_config().neo4j
@@ -466,6 +481,10 @@ def neo4j_sbir_awards(
     research institutions / agencies / sub-agencies, and Individual nodes for PIs.
     Creates RECIPIENT_OF, PARTICIPATED_IN, CONDUCTED_AT, WORKED_AT, FUNDED_BY,
     SUBSIDIARY_OF, and FOLLOWS (phase-progression) relationships.
+
+    Loads incrementally through MERGE batches by default. With
+    ``NEO4J_LOAD_MODE=bulk`` the same writes are staged for an offline
+    ``neo4j-admin`` rebuild and the created/updated counts report staged rows.
     """
     client = _get_neo4j_client()
     if client is None:
@@ -906,6 +925,11 @@ def neo4j_sbir_awards(
         duration = time.time() - start_time
         result = {
             "status": "success",
+            "load_mode": (
+                "bulk"
+                if BulkImportClient is not None and isinstance(client, BulkImportClient)
+                else "incremental"
+            ),
             "awards_submitted": len(award_nodes),
             "awards_loaded": awards_created + awards_updated,
             "awards_created": awards_created,
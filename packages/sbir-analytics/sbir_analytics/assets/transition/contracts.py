@@ -7,7 +7,6 @@ This module contains:
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 from collections.abc import Iterable, Mapping
@@ -23,6 +22,7 @@ from sbir_etl.extractors.usaspending_award_archive import (
     AwardArchiveContractExtractor,
     find_latest_local_contract_archive,
 )
+from sbir_etl.utils.cache.fingerprint import file_sha256
 
 from .utils import (
     ContractExtractor,
@@ -114,11 +114,7 @@ def _file_sha256(path: Path) -> str | None:
 
     if not path.is_file():
         return None
-    digest = hashlib.sha256()
-    with path.open("rb") as file:
-        for chunk in iter(lambda: file.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    return file_sha256(path)
 
 
 def _read_cached_source_provenance(checks_path: Path) -> dict[str, object]:
@@ -259,6 +255,7 @@ def raw_contracts(context) -> Output[pd.DataFrame]:
         else None
     )
     batch_size = _env_int("SBIR_ETL__TRANSITION__CONTRACTS__BATCH_SIZE", 10000)
+    scan_workers = _env_int("SBIR_ETL__TRANSITION__CONTRACTS__SCAN_WORKERS", 1)
     force_refresh = _env_bool("SBIR_ETL__TRANSITION__CONTRACTS__FORCE_REFRESH", False)
 
     context.log.info(
@@ -271,6 +268,7 @@ def raw_contracts(context) -> Output[pd.DataFrame]:
             "vendor_filter_path": str(vendor_filter_path),
             "force_refresh": force_refresh,
             "table_files": table_files,
+            "scan_workers": scan_workers,
         },
     )
 
@@ -365,6 +363,7 @@ def raw_contracts(context) -> Output[pd.DataFrame]:
             extractor = ContractExtractor(
                 vendor_filter_file=vendor_filter_path,
                 batch_size=batch_size,
+                scan_workers=scan_workers,
             )
             extracted_count = extractor.extract_from_dump(
                 dump_dir=dump_dir,
@@ -165,10 +165,12 @@ try:
     from neo4j import Driver  # type: ignore[attr-defined]
 
     from sbir_graph.loaders.neo4j import Neo4jClient, Neo4jConfig
+    from sbir_graph.loaders.neo4j.bulk_import import bulk_import_client_from_env
 except Exception:
     Driver = None  # type: ignore
     Neo4jClient = None  # type: ignore
     Neo4jConfig = None  # type: ignore
+    bulk_import_client_from_env = None  # type: ignore
 
 # Neo4j configuration defaults
 DEFAULT_NEO4J_URI = os.environ.get("NEO4J_URI", "bolt://localhost:7687")
@@ -210,6 +212,12 @@ def _get_neo4j_client() -> Any:
     """Create and return a Neo4jClient, or None if unavailable."""
     import os
 
+    # NEO4J_LOAD_MODE=bulk stages writes for an offline neo4j-admin rebuild.
+    if bulk_import_client_from_env is not None:
+        bulk_client = bulk_import_client_from_env("transitions")
+        if bulk_client is not None:
+            return bulk_client
+
     # Check if Neo4j loading is explicitly skipped
     skip_neo4j = os.getenv("SKIP_NEO4J_LOADING", "false").lower() in ("true", "1", "yes")
 
@@ -7,7 +7,6 @@ This module contains:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
 
 import pandas as pd
 
@@ -16,7 +15,6 @@ from .utils import (
     VendorRecord,
     VendorResolver,
     _env_float,
-    _norm_name,
     asset,
     now_utc_iso,
     save_dataframe_parquet,
@@ -24,6 +22,100 @@ from .utils import (
 )
 
 
+def _clean_text(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return ``column`` as stripped strings, with missing values as ""."""
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    values = df[column]
+    return values.map(str, na_action="ignore").str.strip().where(values.notna(), "").astype(object)
+
+
+def _award_vendor_frame(awards: pd.DataFrame) -> pd.DataFrame:
+    """Vendor identity columns for each SBIR award row.
+
+    ``vendor_id`` is ``uei:<UEI>``, else ``duns:<DUNS>``, else the normalized
+    company name. ``uei_key``/``duns_key`` are the resolver's index keys ("" when
+    the award has no usable identifier).
+    """
+    uei = _clean_text(awards, "UEI")
+    duns = _clean_text(awards, "Duns")
+    name = awards["Company"].map(str).astype(object)
+    vendor_id = ("name:" + name.str.strip().str.lower()).where(duns == "", "duns:" + duns)
+    vendor_id = vendor_id.where(uei == "", "uei:" + uei)
+
+    raw_uei = awards["UEI"] if "UEI" in awards.columns else pd.Series(None, index=awards.index)
+    raw_duns = awards["Duns"] if "Duns" in awards.columns else pd.Series(None, index=awards.index)
+    return pd.DataFrame(
+        {
+            "uei": raw_uei.map(str, na_action="ignore").astype(object).where(raw_uei.notna(), None),
+            "duns": raw_duns.map(str, na_action="ignore")
+            .astype(object)
+            .where(raw_duns.notna(), None),
+            "name": name,
+            "vendor_id": vendor_id,
+            "uei_key": uei.str.upper(),
+            "duns_key": duns,
+        }
+    )
+
+
+def _last_vendor_by_key(awards: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Map identifier key -> vendor_id, keeping the last award per key."""
+    keyed = awards.loc[awards[key] != "", [key, "vendor_id"]]
+    return keyed.drop_duplicates(key, keep="last").rename(columns={key: "key"})
+
+
+def _resolve_distinct_vendors(
+    distinct: pd.DataFrame,
+    uei_lookup: pd.DataFrame,
+    duns_lookup: pd.DataFrame,
+    resolver: VendorResolver,
+) -> pd.DataFrame:
+    """Resolve distinct contract vendor tuples: UEI, then DUNS, then name.
+
+    Identifier hits are merges against the award lookup tables; only distinct
+    names left unresolved reach the fuzzy resolver, in one batched call.
+    """
+    uei_hit = (
+        distinct["vendor_uei"]
+        .str.upper()
+        .to_frame("key")
+        .merge(uei_lookup, on="key", how="left")["vendor_id"]
+    )
+    duns_hit = (
+        distinct["vendor_duns"]
+        .to_frame("key")
+        .merge(duns_lookup, on="key", how="left")["vendor_id"]
+    )
+
+    resolved = distinct.copy()
+    resolved["matched_vendor_id"] = uei_hit.where(uei_hit.notna(), duns_hit).to_numpy(object)
+    resolved["match_method"] = "unresolved"
+    resolved["confidence"] = 0.0
+    resolved.loc[duns_hit.notna().to_numpy(), "match_method"] = "duns"
+    resolved.loc[uei_hit.notna().to_numpy(), "match_method"] = "uei"
+    resolved.loc[resolved["match_method"] != "unresolved", "confidence"] = 1.0
+
+    by_name = (resolved["match_method"] == "unresolved") & (resolved["vendor_name"] != "")
+    names = resolved.loc[by_name, "vendor_name"].unique().tolist()
+    if names:
+        name_matches = {
+            name: match
+            for name, match in zip(names, resolver.resolve_many(names), strict=True)
+            if match.record
+        }
+        for i in resolved.index[by_name]:
+            match = name_matches.get(resolved.at[i, "vendor_name"])
+            if match is not None:
+                resolved.at[i, "matched_vendor_id"] = match.record.metadata.get("vendor_id")
+                resolved.at[i, "match_method"] = match.method
+                resolved.at[i, "confidence"] = match.score
+
+    resolved["matched_vendor_id"] = resolved["matched_vendor_id"].astype(object)
+    resolved.loc[resolved["match_method"] == "unresolved", "matched_vendor_id"] = None
+    return resolved
+
+
 @asset(
     name="enriched_vendor_resolution",
     group_name="enrichment",
@@ -43,58 +135,57 @@ def enriched_vendor_resolution(
     out_path = Path("data/processed/vendor_resolution.parquet")
     checks_path = out_path.with_suffix(".checks.json")
 
-    # Build resolver from SBIR awards
-    award_vendors = []
-    for _, award in enriched_sbir_awards.iterrows():
-        # Create a unique, stable vendor_id for each award recipient
-        vendor_id = None
-        if pd.notna(award.get("UEI")) and str(award["UEI"]).strip():
-            vendor_id = f"uei:{str(award['UEI']).strip()}"
-        elif pd.notna(award.get("Duns")) and str(award["Duns"]).strip():
-            vendor_id = f"duns:{str(award['Duns']).strip()}"
-        else:
-            vendor_id = f"name:{_norm_name(str(award.get('Company', '')))}"
-
-        award_vendors.append(
+    # Award recipients: stable vendor_id per row, then exact-identifier lookup
+    # tables. Later awards win a shared UEI/DUNS, as in the resolver indices.
+    awards = _award_vendor_frame(enriched_sbir_awards)
+    uei_lookup = _last_vendor_by_key(awards, "uei_key")
+    duns_lookup = _last_vendor_by_key(awards, "duns_key")
+
+    # Name fallback only needs one record per distinct recipient.
+    distinct_awards = awards.drop_duplicates(["uei", "duns", "name", "vendor_id"])
+    resolver = VendorResolver.from_records(
+        (
             VendorRecord(
-                uei=str(award["UEI"]) if pd.notna(award.get("UEI")) else None,
-                duns=str(award["Duns"]) if pd.notna(award.get("Duns")) else None,
+                uei=row.uei,
+                duns=row.duns,
                 cage=None,  # No CAGE code in SBIR awards data
-                name=str(award["Company"]),
-                metadata={"vendor_id": vendor_id},
+                name=row.name,
+                metadata={"vendor_id": row.vendor_id},
             )
-        )
-    resolver = VendorResolver.from_records(award_vendors, fuzzy_threshold=fuzzy_threshold)
+            for row in distinct_awards.itertuples(index=False)
+        ),
+        fuzzy_threshold=fuzzy_threshold,
+    )
     context.log.info("Built VendorResolver", extra=resolver.stats())
 
-    # Resolve each contract vendor
-    rows: list[dict[str, Any]] = []
-    for _, contract in validated_contracts_sample.iterrows():
-        match = resolver.resolve(
-            uei=str(contract.get("vendor_uei") or "").strip(),
-            duns=str(contract.get("vendor_duns") or "").strip(),
-            name=str(contract.get("vendor_name") or "").strip(),
-        )
-        if match.record:
-            rows.append(
-                {
-                    "contract_id": contract.get("contract_id") or contract.get("piid") or "",
-                    "matched_vendor_id": match.record.metadata.get("vendor_id"),
-                    "match_method": match.method,
-                    "confidence": match.score,
-                }
-            )
-        else:
-            rows.append(
-                {
-                    "contract_id": contract.get("contract_id") or contract.get("piid") or "",
-                    "matched_vendor_id": None,
-                    "match_method": "unresolved",
-                    "confidence": 0.0,
-                }
-            )
+    # Resolve each distinct (UEI, DUNS, name) tuple once, then broadcast back
+    contracts = validated_contracts_sample
+    keys = pd.DataFrame(
+        {
+            "vendor_uei": _clean_text(contracts, "vendor_uei"),
+            "vendor_duns": _clean_text(contracts, "vendor_duns"),
+            "vendor_name": _clean_text(contracts, "vendor_name"),
+        }
+    )
+    distinct = keys.drop_duplicates(ignore_index=True)
+    vendor_matches = _resolve_distinct_vendors(distinct, uei_lookup, duns_lookup, resolver)
+    matches = keys.merge(vendor_matches, on=list(keys.columns), how="left")
+
+    contract_ids = _clean_text(contracts, "contract_id")
+    piids = _clean_text(contracts, "piid")
+    df_out = pd.DataFrame(
+        {
+            "contract_id": contract_ids.where(contract_ids != "", piids).to_numpy(object),
+            "matched_vendor_id": matches["matched_vendor_id"].to_numpy(object),
+            "match_method": matches["match_method"].to_numpy(object),
+            "confidence": matches["confidence"].to_numpy(float),
+        }
+    )
+    context.log.info(
+        "Resolved contract vendors",
+        extra={"contracts": len(keys), "distinct_vendor_keys": len(distinct)},
+    )
 
-    df_out = pd.DataFrame(rows)
     out_path = save_dataframe_parquet(df_out, out_path)
 
     # Checks
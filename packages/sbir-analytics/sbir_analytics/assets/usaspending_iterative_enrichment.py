@@ -168,7 +168,6 @@ def usaspending_refresh_batch(
     """Refresh USAspending enrichment for a batch of awards."""
 
     source = config.source or "usaspending"
-    store = FreshnessStore()
     if stale_usaspending_awards.empty:
         context.log.info("No stale awards — skipping refresh")
         return Output(
@@ -194,6 +193,7 @@ def usaspending_refresh_batch(
     batch_size = config.batch_size or refresh_config.batch_size
     requests = usable[:batch_size]
 
+    store = FreshnessStore(commit_every=refresh_config.checkpoint_interval)
     adapter = build_usaspending_adapter(freshness=store)
     metrics_collector = EnrichmentMetricsCollector()
     runner = SourceRefreshRunner(
@@ -202,6 +202,8 @@ def usaspending_refresh_batch(
         metrics=metrics_collector,
         partition_id="usaspending-default",
         checkpoint_interval=refresh_config.checkpoint_interval,
+        concurrency=refresh_config.max_concurrent_requests,
+        requests_per_minute=refresh_config.rate_limit_per_minute,
     )
     stats = runner.refresh_records(adapter, requests).as_dict()
 
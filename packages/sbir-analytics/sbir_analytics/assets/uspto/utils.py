@@ -78,10 +78,12 @@ except Exception:
 # Neo4j loaders
 try:  # pragma: no cover - defensive import
     from sbir_graph.loaders.neo4j import LoadMetrics, Neo4jClient, Neo4jConfig  # type: ignore
+    from sbir_graph.loaders.neo4j.bulk_import import bulk_import_client_from_env
 except Exception:
     Neo4jClient = None
     Neo4jConfig = None
     LoadMetrics = None
+    bulk_import_client_from_env = None  # type: ignore[assignment]
 
 try:  # pragma: no cover - defensive import
     from sbir_graph.loaders.neo4j import PatentLoader, PatentLoaderConfig
@@ -512,6 +514,12 @@ def _get_neo4j_client() -> Neo4jClient | None:
     """Create and return a Neo4j client, or None if unavailable."""
     import os
 
+    # NEO4J_LOAD_MODE=bulk stages writes for an offline neo4j-admin rebuild.
+    if bulk_import_client_from_env is not None:
+        bulk_client = bulk_import_client_from_env("uspto")
+        if bulk_client is not None:
+            return bulk_client
+
     # Check if Neo4j loading is explicitly skipped
     skip_neo4j = os.getenv("SKIP_NEO4J_LOADING", "false").lower() in ("true", "1", "yes")
 
@@ -31,6 +31,11 @@ __all__ = [
     "Neo4jHealthStatus",
     "Neo4jStatistics",
     "LoadMetrics",
+    # Bulk import (offline full rebuilds)
+    "BulkImportClient",
+    "BulkImportManifest",
+    "GraphImportStaging",
+    "Neo4jBulkImporter",
     # Patents (USPTO assignments)
     "PatentLoader",
     "PatentLoaderConfig",
@@ -58,6 +63,10 @@ __all__ = [
 _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "BaseLoaderConfig": (".base", "BaseLoaderConfig"),
     "BaseNeo4jLoader": (".base", "BaseNeo4jLoader"),
+    "BulkImportClient": (".bulk_import", "BulkImportClient"),
+    "BulkImportManifest": (".bulk_import", "BulkImportManifest"),
+    "GraphImportStaging": (".bulk_import", "GraphImportStaging"),
+    "Neo4jBulkImporter": (".bulk_import", "Neo4jBulkImporter"),
     "CompanyCategorizationLoader": (".categorization", "CompanyCategorizationLoader"),
     "CompanyCategorizationLoaderConfig": (".categorization", "CompanyCategorizationLoaderConfig"),
     "CETLoader": (".cet", "CETLoader"),
@@ -14,15 +14,30 @@ Key features:
 from __future__ import annotations
 
 from abc import ABC
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
+import pandas as pd
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from .bulk_import import BulkImportClient
 from .client import LoadMetrics, Neo4jClient
 
 
+def as_cypher_datetime(value: Any) -> datetime | None:
+    """Parse a timestamp the way Cypher ``datetime()`` would (naive = UTC).
+
+    Used when staging for bulk import, where no Cypher runs to convert the value.
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize(UTC)
+    return timestamp.to_pydatetime()
+
+
 class BaseLoaderConfig(BaseModel):
     """Base configuration for Neo4j loaders.
 
@@ -84,6 +99,11 @@ class BaseNeo4jLoader(ABC):  # noqa: B024
         self.loader_name = self.__class__.__name__
         logger.debug(f"{self.loader_name} initialized")
 
+    @property
+    def bulk_import(self) -> bool:
+        """True when writes are staged for ``neo4j-admin`` instead of executed."""
+        return isinstance(self.client, BulkImportClient)
+
     # -------------------------------------------------------------------------
     # Node Operations
     # -------------------------------------------------------------------------
@@ -288,7 +308,7 @@ class BaseNeo4jLoader(ABC):  # noqa: B024
             ...     "FOR (p:Patent) REQUIRE p.patent_id IS UNIQUE"
             ... ])
         """
-        if not constraints:
+        if not constraints or self.bulk_import:
             return
 
         logger.info(f"{self.loader_name}: Creating {len(constraints)} constraints")
@@ -313,7 +333,7 @@ class BaseNeo4jLoader(ABC):  # noqa: B024
             ...     "FOR (p:Patent) ON (p.grant_date)"
             ... ])
         """
-        if not indexes:
+        if not indexes or self.bulk_import:
             return
 
         logger.info(f"{self.loader_name}: Creating {len(indexes)} indexes")
@@ -369,6 +389,15 @@ class BaseNeo4jLoader(ABC):  # noqa: B024
             logger.info(f"{self.loader_name}: Enriching {len(enrichments)} {label} nodes")
 
         start_time = datetime.utcnow()
+        if self.bulk_import:
+            self.metrics = self.client.batch_set_existing_node_properties(
+                label=label,
+                key_property=key_property,
+                nodes=[{**props, key_property: key_value} for key_value, props in enrichments],
+                metrics=self.metrics,
+            )
+            return self.metrics
+
         batch_size = self.client.config.batch_size
 
         with self.client.session() as session:
@@ -0,0 +1,772 @@
+"""Offline bulk-import mode for full Neo4j graph rebuilds.
+
+Incremental loading pushes every node and relationship through ``MERGE``/
+``UNWIND`` batches, which is the right tool for deltas but far slower than
+Neo4j's offline importer for a full rebuild. This module provides the bulk
+path:
+
+1. ``BulkImportClient`` stands in for ``Neo4jClient`` during a rebuild. It
+   exposes the same batch write API the loaders use, but appends each call to
+   a JSON-lines stage file under the import directory instead of executing
+   Cypher.
+2. ``Neo4jBulkImporter`` replays every stage in order into a
+   ``GraphImportStaging`` with MERGE semantics (nodes deduplicated on their
+   key, later properties win, Organization multi-key merges, relationships
+   deduplicated per type and endpoint pair), writes node and relationship
+   CSV files with separate header files, and drives
+   ``neo4j-admin database import full``. Stages replayed by a successful
+   import are deleted, so the next rebuild starts from fresh loads.
+
+Typical rebuild::
+
+    NEO4J_LOAD_MODE=bulk dagster asset materialize --select 'neo4j_sbir_awards ...'
+    python scripts/neo4j/bulk_import.py --database neo4j --neo4j-home /var/lib/neo4j
+    python scripts/neo4j/migrate.py upgrade
+
+The import replaces the target database and needs it to be offline.
+Constraints and indexes are not part of the import; apply migrations
+afterwards.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+import numbers
+import os
+import shutil
+import subprocess
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .client import LoadMetrics, Neo4jConfig
+
+
+BULK_LOAD_MODE = "bulk"
+LOAD_MODE_ENV = "NEO4J_LOAD_MODE"
+IMPORT_DIR_ENV = "NEO4J_BULK_IMPORT_DIR"
+DEFAULT_IMPORT_DIR = Path("data/neo4j_import")
+
+# Unit separator: never appears in SBIR text, unlike the ';' default.
+ARRAY_DELIMITER = "\u001f"
+_ARRAY_DELIMITER_ARG = "U+001F"
+
+RelationshipTuple = tuple[str, str, Any, str, str, Any, str, dict[str, Any] | None]
+
+# Staging never connects to a server; the config only reports the stage URI
+# and batch size to loaders that read it.
+_STAGING_CREDENTIAL = "bulk-import-staging"
+
+# Marks a date/datetime value encoded as ``{_STAGE_TYPE_KEY: type, "value": iso}``
+# in a stage line, so replay restores the value and its CSV column type.
+_STAGE_TYPE_KEY = "__bulk_import_type__"
+
+
+def bulk_rebuild_requested() -> bool:
+    """Return True when ``NEO4J_LOAD_MODE=bulk`` selects the offline import path."""
+    return os.getenv(LOAD_MODE_ENV, "incremental").strip().lower() == BULK_LOAD_MODE
+
+
+def bulk_import_client_from_env(stage: str) -> BulkImportClient | None:
+    """Return a staging client when bulk rebuild mode is requested, else None.
+
+    Args:
+        stage: Short name of the loading step (used in the stage file name)
+
+    Returns:
+        BulkImportClient writing under ``NEO4J_BULK_IMPORT_DIR``, or None
+    """
+    if not bulk_rebuild_requested():
+        return None
+    import_dir = Path(os.getenv(IMPORT_DIR_ENV) or DEFAULT_IMPORT_DIR)
+    return BulkImportClient(import_dir, stage)
+
+
+class BulkImportClient:
+    """Drop-in replacement for ``Neo4jClient`` that stages writes for bulk import.
+
+    Every batch write is appended to ``<import_dir>/stages/<stage file>`` as one
+    JSON line holding the operation and its arguments, as it arrives, so
+    memory stays flat however many batches a loader submits.
+    Metrics count submitted rows as created because deduplication happens
+    when the stages are replayed.
+    """
+
+    def __init__(self, import_dir: Path | str, stage: str, batch_size: int = 5000) -> None:
+        """Initialize the staging client.
+
+        Args:
+            import_dir: Root of the bulk import directory
+            stage: Short name of the loading step
+            batch_size: Reported through ``config.batch_size`` for loaders that read it
+        """
+        self.import_dir = Path(import_dir)
+        # Nanosecond prefix: stages replay in the order they were opened.
+        stamp = f"{time.time_ns():020d}"
+        self.stage_path = (
+            self.import_dir / "stages" / f"{stamp}-{stage}-{uuid.uuid4().hex[:8]}.jsonl"
+        )
+        self.stage_path.parent.mkdir(parents=True, exist_ok=True)
+        self.config = Neo4jConfig(
+            uri=self.stage_path.resolve().as_uri(),
+            username=_STAGING_CREDENTIAL,
+            password=_STAGING_CREDENTIAL,
+            batch_size=batch_size,
+        )
+        self._handle = self.stage_path.open("a", encoding="utf-8")
+        logger.info(f"Neo4j bulk import staging to {self.stage_path}")
+
+    def _record(self, op: str, **kwargs: Any) -> None:
+        if self._handle.closed:
+            raise RuntimeError(f"Bulk import stage {self.stage_path} is already closed")
+        self._handle.write(json.dumps([op, kwargs], default=_stage_default) + "\n")
+
+    def session(self) -> Any:
+        """Bulk import mode executes no Cypher."""
+        raise RuntimeError(
+            "Neo4j bulk import mode does not execute Cypher; "
+            "stage writes through the batch_* methods instead"
+        )
+
+    def create_constraints(self) -> None:
+        """No-op: apply migrations after the import instead."""
+        logger.debug("Bulk import mode: constraints are applied by migrations after import")
+
+    def create_indexes(self) -> None:
+        """No-op: apply migrations after the import instead."""
+        logger.debug("Bulk import mode: indexes are applied by migrations after import")
+
+    def batch_upsert_nodes(
+        self,
+        label: str,
+        key_property: str,
+        nodes: list[dict[str, Any]],
+        metrics: LoadMetrics | None = None,
+    ) -> LoadMetrics:
+        """Stage a node upsert keyed on ``key_property``."""
+        if metrics is None:
+            metrics = LoadMetrics()
+        valid = _with_key(nodes, key_property, metrics)
+        if valid:
+            self._record("upsert_nodes", label=label, key_property=key_property, nodes=valid)
+            metrics.nodes_created[label] = metrics.nodes_created.get(label, 0) + len(valid)
+        return metrics
+
+    def batch_set_existing_node_properties(
+        self,
+        label: str,
+        key_property: str,
+        nodes: list[dict[str, Any]],
+        metrics: LoadMetrics | None = None,
+    ) -> LoadMetrics:
+        """Stage a MATCH-and-SET update; unmatched rows are dropped on replay."""
+        if metrics is None:
+            metrics = LoadMetrics()
+        valid = _with_key(nodes, key_property, metrics)
+        if valid:
+            self._record("set_existing", label=label, key_property=key_property, nodes=valid)
+            metrics.nodes_updated[label] = metrics.nodes_updated.get(label, 0) + len(valid)
+        return metrics
+
+    def batch_upsert_organizations_with_multi_key(
+        self,
+        nodes: list[dict[str, Any]],
+        metrics: LoadMetrics | None = None,
+        merge_on_uei: bool = True,
+        merge_on_duns: bool = True,
+        track_merge_history: bool = True,
+    ) -> LoadMetrics:
+        """Stage an Organization upsert that merges on shared UEI/DUNS."""
+        if metrics is None:
+            metrics = LoadMetrics()
+        valid = _with_key(nodes, "organization_id", metrics)
+        if valid:
+            self._record(
+                "upsert_organizations",
+                nodes=valid,
+                merge_on_uei=merge_on_uei,
+                merge_on_duns=merge_on_duns,
+                track_merge_history=track_merge_history,
+            )
+            metrics.nodes_created["Organization"] = metrics.nodes_created.get(
+                "Organization", 0
+            ) + len(valid)
+        return metrics
+
+    def batch_create_relationships(
+        self,
+        relationships: list[RelationshipTuple],
+        metrics: LoadMetrics | None = None,
+    ) -> LoadMetrics:
+        """Stage relationship MERGEs in ``Neo4jClient`` tuple format."""
+        if metrics is None:
+            metrics = LoadMetrics()
+        if relationships:
+            self._record("relationships", relationships=list(relationships))
+            for rel in relationships:
+                rel_type = rel[6]
+                metrics.relationships_created[rel_type] = (
+                    metrics.relationships_created.get(rel_type, 0) + 1
+                )
+        return metrics
+
+    def close(self) -> None:
+        """Flush and close the stage file."""
+        if not self._handle.closed:
+            self._handle.close()
+            logger.info(f"Closed Neo4j bulk import stage {self.stage_path}")
+
+    def __enter__(self) -> BulkImportClient:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+def _stage_default(value: Any) -> Any:
+    """JSON encoding for stage values the ``json`` module does not handle."""
+    if _is_missing(value):
+        return None
+    if isinstance(value, datetime):
+        return {_STAGE_TYPE_KEY: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {_STAGE_TYPE_KEY: "date", "value": value.isoformat()}
+    # numpy scalars and arrays become the matching Python values.
+    tolist = getattr(value, "tolist", None)
+    if callable(tolist):
+        return tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _stage_object(obj: dict[str, Any]) -> Any:
+    """Restore values tagged by ``_stage_default`` while decoding a stage line."""
+    kind = obj.get(_STAGE_TYPE_KEY)
+    if kind == "datetime":
+        return datetime.fromisoformat(obj["value"])
+    if kind == "date":
+        return date.fromisoformat(obj["value"])
+    return obj
+
+
+def _with_key(
+    nodes: list[dict[str, Any]], key_property: str, metrics: LoadMetrics
+) -> list[dict[str, Any]]:
+    valid = [n for n in nodes if n.get(key_property) is not None]
+    invalid = len(nodes) - len(valid)
+    if invalid:
+        logger.error(f"{invalid} nodes missing key property {key_property}")
+        metrics.errors += invalid
+    return valid
+
+
+# ---------------------------------------------------------------------------
+# Replay with MERGE semantics
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BulkImportManifest:
+    """Files written for ``neo4j-admin database import full``."""
+
+    node_files: list[tuple[str, Path, Path]] = field(default_factory=list)
+    relationship_files: list[tuple[str, Path, Path]] = field(default_factory=list)
+    node_counts: dict[str, int] = field(default_factory=dict)
+    relationship_counts: dict[str, int] = field(default_factory=dict)
+    unresolved_relationships: int = 0
+
+
+class GraphImportStaging:
+    """In-memory graph built by replaying staged writes with MERGE semantics.
+
+    Nodes are addressed through lazily built ``(label, property) -> node``
+    indexes, so upserts and relationship endpoints may reference any property
+    the loaders match on. Relationship endpoints are resolved when the files
+    are written, which makes the result independent of load order.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, list[dict[str, Any] | None]] = {}
+        self._indexes: dict[tuple[str, str], dict[Any, int]] = {}
+        self._relationships: dict[tuple[str, tuple, tuple], dict[str, Any]] = {}
+        self.orphan_updates = 0
+
+    # -- node index -----------------------------------------------------------
+
+    def _index(self, label: str, prop: str) -> dict[Any, int]:
+        key = (label, prop)
+        index = self._indexes.get(key)
+        if index is None:
+            index = {}
+            for idx, node in enumerate(self._nodes.get(label, [])):
+                value = node.get(prop) if node is not None else None
+                if value is not None and _hashable(value):
+                    index.setdefault(value, idx)
+            self._indexes[key] = index
+        return index
+
+    def _reindex(self, label: str, idx: int, before: dict[str, Any]) -> None:
+        node = self._nodes[label][idx]
+        for (index_label, prop), index in self._indexes.items():
+            if index_label != label:
+                continue
+            old = before.get(prop)
+            new = node.get(prop) if node is not None else None
+            if old == new:
+                continue
+            if _hashable(old) and index.get(old) == idx:
+                del index[old]
+            if new is not None and _hashable(new):
+                index.setdefault(new, idx)
+
+    def _merge_into(self, label: str, idx: int, props: dict[str, Any]) -> None:
+        node = self._nodes[label][idx]
+        assert node is not None
+        before = dict(node)
+        node.update(props)
+        self._reindex(label, idx, before)
+
+    def _create(self, label: str, props: dict[str, Any]) -> int:
+        nodes = self._nodes.setdefault(label, [])
+        nodes.append(dict(props))
+        idx = len(nodes) - 1
+        self._reindex(label, idx, {})
+        return idx
+
+    def find(self, label: str, prop: str, value: Any) -> dict[str, Any] | None:
+        """Return the staged node matching ``{prop: value}``, if any."""
+        if not _hashable(value):
+            return None
+        idx = self._index(label, prop).get(value)
+        return None if idx is None else self._nodes[label][idx]
+
+    # -- replayed operations ---------------------------------------------------
+
+    def upsert_nodes(self, label: str, key_property: str, nodes: list[dict[str, Any]]) -> None:
+        """``MERGE (n:label {key: ...}) SET n += props`` for each node."""
+        index = self._index(label, key_property)
+        for node in nodes:
+            value = node.get(key_property)
+            if not _hashable(value) or value is None:
+                continue
+            idx = index.get(value)
+            if idx is None:
+                self._create(label, node)
+            else:
+                self._merge_into(label, idx, node)
+
+    def set_existing(self, label: str, key_property: str, nodes: list[dict[str, Any]]) -> None:
+        """``MATCH (n:label {key: ...}) SET n += props``; never creates nodes."""
+        index = self._index(label, key_property)
+        for node in nodes:
+            value = node.get(key_property)
+            idx = index.get(value) if _hashable(value) else None
+            if idx is None:
+                self.orphan_updates += 1
+            else:
+                self._merge_into(label, idx, node)
+
+    def upsert_organizations(
+        self,
+        nodes: list[dict[str, Any]],
+        merge_on_uei: bool = True,
+        merge_on_duns: bool = True,
+        track_merge_history: bool = True,
+    ) -> None:
+        """Organization upsert that folds nodes sharing a UEI/DUNS into the first one.
+
+        The merged-away ``organization_id`` stays addressable as an alias of
+        the surviving node, so relationships staged against it still land.
+        """
+        org_index = self._index("Organization", "organization_id")
+        for node in nodes:
+            org_id = node["organization_id"]
+            existing = None
+            for enabled, prop in ((merge_on_uei, "uei"), (merge_on_duns, "duns")):
+                value = node.get(prop)
+                if not enabled or not value or not _hashable(value):
+                    continue
+                idx = self._index("Organization", prop).get(value)
+                if idx is None:
+                    continue
+                candidate = self._nodes["Organization"][idx]
+                if candidate is not None and candidate["organization_id"] != org_id:
+                    existing = idx
+                    break
+
+            if existing is None:
+                self.upsert_nodes("Organization", "organization_id", [node])
+                continue
+
+            props = {k: v for k, v in node.items() if k != "organization_id"}
+            if track_merge_history:
+                survivor = self._nodes["Organization"][existing]
+                assert survivor is not None
+                props["__merged_from"] = [*(survivor.get("__merged_from") or []), org_id]
+            self._merge_into("Organization", existing, props)
+
+            duplicate = org_index.get(org_id)
+            if duplicate is not None and duplicate != existing:
+                before = self._nodes["Organization"][duplicate] or {}
+                self._nodes["Organization"][duplicate] = None
+                self._reindex("Organization", duplicate, before)
+            org_index[org_id] = existing
+
+    def add_relationships(self, relationships: list[RelationshipTuple]) -> None:
+        """``MERGE (s)-[r:type]->(t) SET r += props`` for each tuple."""
+        for (
+            source_label,
+            source_key,
+            source_value,
+            target_label,
+            target_key,
+            target_value,
+            rel_type,
+            props,
+        ) in relationships:
+            key = (
+                rel_type,
+                (source_label, source_key, source_value),
+                (target_label, target_key, target_value),
+            )
+            self._relationships.setdefault(key, {}).update(props or {})
+
+    def apply(self, op: str, kwargs: dict[str, Any]) -> None:
+        """Replay one staged operation."""
+        if op == "upsert_nodes":
+            self.upsert_nodes(kwargs["label"], kwargs["key_property"], kwargs["nodes"])
+        elif op == "set_existing":
+            self.set_existing(kwargs["label"], kwargs["key_property"], kwargs["nodes"])
+        elif op == "upsert_organizations":
+            self.upsert_organizations(**kwargs)
+        elif op == "relationships":
+            self.add_relationships(kwargs["relationships"])
+        else:
+            raise ValueError(f"Unknown bulk import operation: {op}")
+
+    # -- output ------------------------------------------------------------------
+
+    def node_count(self, label: str) -> int:
+        return sum(1 for node in self._nodes.get(label, []) if node is not None)
+
+    def write(self, output_dir: Path) -> BulkImportManifest:
+        """Write node/relationship CSV and header files for ``neo4j-admin``.
+
+        Node files use an anonymous ``:ID(<Label>)`` column so the internal
+        import id is not stored as a property. Relationships whose endpoints
+        were never staged are dropped, matching the ``MATCH`` in the live
+        loader.
+
+        Args:
+            output_dir: Directory to (re)create
+
+        Returns:
+            BulkImportManifest describing the written files
+        """
+        if output_dir.exists():
+            shutil.rmtree(output_dir)
+        (output_dir / "nodes").mkdir(parents=True)
+        (output_dir / "relationships").mkdir(parents=True)
+        manifest = BulkImportManifest()
+
+        for label, nodes in self._nodes.items():
+            rows = [(idx, node) for idx, node in enumerate(nodes) if node is not None]
+            if not rows:
+                continue
+            columns = _property_columns(node for _, node in rows)
+            header = output_dir / "nodes" / f"{label}_header.csv"
+            data = output_dir / "nodes" / f"{label}.csv"
+            _write_csv(header, [[f":ID({label})", *(f"{c}:{t}" for c, t in columns)]])
+            _write_csv(
+                data,
+                ([idx, *(_format_value(node.get(c), t) for c, t in columns)] for idx, node in rows),
+            )
+            manifest.node_files.append((label, header, data))
+            manifest.node_counts[label] = len(rows)
+
+        resolved: dict[tuple[str, str, int, str, int], dict[str, Any]] = {}
+        for (rel_type, source, target), props in self._relationships.items():
+            source_idx = (
+                self._index(source[0], source[1]).get(source[2]) if _hashable(source[2]) else None
+            )
+            target_idx = (
+                self._index(target[0], target[1]).get(target[2]) if _hashable(target[2]) else None
+            )
+            if source_idx is None or target_idx is None:
+                manifest.unresolved_relationships += 1
+                continue
+            key = (rel_type, source[0], source_idx, target[0], target_idx)
+            resolved.setdefault(key, {}).update(props)
+
+        groups: dict[tuple[str, str, str], list[tuple[int, int, dict[str, Any]]]] = {}
+        for (
+            rel_type,
+            source_label,
+            source_idx,
+            target_label,
+            target_idx,
+        ), props in resolved.items():
+            groups.setdefault((rel_type, source_label, target_label), []).append(
+                (source_idx, target_idx, props)
+            )
+        for (rel_type, source_label, target_label), rels in groups.items():
+            columns = _property_columns(props for _, _, props in rels)
+            stem = f"{source_label}_{rel_type}_{target_label}"
+            header = output_dir / "relationships" / f"{stem}_header.csv"
+            data = output_dir / "relationships" / f"{stem}.csv"
+            _write_csv(
+                header,
+                [
+                    [
+                        f":START_ID({source_label})",
+                        *(f"{c}:{t}" for c, t in columns),
+                        f":END_ID({target_label})",
+                    ]
+                ],
+            )
+            _write_csv(
+                data,
+                (
+                    [s, *(_format_value(props.get(c), t) for c, t in columns), t_idx]
+                    for s, t_idx, props in rels
+                ),
+            )
+            manifest.relationship_files.append((rel_type, header, data))
+            manifest.relationship_counts[rel_type] = manifest.relationship_counts.get(
+                rel_type, 0
+            ) + len(rels)
+
+        if manifest.unresolved_relationships:
+            logger.warning(
+                f"Dropped {manifest.unresolved_relationships} relationships whose endpoints "
+                "were not staged"
+            )
+        return manifest
+
+
+# ---------------------------------------------------------------------------
+# CSV typing
+# ---------------------------------------------------------------------------
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    # pandas NA/NaT and numpy NaN scalars without importing pandas here.
+    try:
+        return bool(value != value)
+    except Exception:
+        return False
+
+
+def _scalar_type(value: Any) -> str:
+    # bool before Integral: bool is an int subclass; numpy.bool_ is neither.
+    if isinstance(value, bool) or type(value).__name__ in ("bool", "bool_"):
+        return "boolean"
+    if isinstance(value, numbers.Integral):
+        return "long"
+    if isinstance(value, numbers.Real):
+        return "double"
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, date):
+        return "date"
+    return "string"
+
+
+def _value_type(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        elements = {_scalar_type(v) for v in value if not _is_missing(v)}
+        return f"{_merge_types(elements) if elements else 'string'}[]"
+    if isinstance(value, dict):
+        return "string"
+    return _scalar_type(value)
+
+
+def _merge_types(types: set[str]) -> str:
+    if len(types) == 1:
+        return next(iter(types))
+    if types <= {"long", "double"}:
+        return "double"
+    if all(t.endswith("[]") for t in types):
+        return "string[]"
+    return "string"
+
+
+def _property_columns(rows: Any) -> list[tuple[str, str]]:
+    """Ordered (property, neo4j-admin type) pairs across all rows."""
+    types: dict[str, set[str]] = {}
+    for row in rows:
+        for name, value in row.items():
+            if not _is_missing(value):
+                types.setdefault(name, set()).add(_value_type(value))
+    return [(name, _merge_types(found)) for name, found in types.items()]
+
+
+def _format_scalar(value: Any, type_name: str) -> str:
+    if type_name == "boolean":
+        return "true" if value else "false"
+    if type_name == "long":
+        return str(int(value))
+    if type_name == "double":
+        return repr(float(value))
+    if type_name in ("datetime", "date"):
+        return value.isoformat()
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _format_value(value: Any, type_name: str) -> str:
+    if isinstance(value, (list, tuple)) and type_name.endswith("[]"):
+        element_type = type_name[:-2]
+        return ARRAY_DELIMITER.join(
+            _format_scalar(v, element_type) for v in value if not _is_missing(v)
+        )
+    if _is_missing(value):
+        return ""
+    return _format_scalar(value, type_name)
+
+
+def _write_csv(path: Path, rows: Any) -> None:
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        csv.writer(handle).writerows(rows)
+
+
+# ---------------------------------------------------------------------------
+# Import driver
+# ---------------------------------------------------------------------------
+
+
+class Neo4jBulkImporter:
+    """Replay staged loads and run ``neo4j-admin database import full``."""
+
+    def __init__(self, import_dir: Path | str | None = None) -> None:
+        """Initialize the importer.
+
+        Args:
+            import_dir: Bulk import directory (``NEO4J_BULK_IMPORT_DIR`` or
+                ``data/neo4j_import`` if None)
+        """
+        self.import_dir = Path(import_dir or os.getenv(IMPORT_DIR_ENV) or DEFAULT_IMPORT_DIR)
+
+    def stage_paths(self) -> list[Path]:
+        """Stage files in the order they were written."""
+        return sorted((self.import_dir / "stages").glob("*.jsonl"))
+
+    def build_staging(self, stages: list[Path] | None = None) -> GraphImportStaging:
+        """Replay stage files (every stage if None) into one deduplicated graph."""
+        staging = GraphImportStaging()
+        for path in self.stage_paths() if stages is None else stages:
+            operations = 0
+            with path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    op, kwargs = json.loads(line, object_hook=_stage_object)
+                    staging.apply(op, kwargs)
+                    operations += 1
+            logger.info(f"Replayed {operations} staged operations from {path.name}")
+        if staging.orphan_updates:
+            logger.warning(f"{staging.orphan_updates} staged property updates matched no node")
+        return staging
+
+    def write_import_files(self, stages: list[Path] | None = None) -> BulkImportManifest:
+        """Replay stage files (every stage if None) and write the ``csv/`` import files."""
+        stages = self.stage_paths() if stages is None else stages
+        if not stages:
+            raise FileNotFoundError(f"No bulk import stages found in {self.import_dir / 'stages'}")
+        manifest = self.build_staging(stages).write(self.import_dir / "csv")
+        logger.info(
+            f"Wrote {sum(manifest.node_counts.values())} nodes and "
+            f"{sum(manifest.relationship_counts.values())} relationships from "
+            f"{len(stages)} stages"
+        )
+        return manifest
+
+    @staticmethod
+    def build_command(
+        manifest: BulkImportManifest,
+        database: str = "neo4j",
+        neo4j_admin: str = "neo4j-admin",
+    ) -> list[str]:
+        """Build the ``neo4j-admin database import full`` argument list."""
+        command = [neo4j_admin, "database", "import", "full", database]
+        command += [
+            f"--nodes={label}={header},{data}" for label, header, data in manifest.node_files
+        ]
+        command += [
+            f"--relationships={rel_type}={header},{data}"
+            for rel_type, header, data in manifest.relationship_files
+        ]
+        command += [
+            "--overwrite-destination=true",
+            "--multiline-fields=true",
+            f"--array-delimiter={_ARRAY_DELIMITER_ARG}",
+        ]
+        return command
+
+    def run(
+        self,
+        database: str = "neo4j",
+        neo4j_admin: str = "neo4j-admin",
+        neo4j_home: Path | str | None = None,
+        dry_run: bool = False,
+        keep_stages: bool = False,
+    ) -> BulkImportManifest:
+        """Write the import files and import them into a local, offline database.
+
+        The replayed stage files are deleted once the import succeeds, so they
+        are not mixed into the next rebuild.
+
+        Args:
+            database: Target database name
+            neo4j_admin: ``neo4j-admin`` executable
+            neo4j_home: ``NEO4J_HOME`` whose configured data directory receives
+                the database (inherits the environment if None)
+            dry_run: Write files and log the command without running it
+            keep_stages: Keep the replayed stage files after a successful import
+
+        Returns:
+            BulkImportManifest of the imported files
+
+        Raises:
+            subprocess.CalledProcessError: If ``neo4j-admin`` fails
+        """
+        stages = self.stage_paths()
+        manifest = self.write_import_files(stages)
+        command = self.build_command(manifest, database=database, neo4j_admin=neo4j_admin)
+        logger.info(f"neo4j-admin import command: {' '.join(command)}")
+        if dry_run:
+            return manifest
+
+        env = dict(os.environ)
+        if neo4j_home is not None:
+            env["NEO4J_HOME"] = str(neo4j_home)
+        subprocess.run(command, check=True, env=env)
+        logger.info(f"Bulk import into database '{database}' complete")
+        if not keep_stages:
+            for path in stages:
+                path.unlink(missing_ok=True)
+            logger.info(f"Removed {len(stages)} imported stage files")
+        return manifest
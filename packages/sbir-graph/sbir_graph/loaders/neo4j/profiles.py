@@ -7,12 +7,13 @@ as TransitionProfile nodes and creates relationships to Company nodes.
 Refactored to inherit from BaseNeo4jLoader for consistency.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pandas as pd
 from loguru import logger
 
-from .base import BaseNeo4jLoader
+from .base import BaseNeo4jLoader, as_cypher_datetime
+from .bulk_import import RelationshipTuple
 from .client import LoadMetrics, Neo4jClient
 
 
@@ -230,6 +231,9 @@ class TransitionProfileLoader(BaseNeo4jLoader):
 
         logger.info(f"Loading {len(profiles_df):,} transition profile nodes")
 
+        if self.bulk_import:
+            return self._stage_profile_nodes(profiles_df, metrics)
+
         with self.client.session() as session:
             for i in range(0, len(profiles_df), self.batch_size):
                 batch = profiles_df.iloc[i : i + self.batch_size]
@@ -291,6 +295,9 @@ class TransitionProfileLoader(BaseNeo4jLoader):
 
         logger.info("Creating ACHIEVED relationships (Organization → TransitionProfile)")
 
+        if self.bulk_import:
+            return self._stage_achieved_relationships(profiles_df, metrics)
+
         with self.client.session() as session:
             for i in range(0, len(profiles_df), self.batch_size):
                 batch = profiles_df.iloc[i : i + self.batch_size]
@@ -332,6 +339,76 @@ class TransitionProfileLoader(BaseNeo4jLoader):
 
         return metrics
 
+    # -------------------------------------------------------------------------
+    # Bulk import staging
+    # -------------------------------------------------------------------------
+
+    _PROFILE_PROPERTIES = (
+        "company_id",
+        "total_awards",
+        "total_transitions",
+        "success_rate",
+        "avg_likelihood_score",
+        "high_confidence_count",
+        "likely_confidence_count",
+        "last_transition_date",
+        "avg_time_to_transition_days",
+    )
+
+    def _stage_profile_nodes(self, profiles_df: pd.DataFrame, metrics: LoadMetrics) -> LoadMetrics:
+        """Stage TransitionProfile nodes with the properties the MERGE query sets."""
+        now = datetime.now(UTC)
+        nodes = [
+            {
+                "profile_id": p["profile_id"],
+                **{prop: p.get(prop) for prop in self._PROFILE_PROPERTIES},
+                "created_at": as_cypher_datetime(p.get("created_at")),
+                "updated_at": now,
+            }
+            for p in profiles_df.to_dict("records")
+        ]
+        metrics = self.client.batch_upsert_nodes(
+            label="TransitionProfile", key_property="profile_id", nodes=nodes, metrics=metrics
+        )
+        logger.info(f"✓ Staged {len(nodes):,} profile nodes for bulk import")
+        return metrics
+
+    def _stage_achieved_relationships(
+        self, profiles_df: pd.DataFrame, metrics: LoadMetrics
+    ) -> LoadMetrics:
+        """Stage ACHIEVED relationships from the company's Organization node.
+
+        The live query matches the company on either ``company_id`` or
+        ``organization_id``; both endpoints are staged and the replay keeps
+        whichever resolves, deduplicating when both reach the same node.
+        """
+        linked = [p for p in profiles_df.to_dict("records") if pd.notna(p.get("company_id"))]
+        relationships: list[RelationshipTuple] = [
+            (
+                "Organization",
+                org_key,
+                p["company_id"],
+                "TransitionProfile",
+                "profile_id",
+                p["profile_id"],
+                "ACHIEVED",
+                {
+                    "success_rate": p.get("success_rate"),
+                    "created_at": as_cypher_datetime(p.get("created_at")),
+                },
+            )
+            for p in linked
+            for org_key in ("company_id", "organization_id")
+        ]
+        if relationships:
+            # Count one relationship per profile, not per candidate endpoint.
+            self.client.batch_create_relationships(relationships)
+            metrics.relationships_created["ACHIEVED"] = metrics.relationships_created.get(
+                "ACHIEVED", 0
+            ) + len(linked)
+        logger.info(f"✓ Staged {len(linked):,} ACHIEVED relationships for bulk import")
+        return metrics
+
     def load_profiles(
         self,
         transitions_df: pd.DataFrame,
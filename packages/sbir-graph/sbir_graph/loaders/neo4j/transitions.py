@@ -9,10 +9,12 @@ Refactored to use BaseNeo4jLoader for consistency with other loaders.
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
 import pandas as pd
 from loguru import logger
 
-from .base import BaseNeo4jLoader
+from .base import BaseNeo4jLoader, as_cypher_datetime
 from .client import Neo4jClient
 
 
@@ -86,6 +88,9 @@ class TransitionLoader(BaseNeo4jLoader):
         logger.info(f"Loading {len(transitions_df):,} transition nodes")
 
         # Convert DataFrame to list of dicts for batch processing
+        if self.bulk_import:
+            return self._stage_transition_nodes(transitions_df)
+
         batch_size = self.client.config.batch_size
         total_processed = 0
 
@@ -154,6 +159,29 @@ class TransitionLoader(BaseNeo4jLoader):
         """
         logger.info("Creating TRANSITIONED_TO relationships (FinancialTransaction → Transition)")
 
+        if self.bulk_import:
+            return self._stage_relationships(
+                "TRANSITIONED_TO",
+                [
+                    (
+                        "FinancialTransaction",
+                        "transaction_id",
+                        f"txn_award_{t['award_id']}",
+                        "Transition",
+                        "transition_id",
+                        t["transition_id"],
+                        "TRANSITIONED_TO",
+                        {
+                            "score": t.get("likelihood_score"),
+                            "confidence": t.get("confidence"),
+                            "detection_date": as_cypher_datetime(t.get("detected_at")),
+                            "evidence": t.get("evidence"),
+                        },
+                    )
+                    for t in transitions_df.to_dict("records")
+                ],
+            )
+
         batch_size = self.client.config.batch_size
         rel_count = 0
 
@@ -230,6 +258,9 @@ class TransitionLoader(BaseNeo4jLoader):
         """
         logger.info("Creating RESULTED_IN relationships (Transition → FinancialTransaction)")
 
+        if self.bulk_import:
+            return self._stage_resulted_in(transitions_df)
+
         batch_size = self.client.config.batch_size
         rel_count = 0
 
@@ -313,6 +344,28 @@ class TransitionLoader(BaseNeo4jLoader):
 
         logger.info("Creating ENABLED_BY relationships (Transition → Patent)")
 
+        if self.bulk_import:
+            now = datetime.now(UTC)
+            return self._stage_relationships(
+                "ENABLED_BY",
+                [
+                    (
+                        "Transition",
+                        "transition_id",
+                        t["transition_id"],
+                        "Patent",
+                        "patent_id",
+                        t["patent_id"],
+                        "ENABLED_BY",
+                        {
+                            "contribution_score": t.get("patent_contribution", 0.0),
+                            "creation_date": now,
+                        },
+                    )
+                    for t in patent_transitions_df.to_dict("records")
+                ],
+            )
+
         batch_size = self.client.config.batch_size
         rel_count = 0
 
@@ -383,6 +436,28 @@ class TransitionLoader(BaseNeo4jLoader):
             f"Creating INVOLVES_TECHNOLOGY relationships for {len(cet_transitions):,} transitions"
         )
 
+        if self.bulk_import:
+            now = datetime.now(UTC)
+            return self._stage_relationships(
+                "INVOLVES_TECHNOLOGY",
+                [
+                    (
+                        "Transition",
+                        "transition_id",
+                        t["transition_id"],
+                        "CETArea",
+                        "cet_id",
+                        t["cet_area"],
+                        "INVOLVES_TECHNOLOGY",
+                        {
+                            "alignment_score": t.get("cet_alignment_score", 0.0),
+                            "creation_date": now,
+                        },
+                    )
+                    for t in cet_transitions.to_dict("records")
+                ],
+            )
+
         batch_size = self.client.config.batch_size
         rel_count = 0
 
@@ -469,6 +544,83 @@ class TransitionLoader(BaseNeo4jLoader):
         # Return backward-compatible stats format
         return self.get_stats()
 
+    # -------------------------------------------------------------------------
+    # Bulk import staging
+    # -------------------------------------------------------------------------
+
+    def _stage_transition_nodes(self, transitions_df: pd.DataFrame) -> int:
+        """Stage Transition nodes with the properties the MERGE query sets."""
+        now = datetime.now(UTC)
+        nodes = [
+            {
+                "transition_id": t["transition_id"],
+                "award_id": t.get("award_id"),
+                "contract_id": t.get("contract_id"),
+                "likelihood_score": t.get("likelihood_score"),
+                "confidence": t.get("confidence"),
+                "signals": t.get("signals"),
+                "evidence": t.get("evidence"),
+                "detected_at": as_cypher_datetime(t.get("detected_at")),
+                "vendor_match_score": t.get("vendor_match_score"),
+                "updated_at": now,
+            }
+            for t in transitions_df.to_dict("records")
+        ]
+        self.metrics = self.client.batch_upsert_nodes(
+            label="Transition", key_property="transition_id", nodes=nodes, metrics=self.metrics
+        )
+        logger.info(f"✓ Staged {len(nodes):,} transition nodes for bulk import")
+        return len(nodes)
+
+    def _stage_resulted_in(self, transitions_df: pd.DataFrame) -> int:
+        """Stage contract FinancialTransaction nodes and RESULTED_IN relationships."""
+        now = datetime.now(UTC)
+        rows = [
+            (t["transition_id"], str(t["contract_id"]).strip(), t.get("confidence"))
+            for t in transitions_df.to_dict("records")
+            if pd.notna(t.get("contract_id")) and str(t["contract_id"]).strip()
+        ]
+        contracts = {
+            f"txn_contract_{contract_id}": {
+                "transaction_id": f"txn_contract_{contract_id}",
+                "transaction_type": "CONTRACT",
+                "contract_id": contract_id,
+            }
+            for _, contract_id, _ in rows
+        }
+        if contracts:
+            self.metrics = self.client.batch_upsert_nodes(
+                label="FinancialTransaction",
+                key_property="transaction_id",
+                nodes=list(contracts.values()),
+                metrics=self.metrics,
+            )
+        return self._stage_relationships(
+            "RESULTED_IN",
+            [
+                (
+                    "Transition",
+                    "transition_id",
+                    transition_id,
+                    "FinancialTransaction",
+                    "transaction_id",
+                    f"txn_contract_{contract_id}",
+                    "RESULTED_IN",
+                    {"confidence": confidence, "creation_date": now},
+                )
+                for transition_id, contract_id, confidence in rows
+            ],
+        )
+
+    def _stage_relationships(self, rel_type: str, relationships: list[tuple]) -> int:
+        """Stage relationships through the bulk import client."""
+        if relationships:
+            self.metrics = self.client.batch_create_relationships(
+                relationships, metrics=self.metrics
+            )
+        logger.info(f"✓ Staged {len(relationships):,} {rel_type} relationships for bulk import")
+        return len(relationships)
+
     def get_stats(self) -> dict[str, int]:
         """Return loading statistics in backward-compatible format."""
         return {
@@ -275,6 +275,30 @@ class TransitionDetector:
         )
         return None
 
+    def _prefetch_vendor_names(self, contracts: Iterable[FederalContract]) -> None:
+        """Batch-resolve names of contracts that no vendor identifier resolves."""
+        names = {
+            contract.vendor_name
+            for contract in contracts
+            if contract.vendor_name
+            and not (
+                (
+                    contract.vendor_uei
+                    and self.vendor_resolver.resolve_by_uei(contract.vendor_uei).record
+                )
+                or (
+                    contract.vendor_cage
+                    and self.vendor_resolver.resolve_by_cage(contract.vendor_cage).record
+                )
+                or (
+                    contract.vendor_duns
+                    and self.vendor_resolver.resolve_by_duns(contract.vendor_duns).record
+                )
+            )
+        }
+        if names:
+            self.vendor_resolver.resolve_many(sorted(names))
+
     def detect_for_award(
         self,
         award: dict[str, Any],
@@ -430,6 +454,22 @@ class TransitionDetector:
             },
         )
 
+        # Fuzzy-resolve candidate vendor names in one batched lookup so that
+        # match_vendor answers them from the resolver cache.
+        award_vendor_ids = {
+            award.get("vendor_uei")
+            or award.get("vendor_cage")
+            or award.get("vendor_duns")
+            or award.get("vendor_name")
+            for award in awards
+        }
+        self._prefetch_vendor_names(
+            contract
+            for vendor_id, vendor_contracts in contract_map.items()
+            if vendor_id in award_vendor_ids
+            for contract in vendor_contracts
+        )
+
         # Process awards in batches
         total_awards = len(awards)
         pbar = tqdm(total=total_awards, desc="Detecting transitions") if show_progress else None
@@ -0,0 +1,159 @@
+# packages/sbir-ml/sbir_ml/transition/features/name_index.py
+"""
+Candidate index for fuzzy vendor-name lookup.
+
+`VendorResolver` and `VendorCrosswalk` both fall back to fuzzy matching when a
+normalized vendor key has no exact hit. Scoring every indexed key in a Python
+loop makes each unresolved vendor cost O(vendors) interpreter calls. This index
+keeps the keys in a frozen array and scores a query (or a batch of queries)
+against all of them with rapidfuzz's native ``process.cdist`` using the same
+token-sort scorer as ``company_name_similarity``. Without rapidfuzz it falls
+back to the original per-key loop.
+
+Results are identical to the loop it replaces: scores are on the 0..1 scale,
+blank keys score 0.0, and ties go to the key indexed first.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from sbir_etl.identity import (
+    CompanyNameMetric,
+    company_name_similarity,
+    native_rapidfuzz_scorer,
+)
+
+
+try:
+    import numpy as np
+    from rapidfuzz import process
+except Exception:
+    np = None  # type: ignore[assignment]
+    process = None  # type: ignore[assignment]
+
+
+# The shared contract's token-sort scorer, in the native form cdist needs.
+_TOKEN_SORT_SCORER = native_rapidfuzz_scorer(CompanyNameMetric.TOKEN_SORT)
+
+
+# Upper bound on query x key cells scored per cdist call (float64 matrix).
+_MAX_BLOCK_CELLS = 1 << 22
+
+
+class NameCandidateIndex:
+    """Insertion-ordered set of normalized name keys with batched fuzzy lookup.
+
+    Keys are appended as they are added; removals leave a tombstone so the
+    remaining keys keep their order, and the frozen array is rebuilt lazily on
+    the next lookup after any change.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        self._slots: list[str | None] = []
+        self._positions: dict[str, int] = {}
+        self._frozen: list[str] | None = None
+        self._dead = 0
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def add(self, key: str) -> None:
+        """Index a key (no-op if it is already indexed)."""
+        if key in self._positions:
+            return
+        self._positions[key] = len(self._slots)
+        self._slots.append(key)
+        self._frozen = None
+
+    def discard(self, key: str) -> None:
+        """Remove a key; re-adding it later places it after existing keys."""
+        pos = self._positions.pop(key, None)
+        if pos is None:
+            return
+        self._slots[pos] = None
+        self._dead += 1
+        self._frozen = None
+        if self._dead > len(self._positions):
+            self._compact()
+
+    def _compact(self) -> None:
+        self._slots = [key for key in self._slots if key is not None]
+        self._positions = {key: i for i, key in enumerate(self._slots)}  # type: ignore[misc]
+        self._dead = 0
+
+    def _freeze(self) -> list[str]:
+        if self._frozen is None:
+            # Blank keys never match (company_name_similarity returns 0.0 for
+            # them), so they are excluded from the scored array.
+            self._frozen = [k for k in self._slots if k is not None and k.strip()]
+        return self._frozen
+
+    def best_match(self, query: str, score_cutoff: float = 0.0) -> tuple[str | None, float]:
+        """Return ``(key, score)`` of the best-scoring key, or ``(None, 0.0)``.
+
+        Args:
+            query: Normalized name to look up
+            score_cutoff: Minimum score (0..1) for a key to be returned
+
+        Returns:
+            The first indexed key with the highest score, if that score is
+            positive and at least ``score_cutoff``
+        """
+        return self.best_matches([query], score_cutoff=score_cutoff)[0]
+
+    def best_matches(
+        self, queries: Sequence[str], score_cutoff: float = 0.0
+    ) -> list[tuple[str | None, float]]:
+        """Batch form of :meth:`best_match`, one result per query."""
+        keys = self._freeze()
+        results: list[tuple[str | None, float]] = [(None, 0.0)] * len(queries)
+        live = [i for i, q in enumerate(queries) if q and q.strip()]
+        if not keys or not live:
+            return results
+
+        if process is None or _TOKEN_SORT_SCORER is None:
+            for i in live:
+                results[i] = self._best_match_loop(queries[i], keys, score_cutoff)
+            return results
+
+        block = max(1, _MAX_BLOCK_CELLS // len(keys))
+        for start in range(0, len(live), block):
+            rows = live[start : start + block]
+            scores = process.cdist(
+                [queries[i] for i in rows],
+                keys,
+                scorer=_TOKEN_SORT_SCORER,
+                dtype=np.float64,
+                # Slightly below the cutoff so float rounding of ``t * 100``
+                # cannot drop a key the loop would accept; the exact
+                # comparison happens on the 0..1 score below.
+                score_cutoff=max(0.0, score_cutoff * 100.0 - 1e-6),
+                workers=-1,
+            )
+            best = scores.argmax(axis=1)
+            for row, i in enumerate(rows):
+                score = float(scores[row, best[row]]) / 100.0
+                if score > 0.0 and score >= score_cutoff:
+                    results[i] = (keys[best[row]], score)
+        return results
+
+    @staticmethod
+    def _best_match_loop(
+        query: str, keys: list[str], score_cutoff: float
+    ) -> tuple[str | None, float]:
+        best_score = 0.0
+        best_key: str | None = None
+        for key in keys:
+            score = company_name_similarity(query, key, metric=CompanyNameMetric.TOKEN_SORT)
+            if score > best_score:
+                best_score = score
+                best_key = key
+        if best_key is None or best_score < score_cutoff:
+            return None, 0.0
+        return best_key, best_score
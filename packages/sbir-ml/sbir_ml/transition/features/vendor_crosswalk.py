@@ -40,6 +40,7 @@ from sbir_etl.identity import (
     company_name_similarity,
     normalize_company_name,
 )
+from sbir_ml.transition.features.name_index import NameCandidateIndex
 
 
 # Optional dependencies
@@ -171,6 +172,7 @@ class VendorCrosswalk:
         self._cage_index: dict[str, str] = {}
         self._duns_index: dict[str, str] = {}
         self._name_index: dict[str, list[str]] = {}  # normalized name -> list of canonical_id
+        self._name_candidates = NameCandidateIndex()  # fuzzy lookup over _name_index keys
         if records:
             for r in records:
                 self.add_or_merge(r)
@@ -219,6 +221,7 @@ class VendorCrosswalk:
         nm = _normalize_name(rec.canonical_name)
         if nm:
             self._name_index.setdefault(nm, []).append(rec.canonical_id)
+            self._name_candidates.add(nm)
         logger.info("Added new crosswalk record: %s (%s)", rec.canonical_id, rec.canonical_name)
         return rec
 
@@ -270,6 +273,7 @@ class VendorCrosswalk:
             self._name_index[nm] = [cid for cid in self._name_index[nm] if cid != canonical_id]
             if not self._name_index[nm]:
                 self._name_index.pop(nm, None)
+                self._name_candidates.discard(nm)
         logger.info("Removed crosswalk record %s", canonical_id)
         return True
 
@@ -318,13 +322,8 @@ class VendorCrosswalk:
         if cids:
             return (self.records[cids[0]], 1.0) if len(cids) == 1 else None
         # fuzzy choose best across canonical names
-        best_score = 0.0
-        best_cids: list[str] = []
-        for canon_name, cid_list in self._name_index.items():
-            score = _fuzzy_score(norm, canon_name)
-            if score > best_score:
-                best_score = score
-                best_cids = cid_list
+        best_name, best_score = self._name_candidates.best_match(norm, score_cutoff=fuzzy_threshold)
+        best_cids = self._name_index[best_name] if best_name is not None else []
         if best_score >= fuzzy_threshold and len(best_cids) == 1:
             return self.records[best_cids[0]], best_score
         return None
@@ -395,6 +394,7 @@ class VendorCrosswalk:
             indexed = self._name_index.setdefault(alias_key, [])
             if canonical_id not in indexed:
                 indexed.append(canonical_id)
+            self._name_candidates.add(alias_key)
         logger.info("Added alias '%s' to %s", alias_name, canonical_id)
         return True
 
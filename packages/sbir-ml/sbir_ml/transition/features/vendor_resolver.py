@@ -39,6 +39,7 @@ from typing import Any
 from loguru import logger
 
 from sbir_etl.identity import CompanyNameProfile, normalize_company_name
+from sbir_ml.transition.features.name_index import NameCandidateIndex
 from sbir_ml.transition.features.vendor_crosswalk import _fuzzy_score as _crosswalk_fuzzy_score
 
 
@@ -98,8 +99,9 @@ class VendorResolver:
       5. Fuzzy name match (threshold configurable)
 
     The resolver maintains small indices on UEI/CAGE/DUNS and a name index for
-    fast lookups. For fuzzy matching, it will use rapidfuzz.fuzz.ratio if available;
-    otherwise it falls back to difflib.SequenceMatcher ratio.
+    fast lookups. Fuzzy matching scores the query against every indexed name
+    through a shared NameCandidateIndex (rapidfuzz ``cdist`` when available,
+    otherwise a difflib loop); use resolve_many to score a batch of names at once.
     """
 
     def __init__(
@@ -117,6 +119,8 @@ class VendorResolver:
         self._duns_index: dict[str, VendorRecord] = {}
         # Name index: normalized lowercase name -> list of records (to support duplicates)
         self._name_index: dict[str, list[VendorRecord]] = {}
+        # Fuzzy candidates over the keys of _name_index, in insertion order
+        self._name_candidates = NameCandidateIndex()
 
         # Cache resolved queries for speed (simple in-memory)
         self._cache: dict[tuple[str, str], ResolverMatch] = {}
@@ -154,6 +158,7 @@ class VendorResolver:
                     self._duns_index[key] = r
             nm = self._normalize_name(r.name)
             self._name_index.setdefault(nm, []).append(r)
+            self._name_candidates.add(nm)
         logger.info("VendorResolver loaded {} vendor records", count)
 
     # -----------------------------
@@ -223,36 +228,71 @@ class VendorResolver:
             self._cache[cache_key] = result
             return result
 
-        # Fuzzy search: compute best candidate across known names
-        best_score = 0.0
-        best_record: VendorRecord | None = None
-        # Iterate through indexed names and compute fuzzy score
-        for indexed_name, recs in self._name_index.items():
-            s = self._fuzzy_score(norm, indexed_name)
-            if s > best_score:
-                best_score = s
-                best_record = self._choose_preferred_record(recs)
+        # Fuzzy search: best candidate across known names
+        best_name, best_score = self._name_candidates.best_match(
+            norm, score_cutoff=min(self.fuzzy_threshold, self.fuzzy_secondary_threshold)
+        )
+        result = self._fuzzy_result(best_name, best_score)
+        self._cache[cache_key] = result
+        return result
+
+    def resolve_many(
+        self, names: Iterable[str], prefer_identifiers: bool = True
+    ) -> list[ResolverMatch]:
+        """
+        Resolve a batch of vendor names; results match calling resolve_by_name per name.
+
+        Cached and exact-key names are answered directly. The remaining names are
+        fuzzy-scored against the name index in one batched lookup and cached.
+        """
+        names = list(names)
+        results: list[ResolverMatch | None] = [None] * len(names)
+        pending: dict[str, list[int]] = {}
+        for i, name in enumerate(names):
+            cache_key = ("name", name or "")
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                results[i] = cached
+            elif not name or self._normalize_name(name) in self._name_index:
+                results[i] = self.resolve_by_name(name, prefer_identifiers=prefer_identifiers)
+            else:
+                pending.setdefault(name, []).append(i)
+
+        if pending:
+            queries = list(pending)
+            matches = self._name_candidates.best_matches(
+                [self._normalize_name(name) for name in queries],
+                score_cutoff=min(self.fuzzy_threshold, self.fuzzy_secondary_threshold),
+            )
+            for name, (best_name, best_score) in zip(queries, matches, strict=True):
+                result = self._fuzzy_result(best_name, best_score)
+                self._cache[("name", name)] = result
+                for i in pending[name]:
+                    results[i] = result
+        return results  # type: ignore[return-value]
+
+    def _fuzzy_result(self, best_name: str | None, best_score: float) -> ResolverMatch:
+        """Apply the primary/secondary fuzzy thresholds to the best candidate."""
+        best_record = (
+            self._choose_preferred_record(self._name_index[best_name])
+            if best_name is not None
+            else None
+        )
 
         # Decide if best_score is acceptable
         if best_score >= self.fuzzy_threshold:
-            result = ResolverMatch(record=best_record, method="name_fuzzy", score=best_score)
-            self._cache[cache_key] = result
-            return result
+            return ResolverMatch(record=best_record, method="name_fuzzy", score=best_score)
 
         # If secondary threshold met, return as lower-confidence match
         if best_score >= self.fuzzy_secondary_threshold:
-            result = ResolverMatch(
+            return ResolverMatch(
                 record=best_record,
                 method="name_fuzzy_secondary",
                 score=best_score,
                 note="secondary threshold met",
             )
-            self._cache[cache_key] = result
-            return result
 
-        result = ResolverMatch(record=None, method="name", score=0.0, note="no reliable match")
-        self._cache[cache_key] = result
-        return result
+        return ResolverMatch(record=None, method="name", score=0.0, note="no reliable match")
 
     def _choose_preferred_record(self, recs: list[VendorRecord]) -> VendorRecord:
         """
@@ -334,6 +374,7 @@ class VendorResolver:
             self._duns_index[str(rec.duns).strip()] = rec
         nm = self._normalize_name(rec.name)
         self._name_index.setdefault(nm, []).append(rec)
+        self._name_candidates.add(nm)
         # Clear caches (conservative)
         self._cache.clear()
 
@@ -350,8 +391,12 @@ class VendorResolver:
             if rec.duns:
                 self._duns_index.pop(str(rec.duns).strip(), None)
             nm = self._normalize_name(rec.name)
-            lst = self._name_index.get(nm, [])
-            self._name_index[nm] = [r for r in lst if r is not rec]
+            remaining = [r for r in self._name_index.get(nm, []) if r is not rec]
+            if remaining:
+                self._name_index[nm] = remaining
+            else:
+                self._name_index.pop(nm, None)
+                self._name_candidates.discard(nm)
         except (KeyError, AttributeError) as exc:
             logger.warning("Error removing record from indices for uei={}: {}", uei, exc)
         self._cache.clear()
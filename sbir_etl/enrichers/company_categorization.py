@@ -699,6 +699,45 @@ def retrieve_sbir_awards_api(
 # ---------------------------------------------------------------------------
 
 
+def _company_identifier_frame(
+    companies: pd.DataFrame, columns: dict[str, str]
+) -> tuple[pd.DataFrame, list[str]]:
+    """Long (company_key, kind, value) frame of each company's identifiers.
+
+    ``company_key`` is the first valid identifier of UEI, DUNS, CAGE. When
+    several companies share a key the last one wins, as when results are keyed
+    in a dict. Returns the frame and the distinct company keys.
+    """
+    present = {
+        kind: companies[col]
+        .where(companies[col].map(_is_valid_identifier))
+        .map(str, na_action="ignore")
+        for kind, col in columns.items()
+        if col in companies.columns
+    }
+    key = pd.Series(None, index=companies.index, dtype=object)
+    for kind in ("cage", "duns", "uei"):
+        if kind in present:
+            key = present[kind].where(present[kind].notna(), key)
+
+    skipped = int(key.isna().sum())
+    if skipped:
+        logger.warning(f"{skipped} companies have no identifiers, skipping")
+    key = key.dropna()
+    key = key[~key.duplicated(keep="last")]
+
+    frames = [
+        pd.DataFrame({"company_key": key, "kind": kind, "value": values[key.index]}).dropna()
+        for kind, values in present.items()
+    ]
+    ids = (
+        pd.concat(frames, ignore_index=True).drop_duplicates()
+        if frames
+        else pd.DataFrame(columns=["company_key", "kind", "value"])
+    )
+    return ids, key.tolist()
+
+
 def batch_retrieve_company_contracts(
     extractor: DuckDBUSAspendingExtractor,
     companies: pd.DataFrame,
@@ -706,23 +745,114 @@ def batch_retrieve_company_contracts(
     duns_col: str = "company_duns",
     cage_col: str = "company_cage",
     batch_size: int = 100,
+    table_name: str = "usaspending_awards",
 ) -> dict[str, pd.DataFrame]:
-    """Retrieve contracts for many companies; keyed by UEI/DUNS/CAGE."""
-    results: dict[str, pd.DataFrame] = {}
-    total = len(companies)
-    for i in range(0, total, batch_size):
-        batch = companies.iloc[i : i + batch_size]
-        logger.info(
-            f"Processing batch {i // batch_size + 1} ({i + 1}-{min(i + batch_size, total)} of {total})"
-        )
-        for _, company in batch.iterrows():
-            uei = company.get(uei_col) if uei_col in company else None
-            duns = company.get(duns_col) if duns_col in company else None
-            cage = company.get(cage_col) if cage_col in company else None
-            key = uei or duns or cage
-            if not key:
-                logger.warning("Company has no identifiers, skipping")
-                continue
-            results[key] = retrieve_company_contracts(extractor, uei=uei, duns=duns, cage=cage)
-    logger.info(f"Retrieved contracts for {len(results)} companies")
+    """Retrieve non-SBIR contracts for many companies in one scan of the dump.
+
+    The company identifiers are registered as a temporary DuckDB relation and
+    semi-joined against the UEI/DUNS/CAGE columns, so the table and its SBIR
+    keyword predicate are evaluated once per row regardless of how many
+    companies are requested. Matched rows are split back out per company and
+    post-processed exactly like ``retrieve_company_contracts``.
+
+    Args:
+        extractor: DuckDB USAspending extractor
+        companies: One row per company with identifier columns
+        uei_col: UEI column name
+        duns_col: DUNS column name
+        cage_col: CAGE column name
+        batch_size: Unused; retained for API compatibility (the batch path is a
+            single query)
+        table_name: USAspending table or view to scan
+
+    Returns:
+        Mapping from each company's key (UEI, else DUNS, else CAGE) to its
+        contracts; companies without contracts map to an empty DataFrame
+    """
+    del batch_size
+    ids, company_keys = _company_identifier_frame(
+        companies, {"uei": uei_col, "duns": duns_col, "cage": cage_col}
+    )
+    results: dict[str, pd.DataFrame] = {key: pd.DataFrame() for key in company_keys}
+    if ids.empty:
+        return results
+
+    # (id_alias, kind) for every identifier column a company may match on.
+    id_columns = [
+        (f"_id_{kind}_{i}", kind, col)
+        for kind, cols in _IDENTIFIER_COLUMNS.items()
+        for i, col in enumerate(cols)
+    ]
+    match_clause = " OR ".join(
+        f"CAST({col} AS VARCHAR) IN (SELECT value FROM _company_ids WHERE kind = '{kind}')"
+        for _, kind, col in id_columns
+    )
+    query = f"""
+    SELECT COALESCE(award_id_piid, piid, fain, uri, award_id) as award_id,
+           product_or_service_code as psc,
+           type_of_contract_pricing as contract_type,
+           type_of_contract_pricing as pricing,
+           award_description as description,
+           CAST(federal_action_obligation as DOUBLE) as award_amount,
+           recipient_uei, awardee_or_recipient_uei,
+           COALESCE(recipient_duns, awardee_or_recipient_uniqu) as recipient_duns,
+           cage_code, action_date, fiscal_year,
+           {", ".join(f"CAST({col} AS VARCHAR) as {alias}" for alias, _, col in id_columns)}
+    FROM {table_name}
+    WHERE ({match_clause})
+      AND federal_action_obligation IS NOT NULL
+      AND federal_action_obligation != 0
+      AND (award_description IS NULL OR NOT ({_SBIR_SQL_PREDICATE}))
+    """
+
+    conn = extractor.connect()
+    try:
+        conn.register("_company_ids", ids)
+        rows = conn.execute(query).fetchdf()
+    except Exception as e:
+        logger.error(f"Failed to batch query USAspending for {len(company_keys)} companies: {e}")
+        return results
+    finally:
+        try:
+            conn.unregister("_company_ids")
+        except Exception:
+            pass
+
+    if rows.empty:
+        logger.info(f"Retrieved contracts for 0 of {len(company_keys)} companies")
+        return results
+
+    rows["recipient_uei"] = rows["recipient_uei"].fillna(rows["awardee_or_recipient_uei"])
+    rows = rows.drop(columns=["awardee_or_recipient_uei"])
+    rows = rows[rows["award_id"].notna()].reset_index(drop=True)
+    rows["award_amount"] = pd.to_numeric(rows["award_amount"], errors="coerce")
+    # Phase extraction once per distinct description, not per company.
+    descriptions = rows["description"].drop_duplicates()
+    rows["sbir_phase"] = rows["description"].map(
+        dict(zip(descriptions, descriptions.map(_extract_sbir_phase), strict=True))
+    )
+
+    # (row, company) pairs from every identifier column the row matched on.
+    pairs = pd.concat(
+        [
+            rows[[alias]]
+            .reset_index()
+            .merge(ids[ids["kind"] == kind], left_on=alias, right_on="value")[
+                ["index", "company_key"]
+            ]
+            for alias, kind, _ in id_columns
+        ],
+        ignore_index=True,
+    ).drop_duplicates()
+    contracts = rows.drop(columns=[alias for alias, _, _ in id_columns])
+
+    matched = 0
+    for key, group in pairs.groupby("company_key", sort=False):
+        company_rows = contracts.loc[group["index"].sort_values()]
+        results[str(key)] = company_rows.drop_duplicates(subset=["award_id"]).reset_index(drop=True)
+        matched += 1
+    logger.info(
+        f"Retrieved {len(contracts)} non-SBIR awards for {matched} of "
+        f"{len(company_keys)} companies in one scan"
+    )
     return results
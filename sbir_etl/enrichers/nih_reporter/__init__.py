@@ -21,7 +21,10 @@ from sbir_etl.enrichers.nih_reporter.keys import (
     parse_refresh_window,
 )
 from sbir_etl.enrichers.nih_reporter.persist import (
+    compact_nih_reporter_awards,
     nih_reporter_awards_path,
+    read_nih_reporter_awards,
+    upsert_nih_reporter_award_batches,
     upsert_nih_reporter_awards,
 )
 from sbir_etl.enrichers.nih_reporter.requests import (
@@ -48,11 +51,14 @@ __all__ = [
     "NIHWindowKind",
     "build_nih_reporter_requests",
     "canonicalize_nih_query_key",
+    "compact_nih_reporter_awards",
     "frame_to_nih_requests",
     "load_sbir_award_frame",
     "nih_ids_needing_refresh",
     "nih_reporter_awards_path",
     "normalize_reporter_result",
     "parse_refresh_window",
+    "read_nih_reporter_awards",
+    "upsert_nih_reporter_award_batches",
     "upsert_nih_reporter_awards",
 ]
@@ -3,6 +3,11 @@
 Epistemic tier: pipelines. Exact ``project_num`` + FY lookup stays on the
 client; this module exposes the shared refresh lifecycle and persists the
 project table.
+
+Fetched records are buffered and written ``persist_every`` awards at a time
+with ``upsert_nih_reporter_award_batches``. When the adapter shares a
+``FreshnessStore`` with the runner, the buffer is also written before each
+ledger flush, so an award is never marked fresh ahead of its rows.
 """
 
 from __future__ import annotations
@@ -14,7 +19,7 @@ from typing import Any
 
 from sbir_etl.enrichers.nih_reporter.client import NIH_REPORTER_CITATION, NIHReporterAPIClient
 from sbir_etl.enrichers.nih_reporter.keys import NIHWindowKind, parse_refresh_window
-from sbir_etl.enrichers.nih_reporter.persist import upsert_nih_reporter_awards
+from sbir_etl.enrichers.nih_reporter.persist import upsert_nih_reporter_award_batches
 from sbir_etl.enrichers.nih_reporter.schema import NIHReporterRecord
 from sbir_etl.enrichers.source_adapter import QualityResult, RawPage, SourceProvenance
 from sbir_etl.utils.async_tools import run_sync
@@ -35,12 +40,28 @@ class NIHReporterSourceAdapter:
         *,
         freshness: FreshnessStore | None = None,
         persist_path: Path | None = None,
+        persist_every: int = 50,
     ) -> None:
         self._client = client or NIHReporterAPIClient()
         self._freshness = freshness
         self._persist_path = persist_path
+        self._persist_every = max(1, persist_every)
+        self._unpersisted: list[tuple[str, list[NIHReporterRecord]]] = []
+        if freshness is not None:
+            freshness.add_flush_hook(self.flush)
+
+    def flush(self) -> None:
+        """Write buffered records to the project table."""
+
+        if not self._unpersisted:
+            return
+        batches, self._unpersisted = self._unpersisted, []
+        upsert_nih_reporter_award_batches(batches, path=self._persist_path)
 
     def fetch_page(self, request: Mapping[str, Any], cursor: str | None) -> RawPage:
+        return run_sync(self.afetch_page(request, cursor))
+
+    async def afetch_page(self, request: Mapping[str, Any], cursor: str | None) -> RawPage:
         del cursor
         award_id = str(request.get("award_id") or "")
         project_nums = _project_nums(request)
@@ -58,12 +79,10 @@ class NIHReporterSourceAdapter:
                 record_id=award_id or "unknown",
             )
 
-        records = run_sync(
-            self._client.lookup_projects(
-                project_nums,
-                award_year,
-                window=_lookup_window(request.get("window")),
-            )
+        records = await self._client.lookup_projects(
+            project_nums,
+            award_year,
+            window=_lookup_window(request.get("window")),
         )
         payload_hash = _payload_hash(self._client, records)
         previous = None
@@ -72,11 +91,11 @@ class NIHReporterSourceAdapter:
         previous_hash = previous.payload_hash if previous is not None else None
         delta_detected = previous_hash is None or previous_hash != payload_hash
         if records:
-            upsert_nih_reporter_awards(
-                records,
-                award_id=award_id,
-                path=self._persist_path,
-            )
+            # Runs on the loop thread between awaits, so concurrent fetches
+            # never write the project table at the same time.
+            self._unpersisted.append((award_id, list(records)))
+            if len(self._unpersisted) >= self._persist_every:
+                self.flush()
         return RawPage(
             payload={
                 "success": True,
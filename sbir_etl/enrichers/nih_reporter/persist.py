@@ -3,29 +3,90 @@
 Epistemic tier: pipelines. Official row id is ``appl_id``. Award-level
 replace uses ``(canonical project_num, fy)``; multiple ``appl_id``s for one
 upsert key are retained, not collapsed.
+
+The table is a hive-partitioned Parquet dataset. It keeps the historical
+``nih_reporter_awards.parquet`` path, which now names a directory rather than a
+single file. Each upsert key hashes to one of ``NIH_REPORTER_BUCKETS``
+``bucket=NN`` directories, each holding one or more part files with a fixed
+Arrow schema. An upsert only touches the buckets of the keys it writes:
+
+- part files holding a replaced key are rewritten without it (or removed when
+  nothing else is left), which only requires reading their ``upsert_key``
+  column to find them;
+- the new rows land in a fresh part file, so adding a key never rewrites
+  existing data.
+
+A bucket that passes ``NIH_REPORTER_MAX_PARTS`` part files is merged back into
+one on the upsert that crossed the limit, so the files an upsert has to scan
+stay bounded however many upserts came before it.
+``compact_nih_reporter_awards`` merges every bucket the same way, and migrates
+a table still stored in the single-file layout. Readers use
+``read_nih_reporter_awards`` (one dataset scan) or point any Parquet reader at
+the directory.
 """
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import os
+import uuid
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
 
 from sbir_etl.enrichers.nih_reporter.schema import NIHReporterRecord
 from sbir_etl.utils.cloud_storage import get_data_root
-from sbir_etl.utils.data.file_io import save_dataframe_parquet
 from sbir_etl.utils.path_utils import ensure_parent_dir
 
 
 EPISTEMIC_TIER = "pipelines"
 
 NIH_REPORTER_AWARDS_NAME = "nih_reporter_awards.parquet"
+NIH_REPORTER_BUCKETS = 32
+NIH_REPORTER_MAX_PARTS = 8
+
+BUCKET_COLUMN = "bucket"
+BUCKETS_STAMP = "_buckets"
+
+NIH_REPORTER_AWARDS_SCHEMA = pa.schema(
+    [
+        ("appl_id", pa.string()),
+        ("fy", pa.int64()),
+        ("project_num", pa.string()),
+        ("core_project_num", pa.string()),
+        ("activity_code", pa.string()),
+        ("agency_ic_admin", pa.string()),
+        ("org_name", pa.string()),
+        ("org_uei", pa.string()),
+        ("org_duns", pa.string()),
+        ("org_ueis", pa.list_(pa.string())),
+        ("org_duns_values", pa.list_(pa.string())),
+        ("pi_names", pa.list_(pa.string())),
+        ("project_title", pa.string()),
+        ("abstract_text", pa.string()),
+        ("award_amount", pa.float64()),
+        ("foa_number", pa.string()),
+        ("study_section", pa.string()),
+        ("source", pa.string()),
+        ("last_refreshed_at", pa.string()),
+        ("payload_hash", pa.string()),
+        ("award_id", pa.string()),
+        ("project_num_canonical", pa.string()),
+        ("upsert_key", pa.string()),
+    ]
+)
 
 
 def nih_reporter_awards_path() -> Path:
-    """Canonical location of the persisted RePORTER project table."""
+    """Canonical location of the persisted RePORTER project table (a dataset directory)."""
 
     return get_data_root() / "derived" / NIH_REPORTER_AWARDS_NAME
 
@@ -36,6 +97,12 @@ def upsert_key_text(canonical_project_num: str, fy: int) -> str:
     return f"{canonical_project_num}|{fy}"
 
 
+def upsert_key_bucket(upsert_key: str, buckets: int = NIH_REPORTER_BUCKETS) -> int:
+    """Partition an upsert key hashes to (stable across processes and runs)."""
+
+    return zlib.crc32(upsert_key.encode("utf-8")) % buckets
+
+
 def upsert_nih_reporter_awards(
     records: Sequence[NIHReporterRecord],
     *,
@@ -44,35 +111,195 @@ def upsert_nih_reporter_awards(
 ) -> Path | None:
     """Replace persisted rows for each upsert key present in ``records``.
 
-    An empty fetch does not delete existing rows. Returns the path written,
-    or ``None`` when there is nothing to persist.
+    An empty fetch does not delete existing rows. Returns the dataset path
+    written, or ``None`` when there is nothing to persist.
     """
 
-    rows: list[dict[str, Any]] = []
-    keys: set[str] = set()
-    for record in records:
-        key = record.upsert_key()
-        if key is None:
-            continue
-        mapping = record.to_mapping()
-        mapping["award_id"] = award_id
-        mapping["project_num_canonical"] = key[0]
-        mapping["upsert_key"] = upsert_key_text(key[0], key[1])
-        rows.append(mapping)
-        keys.add(mapping["upsert_key"])
-    if not rows:
+    return upsert_nih_reporter_award_batches([(award_id, records)], path=path)
+
+
+def upsert_nih_reporter_award_batches(
+    batches: Iterable[tuple[str, Sequence[NIHReporterRecord]]],
+    *,
+    path: Path | None = None,
+    buckets: int = NIH_REPORTER_BUCKETS,
+    max_parts: int = NIH_REPORTER_MAX_PARTS,
+) -> Path | None:
+    """Upsert the records of many awards, touching each bucket once.
+
+    Args:
+        batches: ``(award_id, records)`` pairs; a later pair replaces rows an
+            earlier one wrote for the same upsert key
+        path: Dataset directory (defaults to ``nih_reporter_awards_path()``)
+        buckets: Partition count for a new dataset
+        max_parts: Part files a bucket may hold before it is compacted
+
+    Returns:
+        The dataset path, or ``None`` when there is nothing to persist.
+    """
+
+    rows_by_key: dict[str, list[dict[str, Any]]] = {}
+    for award_id, records in batches:
+        award_rows: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for record in records:
+            record_key = record.upsert_key()
+            if record_key is None:
+                continue
+            mapping = record.to_mapping()
+            mapping["award_id"] = award_id
+            mapping["project_num_canonical"] = record_key[0]
+            mapping["upsert_key"] = upsert_key_text(*record_key)
+            award_rows[mapping["upsert_key"]].append(mapping)
+        rows_by_key.update(award_rows)
+    if not rows_by_key:
         return None
 
     dest = path or nih_reporter_awards_path()
-    ensure_parent_dir(dest)
-    existing = _load_existing(dest)
-    if not existing.empty and "upsert_key" in existing.columns:
-        existing = existing.loc[~existing["upsert_key"].isin(keys)].copy()
-    combined = pd.concat([existing, pd.DataFrame(rows)], ignore_index=True)
-    return save_dataframe_parquet(combined, dest, index=False)
-
-
-def _load_existing(path: Path) -> pd.DataFrame:
-    if not path.is_file():
-        return pd.DataFrame()
-    return pd.read_parquet(path)
+    if dest.is_file():
+        compact_nih_reporter_awards(dest, buckets=buckets)
+    if dest.is_dir():
+        buckets = _bucket_count(dest)
+    else:
+        _stamp_bucket_count(dest, buckets)
+
+    by_bucket: dict[int, dict[str, list[dict[str, Any]]]] = defaultdict(dict)
+    for key, rows in rows_by_key.items():
+        by_bucket[upsert_key_bucket(key, buckets)][key] = rows
+    for bucket, keyed_rows in sorted(by_bucket.items()):
+        bucket_dir = dest / f"{BUCKET_COLUMN}={bucket:02d}"
+        # Drop replaced keys before adding their new rows: a crash in between
+        # loses the award's rows (it is refetched, its ledger entry was never
+        # written) rather than leaving duplicates behind.
+        _remove_keys(bucket_dir, set(keyed_rows))
+        new_rows = [row for rows in keyed_rows.values() for row in rows]
+        _write_part(bucket_dir, _to_table(pd.DataFrame(new_rows)))
+        if len(list(bucket_dir.glob("*.parquet"))) > max_parts:
+            _compact_bucket(bucket_dir)
+    return dest
+
+
+def read_nih_reporter_awards(path: Path | None = None) -> pd.DataFrame:
+    """Load the whole table with one dataset scan (either layout)."""
+
+    dest = path or nih_reporter_awards_path()
+    if dest.is_file():
+        return pd.read_parquet(dest)
+    if not dest.is_dir():
+        return pd.DataFrame(columns=NIH_REPORTER_AWARDS_SCHEMA.names)
+    return _dataset(dest).to_table(columns=NIH_REPORTER_AWARDS_SCHEMA.names).to_pandas()
+
+
+def compact_nih_reporter_awards(
+    path: Path | None = None, *, buckets: int = NIH_REPORTER_BUCKETS
+) -> dict[str, int]:
+    """Merge each bucket's part files into one; migrate a single-file table.
+
+    Returns counts of buckets rewritten, part files removed, and rows kept.
+    """
+
+    dest = path or nih_reporter_awards_path()
+    stats = {"buckets": 0, "files_removed": 0, "rows": 0}
+    if dest.is_file():
+        # Raises on an unreadable file rather than replacing it with nothing.
+        legacy = _to_table(pd.read_parquet(dest))
+        staging = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}")
+        _stamp_bucket_count(staging, buckets)
+        keys = legacy.column("upsert_key").to_pylist()
+        bucket_ids = pa.array([upsert_key_bucket(key, buckets) for key in keys])
+        for bucket in sorted(set(bucket_ids.to_pylist())):
+            mask = pc.equal(bucket_ids, bucket)
+            _write_part(staging / f"{BUCKET_COLUMN}={bucket:02d}", legacy.filter(mask))
+            stats["buckets"] += 1
+        stats["files_removed"] = 1
+        stats["rows"] = legacy.num_rows
+        dest.unlink()
+        os.replace(staging, dest)
+        logger.info(f"Migrated {dest} to {stats['buckets']} partitions")
+        return stats
+    if not dest.is_dir():
+        return stats
+
+    for bucket_dir in sorted(dest.glob(f"{BUCKET_COLUMN}=*")):
+        parts = sorted(bucket_dir.glob("*.parquet"))
+        stats["rows"] += sum(pq.ParquetFile(part).metadata.num_rows for part in parts)
+        if len(parts) <= 1:
+            continue
+        _compact_bucket(bucket_dir, parts)
+        stats["buckets"] += 1
+        stats["files_removed"] += len(parts)
+    return stats
+
+
+def _compact_bucket(bucket_dir: Path, parts: list[Path] | None = None) -> None:
+    parts = parts if parts is not None else sorted(bucket_dir.glob("*.parquet"))
+    merged = pa.concat_tables(
+        pq.read_table(part, schema=NIH_REPORTER_AWARDS_SCHEMA) for part in parts
+    )
+    # The merged file replaces the first part before the rest are removed.
+    _write_part(bucket_dir, merged, target=parts[0])
+    for part in parts[1:]:
+        part.unlink()
+
+
+def _bucket_count(dest: Path) -> int:
+    """Partition count the dataset at ``dest`` was created with."""
+
+    return int((dest / BUCKETS_STAMP).read_text().strip())
+
+
+def _stamp_bucket_count(dest: Path, buckets: int) -> None:
+    # Key-to-bucket placement must not change under an existing dataset.
+    # Underscore-prefixed files are skipped by Parquet dataset readers.
+    dest.mkdir(parents=True, exist_ok=True)
+    (dest / BUCKETS_STAMP).write_text(f"{buckets}\n")
+
+
+def _dataset(dest: Path) -> ds.Dataset:
+    return ds.dataset(
+        dest,
+        format="parquet",
+        schema=NIH_REPORTER_AWARDS_SCHEMA,
+        partitioning=ds.partitioning(pa.schema([(BUCKET_COLUMN, pa.string())]), flavor="hive"),
+    )
+
+
+def _to_table(frame: pd.DataFrame) -> pa.Table:
+    for column in NIH_REPORTER_AWARDS_SCHEMA.names:
+        if column not in frame.columns:
+            frame[column] = None
+    return pa.Table.from_pandas(
+        frame[NIH_REPORTER_AWARDS_SCHEMA.names],
+        schema=NIH_REPORTER_AWARDS_SCHEMA,
+        preserve_index=False,
+    )
+
+
+def _remove_keys(bucket_dir: Path, keys: set[str]) -> None:
+    if not bucket_dir.is_dir():
+        return
+    wanted = pa.array(sorted(keys), type=pa.string())
+    for part in sorted(bucket_dir.glob("*.parquet")):
+        stored_keys = pq.read_table(part, columns=["upsert_key"]).column("upsert_key")
+        replaced = pc.is_in(stored_keys, value_set=wanted)
+        if not pc.any(replaced).as_py():
+            continue
+        kept = pq.read_table(part, schema=NIH_REPORTER_AWARDS_SCHEMA).filter(pc.invert(replaced))
+        if kept.num_rows:
+            _write_part(bucket_dir, kept, target=part)
+        else:
+            part.unlink()
+
+
+def _write_part(bucket_dir: Path, table: pa.Table, *, target: Path | None = None) -> Path:
+    """Write ``table`` as a part file, renamed into place once complete.
+
+    Without ``target`` a new part file is added to the bucket; with it, that
+    part file is replaced atomically.
+    """
+
+    target = target or bucket_dir / f"part-{uuid.uuid4().hex}.parquet"
+    ensure_parent_dir(target)
+    staging = bucket_dir / f".{target.name}.tmp"
+    pq.write_table(table, staging)
+    os.replace(staging, target)
+    return target
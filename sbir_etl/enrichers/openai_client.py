@@ -6,6 +6,7 @@ APIs with:
 - Exponential-backoff retry on 429 and 5xx errors
 - Configurable concurrency semaphore for thread-pool safety
 - Token usage logging via loguru
+- Optional content-addressed response cache (:class:`LLMResponseCache`)
 
 Usage::
 
@@ -25,12 +26,15 @@ from __future__ import annotations
 
 import threading
 import time
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from loguru import logger
 
+if TYPE_CHECKING:
+    from sbir_etl.utils.cache.llm_cache import LLMResponseCache
+
 OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
 OPENAI_RESPONSES_URL = "https://api.openai.com/v1/responses"
 
@@ -57,6 +61,8 @@ class OpenAIClient:
             Controls the semaphore size. Default 4.
         timeout: HTTP request timeout in seconds.
         model: Default model for chat and web search.
+        cache: Response cache consulted before each request; successful
+            responses are stored in it. ``None`` disables caching.
     """
 
     def __init__(
@@ -65,9 +71,11 @@ class OpenAIClient:
         max_concurrent: int = 4,
         timeout: int = 120,
         model: str = DEFAULT_MODEL,
+        cache: LLMResponseCache | None = None,
     ) -> None:
         self._api_key = api_key
         self._model = model
+        self._cache = cache
         self._timeout = timeout
         self._semaphore = threading.Semaphore(max_concurrent)
         self._client = httpx.Client(timeout=timeout)
@@ -138,6 +146,7 @@ class OpenAIClient:
         user: str,
         model: str | None = None,
         temperature: float = 0.3,
+        cache_version: str = "",
     ) -> str | None:
         """Call the Chat Completions API.
 
@@ -146,18 +155,27 @@ class OpenAIClient:
             user: User message content.
             model: Model override (defaults to client's model).
             temperature: Sampling temperature.
+            cache_version: Prompt template version folded into the cache key.
 
         Returns:
             Assistant message text, or ``None`` on failure.
         """
+        model = model or self._model
         payload = {
-            "model": model or self._model,
+            "model": model,
             "temperature": temperature,
             "messages": [
                 {"role": "system", "content": system},
                 {"role": "user", "content": user},
             ],
         }
+        if self._cache is None:
+            return self._chat(payload)
+        return self._cache.get_or_call(
+            "chat", model, cache_version, payload, lambda: self._chat(payload)
+        )
+
+    def _chat(self, payload: dict[str, Any]) -> str | None:
         resp = self._request("POST", OPENAI_CHAT_URL, payload)
         if resp is None:
             return None
@@ -182,6 +200,7 @@ class OpenAIClient:
         query: str,
         instructions: str | None = None,
         model: str | None = None,
+        cache_version: str = "",
     ) -> WebSearchResult | None:
         """Call the Responses API with web_search_preview tool.
 
@@ -189,6 +208,7 @@ class OpenAIClient:
             query: The search query / input text.
             instructions: System-level instructions for the search.
             model: Model override.
+            cache_version: Prompt template version folded into the cache key.
 
         Returns:
             :class:`WebSearchResult` with summary and source URLs, or ``None``.
@@ -200,12 +220,24 @@ class OpenAIClient:
             "notable products or contracts, and any previous SBIR/STTR history. "
             "Cite your sources."
         )
+        model = model or self._model
         payload = {
-            "model": model or self._model,
+            "model": model,
             "tools": [{"type": "web_search_preview"}],
             "instructions": instructions or default_instructions,
             "input": query,
         }
+        if self._cache is None:
+            return self._web_search(payload)
+
+        def _call() -> dict[str, Any] | None:
+            result = self._web_search(payload)
+            return asdict(result) if result is not None else None
+
+        cached = self._cache.get_or_call("web_search", model, cache_version, payload, _call)
+        return WebSearchResult(**cached) if cached is not None else None
+
+    def _web_search(self, payload: dict[str, Any]) -> WebSearchResult | None:
         resp = self._request("POST", OPENAI_RESPONSES_URL, payload, timeout=60)
         if resp is None:
             return None
@@ -192,8 +192,8 @@ def run_refresh(
             f"source {source!r} has no adapter yet; implement SourceAdapter to join the runner"
         )
     requests = _requests_for_source(source, award_ids, window)
-    freshness = FreshnessStore()
     source_config = getattr(get_config().enrichment_refresh, source)
+    freshness = FreshnessStore(commit_every=source_config.checkpoint_interval)
     if adapter is not None:
         active_adapter = adapter
     elif source == "nih_reporter":
@@ -205,6 +205,8 @@ def run_refresh(
         checkpoints=CheckpointStore(),
         partition_id=f"{source}-cli",
         checkpoint_interval=source_config.checkpoint_interval,
+        concurrency=source_config.max_concurrent_requests,
+        requests_per_minute=source_config.rate_limit_per_minute,
     )
     return active_runner.refresh_records(active_adapter, requests).as_dict()
 
@@ -8,11 +8,15 @@ freshness and checkpoint bookkeeping.
 
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Protocol
 
+from sbir_etl.enrichers.rate_limiting import RateLimiter
+from sbir_etl.utils.async_tools import run_sync
 from sbir_etl.utils.enrichment.checkpoints import CheckpointStore, EnrichmentCheckpoint
 from sbir_etl.utils.enrichment.freshness import FreshnessStore, update_freshness_ledger
 from sbir_etl.utils.enrichment.metrics import EnrichmentMetricsCollector
@@ -68,9 +72,16 @@ class SourceAdapter(Protocol):
         """Return source id, retrieval time, content hash, and citation URL."""
 
 
+class AsyncSourceAdapter(SourceAdapter, Protocol):
+    """Adapter whose fetch can run on the event loop alongside other fetches."""
+
+    async def afetch_page(self, request: Mapping[str, Any], cursor: str | None) -> RawPage:
+        """Async counterpart of :meth:`SourceAdapter.fetch_page`."""
+
+
 @dataclass
 class RefreshStats:
-    """Aggregate outcome of one runner pass."""
+    """Aggregate outcome and throughput of one runner pass."""
 
     total: int = 0
     success: int = 0
@@ -78,6 +89,16 @@ class RefreshStats:
     unchanged: int = 0
     skipped: int = 0
     errors: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    peak_in_flight: int = 0
+
+    @property
+    def attempted(self) -> int:
+        return self.success + self.unchanged + self.failed
+
+    @property
+    def records_per_second(self) -> float:
+        return self.attempted / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
 
     def as_dict(self) -> dict[str, Any]:
         return {
@@ -87,11 +108,22 @@ class RefreshStats:
             "unchanged": self.unchanged,
             "skipped": self.skipped,
             "errors": list(self.errors),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "records_per_second": round(self.records_per_second, 3),
+            "peak_in_flight": self.peak_in_flight,
         }
 
 
 class SourceRefreshRunner:
-    """One request loop over freshness, checkpoints, and metrics."""
+    """One request loop over freshness, checkpoints, and metrics.
+
+    With ``concurrency`` above 1 the pass runs on the event loop: up to that
+    many fetches are in flight (``afetch_page`` when the adapter provides it,
+    otherwise ``fetch_page`` on a worker thread), each gated by a per-source
+    ``requests_per_minute`` limiter. Results are applied to the ledger and
+    checkpoints one at a time as they complete, with the same resume and
+    retry semantics as the sequential pass.
+    """
 
     def __init__(
         self,
@@ -101,12 +133,32 @@ class SourceRefreshRunner:
         metrics: EnrichmentMetricsCollector | None = None,
         partition_id: str = "default",
         checkpoint_interval: int = 50,
+        concurrency: int = 1,
+        requests_per_minute: int | None = None,
     ) -> None:
         self.freshness = freshness
         self.checkpoints = checkpoints
         self.metrics = metrics or EnrichmentMetricsCollector()
         self.partition_id = partition_id
         self.checkpoint_interval = max(1, checkpoint_interval)
+        self.concurrency = max(1, concurrency)
+        self.requests_per_minute = requests_per_minute
+        self._limiters: dict[str, RateLimiter] = {}
+
+    def _limiter(self, source_id: str) -> RateLimiter | None:
+        if self.requests_per_minute is None:
+            return None
+        if source_id not in self._limiters:
+            self._limiters[source_id] = RateLimiter(self.requests_per_minute)
+        return self._limiters[source_id]
+
+    def _resume_ids(self, adapter: SourceAdapter) -> set[str]:
+        processed = self.checkpoints.load_processed(self.partition_id, adapter.source_id)
+        existing = self.checkpoints.load_checkpoint(self.partition_id, adapter.source_id)
+        if existing and isinstance(existing.metadata, dict):
+            # Checkpoints written before the processed set file carried the IDs inline.
+            processed.update(str(item) for item in existing.metadata.get("processed_ids") or [])
+        return processed
 
     def refresh_records(
         self,
@@ -121,79 +173,184 @@ class SourceRefreshRunner:
         on resume rather than being skipped forever.
         """
 
+        if self.concurrency > 1:
+            return run_sync(self.refresh_records_async(adapter, records))
+
+        started = time.monotonic()
         stats = RefreshStats(total=len(records))
-        existing = self.checkpoints.load_checkpoint(self.partition_id, adapter.source_id)
-        processed_ids = set()
-        if existing and isinstance(existing.metadata, dict):
-            raw_ids = existing.metadata.get("processed_ids") or []
-            processed_ids = {str(item) for item in raw_ids}
+        processed_ids = self._resume_ids(adapter)
+        unrecorded: list[str] = []
         since_checkpoint = 0
+        limiter = self._limiter(adapter.source_id)
 
         for request in records:
-            award_id = str(request.get("award_id") or "")
-            if not award_id:
-                stats.failed += 1
-                stats.errors.append("missing award_id")
-                continue
-            if award_id in processed_ids:
-                stats.skipped += 1
+            award_id = self._award_id(request, stats, processed_ids)
+            if award_id is None:
                 continue
 
+            stats.peak_in_flight = 1
             try:
+                if limiter is not None:
+                    limiter.wait_if_needed()
                 raw = adapter.fetch_page(request, cursor=None)
-                normalized = adapter.normalize(raw)
-                quality = adapter.validate(normalized)
-                proven = adapter.provenance(raw)
-                first = normalized[0] if normalized else {}
-                success = bool(quality.ok and first.get("success", quality.ok))
-                unchanged = bool(first.get("delta_detected") is False)
-                if success:
-                    error = None
-                elif first.get("error"):
-                    error = first.get("error")
-                elif quality.errors:
-                    error = quality.errors[0]
-                else:
-                    error = "validation failed"
-                self.metrics.record_api_call(adapter.source_id, error=not success)
-                update_freshness_ledger(
-                    store=self.freshness,
-                    award_id=award_id,
-                    source=adapter.source_id,
-                    success=success,
-                    payload_hash=proven.content_hash,
-                    metadata=dict(first.get("metadata") or {}),
-                    error_message=None if success else str(error),
-                )
-                if success and unchanged:
-                    stats.unchanged += 1
-                elif success:
-                    stats.success += 1
-                else:
-                    stats.failed += 1
-                    stats.errors.append(f"{award_id}: {error}")
-                record_succeeded = success
+                record_succeeded = self._apply_page(adapter, award_id, raw, stats)
             except Exception as exc:
-                stats.failed += 1
-                stats.errors.append(f"{award_id}: {exc}")
-                self.metrics.record_api_call(adapter.source_id, error=True)
-                update_freshness_ledger(
-                    store=self.freshness,
-                    award_id=award_id,
-                    source=adapter.source_id,
-                    success=False,
-                    error_message=str(exc),
-                )
+                self._apply_error(adapter, award_id, exc, stats)
                 record_succeeded = False
 
             if record_succeeded:
                 processed_ids.add(award_id)
+                unrecorded.append(award_id)
             since_checkpoint += 1
             if since_checkpoint >= self.checkpoint_interval:
-                self._save_checkpoint(adapter, award_id, stats, processed_ids)
+                # Ledger updates must be durable before the checkpoint that
+                # marks their awards processed.
+                self.freshness.flush()
+                self._save_checkpoint(adapter, award_id, stats, processed_ids, unrecorded)
                 since_checkpoint = 0
 
+        return self._finish(adapter, stats, started)
+
+    async def refresh_records_async(
+        self,
+        adapter: SourceAdapter,
+        records: Sequence[Mapping[str, Any]],
+    ) -> RefreshStats:
+        """Refresh records with up to ``concurrency`` fetches in flight.
+
+        Checkpoints are written every ``checkpoint_interval`` completions and
+        name the award that completed last; as in the sequential pass, only
+        successes are recorded as processed.
+        """
+
+        started = time.monotonic()
+        stats = RefreshStats(total=len(records))
+        processed_ids = self._resume_ids(adapter)
+        unrecorded: list[str] = []
+        limiter = self._limiter(adapter.source_id)
+        afetch = getattr(adapter, "afetch_page", None)
+        pending = iter(records)
+        in_flight = 0
+        since_checkpoint = 0
+
+        async def fetch(request: Mapping[str, Any]) -> RawPage:
+            if limiter is not None:
+                await asyncio.to_thread(limiter.wait_if_needed)
+            if afetch is not None:
+                return await afetch(request, None)
+            return await asyncio.to_thread(adapter.fetch_page, request, None)
+
+        async def worker() -> None:
+            nonlocal in_flight, since_checkpoint
+            for request in pending:
+                award_id = self._award_id(request, stats, processed_ids)
+                if award_id is None:
+                    continue
+                in_flight += 1
+                stats.peak_in_flight = max(stats.peak_in_flight, in_flight)
+                try:
+                    raw = await fetch(request)
+                    # Bookkeeping runs on the loop thread, one result at a time.
+                    record_succeeded = self._apply_page(adapter, award_id, raw, stats)
+                except Exception as exc:
+                    self._apply_error(adapter, award_id, exc, stats)
+                    record_succeeded = False
+                finally:
+                    in_flight -= 1
+
+                if record_succeeded:
+                    processed_ids.add(award_id)
+                    unrecorded.append(award_id)
+                since_checkpoint += 1
+                if since_checkpoint >= self.checkpoint_interval:
+                    self.freshness.flush()
+                    self._save_checkpoint(adapter, award_id, stats, processed_ids, unrecorded)
+                    since_checkpoint = 0
+
+        # Workers share one iterator, so at most ``concurrency`` fetches overlap.
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(records)))))
+        return self._finish(adapter, stats, started)
+
+    @staticmethod
+    def _award_id(
+        request: Mapping[str, Any], stats: RefreshStats, processed_ids: set[str]
+    ) -> str | None:
+        """Return the award to refresh, or None after counting a skip or bad request."""
+
+        award_id = str(request.get("award_id") or "")
+        if not award_id:
+            stats.failed += 1
+            stats.errors.append("missing award_id")
+            return None
+        if award_id in processed_ids:
+            stats.skipped += 1
+            return None
+        return award_id
+
+    def _apply_page(
+        self,
+        adapter: SourceAdapter,
+        award_id: str,
+        raw: RawPage,
+        stats: RefreshStats,
+    ) -> bool:
+        """Normalize, validate and record one fetched page; returns success."""
+
+        normalized = adapter.normalize(raw)
+        quality = adapter.validate(normalized)
+        proven = adapter.provenance(raw)
+        first = normalized[0] if normalized else {}
+        success = bool(quality.ok and first.get("success", quality.ok))
+        unchanged = bool(first.get("delta_detected") is False)
+        if success:
+            error = None
+        elif first.get("error"):
+            error = first.get("error")
+        elif quality.errors:
+            error = quality.errors[0]
+        else:
+            error = "validation failed"
+        self.metrics.record_api_call(adapter.source_id, error=not success)
+        update_freshness_ledger(
+            store=self.freshness,
+            award_id=award_id,
+            source=adapter.source_id,
+            success=success,
+            payload_hash=proven.content_hash,
+            metadata=dict(first.get("metadata") or {}),
+            error_message=None if success else str(error),
+        )
+        if success and unchanged:
+            stats.unchanged += 1
+        elif success:
+            stats.success += 1
+        else:
+            stats.failed += 1
+            stats.errors.append(f"{award_id}: {error}")
+        return success
+
+    def _apply_error(
+        self,
+        adapter: SourceAdapter,
+        award_id: str,
+        exc: Exception,
+        stats: RefreshStats,
+    ) -> None:
+        stats.failed += 1
+        stats.errors.append(f"{award_id}: {exc}")
+        self.metrics.record_api_call(adapter.source_id, error=True)
+        update_freshness_ledger(
+            store=self.freshness,
+            award_id=award_id,
+            source=adapter.source_id,
+            success=False,
+            error_message=str(exc),
+        )
+
+    def _finish(self, adapter: SourceAdapter, stats: RefreshStats, started: float) -> RefreshStats:
+        self.freshness.flush()
         self.checkpoints.delete_checkpoint(self.partition_id, adapter.source_id)
+        stats.elapsed_seconds = time.monotonic() - started
         return stats
 
     def _save_checkpoint(
@@ -202,9 +359,17 @@ class SourceRefreshRunner:
         award_id: str,
         stats: RefreshStats,
         processed_ids: set[str],
+        unrecorded: list[str],
     ) -> None:
-        """Persist resume state for an in-progress pass."""
+        """Persist resume state for an in-progress pass.
+
+        Only awards finished since the previous checkpoint are written (and
+        ``unrecorded`` is cleared), so each checkpoint costs the same however
+        far into the pass it is.
+        """
 
+        self.checkpoints.record_processed(self.partition_id, adapter.source_id, unrecorded)
+        unrecorded.clear()
         now = datetime.now(UTC)
         self.checkpoints.save_checkpoint(
             EnrichmentCheckpoint(
@@ -216,6 +381,6 @@ class SourceRefreshRunner:
                 records_failed=stats.failed,
                 records_total=stats.total,
                 checkpoint_timestamp=now,
-                metadata={"processed_ids": sorted(processed_ids)},
+                metadata={"processed_count": len(processed_ids)},
             )
         )
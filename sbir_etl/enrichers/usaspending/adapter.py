@@ -39,20 +39,21 @@ class USAspendingSourceAdapter:
         self._freshness = freshness
 
     def fetch_page(self, request: Mapping[str, Any], cursor: str | None) -> RawPage:
+        return run_sync(self.afetch_page(request, cursor))
+
+    async def afetch_page(self, request: Mapping[str, Any], cursor: str | None) -> RawPage:
         del cursor
         award_id = str(request["award_id"])
         freshness_record = None
         if self._freshness is not None:
             freshness_record = self._freshness.get_record(award_id, self.source_id)
-        result = run_sync(
-            self._client.enrich_award(
-                award_id=award_id,
-                uei=_optional_str(request.get("uei")),
-                duns=_optional_str(request.get("duns")),
-                cage=_optional_str(request.get("cage")),
-                piid=_optional_str(request.get("piid")),
-                freshness_record=freshness_record,
-            )
+        result = await self._client.enrich_award(
+            award_id=award_id,
+            uei=_optional_str(request.get("uei")),
+            duns=_optional_str(request.get("duns")),
+            cage=_optional_str(request.get("cage")),
+            piid=_optional_str(request.get("piid")),
+            freshness_record=freshness_record,
         )
         return RawPage(payload=result, record_id=award_id)
 
@@ -15,13 +15,18 @@ import shutil
 import subprocess
 import tempfile
 import threading
+from collections import deque
 from collections.abc import Iterable, Iterator, Mapping, Sequence
-from dataclasses import dataclass, replace
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path, PurePosixPath
+from typing import Any, Literal, overload
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 from sbir_etl.models.transition_models import CompetitionType, FederalContract
+from sbir_etl.utils.cache.fingerprint import file_sha256 as _file_sha256
 
 
 CANONICAL_RELATION = "rpt.transaction_search"
@@ -45,6 +50,28 @@ REQUIRED_SOURCE_COLUMNS = frozenset(
     }
 )
 
+# Source columns projected into each row dict; everything else stays unparsed.
+PROJECTED_SOURCE_COLUMNS = REQUIRED_SOURCE_COLUMNS | {
+    "recipient_unique_id",
+    "piid",
+    "period_of_performance_start_date",
+    "period_of_performance_current_end_date",
+    "cage_code",
+    "parent_award_id",
+    "referenced_idv_piid",
+    "referenced_idv_agency_iden",
+    "contract_award_type",
+    "transaction_description",
+    "modification_number",
+    "funding_toptier_agency_name",
+    "parent_uei",
+    "recipient_location_state_code",
+    "business_categories",
+}
+
+# Decompressed bytes per newline-aligned block handed to a parallel scan worker.
+PARALLEL_SCAN_BLOCK_BYTES = 16 * 1024 * 1024
+
 
 # POSIX awk program used only as a conservative first pass over remote COPY rows.
 # Every emitted row is parsed and matched again by Python; this program exists to
@@ -280,16 +307,6 @@ def _unquote(value: str) -> str:
     return value.strip().strip('"').replace('""', '"')
 
 
-def _file_sha256(path: Path) -> str:
-    """Hash an archive input without loading it into memory."""
-
-    digest = hashlib.sha256()
-    with path.open("rb") as file:
-        for chunk in iter(lambda: file.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _select_table_entry(toc_text: str, schema_sql: str) -> tuple[_TableEntry, bool]:
     entries: list[_TableEntry] = []
     for line in toc_text.splitlines():
@@ -391,6 +408,156 @@ def _pg_bool(value: str | None) -> bool:
     raise SourceDataError(f"Invalid or NULL is_fpds value: {value!r}")
 
 
+def _parse_obligation(value: str | None) -> float | None:
+    try:
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _map_distinct(values: pd.Series, func: Any) -> pd.Series:
+    """Apply ``func`` once per distinct value (and once for null) of an object column."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    # Null rows carry code -1, which indexes the trailing ``func(None)`` result.
+    results = np.empty(len(uniques) + 1, dtype=object)
+    results[:-1] = [func(value) for value in uniques]
+    results[-1] = func(None)
+    return pd.Series(results[codes], index=values.index, dtype=object)
+
+
+def _present(values: pd.Series) -> pd.Series:
+    """Truthiness of an object column of optional strings."""
+    return values.notna() & values.ne("")
+
+
+def _or(values: pd.Series, fallback: pd.Series) -> pd.Series:
+    """Column-wise ``value or fallback``."""
+    return values.where(_present(values), fallback)
+
+
+@dataclass(frozen=True)
+class _ScanContext:
+    """Everything a scan worker needs to project and match COPY rows."""
+
+    source_name: str
+    column_count: int
+    indexes: tuple[tuple[str, int], ...]
+    fpds_only: bool
+    filtered: bool
+    uei: frozenset[str]
+    legacy_ids: frozenset[str]
+    company_names: frozenset[str]
+
+    def matches_vendor(self, row: Mapping[str, str | None]) -> bool:
+        """Same rules as ``ContractExtractor._matches_vendor_filter``."""
+        if not self.filtered:
+            return True
+        uei = row.get("recipient_uei")
+        if uei and uei.strip() in self.uei:
+            return True
+        legacy_id = row.get("recipient_unique_id")
+        if legacy_id and legacy_id.strip() in self.legacy_ids:
+            return True
+        name = row.get("recipient_name")
+        return bool(name and name.strip().upper() in self.company_names)
+
+
+@dataclass
+class _BlockScan:
+    """Matched rows and counters from one block, in source order."""
+
+    first_line: int
+    rows: list[dict[str, str | None]] = field(default_factory=list)
+    records_scanned: int = 0
+    contracts_found: int = 0
+    terminated: bool = False
+    # First non-empty line; any is an error once an earlier block hit the terminator.
+    first_nonblank_line: int | None = None
+    # A SourceDataError message, raised by the parent after the rows before it.
+    error: str | None = None
+
+
+def _newline_blocks(stream: io.BufferedIOBase, block_bytes: int) -> Iterator[bytes]:
+    """Cut a byte stream into blocks that end on a line boundary."""
+    carry = b""
+    while chunk := stream.read(block_bytes):
+        data = carry + chunk if carry else chunk
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            carry = data
+            continue
+        carry = data[cut:]
+        yield data[:cut]
+    if carry:
+        yield carry
+
+
+def _block_line_count(block: bytes) -> int:
+    """Lines in a block under universal newlines (how the text readers split)."""
+    breaks = block.count(b"\n") + block.count(b"\r") - block.count(b"\r\n")
+    return breaks + (0 if block.endswith((b"\n", b"\r")) else 1)
+
+
+def _scan_block_with(context: _ScanContext, block: bytes, first_line: int) -> _BlockScan:
+    """Project, FPDS-check and vendor-match one block exactly like ``_parse_lines``."""
+    text = block.decode("utf-8", errors="replace")
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    scan = _BlockScan(first_line=first_line)
+    for line_num, serialized in enumerate(lines, first_line):
+        if serialized and scan.first_nonblank_line is None:
+            scan.first_nonblank_line = line_num
+        if scan.terminated:
+            if serialized:
+                scan.error = (
+                    f"{context.source_name} line {line_num} contains non-empty data "
+                    "after COPY terminator"
+                )
+                break
+            continue
+        if serialized == r"\.":
+            scan.terminated = True
+            continue
+
+        scan.records_scanned += 1
+        values = serialized.split("\t")
+        if len(values) != context.column_count:
+            scan.error = (
+                f"{context.source_name} row {line_num} has {len(values)} fields; "
+                f"COPY declares {context.column_count}"
+            )
+            break
+        row = {name: _copy_value(values[index]) for name, index in context.indexes}
+        try:
+            is_fpds = _pg_bool(row["is_fpds"])
+        except SourceDataError as error:
+            scan.error = str(error)
+            break
+        if context.fpds_only and not is_fpds:
+            scan.error = f"Non-FPDS row found in {FPDS_RELATION}"
+            break
+        if not is_fpds:
+            continue
+        scan.contracts_found += 1
+        if context.matches_vendor(row):
+            scan.rows.append(row)
+    return scan
+
+
+_worker_context: _ScanContext | None = None
+
+
+def _init_scan_worker(context: _ScanContext) -> None:
+    global _worker_context
+    _worker_context = context
+
+
+def _scan_block_in_worker(block: bytes, first_line: int) -> _BlockScan:
+    assert _worker_context is not None
+    return _scan_block_with(_worker_context, block, first_line)
+
+
 class ContractExtractor:
     """
     Extract federal contracts from USAspending PostgreSQL dump files.
@@ -399,6 +566,7 @@ class ContractExtractor:
     - Streaming processing of large .dat.gz files
     - Vendor-based filtering (only extract SBIR vendor contracts)
     - Memory-efficient batch processing
+    - Optional multi-process COPY scanning (``scan_workers``)
     - Direct FederalContract model output
 
     Example:
@@ -417,6 +585,7 @@ class ContractExtractor:
         self,
         vendor_filter_file: Path | None = None,
         batch_size: int = 10000,
+        scan_workers: int = 1,
     ):
         """
         Initialize contract extractor.
@@ -424,8 +593,12 @@ class ContractExtractor:
         Args:
             vendor_filter_file: Path to JSON file with SBIR vendor filters
             batch_size: Number of records to process per batch
+            scan_workers: Worker processes for the COPY scan; above 1, the
+                decompressed member is cut into newline-aligned blocks scanned
+                in parallel (replacing the awk prefilter)
         """
         self.batch_size = batch_size
+        self.scan_workers = max(1, scan_workers)
         self.vendor_filters = self._load_vendor_filters(vendor_filter_file)
 
         # Statistics
@@ -585,11 +758,7 @@ class ContractExtractor:
             # verbatim in metadata and expose the normalization in extraction stats.
             self.stats["invalid_performance_periods"] += 1
             end_date = None
-        obligation_text = row.get("federal_action_obligation")
-        try:
-            obligation = float(obligation_text) if obligation_text else None
-        except (TypeError, ValueError):
-            obligation = None
+        obligation = _parse_obligation(row.get("federal_action_obligation"))
 
         recipient_uei = row.get("recipient_uei")
         legacy_id = row.get("recipient_unique_id")
@@ -671,6 +840,158 @@ class ContractExtractor:
             self._idv_parent_ids_seen.add(contract.contract_id)
         return contract
 
+    def _contract_frame(self, rows: Sequence[Mapping[str, str | None]]) -> pd.DataFrame:
+        """Build the ``FederalContract.model_dump()`` frame for matched rows by column.
+
+        The columnar counterpart of :meth:`_parse_contract_row` used by the
+        Parquet writer: each source field is gathered once into a column, the
+        date, obligation and competition parsers run once per distinct value,
+        and the remaining derivations and the model's invariants are column
+        operations. The frame holds the same Python values ``model_dump()``
+        would, so both paths write identical Parquet.
+        """
+        from sbir_etl.utils.date_utils import parse_date
+
+        def source(name: str) -> pd.Series:
+            return pd.Series([row.get(name) for row in rows], dtype=object)
+
+        def parse_source_date(value: str | None) -> object:
+            return parse_date(value, allow_8digit=True, strict=False)
+
+        transaction_id = source("transaction_unique_id")
+        award_id = source("generated_unique_award_id")
+        has_transaction_id = _present(transaction_id)
+        missing_keys = ~(has_transaction_id & _present(award_id))
+        if missing_keys.any():
+            first = int(missing_keys.to_numpy().argmax())
+            missing = (
+                "transaction_unique_id"
+                if not has_transaction_id.iloc[first]
+                else "generated_unique_award_id"
+            )
+            raise SourceDataError(f"Matched FPDS row is missing {missing}")
+
+        source_start = source("period_of_performance_start_date")
+        source_end = source("period_of_performance_current_end_date")
+        action_date = _map_distinct(source("action_date"), parse_source_date)
+        start_date = _map_distinct(source_start, parse_source_date)
+        start_date = start_date.where(start_date.notna(), action_date)
+        end_date = _map_distinct(source_end, parse_source_date)
+        # FederalContract rejects end < start; keep the row, drop the source end date.
+        end_date_suppressed = pd.Series(
+            [
+                start is not None and end is not None and end < start
+                for start, end in zip(start_date, end_date, strict=True)
+            ],
+            dtype=bool,
+        )
+        end_date = end_date.where(~end_date_suppressed, None)
+        self.stats["invalid_performance_periods"] += int(end_date_suppressed.sum())
+
+        obligation = _map_distinct(source("federal_action_obligation"), _parse_obligation)
+        is_deobligation = pd.to_numeric(obligation, errors="coerce").lt(0)
+
+        recipient_uei = source("recipient_uei")
+        legacy_id = source("recipient_unique_id")
+        vendor_uei = recipient_uei.where(recipient_uei.str.len().eq(12), None)
+        vendor_uei = vendor_uei.where(
+            vendor_uei.notna(), legacy_id.where(legacy_id.str.len().eq(12), None)
+        )
+        vendor_duns = legacy_id.where(
+            legacy_id.str.len().eq(9) & legacy_id.str.isdigit().fillna(False).astype(bool),
+            None,
+        )
+
+        piid = source("piid")
+        contract_id = _or(piid, award_id)
+        parent_id = _or(source("parent_award_id"), source("referenced_idv_piid"))
+        parent_agency = source("referenced_idv_agency_iden")
+        award_type = source("contract_award_type")
+        normalized_type = award_type.str.strip().str.upper()
+        is_child = _present(parent_id)
+        is_idv_parent = (
+            ~is_child
+            & _present(award_type)
+            & (
+                normalized_type.str.startswith("IDV", na=False)
+                | normalized_type.isin({"BPA", "BOA", "IDIQ"})
+            )
+        )
+        relationship_type = pd.Series(
+            np.select([is_child, is_idv_parent], ["child_of_idv", "idv_parent"], "standalone"),
+            dtype=object,
+        )
+        self.stats["parent_relationships"] += int(is_child.sum())
+        self.stats["child_relationships"] += int(is_child.sum())
+        self.stats["idv_parents"] += int(is_idv_parent.sum())
+        self._parent_ids_seen.update(parent_id[is_child])
+        self._idv_parent_ids_seen.update(contract_id[is_idv_parent])
+
+        extent_competed = source("extent_competed")
+        research = source("research")
+        naics_code = source("naics_code")
+        product_or_service_code = source("product_or_service_code")
+        metadata_columns = {
+            "transaction_id": transaction_id,
+            "award_id": award_id,
+            "modification_number": source("modification_number"),
+            "action_date": _map_distinct(
+                action_date, lambda value: value.isoformat() if value else None
+            ),
+            "source_period_of_performance_start_date": source_start,
+            "source_period_of_performance_current_end_date": source_end,
+            "end_date_suppressed_before_effective_start": end_date_suppressed,
+            "funding_agency": source("funding_toptier_agency_name"),
+            "parent_uei": source("parent_uei"),
+            "recipient_state": source("recipient_location_state_code"),
+            "business_categories": source("business_categories"),
+            "extent_competed": extent_competed,
+            "contract_award_type": award_type,
+            "parent_idv_piid": parent_id,
+            "referenced_idv_agency": parent_agency,
+            "parent_relationship_type": relationship_type,
+            "research": research,
+            "naics_code": naics_code,
+            "product_or_service_code": product_or_service_code,
+        }
+        metadata_keys = list(metadata_columns)
+        metadata = [
+            dict(zip(metadata_keys, values, strict=True))
+            for values in zip(*(list(column) for column in metadata_columns.values()), strict=True)
+        ]
+
+        columns: dict[str, Iterable[Any]] = {
+            "contract_id": contract_id,
+            "piid": piid,
+            "transaction_unique_id": transaction_id,
+            "generated_unique_award_id": award_id,
+            "agency": source("awarding_toptier_agency_name"),
+            "sub_agency": source("awarding_subtier_agency_name"),
+            "vendor_name": source("recipient_name"),
+            "vendor_uei": vendor_uei,
+            "vendor_cage": source("cage_code"),
+            "vendor_duns": vendor_duns,
+            "action_date": action_date,
+            "start_date": start_date,
+            "end_date": end_date,
+            "obligation_amount": obligation,
+            "is_deobligation": is_deobligation,
+            "competition_type": _map_distinct(extent_competed, self._parse_competition_type),
+            "description": source("transaction_description"),
+            "parent_contract_id": parent_id,
+            "parent_contract_agency": parent_agency,
+            "contract_award_type": award_type,
+            "research": research,
+            "naics_code": naics_code,
+            "product_or_service_code": product_or_service_code,
+            "matched_vendor": [None] * len(rows),
+            "metadata": metadata,
+        }
+        return pd.DataFrame(
+            {name: list(columns[name]) for name in FederalContract.model_fields},
+            columns=list(FederalContract.model_fields),
+        )
+
     def _parse_lines(
         self,
         lines: Iterable[str],
@@ -678,28 +999,14 @@ class ContractExtractor:
         columns: Sequence[str],
         *,
         fpds_only: bool,
-    ) -> Iterator[FederalContract]:
-        """Parse rows with a name-to-index projection derived from the COPY list."""
-        if missing := sorted(REQUIRED_SOURCE_COLUMNS.difference(columns)):
-            raise ArchiveSchemaError(f"Verified source columns missing: {', '.join(missing)}")
-        projected_names = REQUIRED_SOURCE_COLUMNS | {
-            "recipient_unique_id",
-            "piid",
-            "period_of_performance_start_date",
-            "period_of_performance_current_end_date",
-            "cage_code",
-            "parent_award_id",
-            "referenced_idv_piid",
-            "referenced_idv_agency_iden",
-            "contract_award_type",
-            "transaction_description",
-            "modification_number",
-            "funding_toptier_agency_name",
-            "parent_uei",
-            "recipient_location_state_code",
-            "business_categories",
-        }
-        indexes = {name: index for index, name in enumerate(columns) if name in projected_names}
+        raw_rows: bool = False,
+    ) -> Iterator[FederalContract] | Iterator[dict[str, str | None]]:
+        """Parse rows with a name-to-index projection derived from the COPY list.
+
+        With ``raw_rows``, matched rows are yielded as projected source dicts for
+        the columnar writer instead of as ``FederalContract`` models.
+        """
+        indexes = self._projection(columns)
         copy_terminated = False
         for line_num, line in enumerate(lines, 1):
             serialized = line.rstrip("\r\n")
@@ -739,9 +1046,101 @@ class ContractExtractor:
             if not self._matches_vendor_filter(row):
                 continue
             self.stats["vendor_matches"] += 1
-            contract = self._parse_contract_row(row)
+            record = row if raw_rows else self._parse_contract_row(row)
             self.stats["records_extracted"] += 1
-            yield contract
+            yield record
+
+    @staticmethod
+    def _projection(columns: Sequence[str]) -> dict[str, int]:
+        """Map each projected source column to its COPY index."""
+        if missing := sorted(REQUIRED_SOURCE_COLUMNS.difference(columns)):
+            raise ArchiveSchemaError(f"Verified source columns missing: {', '.join(missing)}")
+        return {
+            name: index for index, name in enumerate(columns) if name in PROJECTED_SOURCE_COLUMNS
+        }
+
+    def _scan_context(
+        self, source_name: str, columns: Sequence[str], *, fpds_only: bool
+    ) -> _ScanContext:
+        filters = self.vendor_filters
+        return _ScanContext(
+            source_name=source_name,
+            column_count=len(columns),
+            indexes=tuple(self._projection(columns).items()),
+            fpds_only=fpds_only,
+            filtered=any(filters.values()),
+            uei=frozenset(filters["uei"]),
+            legacy_ids=frozenset(filters["uei"] | filters["duns"]),
+            company_names=frozenset(filters["company_names"]),
+        )
+
+    def _parallel_parse_stream(
+        self,
+        stream: io.BufferedIOBase,
+        source_name: str,
+        columns: Sequence[str],
+        *,
+        fpds_only: bool,
+        raw_rows: bool = False,
+    ) -> Iterator[FederalContract] | Iterator[dict[str, str | None]]:
+        """Scan a decompressed COPY stream on ``scan_workers`` processes.
+
+        The parent decompresses once and cuts newline-aligned blocks; workers
+        run the same projection, ``is_fpds`` check and vendor match as
+        :meth:`_parse_lines` and return only matched rows. Results are consumed
+        in source order, so contracts, statistics, the COPY terminator check
+        and the first fail-closed error are identical to the serial scan.
+        """
+        context = self._scan_context(source_name, columns, fpds_only=fpds_only)
+        blocks = _newline_blocks(stream, PARALLEL_SCAN_BLOCK_BYTES)
+        next_line = 1
+        terminated = False
+        with ProcessPoolExecutor(
+            max_workers=self.scan_workers,
+            initializer=_init_scan_worker,
+            initargs=(context,),
+        ) as pool:
+            pending: deque[Future[_BlockScan]] = deque()
+
+            def submit_next() -> None:
+                nonlocal next_line
+                block = next(blocks, None)
+                if block is not None:
+                    pending.append(pool.submit(_scan_block_in_worker, block, next_line))
+                    next_line += _block_line_count(block)
+
+            # Two blocks per worker keep every process busy while the parent
+            # decompresses and builds contracts, with bounded memory.
+            for _ in range(2 * self.scan_workers):
+                submit_next()
+            try:
+                while pending:
+                    scan = pending.popleft().result()
+                    submit_next()
+                    if terminated:
+                        if scan.first_nonblank_line is not None:
+                            raise SourceDataError(
+                                f"{source_name} line {scan.first_nonblank_line} contains "
+                                "non-empty data after COPY terminator"
+                            )
+                        continue
+                    self.stats["records_scanned"] += scan.records_scanned
+                    self.stats["contracts_found"] += scan.contracts_found
+                    for row in scan.rows:
+                        self.stats["vendor_matches"] += 1
+                        record = row if raw_rows else self._parse_contract_row(row)
+                        self.stats["records_extracted"] += 1
+                        yield record
+                    if scan.error is not None:
+                        raise SourceDataError(scan.error)
+                    terminated = scan.terminated
+                    logger.info(
+                        f"  [{source_name}] processed {self.stats['records_scanned']:,} records, "
+                        f"found {self.stats['records_extracted']} contracts"
+                    )
+            finally:
+                for future in pending:
+                    future.cancel()
 
     @staticmethod
     def _run_pg_restore(dump_dir: Path, *arguments: str) -> str:
@@ -878,11 +1277,23 @@ class ContractExtractor:
         columns: Sequence[str],
         *,
         fpds_only: bool,
-    ) -> Iterator[FederalContract]:
-        """Stream a local member using its verified COPY column order."""
+        raw_rows: bool = False,
+    ) -> Iterator[FederalContract] | Iterator[dict[str, str | None]]:
+        """Stream a local member using its verified COPY column order.
+
+        ``raw_rows`` yields projected source rows instead of ``FederalContract``.
+        """
         logger.info(f"Processing {dat_file.name}...")
-        with gzip.open(dat_file, "rt", encoding="utf-8", errors="replace") as f:
-            yield from self._parse_lines(f, dat_file.name, columns, fpds_only=fpds_only)
+        if self.scan_workers > 1:
+            with gzip.open(dat_file, "rb") as raw:
+                yield from self._parallel_parse_stream(
+                    raw, dat_file.name, columns, fpds_only=fpds_only, raw_rows=raw_rows
+                )
+        else:
+            with gzip.open(dat_file, "rt", encoding="utf-8", errors="replace") as f:
+                yield from self._parse_lines(
+                    f, dat_file.name, columns, fpds_only=fpds_only, raw_rows=raw_rows
+                )
         logger.info(
             f"Completed {dat_file.name}: {self.stats['records_extracted']} contracts extracted"
         )
@@ -1110,7 +1521,8 @@ class ContractExtractor:
         columns: Sequence[str],
         *,
         fpds_only: bool,
-    ) -> Iterator[FederalContract]:
+        raw_rows: bool = False,
+    ) -> Iterator[FederalContract] | Iterator[dict[str, str | None]]:
         """Stream-parse one ``.dat.gz`` member directly from a remote ``.zip``.
 
         Uses HTTP Range requests (via ``remotezip``) to read **only** the bytes of
@@ -1126,6 +1538,8 @@ class ContractExtractor:
             zip_url: ``https://`` URL of the database zip (e.g.
                 ``https://files.usaspending.gov/database_download/usaspending-db-subset_YYYYMMDD.zip``).
             member_name: Path of the ``.dat.gz`` member inside the zip.
+            raw_rows: Yield projected source rows (for the columnar writer)
+                instead of ``FederalContract`` models.
 
         Yields:
             FederalContract instances that match vendor filters.
@@ -1145,8 +1559,42 @@ class ContractExtractor:
                 member_name,
                 columns,
                 fpds_only=fpds_only,
+                raw_rows=raw_rows,
             )
 
+    @overload
+    def _stream_remote_archive_member(
+        self,
+        remote_zip: object,
+        member_name: str,
+        columns: Sequence[str],
+        *,
+        fpds_only: bool,
+        raw_rows: Literal[False] = False,
+    ) -> Iterator[FederalContract]: ...
+
+    @overload
+    def _stream_remote_archive_member(
+        self,
+        remote_zip: object,
+        member_name: str,
+        columns: Sequence[str],
+        *,
+        fpds_only: bool,
+        raw_rows: Literal[True],
+    ) -> Iterator[dict[str, str | None]]: ...
+
+    @overload
+    def _stream_remote_archive_member(
+        self,
+        remote_zip: object,
+        member_name: str,
+        columns: Sequence[str],
+        *,
+        fpds_only: bool,
+        raw_rows: bool = ...,
+    ) -> Iterator[FederalContract] | Iterator[dict[str, str | None]]: ...
+
     def _stream_remote_archive_member(
         self,
         remote_zip: object,
@@ -1154,7 +1602,8 @@ class ContractExtractor:
         columns: Sequence[str],
         *,
         fpds_only: bool,
-    ) -> Iterator[FederalContract]:
+        raw_rows: bool = False,
+    ) -> Iterator[FederalContract] | Iterator[dict[str, str | None]]:
         """Stream one unique ZipInfo through outer ZIP CRC, inner gzip, then parsing."""
 
         member_infos = [
@@ -1172,14 +1621,19 @@ class ContractExtractor:
             digesting_member = _DigestingReader(member)
             # `member` yields the gzip-compressed .dat.gz bytes; decompress streaming.
             with gzip.GzipFile(fileobj=digesting_member) as gz:
-                awk_path = self._awk_prefilter_path()
-                if awk_path is None:
+                if self.scan_workers > 1:
+                    logger.info(f"Scanning {member_name} with {self.scan_workers} worker processes")
+                    yield from self._parallel_parse_stream(
+                        gz, member_name, columns, fpds_only=fpds_only, raw_rows=raw_rows
+                    )
+                elif (awk_path := self._awk_prefilter_path()) is None:
                     with io.TextIOWrapper(gz, encoding="utf-8", errors="replace") as text:
                         yield from self._parse_lines(
                             text,
                             member_name,
                             columns,
                             fpds_only=fpds_only,
+                            raw_rows=raw_rows,
                         )
                 else:
                     logger.info(
@@ -1198,6 +1652,7 @@ class ContractExtractor:
                         member_name,
                         columns,
                         fpds_only=fpds_only,
+                        raw_rows=raw_rows,
                     )
 
             # Successful parsing must consume the selected ZipExtFile to EOF.
@@ -1247,12 +1702,13 @@ class ContractExtractor:
                 f"Configured table_files {table_files!r} do not match TOC-selected "
                 f"member {source.member_name!r}"
             )
-        contracts = self.stream_dat_gz_file(
+        rows = self.stream_dat_gz_file(
             dump_dir / source.member_name,
             source.columns,
             fpds_only=source.fpds_only,
+            raw_rows=True,
         )
-        return self._collect_and_write(contracts, output_file)
+        return self._collect_and_write(rows, output_file)
 
     def extract_from_remote_zip(
         self,
@@ -1292,6 +1748,7 @@ class ContractExtractor:
                     source.member_name,
                     source.columns,
                     fpds_only=source.fpds_only,
+                    raw_rows=True,
                 ),
                 Path(output_file),
             )
@@ -1328,30 +1785,37 @@ class ContractExtractor:
                 }
             )
             remote_zip.enable_parallel_prefetch()
-            contracts = self._stream_remote_archive_member(
+            rows = self._stream_remote_archive_member(
                 remote_zip,
                 source.member_name,
                 source.columns,
                 fpds_only=source.fpds_only,
+                raw_rows=True,
             )
 
-            def verified_contracts() -> Iterator[FederalContract]:
-                yield from contracts
+            def verified_rows() -> Iterator[dict[str, str | None]]:
+                yield from rows
                 # Run before iterator exhaustion so _collect_and_write cannot
                 # atomically publish output while a scheduled range is invalid.
                 remote_zip.range_file.validate_pending()
 
             return self._collect_and_write(
-                verified_contracts(),
+                verified_rows(),
                 Path(output_file),
             )
 
     def _collect_and_write(
         self,
-        contracts: Iterable[FederalContract],
+        contracts: Iterable[FederalContract] | Iterable[Mapping[str, str | None]],
         output_file: Path,
     ) -> int:
-        """Write matched contracts atomically with bounded batches in memory."""
+        """Write matched contracts atomically with bounded batches in memory.
+
+        ``contracts`` holds either ``FederalContract`` models or the projected
+        source rows yielded with ``raw_rows=True``. Rows skip per-row model
+        construction: each batch is built column by column by
+        :meth:`_contract_frame` into the same frame ``model_dump()`` would give.
+        """
         import pyarrow as pa
         import pyarrow.parquet as pq
 
@@ -1431,21 +1895,25 @@ class ContractExtractor:
         schema = pa.schema([pa.field(column, field_types[column]) for column in columns])
         metadata_fields = {field.name for field in metadata_type}
 
-        def normalized_frame(rows: list[dict[str, object]]) -> pd.DataFrame:
-            for row in rows:
-                if row.get("matched_vendor") is not None:
-                    raise SourceDataError(
-                        "Raw contract extraction cannot serialize a resolved matched_vendor"
-                    )
-                metadata = row.get("metadata")
-                if not isinstance(metadata, Mapping):
-                    raise SourceDataError("Raw contract metadata must be a mapping")
-                if unexpected := sorted(set(metadata) - metadata_fields):
-                    raise SourceDataError(
-                        "Raw contract metadata has fields outside the verified Parquet schema: "
-                        f"{unexpected}"
-                    )
-            frame = pd.DataFrame.from_records(rows, columns=columns)
+        def batch_frame(batch: list) -> pd.DataFrame:
+            if isinstance(batch[0], FederalContract):
+                return pd.DataFrame.from_records(
+                    [contract.model_dump() for contract in batch], columns=columns
+                )
+            return self._contract_frame(batch)
+
+        def normalized_frame(frame: pd.DataFrame) -> pd.DataFrame:
+            if frame["matched_vendor"].notna().any():
+                raise SourceDataError(
+                    "Raw contract extraction cannot serialize a resolved matched_vendor"
+                )
+            if not all(isinstance(metadata, Mapping) for metadata in frame["metadata"]):
+                raise SourceDataError("Raw contract metadata must be a mapping")
+            if unexpected := sorted(set().union(*frame["metadata"]) - metadata_fields):
+                raise SourceDataError(
+                    "Raw contract metadata has fields outside the verified Parquet schema: "
+                    f"{unexpected}"
+                )
             # The explicit Arrow schema below supplies the runtime's one-shot
             # string width without coercing missing values through Python ``str``.
             frame["obligation_amount"] = pd.to_numeric(
@@ -1456,14 +1924,13 @@ class ContractExtractor:
 
         contract_iterator = iter(contracts)
 
-        def next_batch(first: FederalContract | None = None) -> list[dict[str, object]]:
-            rows = [] if first is None else [first.model_dump()]
+        def next_batch(first: object | None = None) -> list:
+            rows = [] if first is None else [first]
             for _ in range(self.batch_size - len(rows)):
                 try:
-                    contract = next(contract_iterator)
+                    rows.append(next(contract_iterator))
                 except StopIteration:
                     break
-                rows.append(contract.model_dump())
             return rows
 
         first_rows = next_batch()
@@ -1486,7 +1953,7 @@ class ContractExtractor:
                 except StopIteration:
                     # A single bounded batch follows the exact legacy one-shot path.
                     save_dataframe_parquet(
-                        pd.DataFrame.from_records(first_rows, columns=columns),
+                        batch_frame(first_rows),
                         temp_file,
                         index=False,
                         compression="snappy",
@@ -1494,7 +1961,7 @@ class ContractExtractor:
                     )
                     row_count = len(first_rows)
                 else:
-                    first_frame = normalized_frame(first_rows)
+                    first_frame = normalized_frame(batch_frame(first_rows))
                     first_table = pa.Table.from_pandas(
                         first_frame,
                         schema=schema,
@@ -1515,7 +1982,7 @@ class ContractExtractor:
                     rows = next_batch(lookahead)
                     while rows:
                         table = pa.Table.from_pandas(
-                            normalized_frame(rows),
+                            normalized_frame(batch_frame(rows)),
                             schema=first_table.schema,
                             preserve_index=False,
                             safe=True,
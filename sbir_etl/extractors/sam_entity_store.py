@@ -0,0 +1,445 @@
+"""Persistent, key-indexed store for SAM.gov entity lookups.
+
+``SAMGovExtractor.load_parquet`` materializes the whole multi-million-row
+public extract in pandas, and its ``get_entity_*`` helpers then scan that
+frame once per lookup. ``SAMEntityStore`` instead builds, once per extract:
+
+- ``entities.parquet``: every extract row sorted by ``unique_entity_id`` and
+  written in small row groups, so each group's min/max statistics act as a
+  sparse primary-key index;
+- ``cage_index.parquet`` / ``duns_index.parquet``: ``(key, unique_entity_id,
+  _source_row)`` tables sorted by CAGE code and DUNS number.
+
+Lookups memory-map these files, locate the candidate row groups by binary
+search over the statistics, and decode only those groups. A process can answer
+point or batch lookups without ever loading the extract.
+
+The sort runs in DuckDB, which spills to disk instead of holding the extract
+in memory. Each build goes into its own version directory and is published by
+atomically replacing ``manifest.json``, so open readers keep working while a
+newer extract is indexed. ``refresh`` only rebuilds when the source extract
+changed and is not older than the one already indexed.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from loguru import logger
+
+
+UEI_COLUMN = "unique_entity_id"
+CAGE_COLUMN = "cage_code"
+# The public V2 extract names the legacy DUNS field ``duns_number``; older
+# ad-hoc extracts used ``duns``.
+DUNS_COLUMNS = ("duns_number", "duns")
+SOURCE_ROW_COLUMN = "_source_row"
+
+MANIFEST_NAME = "manifest.json"
+ENTITIES_FILE = "entities.parquet"
+INDEX_FILES = {"cage": "cage_index.parquet", "duns": "duns_index.parquet"}
+
+DEFAULT_ROW_GROUP_SIZE = 16_384
+
+_DATE_IN_NAME = re.compile(r"(\d{8})")
+
+
+@dataclass
+class SAMEntityStoreManifest:
+    """Provenance of the extract a store version was built from."""
+
+    version: str
+    source_path: str
+    source_date: str | None
+    source_size: int
+    source_mtime_ns: int
+    row_count: int
+    duns_column: str | None
+    columns: list[str] = field(default_factory=list)
+    built_at: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SAMEntityStoreManifest:
+        return cls(**{k: data.get(k) for k in cls.__dataclass_fields__})  # type: ignore[arg-type]
+
+
+def extract_source_date(parquet_path: Path) -> str | None:
+    """Return the ``YYYYMMDD`` date of a SAM.gov extract, if known.
+
+    Prefers the ``source_date`` recorded in the downloader's
+    ``<stem>.meta.json`` sidecar and falls back to a date in the file name.
+    """
+    sidecar = parquet_path.with_name(f"{parquet_path.stem}.meta.json")
+    if sidecar.is_file():
+        try:
+            source_date = json.loads(sidecar.read_text()).get("source_date")
+            if source_date:
+                return str(source_date).replace("-", "")[:8]
+        except (OSError, ValueError):
+            logger.debug(f"Unreadable SAM.gov sidecar: {sidecar}")
+    match = _DATE_IN_NAME.search(parquet_path.stem)
+    return match.group(1) if match else None
+
+
+def _sql_string(value: str | Path) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _sql_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class _SortedParquetLookup:
+    """Memory-mapped point lookups over a parquet file sorted by one column."""
+
+    def __init__(self, path: Path, key: str):
+        self.path = path
+        self.key = key
+        self._file = pq.ParquetFile(path, memory_map=True)
+        metadata = self._file.metadata
+        key_index = self._file.schema_arrow.get_field_index(key)
+        self._mins: list[str] = []
+        self._maxs: list[str] = []
+        self._groups: list[int] = []
+        for group in range(metadata.num_row_groups):
+            row_group = metadata.row_group(group)
+            stats = row_group.column(key_index).statistics
+            if row_group.num_rows == 0 or stats is None or not stats.has_min_max:
+                continue
+            self._mins.append(stats.min)
+            self._maxs.append(stats.max)
+            self._groups.append(group)
+
+    @property
+    def num_rows(self) -> int:
+        return self._file.metadata.num_rows
+
+    @property
+    def schema(self) -> pa.Schema:
+        return self._file.schema_arrow
+
+    def _row_groups_for(self, keys: list[str]) -> list[int]:
+        groups: set[int] = set()
+        for key in keys:
+            # Groups are sorted, so the candidates for ``key`` are the run of
+            # groups whose [min, max] range contains it (a key repeated across
+            # a group boundary spans more than one).
+            pos = bisect.bisect_right(self._mins, key) - 1
+            while pos >= 0 and self._maxs[pos] >= key:
+                groups.add(self._groups[pos])
+                if self._mins[pos] < key:
+                    break
+                pos -= 1
+        return sorted(groups)
+
+    def lookup(self, keys: Iterable[str], columns: list[str] | None = None) -> pa.Table:
+        """Return every row whose key is in ``keys``, in file order."""
+        wanted = sorted({k for k in keys if isinstance(k, str) and k})
+        if columns is not None and self.key not in columns:
+            columns = [self.key, *columns]
+        groups = self._row_groups_for(wanted) if wanted else []
+        if not groups:
+            schema = self.schema
+            if columns is not None:
+                schema = pa.schema([schema.field(c) for c in columns])
+            return schema.empty_table()
+        table = self._file.read_row_groups(groups, columns=columns)
+        return table.filter(pc.is_in(table[self.key], value_set=pa.array(wanted, pa.string())))
+
+
+class SAMEntityStore:
+    """Key-indexed, memory-mapped view of a SAM.gov entity extract.
+
+    Open an existing store with ``SAMEntityStore(store_dir)``; create or update
+    one from an extract with :meth:`build` or :meth:`refresh`. Lookups return
+    the same rows as ``SAMGovExtractor.get_entity_*`` over the full extract:
+    the first extract row per UEI or CAGE code, and every row for a DUNS
+    number (read from ``duns_number`` or the legacy ``duns`` column).
+    """
+
+    def __init__(self, store_dir: Path | str):
+        self.store_dir = Path(store_dir)
+        manifest_path = self.store_dir / MANIFEST_NAME
+        if not manifest_path.is_file():
+            raise FileNotFoundError(f"SAM.gov entity store not built: {manifest_path}")
+        self.manifest = SAMEntityStoreManifest.from_dict(json.loads(manifest_path.read_text()))
+        version_dir = self.store_dir / self.manifest.version
+        self._entities = _SortedParquetLookup(version_dir / ENTITIES_FILE, UEI_COLUMN)
+        self._indexes: dict[str, _SortedParquetLookup] = {}
+        key_columns = {"cage": CAGE_COLUMN, "duns": self.manifest.duns_column}
+        for kind, filename in INDEX_FILES.items():
+            path = version_dir / filename
+            if key_columns[kind] and path.is_file():
+                self._indexes[kind] = _SortedParquetLookup(path, key_columns[kind])  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return self.manifest.row_count
+
+    @property
+    def columns(self) -> list[str]:
+        """Extract columns available from lookups."""
+        return list(self.manifest.columns)
+
+    # ------------------------------------------------------------------
+    # Build / refresh
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        parquet_path: Path | str,
+        store_dir: Path | str,
+        *,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> SAMEntityStore:
+        """Index ``parquet_path`` into a new store version and publish it.
+
+        Args:
+            parquet_path: SAM.gov entity extract (as written by the downloader)
+            store_dir: Directory holding the store's versions and manifest
+            row_group_size: Rows per parquet row group; smaller groups make
+                point lookups decode less data at the cost of larger footers
+
+        Returns:
+            The opened store
+
+        Raises:
+            FileNotFoundError: If the extract does not exist
+            ValueError: If the extract has no ``unique_entity_id`` column
+        """
+        import duckdb
+
+        source = Path(parquet_path)
+        if not source.is_file():
+            raise FileNotFoundError(f"SAM.gov parquet file not found: {source}")
+        store = Path(store_dir)
+        store.mkdir(parents=True, exist_ok=True)
+
+        columns = pq.read_schema(source).names
+        if UEI_COLUMN not in columns:
+            raise ValueError(f"SAM.gov extract has no {UEI_COLUMN} column: {source}")
+        duns_column = next((c for c in DUNS_COLUMNS if c in columns), None)
+
+        stat = source.stat()
+        source_date = extract_source_date(source)
+        version = f"v{source_date or 'undated'}_{stat.st_mtime_ns}"
+        staging = Path(tempfile.mkdtemp(prefix=".build_", dir=store))
+        logger.info(f"Building SAM.gov entity store {version} from {source}")
+
+        # Sort keys are cast to VARCHAR so lookups compare strings regardless
+        # of how the extract typed an identifier column.
+        selected = ", ".join(
+            f"CAST({_sql_ident(c)} AS VARCHAR) AS {_sql_ident(c)}"
+            if c in (UEI_COLUMN, CAGE_COLUMN, duns_column)
+            else _sql_ident(c)
+            for c in columns
+        )
+        entities = staging / ENTITIES_FILE
+        options = f"(FORMAT PARQUET, ROW_GROUP_SIZE {int(row_group_size)})"
+        try:
+            with duckdb.connect() as conn:
+                conn.execute(
+                    f"""
+                    COPY (
+                        SELECT {selected}, file_row_number AS {SOURCE_ROW_COLUMN}
+                        FROM read_parquet({_sql_string(source)}, file_row_number = true)
+                        WHERE {_sql_ident(UEI_COLUMN)} IS NOT NULL
+                        ORDER BY {_sql_ident(UEI_COLUMN)}, {SOURCE_ROW_COLUMN}
+                    ) TO {_sql_string(entities)} {options}
+                    """
+                )
+                for kind, key in (("cage", CAGE_COLUMN), ("duns", duns_column)):
+                    if key is None or key not in columns:
+                        continue
+                    conn.execute(
+                        f"""
+                        COPY (
+                            SELECT {_sql_ident(key)}, {_sql_ident(UEI_COLUMN)},
+                                   {SOURCE_ROW_COLUMN}
+                            FROM read_parquet({_sql_string(entities)})
+                            WHERE NULLIF(TRIM({_sql_ident(key)}), '') IS NOT NULL
+                            ORDER BY {_sql_ident(key)}, {SOURCE_ROW_COLUMN}
+                        ) TO {_sql_string(staging / INDEX_FILES[kind])} {options}
+                        """
+                    )
+            row_count = pq.ParquetFile(entities).metadata.num_rows
+
+            target = store / version
+            if target.exists():
+                shutil.rmtree(target)
+            staging.rename(target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        manifest = SAMEntityStoreManifest(
+            version=version,
+            source_path=str(source.resolve()),
+            source_date=source_date,
+            source_size=stat.st_size,
+            source_mtime_ns=stat.st_mtime_ns,
+            row_count=row_count,
+            duns_column=duns_column,
+            columns=list(columns),
+            built_at=datetime.now(UTC).isoformat(),
+        )
+        tmp_manifest = store / f".{MANIFEST_NAME}.tmp"
+        tmp_manifest.write_text(json.dumps(asdict(manifest), indent=2))
+        os.replace(tmp_manifest, store / MANIFEST_NAME)
+        cls._prune_versions(store, keep=version)
+
+        logger.info(f"Built SAM.gov entity store {version}: {row_count:,} entities")
+        return cls(store)
+
+    @classmethod
+    def refresh(
+        cls,
+        parquet_path: Path | str,
+        store_dir: Path | str,
+        *,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> SAMEntityStore:
+        """Open the store, rebuilding it first if ``parquet_path`` is newer.
+
+        The store is rebuilt when it does not exist yet or when the extract's
+        size, modification time or path differ from the indexed one. An
+        extract dated before the indexed one never replaces it.
+        """
+        source = Path(parquet_path)
+        store = Path(store_dir)
+        manifest_path = store / MANIFEST_NAME
+        if not manifest_path.is_file():
+            return cls.build(source, store, row_group_size=row_group_size)
+
+        current = cls(store)
+        manifest = current.manifest
+        stat = source.stat()
+        if (
+            manifest.source_path == str(source.resolve())
+            and manifest.source_size == stat.st_size
+            and manifest.source_mtime_ns == stat.st_mtime_ns
+        ):
+            return current
+
+        source_date = extract_source_date(source)
+        if source_date and manifest.source_date and source_date < manifest.source_date:
+            logger.warning(
+                f"Keeping SAM.gov entity store {manifest.version}: {source} "
+                f"({source_date}) is older than the indexed extract ({manifest.source_date})"
+            )
+            return current
+        return cls.build(source, store, row_group_size=row_group_size)
+
+    @staticmethod
+    def _prune_versions(store: Path, keep: str) -> None:
+        # Readers memory-map files, and unlinking a mapped file leaves the
+        # mapping valid on POSIX, so superseded versions can go immediately.
+        for path in store.iterdir():
+            if path.is_dir() and path.name.startswith("v") and path.name != keep:
+                shutil.rmtree(path, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _to_frame(self, table: pa.Table) -> pd.DataFrame:
+        if SOURCE_ROW_COLUMN in table.column_names:
+            table = table.drop_columns([SOURCE_ROW_COLUMN])
+        return table.to_pandas()
+
+    def _first_by(self, table: pa.Table, key: str) -> pa.Table:
+        # Rows arrive sorted by (key, source row), so the first row per key is
+        # the one a scan of the original extract would have found first.
+        if table.num_rows == 0:
+            return table
+        keys = table[key].to_numpy(zero_copy_only=False)
+        first = np.concatenate([[0], np.flatnonzero(keys[1:] != keys[:-1]) + 1])
+        return table.take(pa.array(first, pa.int64()))
+
+    @staticmethod
+    def _in_request_order(frame: pd.DataFrame, key: str, requested: list[str]) -> pd.DataFrame:
+        order = {k: i for i, k in enumerate(dict.fromkeys(requested))}
+        frame = frame.assign(_order=frame[key].map(order))
+        return (
+            frame.sort_values("_order", kind="stable").drop(columns="_order").reset_index(drop=True)
+        )
+
+    def _entity_rows(self, ueis: Iterable[str], columns: list[str] | None) -> pa.Table:
+        if columns is not None:
+            columns = [c for c in columns if c in self.manifest.columns]
+            columns = [*columns, SOURCE_ROW_COLUMN]
+        return self._entities.lookup(ueis, columns=columns)
+
+    def get_many(self, ueis: Iterable[str], columns: list[str] | None = None) -> pd.DataFrame:
+        """Return one entity row per found UEI, in request order.
+
+        Args:
+            ueis: Unique Entity Identifiers to look up (duplicates and blanks
+                are ignored)
+            columns: Extract columns to return (``unique_entity_id`` is always
+                included); all columns when None
+
+        Returns:
+            DataFrame with the first extract row of each UEI that was found
+        """
+        requested = [u for u in ueis if isinstance(u, str) and u]
+        table = self._first_by(self._entity_rows(requested, columns), UEI_COLUMN)
+        return self._in_request_order(self._to_frame(table), UEI_COLUMN, requested)
+
+    def get(self, uei: str) -> pd.Series | None:
+        """Return the entity row for ``uei``, or None if it is not in the extract."""
+        frame = self.get_many([uei])
+        return frame.iloc[0] if len(frame) > 0 else None
+
+    def _by_index(self, kind: str, values: list[str]) -> tuple[pa.Table, pa.Table]:
+        index = self._indexes.get(kind)
+        if index is None or not values:
+            return pa.table({}), pa.table({})
+        hits = index.lookup(values)
+        rows = self._entity_rows(hits[UEI_COLUMN].to_pylist(), None)
+        wanted = pc.is_in(rows[SOURCE_ROW_COLUMN], value_set=hits[SOURCE_ROW_COLUMN])
+        return hits, rows.filter(wanted)
+
+    def get_many_by_cage(self, cages: Iterable[str]) -> pd.DataFrame:
+        """Return one entity row per found CAGE code, in request order."""
+        requested = [c for c in cages if isinstance(c, str) and c]
+        hits, rows = self._by_index("cage", requested)
+        if rows.num_rows == 0:
+            return pd.DataFrame(columns=self.columns)
+        first = self._first_by(hits, CAGE_COLUMN)[SOURCE_ROW_COLUMN]
+        rows = rows.filter(pc.is_in(rows[SOURCE_ROW_COLUMN], value_set=first))
+        rows = rows.sort_by([(SOURCE_ROW_COLUMN, "ascending")])
+        return self._in_request_order(self._to_frame(rows), CAGE_COLUMN, requested)
+
+    def get_by_cage(self, cage: str) -> pd.Series | None:
+        """Return the entity row for a CAGE code, or None if it is not indexed."""
+        frame = self.get_many_by_cage([cage])
+        return frame.iloc[0] if len(frame) > 0 else None
+
+    def get_by_duns(self, duns: str) -> pd.DataFrame:
+        """Return every entity row carrying a legacy DUNS number, in extract order.
+
+        Returns an empty DataFrame when the extract has no DUNS column.
+        """
+        if self.manifest.duns_column is None:
+            return pd.DataFrame()
+        _, rows = self._by_index("duns", [duns] if isinstance(duns, str) and duns else [])
+        if rows.num_rows == 0:
+            return pd.DataFrame(columns=self.columns)
+        rows = rows.sort_by([(SOURCE_ROW_COLUMN, "ascending")])
+        return self._to_frame(rows).reset_index(drop=True)
@@ -13,7 +13,8 @@ import pandas as pd
 from loguru import logger
 
 from ..config.loader import get_config
-from ..utils.cloud_storage import find_latest_sam_gov_parquet, resolve_data_path
+from ..utils.cloud_storage import find_latest_sam_gov_parquet, get_data_root, resolve_data_path
+from .sam_entity_store import SAMEntityStore
 
 
 class SAMGovExtractor:
@@ -46,22 +47,8 @@ class SAMGovExtractor:
         "duns_number",
     ]
 
-    def load_parquet(
-        self,
-        parquet_path: Path | str | None = None,
-        *,
-        columns: list[str] | None = None,
-    ) -> pd.DataFrame:
-        """
-        Load SAM.gov entity records from parquet file.
-
-        Args:
-            parquet_path: Path to parquet file. If None, uses config.
-            columns: Specific columns to load (reduces memory). If None, loads all columns.
-                     Use SAMGovExtractor.ENRICHMENT_COLUMNS for standard enrichment.
-
-        Returns:
-            pandas DataFrame with SAM.gov entity records
+    def _resolve_parquet_path(self, parquet_path: Path | str | None) -> Path:
+        """Resolve the extract path from the argument, config, or discovery.
 
         Raises:
             FileNotFoundError: If parquet file not found
@@ -86,6 +73,30 @@ class SAMGovExtractor:
                 f"SAM.gov parquet file not found: {resolved_path or parquet_path}"
             )
 
+        return resolved_path
+
+    def load_parquet(
+        self,
+        parquet_path: Path | str | None = None,
+        *,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Load SAM.gov entity records from parquet file.
+
+        Args:
+            parquet_path: Path to parquet file. If None, uses config.
+            columns: Specific columns to load (reduces memory). If None, loads all columns.
+                     Use SAMGovExtractor.ENRICHMENT_COLUMNS for standard enrichment.
+
+        Returns:
+            pandas DataFrame with SAM.gov entity records
+
+        Raises:
+            FileNotFoundError: If parquet file not found
+        """
+        resolved_path = self._resolve_parquet_path(parquet_path)
+
         logger.info(f"Loading SAM.gov parquet from: {resolved_path}")
         read_kwargs: dict[str, Any] = {}
         if columns:
@@ -109,35 +120,67 @@ class SAMGovExtractor:
 
         return df
 
-    def get_entity_by_uei(self, df: pd.DataFrame, uei: str) -> pd.Series | None:
+    def open_entity_store(
+        self,
+        parquet_path: Path | str | None = None,
+        store_dir: Path | str | None = None,
+    ) -> SAMEntityStore:
+        """
+        Open the key-indexed entity store, (re)building it from the extract if needed.
+
+        The store is rebuilt only when the resolved extract differs from the
+        one it was built from and is not older; otherwise the existing store is
+        memory-mapped as is.
+
+        Args:
+            parquet_path: Path to parquet file. If None, uses config.
+            store_dir: Store directory. Defaults to
+                ``<data root>/processed/sam_gov_entity_store``.
+
+        Returns:
+            SAMEntityStore answering UEI/CAGE/DUNS lookups
+
+        Raises:
+            FileNotFoundError: If parquet file not found
+        """
+        resolved_path = self._resolve_parquet_path(parquet_path)
+        if store_dir is None:
+            store_dir = get_data_root() / "processed" / "sam_gov_entity_store"
+        return SAMEntityStore.refresh(resolved_path, store_dir)
+
+    def get_entity_by_uei(self, df: pd.DataFrame | SAMEntityStore, uei: str) -> pd.Series | None:
         """
         Get entity record by UEI (Unique Entity Identifier).
 
         Args:
-            df: DataFrame with SAM.gov entities
+            df: DataFrame with SAM.gov entities, or an entity store
             uei: Unique Entity Identifier
 
         Returns:
             Series with entity data, or None if not found
         """
+        if isinstance(df, SAMEntityStore):
+            return df.get(uei)
         matches = df[df["unique_entity_id"] == uei]
         return matches.iloc[0] if len(matches) > 0 else None
 
-    def get_entity_by_cage(self, df: pd.DataFrame, cage: str) -> pd.Series | None:
+    def get_entity_by_cage(self, df: pd.DataFrame | SAMEntityStore, cage: str) -> pd.Series | None:
         """
         Get entity record by CAGE code.
 
         Args:
-            df: DataFrame with SAM.gov entities
+            df: DataFrame with SAM.gov entities, or an entity store
             cage: CAGE code
 
         Returns:
             Series with entity data, or None if not found
         """
+        if isinstance(df, SAMEntityStore):
+            return df.get_by_cage(cage)
         matches = df[df["cage_code"] == cage]
         return matches.iloc[0] if len(matches) > 0 else None
 
-    def get_entities_by_duns(self, df: pd.DataFrame, duns: str) -> pd.DataFrame:
+    def get_entities_by_duns(self, df: pd.DataFrame | SAMEntityStore, duns: str) -> pd.DataFrame:
         """
         Get entity records by DUNS number.
 
@@ -145,12 +188,14 @@ class SAMGovExtractor:
         This method searches for DUNS in various identifier fields.
 
         Args:
-            df: DataFrame with SAM.gov entities
+            df: DataFrame with SAM.gov entities, or an entity store
             duns: DUNS number
 
         Returns:
             DataFrame with matching entities
         """
+        if isinstance(df, SAMEntityStore):
+            return df.get_by_duns(duns)
         # SAM.gov uses UEI now, but some records may have legacy DUNS references
         # Search in tax_identifier_number or other fields if available
         # For now, return empty if DUNS column doesn't exist
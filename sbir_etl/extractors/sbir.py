@@ -76,11 +76,12 @@ class SbirDuckDBExtractor:
 
         Supports two modes:
          - Bulk import via DuckDB's native read_csv_auto (fast, single-step)
-         - Incremental import via pandas chunking (lower memory footprint)
+         - Incremental import streaming Arrow record batches into DuckDB
+           (bounded memory; every column imported as text)
 
         Args:
-            incremental: If True, use incremental pandas-chunk import
-            batch_size: Chunk size for incremental import (defaults to 10000)
+            incremental: If True, use the streaming incremental import
+            batch_size: Chunk size (rows) for the pandas import fallbacks
             delimiter: CSV delimiter
             header: Whether CSV has header row
             encoding: File encoding
@@ -118,6 +119,7 @@ class SbirDuckDBExtractor:
                 delimiter=delimiter,
                 header=header,
                 encoding=encoding,
+                engine="arrow",
             )
             import_duration = time.time() - start_time
         else:
@@ -278,6 +280,11 @@ class SbirDuckDBExtractor:
             "records_per_second": round(row_count / import_duration) if import_duration > 0 else 0,
             "used_incremental": bool(incremental),
             "chunk_size": batch_size or None,
+            "peak_arrow_memory_mb": (
+                self.duckdb_client.last_import_stats.get("peak_arrow_memory_mb")
+                if incremental
+                else None
+            ),
             "extraction_start_utc": extraction_start,
             "extraction_end_utc": extraction_end,
         }
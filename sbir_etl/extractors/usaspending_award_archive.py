@@ -10,7 +10,7 @@ from collections.abc import Iterator, Mapping
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import BinaryIO, Literal, cast
+from typing import BinaryIO, Literal, cast, overload
 from urllib.parse import urlparse
 
 import httpx
@@ -20,6 +20,7 @@ import pyarrow.csv as pa_csv
 from loguru import logger
 
 from sbir_etl.models.transition_models import FederalContract
+from sbir_etl.utils.cache.fingerprint import file_sha256 as _sha256
 
 from .contract_extractor import ArchiveSchemaError, ContractExtractor, SourceDataError
 
@@ -122,14 +123,6 @@ class AwardArchiveFile:
         )
 
 
-def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as stream:
-        for chunk in iter(lambda: stream.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _write_json_atomic(path: Path, payload: Mapping[str, object]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     temporary = path.with_name(f".{path.name}.tmp")
@@ -405,11 +398,40 @@ class AwardArchiveContractExtractor(ContractExtractor):
             "research": row.get("research"),
         }
 
+    @overload
+    def _stream_member(
+        self,
+        archive: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        *,
+        raw_rows: Literal[False] = False,
+    ) -> Iterator[FederalContract]: ...
+
+    @overload
+    def _stream_member(
+        self,
+        archive: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        *,
+        raw_rows: Literal[True],
+    ) -> Iterator[dict[str, str | None]]: ...
+
+    @overload
+    def _stream_member(
+        self,
+        archive: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        *,
+        raw_rows: bool = ...,
+    ) -> Iterator[FederalContract] | Iterator[dict[str, str | None]]: ...
+
     def _stream_member(
         self,
         archive: zipfile.ZipFile,
         info: zipfile.ZipInfo,
-    ) -> Iterator[FederalContract]:
+        *,
+        raw_rows: bool = False,
+    ) -> Iterator[FederalContract] | Iterator[dict[str, str | None]]:
         with archive.open(info) as member:
             reader = pa_csv.open_csv(
                 member,
@@ -426,9 +448,10 @@ class AwardArchiveContractExtractor(ContractExtractor):
                 matched = batch.filter(self._match_mask(batch))
                 self.stats["vendor_matches"] += matched.num_rows
                 for row in matched.to_pylist():
-                    contract = self._parse_contract_row(self._map_row(row))
+                    mapped = self._map_row(row)
+                    record = mapped if raw_rows else self._parse_contract_row(mapped)
                     self.stats["records_extracted"] += 1
-                    yield contract
+                    yield record
 
     def extract_from_archive(self, archive_file: Path, output_file: Path) -> int:
         """Stream all CSV members and atomically write matched contracts to Parquet."""
@@ -471,14 +494,14 @@ class AwardArchiveContractExtractor(ContractExtractor):
                 "provenance_version": AWARD_ARCHIVE_PROVENANCE_VERSION,
             }
 
-            def contracts() -> Iterator[FederalContract]:
+            def rows() -> Iterator[dict[str, str | None]]:
                 for info in members:
                     logger.info(
                         f"Scanning {info.filename} ({info.file_size / (1024**3):.2f} GiB uncompressed)"
                     )
-                    yield from self._stream_member(archive, info)
+                    yield from self._stream_member(archive, info, raw_rows=True)
 
-            count = self._collect_and_write(contracts(), Path(output_file))
+            count = self._collect_and_write(rows(), Path(output_file))
 
         final_stat = archive_file.stat()
         if (final_stat.st_size, final_stat.st_mtime_ns) != (
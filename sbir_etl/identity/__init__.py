@@ -15,6 +15,7 @@ from .company_names import (
     CompanyNameMetric,
     CompanyNameProfile,
     company_name_similarity,
+    native_rapidfuzz_scorer,
     normalize_company_name,
     rapidfuzz_jaro_winkler_100,
     rapidfuzz_ratio_100,
@@ -69,6 +70,7 @@ __all__ = [
     "SbirAwardKeyProfile",
     "build_canonical_company_map",
     "company_name_similarity",
+    "native_rapidfuzz_scorer",
     "normalize_company_name",
     "normalize_us_jurisdiction",
     "rapidfuzz_jaro_winkler_100",
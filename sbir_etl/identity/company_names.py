@@ -12,6 +12,7 @@ a profile rather than silently inventing another normalization rule.
 
 import re
 import unicodedata
+from collections.abc import Callable
 from difflib import SequenceMatcher
 from enum import StrEnum
 from typing import Any
@@ -335,6 +336,29 @@ def _raw_name(value: Any) -> str:
     return "" if _blank(value) else str(value)
 
 
+# RapidFuzz's native 0..100 scorers behind each metric the contract delegates.
+_NATIVE_SCORERS: dict[CompanyNameMetric, Callable[..., float]] = (
+    {}
+    if fuzz is None
+    else {
+        CompanyNameMetric.RATIO: fuzz.ratio,
+        CompanyNameMetric.TOKEN_SET: fuzz.token_set_ratio,
+        CompanyNameMetric.TOKEN_SORT: fuzz.token_sort_ratio,
+    }
+)
+
+
+def native_rapidfuzz_scorer(metric: CompanyNameMetric) -> Callable[..., float] | None:
+    """Return the native RapidFuzz scorer behind ``metric``, or None if unavailable.
+
+    For batch APIs such as ``rapidfuzz.process.cdist`` that only run at native
+    speed with a built-in scorer. On un-profiled, non-blank input its score is
+    ``company_name_similarity(metric=metric) * 100``.
+    """
+
+    return _NATIVE_SCORERS.get(metric)
+
+
 def company_name_similarity(
     left: Any,
     right: Any,
@@ -349,14 +373,8 @@ def company_name_similarity(
     right_text = normalize_company_name(right, profile=profile) if profile else _raw_name(right)
     if not left_text or not right_text:
         return 0.0
-    if fuzz is not None:
-        scorers = {
-            CompanyNameMetric.RATIO: fuzz.ratio,
-            CompanyNameMetric.TOKEN_SET: fuzz.token_set_ratio,
-            CompanyNameMetric.TOKEN_SORT: fuzz.token_sort_ratio,
-        }
-        if metric in scorers:
-            return float(scorers[metric](left_text, right_text)) / 100.0
+    if metric in _NATIVE_SCORERS:
+        return float(_NATIVE_SCORERS[metric](left_text, right_text)) / 100.0
     if metric is CompanyNameMetric.JARO_WINKLER and JaroWinkler is not None:
         return float(JaroWinkler.similarity(left_text, right_text, prefix_weight=prefix_weight))
     if metric is CompanyNameMetric.TOKEN_SET:
@@ -8,6 +8,7 @@ from collections.abc import Callable
 from typing import Any
 
 from sbir_etl.enrichers.openai_client import OpenAIClient
+from sbir_etl.utils.cache.llm_cache import default_llm_cache
 
 
 _CITATION = re.compile(r"\[(SAM|SBIR|USASPENDING)\]")
@@ -18,6 +19,9 @@ _SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
 # off and present uncited text as evidence-bounded.
 MAX_SUMMARY_CHARS = 600
 
+# Response-cache key version; bump when validation or evidence shaping changes.
+PROMPT_TEMPLATE_VERSION = "procurement-evidence-v1"
+
 
 def _first(row: dict[str, Any], *names: str) -> Any:
     for name in names:
@@ -82,7 +86,7 @@ def validate_cited_summary(value: str | None, *, max_chars: int = MAX_SUMMARY_CH
 def build_public_evidence_summarizer(api_key: str) -> Callable[[dict[str, Any]], str | None]:
     """Return a callback that summarizes supplied public fields and cannot affect scoring."""
 
-    client = OpenAIClient(api_key=api_key, max_concurrent=1, timeout=30)
+    client = OpenAIClient(api_key=api_key, max_concurrent=1, timeout=30, cache=default_llm_cache())
 
     def summarize(row: dict[str, Any]) -> str | None:
         evidence = {
@@ -116,6 +120,7 @@ def build_public_evidence_summarizer(api_key: str) -> Callable[[dict[str, Any]],
             f"{MAX_SUMMARY_CHARS} characters.",
             json.dumps(evidence, default=str),
             temperature=0.0,
+            cache_version=PROMPT_TEMPLATE_VERSION,
         )
         return validate_cited_summary(result)
 
@@ -22,13 +22,13 @@ from sbir_etl.identity.sbir_awards import SBIR_AWARD_KEY_VERSION
 from sbir_etl.reporting.procurement_transition.ai import MAX_SUMMARY_CHARS
 from sbir_etl.reporting.procurement_transition.cet_vocabulary import cet_agreement_fact
 from sbir_etl.utils.procurement_text import (
-    document_token_frequencies,
     extract_connection_sentences,
     find_lineage_phrases,
     rank_phrases_by_rarity,
     shared_technical_phrases,
     tokenize_technical_text,
 )
+from sbir_etl.utils.procurement_text_index import ProcurementTextIndex
 
 
 logger = logging.getLogger(__name__)
@@ -411,11 +411,13 @@ def _public_field_facts(
     award_abstract: str | None,
     opportunity_description: str | None,
     token_doc_freq: dict[str, int] | None = None,
+    text_index: ProcurementTextIndex | None = None,
 ) -> list[str]:
     """Describe deterministic, reader-verifiable links in the merged public fields.
 
     ``token_doc_freq`` (document frequencies over the run's corpus) re-ranks the
     shared phrases rarest-first so distinctive jargon leads the evidence.
+    ``text_index`` serves the shared phrases from cached n-gram sets.
     """
 
     facts: list[str] = []
@@ -444,7 +446,11 @@ def _public_field_facts(
         )
         if text
     )
-    phrases = shared_technical_phrases(award_text, opportunity_description)
+    phrases = (
+        text_index.shared_phrases(award_text, opportunity_description)
+        if text_index is not None
+        else shared_technical_phrases(award_text, opportunity_description)
+    )
     if phrases:
         if token_doc_freq:
             phrases = rank_phrases_by_rarity(phrases, token_doc_freq)
@@ -923,6 +929,7 @@ class MonthlyReportBuilder:
         max_summaries: int = 10,
         abstract_simplifier: Callable[[str], str | None] | None = None,
         fusion_scorer: FusionScorer | None,
+        text_index: ProcurementTextIndex | None = None,
     ) -> None:
         _month_bounds(report_month)
         if max_summaries < 0:
@@ -936,6 +943,8 @@ class MonthlyReportBuilder:
         self._summary_attempts = 0
         self._summary_targets: set[str] = set()
         self._token_doc_freq: dict[str, int] = {}
+        # Without a persistent index, texts are still tokenized once per run.
+        self.text_index = text_index if text_index is not None else ProcurementTextIndex()
 
     def _master(
         self,
@@ -1164,6 +1173,7 @@ class MonthlyReportBuilder:
             award_abstract=award_abstract,
             opportunity_description=opportunity_description,
             token_doc_freq=self._token_doc_freq,
+            text_index=self.text_index,
         )
         if facts:
             lines.append(f"**Why it connects:** {_markdown_text(' '.join(facts), limit=500)}")
@@ -1274,6 +1284,7 @@ class MonthlyReportBuilder:
             award_abstract=award_abstract,
             opportunity_description=opportunity_description,
             token_doc_freq=self._token_doc_freq,
+            text_index=self.text_index,
         )
         if not facts:
             return "No shared public fields — compare the source records."
@@ -1479,7 +1490,7 @@ class MonthlyReportBuilder:
             *award_cohorts.get("abstract", pd.Series(dtype="object")).tolist(),
             *opportunities.get("description", pd.Series(dtype="object")).tolist(),
         ]
-        self._token_doc_freq = document_token_frequencies(corpus)
+        self._token_doc_freq = self.text_index.document_frequencies(corpus)
         _spreadsheet_safe_frame(master).to_csv(
             self.output_dir / "master_candidates.csv", index=False
         )
@@ -1590,6 +1601,11 @@ class MonthlyReportBuilder:
         (self.output_dir / "manifest.json").write_text(
             json.dumps(manifest, indent=2), encoding="utf-8"
         )
+        logger.info(
+            "Text index: %d documents tokenized, %d reused from the store",
+            self.text_index.indexed,
+            self.text_index.reused,
+        )
         return self.output_dir
 
 
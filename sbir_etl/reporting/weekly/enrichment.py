@@ -1,7 +1,8 @@
 """External-data enrichment for the weekly report.
 
 Thin wrappers over sbir_etl.enrichers.* that add per-stage wall-clock
-budgeting, shared rate limiting, and report-shaped aggregation."""
+budgeting, shared rate limiting and per-API concurrency, and report-shaped
+aggregation."""
 
 import os
 import sys
@@ -33,16 +34,47 @@ from sbir_etl.extractors.solicitation import SolicitationExtractor
 from sbir_etl.reporting.weekly.debug import _debug
 from sbir_etl.reporting.weekly.fetching import _company_key
 from sbir_etl.reporting.weekly.models import SolicitationTopic
+from sbir_etl.reporting.weekly.scheduler import ApiBudget
 
 
 STAGE_TIMEOUT = int(os.environ.get("STAGE_TIMEOUT", "60"))
 
 
+# Concurrent calls allowed per external API across the whole report run. Batch
+# lookups size their pools from these and hold a slot around every call; the
+# report scheduler dispatches per-company stages against the same slots.
+API_CONCURRENCY: dict[str, int] = {
+    "usaspending": 4,
+    "sam_gov": 3,  # SAM.gov allows 60 req/min
+    "opencorporates": 2,
+    "lens": 3,
+    "semantic_scholar": 3,
+    "orcid": 3,
+    "openai": int(os.environ.get("OPENAI_MAX_CONCURRENT", "4")),
+}
+
+
+api_budget = ApiBudget(API_CONCURRENCY)
+
+
+# Overall report deadline (monotonic); stage deadlines never extend past it.
+_pipeline_deadline: float | None = None
+
+
+def set_pipeline_deadline(deadline: float | None) -> None:
+    """Cap every subsequent stage deadline at ``deadline`` (None to clear)."""
+    global _pipeline_deadline  # noqa: PLW0603
+    _pipeline_deadline = deadline
+
+
 def _stage_deadline(budget_seconds: int | None = None) -> float:
     """Return a monotonic deadline for the current pipeline stage."""
     import time
 
-    return time.monotonic() + (budget_seconds or STAGE_TIMEOUT)
+    deadline = time.monotonic() + (budget_seconds or STAGE_TIMEOUT)
+    if _pipeline_deadline is not None:
+        deadline = min(deadline, _pipeline_deadline)
+    return deadline
 
 
 def _past_deadline(deadline: float) -> bool:
@@ -70,22 +102,16 @@ _opencorporates_limiter = RateLimiter(rate_limit_per_minute=30)  # Free tier ~50
 _lens_limiter = RateLimiter(rate_limit_per_minute=50)  # Lens.org free tier
 
 
-def lookup_pi_external_data(
-    awards: list[dict],
-    company_federal_awards: dict[str, PIFederalAwardRecord] | None = None,
-) -> dict[str, dict]:
-    """Look up external data (patents, publications, ORCID, federal awards) for each PI.
+# External PI sources and the API whose concurrency slot each lookup holds.
+PI_SOURCE_APIS: dict[str, str] = {
+    "patents": "lens",
+    "publications": "semantic_scholar",
+    "orcid": "orcid",
+}
 
-    If company_federal_awards is provided, reuses those results instead of
-    re-querying USAspending for each PI's company.
 
-    Returns a dict keyed by upper-cased PI name, with sub-keys:
-    - "patents": PIPatentRecord | None
-    - "publications": PIPublicationRecord | None
-    - "orcid": ORCIDRecord | None
-    - "federal_awards": PIFederalAwardRecord | None
-    """
-    # Collect unique PIs with their company context
+def collect_pis(awards: list[dict]) -> dict[str, dict]:
+    """Return unique PIs keyed by upper-cased name, with their first award's company."""
     pis: dict[str, dict] = {}
     for a in awards:
         pi = str(a.get("PI Name", "")).strip()
@@ -99,67 +125,76 @@ def lookup_pi_external_data(
                 "uei": str(a.get("Company UEI", a.get("UEI", ""))).strip(),
                 "company_key": _company_key(a),
             }
+    return pis
 
-    results: dict[str, dict] = {}
-    total = len(pis)
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+def lookup_pi_source(source: str, info: dict):
+    """Run one external lookup (``patents``, ``publications`` or ``orcid``) for a PI.
 
-    def _lookup_single_pi(key: str, info: dict) -> tuple[str, dict]:
-        name = info["name"]
-        company = info["company"]
-        uei = info["uei"] or None
-
-        # Run the 3 independent API calls concurrently per PI
-        # Use _with_fallback variants for cross-API resilience
-        with ThreadPoolExecutor(max_workers=3) as inner:
-            patent_future = inner.submit(
-                _lib_lookup_pi_patents_with_fallback,
-                name,
-                company,
-                lens_rate_limiter=_lens_limiter,
-            )
-            pub_future = inner.submit(
-                _lib_lookup_pi_publications_with_fallback,
-                name,
-                rate_limiter=_semantic_scholar_limiter,
-                orcid_rate_limiter=_orcid_limiter,
-            )
-            orcid_future = inner.submit(
-                _lib_lookup_pi_orcid_with_fallback,
-                name,
-                rate_limiter=_orcid_limiter,
-                semantic_scholar_rate_limiter=_semantic_scholar_limiter,
-            )
+    Uses the _with_fallback variants for cross-API resilience.
+    """
+    name = info["name"]
+    if source == "patents":
+        return _lib_lookup_pi_patents_with_fallback(
+            name,
+            info["company"],
+            lens_rate_limiter=_lens_limiter,
+        )
+    if source == "publications":
+        return _lib_lookup_pi_publications_with_fallback(
+            name,
+            rate_limiter=_semantic_scholar_limiter,
+            orcid_rate_limiter=_orcid_limiter,
+        )
+    if source == "orcid":
+        return _lib_lookup_pi_orcid_with_fallback(
+            name,
+            rate_limiter=_orcid_limiter,
+            semantic_scholar_rate_limiter=_semantic_scholar_limiter,
+        )
+    raise ValueError(f"Unknown PI source: {source}")
 
-            patents = patent_future.result()
-            publications = pub_future.result()
-            orcid_rec = orcid_future.result()
-
-        # Reuse company federal awards if already fetched, else query fresh
-        fed = None
-        if company_federal_awards is not None:
-            fed = company_federal_awards.get(info["company_key"])
-        if fed is None and company_federal_awards is None:
-            fed = _lib_lookup_company_federal_awards(
-                company, uei, rate_limiter=_usaspending_limiter
-            )
 
-        return key, {
-            "patents": patents,
-            "publications": publications,
-            "orcid": orcid_rec,
-            "federal_awards": fed,
-        }
+def lookup_pi_external_data(
+    awards: list[dict],
+    company_federal_awards: dict[str, PIFederalAwardRecord] | None = None,
+) -> dict[str, dict]:
+    """Look up external data (patents, publications, ORCID, federal awards) for each PI.
+
+    If company_federal_awards is provided, reuses those results instead of
+    re-querying USAspending for each PI's company.
+
+    Returns a dict keyed by upper-cased PI name, with sub-keys:
+    - "patents": PIPatentRecord | None
+    - "publications": PIPublicationRecord | None
+    - "orcid": ORCIDRecord | None
+    - "federal_awards": PIFederalAwardRecord | None
+    """
+    import time
+
+    pis = collect_pis(awards)
+    results: dict[str, dict] = {}
+    total = len(pis)
+
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Process PIs concurrently (capped at 4 to respect API rate limits)
+    def _lookup_source(source: str, info: dict):
+        with api_budget.slot(PI_SOURCE_APIS[source]):
+            return lookup_pi_source(source, info)
+
+    # One flat pool of (PI, source) calls; each source is capped by its own
+    # API budget, so no per-PI inner pool is needed.
+    workers = sum(api_budget.limit(api) for api in PI_SOURCE_APIS.values())
     deadline = _stage_deadline()
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
         futures = {
-            executor.submit(_lookup_single_pi, key, info): (key, info) for key, info in pis.items()
+            key: {
+                source: executor.submit(_lookup_source, source, info) for source in PI_SOURCE_APIS
+            }
+            for key, info in pis.items()
         }
         done = 0
-        for future in as_completed(futures):
+        for key, info in pis.items():
             if _past_deadline(deadline):
                 print(
                     f"PI external data stage timeout ({STAGE_TIMEOUT}s) — "
@@ -169,10 +204,23 @@ def lookup_pi_external_data(
                 executor.shutdown(wait=False, cancel_futures=True)
                 break
             done += 1
-            key, info = futures[future]
             try:
-                pi_key, pi_data = future.result(timeout=10)
-                results[pi_key] = pi_data
+                timeout = max(0.0, deadline - time.monotonic())
+                pi_data = {
+                    source: future.result(timeout=timeout)
+                    for source, future in futures[key].items()
+                }
+                # Reuse company federal awards if already fetched, else query fresh
+                fed = None
+                if company_federal_awards is not None:
+                    fed = company_federal_awards.get(info["company_key"])
+                if fed is None and company_federal_awards is None:
+                    with api_budget.slot("usaspending"):
+                        fed = _lib_lookup_company_federal_awards(
+                            info["company"], info["uei"] or None, rate_limiter=_usaspending_limiter
+                        )
+                pi_data["federal_awards"] = fed
+                results[key] = pi_data
                 print(
                     f"Completed PI external data {done}/{total}: {info['name']}",
                     file=sys.stderr,
@@ -214,14 +262,15 @@ def lookup_usaspending_recipients(
 
     def _lookup_one(item: tuple[str, dict]) -> tuple[str, USARecipientProfile | None]:
         key, info = item
-        return key, _lib_lookup_usaspending_recipient_with_fallback(
-            info["name"],
-            info["uei"],
-            rate_limiter=_usaspending_limiter,
-            fallback_rate_limiter=_sam_gov_limiter,
-        )
+        with api_budget.slot("usaspending"):
+            return key, _lib_lookup_usaspending_recipient_with_fallback(
+                info["name"],
+                info["uei"],
+                rate_limiter=_usaspending_limiter,
+                fallback_rate_limiter=_sam_gov_limiter,
+            )
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    with ThreadPoolExecutor(max_workers=api_budget.limit("usaspending")) as executor:
         futures = {executor.submit(_lookup_one, item): item for item in companies.items()}
         for future in as_completed(futures):
             if _past_deadline(deadline):
@@ -284,16 +333,16 @@ def lookup_sam_entities(
 
     def _lookup_one(item: tuple[str, dict]) -> tuple[str, SAMEntityRecord | None]:
         key, info = item
-        return key, _lib_lookup_sam_entity_with_fallback(
-            info["name"],
-            info["uei"],
-            info["cage"],
-            rate_limiter=_sam_gov_limiter,
-            fallback_rate_limiter=_usaspending_limiter,
-        )
+        with api_budget.slot("sam_gov"):
+            return key, _lib_lookup_sam_entity_with_fallback(
+                info["name"],
+                info["uei"],
+                info["cage"],
+                rate_limiter=_sam_gov_limiter,
+                fallback_rate_limiter=_usaspending_limiter,
+            )
 
-    # Cap at 3 workers to respect SAM.gov 60 req/min rate limit
-    with ThreadPoolExecutor(max_workers=3) as executor:
+    with ThreadPoolExecutor(max_workers=api_budget.limit("sam_gov")) as executor:
         futures = {executor.submit(_lookup_one, item): item for item in companies.items()}
         for future in as_completed(futures):
             if _past_deadline(deadline):
@@ -347,10 +396,13 @@ def lookup_opencorporates(
 
     def _lookup_one(item: tuple[str, dict]) -> tuple[str, CorporateRecord | None]:
         key, info = item
-        with SyncOpenCorporatesClient(shared_limiter=_opencorporates_limiter) as client:
+        with (
+            api_budget.slot("opencorporates"),
+            SyncOpenCorporatesClient(shared_limiter=_opencorporates_limiter) as client,
+        ):
             return key, client.lookup_company(info["name"], jurisdiction=info["jurisdiction"])
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
+    with ThreadPoolExecutor(max_workers=api_budget.limit("opencorporates")) as executor:
         futures = {executor.submit(_lookup_one, item): item for item in companies.items()}
         for future in as_completed(futures):
             if _past_deadline(deadline):
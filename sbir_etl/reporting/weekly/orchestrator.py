@@ -3,6 +3,10 @@
 Composes the fetching, enrichment, LLM, and rendering stages. The CLI script
 (scripts/data/weekly_awards_report.py) parses arguments and delegates here.
 
+Stages run as a dependency graph on ``scheduler.StageScheduler``: each lookup
+or LLM call starts once its inputs are ready, under the per-API concurrency
+budget in ``enrichment.API_CONCURRENCY`` and the overall ``timeout``.
+
 Stage functions are called through their modules (``fetching.fetch_weekly_awards``
 etc.) so tests can stub any stage by patching the module attribute.
 """
@@ -10,11 +14,11 @@ etc.) so tests can stub any stage by patching the module attribute.
 import os
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
 
 from sbir_etl.enrichers.company_enrichment import (
-    FederalAwardSummary as PIFederalAwardRecord,
     SAMEntityRecord,
     USARecipientProfile,
     lookup_company_federal_awards as _lib_lookup_company_federal_awards,
@@ -24,13 +28,42 @@ from sbir_etl.enrichers.press_wire import PressRelease
 
 from sbir_etl.reporting.weekly import enrichment, fetching, link_verification, llm, rendering
 from sbir_etl.reporting.weekly.debug import _debug, debug_enabled
-from sbir_etl.reporting.weekly.enrichment import (
-    STAGE_TIMEOUT,
-    _past_deadline,
-    _stage_deadline,
-    _usaspending_limiter,
-)
+from sbir_etl.reporting.weekly.enrichment import _usaspending_limiter
 from sbir_etl.reporting.weekly.models import CompanyResearch
+from sbir_etl.reporting.weekly.scheduler import StageScheduler, StageTiming
+from sbir_etl.utils.cache.llm_cache import default_llm_cache
+
+
+@dataclass
+class _StagePlan:
+    """Entity keys of the per-company / per-PI stages declared for a run."""
+
+    research: list[str] = field(default_factory=list)
+    co_fed: list[str] = field(default_factory=list)
+    co_diligence: list[str] = field(default_factory=list)
+    pi_diligence: list[str] = field(default_factory=list)
+
+
+def _collect(results: Mapping[str, Any], prefix: str, keys: list[str]) -> dict[str, Any]:
+    """Gather ``{key: result}`` from per-entity stages, dropping empty results."""
+    collected = {}
+    for key in keys:
+        value = results.get(f"{prefix}:{key}")
+        if value:
+            collected[key] = value
+    return collected
+
+
+def _map_sam_naics(sam_data: dict[str, SAMEntityRecord] | None) -> dict[str, str]:
+    """BEA sector mapping from SAM.gov NAICS codes (local YAML lookup)."""
+    if not sam_data:
+        return {}
+    all_naics: list[str] = []
+    for sam_rec in sam_data.values():
+        for code in sam_rec.naics_codes or []:
+            if code and code not in all_naics:
+                all_naics.append(code)
+    return enrichment.map_naics_to_bea_sectors(all_naics)
 
 
 @dataclass
@@ -47,14 +80,12 @@ class WeeklyAwardsReportBuilder:
     skip_sbir_api: bool = False
     timeout: int = 720
     api_key: str = ""
+    stage_timings: dict[str, StageTiming] = field(default_factory=dict, init=False, repr=False)
 
     def run(self) -> str:
         pipeline_start = time.monotonic()
         pipeline_deadline = pipeline_start + self.timeout
 
-        def _pipeline_expired() -> bool:
-            return time.monotonic() > pipeline_deadline
-
         awards, freshness_warnings, shared_source, shared_ext, shared_table = (
             fetching.fetch_weekly_awards(days=self.days)
         )
@@ -73,260 +104,62 @@ class WeeklyAwardsReportBuilder:
                 f"Topic='{sample.get('Topic Code')}'"
             )
 
-        # Generate AI content if API key is available
-        synopsis = None
-        descriptions = None
+        # Every lookup and LLM call is a stage in one dependency graph, so each
+        # starts as soon as its inputs are ready (see scheduler.py).
+        api_key = self.api_key
+        scheduler = StageScheduler(budget=enrichment.api_budget, deadline=pipeline_deadline)
+        enrichment.set_pipeline_deadline(pipeline_deadline)
+        try:
+            plan = self._plan_stages(scheduler, awards, shared_source, shared_ext, shared_table)
+            results = scheduler.run()
+        finally:
+            enrichment.set_pipeline_deadline(None)
+        self.stage_timings = scheduler.timings
+        _debug("Stage timings (slowest first):\n" + scheduler.summary())
+
+        sol_topics = results.get("sol_topics")
+        usa_descs: dict[str, str] | None = results.get("usa_descs")
+        usa_recipients: dict[str, USARecipientProfile] | None = results.get("usa_recipients")
+        sam_data: dict[str, SAMEntityRecord] | None = results.get("sam_data")
+        oc_data: dict[str, CorporateRecord] | None = results.get("oc_data")
+        press_hits: dict[str, list[PressRelease]] | None = results.get("press_hits")
+        inflation_data: dict[str, float] = results.get("inflation") or {}
+        synopsis = results.get("synopsis")
+        descriptions = results.get("descriptions")
         company_info: dict[str, CompanyResearch] | None = None
         co_diligence: dict[str, str] | None = None
         pi_dilig: dict[str, str] | None = None
-        api_key = self.api_key
-
-        # --- Stage 1: Parallel API fetches (solicitation topics + USAspending +
-        # SAM + OpenCorporates + press wire) ---
-        sol_topics = None
-        usa_descs: dict[str, str] | None = None
-        usa_recipients: dict[str, USARecipientProfile] | None = None
-        sam_data: dict[str, SAMEntityRecord] | None = None
-        oc_data: dict[str, CorporateRecord] | None = None
-        press_hits: dict[str, list[PressRelease]] | None = None
-        if awards:
-            fetch_futures: dict = {}
-            with ThreadPoolExecutor(max_workers=6) as fetch_pool:
-                if not self.skip_sbir_api:
-                    fetch_futures["sol_topics"] = fetch_pool.submit(
-                        enrichment.fetch_solicitation_topics, awards
-                    )
-                else:
-                    print("Skipping SBIR.gov API calls (--skip-sbir-api)", file=sys.stderr)
-
-                # Government data APIs (USAspending, SAM.gov) are independent of AI —
-                # always fetch when awards exist so enrichment data (BEA sectors,
-                # congressional districts, recipient profiles) is available regardless
-                # of whether AI descriptions are generated.
-                fetch_futures["usa_descs"] = fetch_pool.submit(
-                    enrichment.fetch_usaspending_contract_descriptions, awards
-                )
-                fetch_futures["usa_recipients"] = fetch_pool.submit(
-                    enrichment.lookup_usaspending_recipients, awards
-                )
-                fetch_futures["sam_data"] = fetch_pool.submit(
-                    enrichment.lookup_sam_entities, awards
-                )
-                # OpenCorporates — state corporation filings (free tier, no key required)
-                fetch_futures["oc_data"] = fetch_pool.submit(
-                    enrichment.lookup_opencorporates, awards
-                )
-                # Press wire feeds — RSS polling (free, no key required)
-                fetch_futures["press_hits"] = fetch_pool.submit(enrichment.poll_press_wire, awards)
-
-                # Collect results
-                for name, future in fetch_futures.items():
-                    try:
-                        result = future.result()
-                        if name == "sol_topics":
-                            sol_topics = result
-                        elif name == "usa_descs":
-                            usa_descs = result
-                        elif name == "usa_recipients":
-                            usa_recipients = result
-                        elif name == "sam_data":
-                            sam_data = result
-                        elif name == "oc_data":
-                            oc_data = result
-                        elif name == "press_hits":
-                            press_hits = result
-                    except Exception as e:
-                        print(f"Warning: {name} fetch failed: {e}", file=sys.stderr)
-
-        # Local enrichments (no network I/O except congressional district Census fallback)
-        inflation_data: dict[str, float] = {}
-        congressional: dict[str, str] = {}
-        bea_sectors: dict[str, str] = {}
-        if awards:
-            inflation_data = enrichment.enrich_with_inflation(awards)
-            # BEA sector mapping from SAM.gov NAICS codes (local YAML lookup)
-            if sam_data:
-                all_naics: list[str] = []
-                for sam_rec in sam_data.values():
-                    for code in sam_rec.naics_codes or []:
-                        if code and code not in all_naics:
-                            all_naics.append(code)
-                bea_sectors = enrichment.map_naics_to_bea_sectors(all_naics)
-        # Congressional district resolution may call Census API — only when AI is enabled
-        if awards and api_key and not self.no_ai:
-            congressional = enrichment.resolve_congressional_districts(awards)
+        if plan.research:
+            company_info = _collect(results, "research", plan.research)
+        if plan.co_fed:
+            co_fed = _collect(results, "co_fed", plan.co_fed)
+            print(
+                f"Found federal awards for {len(co_fed)}/{len(plan.co_fed)} companies",
+                file=sys.stderr,
+            )
+        if plan.co_diligence:
+            co_diligence = _collect(results, "co_diligence", plan.co_diligence)
+        if plan.pi_diligence:
+            pi_dilig = _collect(results, "pi_diligence", plan.pi_diligence)
 
+        if any(t.status == "skipped" for t in scheduler.timings.values()):
+            elapsed = int(time.monotonic() - pipeline_start)
+            print(
+                f"Pipeline timeout ({self.timeout}s) at {elapsed}s — "
+                f"generating report with partial enrichment",
+                file=sys.stderr,
+            )
         if api_key and not self.no_ai:
-            # --- Stage 2: Company research (parallelized within) ---
-            if not self.no_company_research and not _pipeline_expired():
-                company_info = llm.research_companies(api_key, awards)
-            if _pipeline_expired():
+            cache_stats = default_llm_cache().stats()
+            if cache_stats["enabled"]:
+                lookups = cache_stats["hits"] + cache_stats["misses"]
                 print(
-                    f"Pipeline timeout ({self.timeout}s) — skipping remaining AI enrichment",
+                    f"LLM response cache: {cache_stats['hits']}/{lookups} hits "
+                    f"({cache_stats['hit_rate']:.0%}), {cache_stats['entries']} entries, "
+                    f"{cache_stats['size_mb']} MB",
                     file=sys.stderr,
                 )
-            else:
-                # --- Stage 3: Synopsis + descriptions in parallel ---
-                with ThreadPoolExecutor(max_workers=2) as ai_pool:
-                    synopsis_future = ai_pool.submit(
-                        llm.generate_weekly_synopsis,
-                        api_key,
-                        awards,
-                        self.days,
-                        company_info,
-                        sol_topics,
-                        usa_descs,
-                        sam_data,
-                        oc_data,
-                        press_hits,
-                    )
-                    desc_future = ai_pool.submit(
-                        llm.generate_award_descriptions,
-                        api_key,
-                        awards,
-                        company_info,
-                        sol_topics,
-                        usa_descs,
-                        sam_data,
-                        oc_data,
-                        press_hits,
-                    )
-                    try:
-                        synopsis = synopsis_future.result()
-                    except Exception as e:
-                        print(f"Warning: synopsis generation failed: {e}", file=sys.stderr)
-                    try:
-                        descriptions = desc_future.result()
-                    except Exception as e:
-                        print(f"Warning: description generation failed: {e}", file=sys.stderr)
-
-            if not self.no_diligence and not _pipeline_expired():
-                # Reuse the source/extractor/table from fetch_weekly_awards() to
-                # avoid re-downloading and re-importing the ~376 MB CSV.
-                # Build history sequentially — both use the same DuckDB connection
-                # which is not thread-safe for concurrent queries.
-                print("Building historical context...", file=sys.stderr)
-                co_history = fetching.get_company_history(
-                    awards, shared_source, shared_ext, shared_table
-                )
-                pi_history = fetching.get_pi_history(
-                    awards, shared_source, shared_ext, shared_table
-                )
-
-                # SAM.gov entity data was already fetched above for LLM context;
-                # reuse sam_data for diligence.
-
-                # --- Stage 5: Company federal awards (already parallelized) ---
-                print("Looking up company federal awards on USAspending...", file=sys.stderr)
-                co_fed: dict[str, PIFederalAwardRecord] = {}
-                co_names: dict[str, dict] = {}
-                for a in awards:
-                    name = str(a.get("Company", "")).strip()
-                    if not name:
-                        continue
-                    key = fetching._company_key(a)
-                    if key not in co_names:
-                        co_names[key] = {
-                            "name": name,
-                            "uei": str(a.get("Company UEI", a.get("UEI", ""))).strip() or None,
-                        }
-
-                def _lookup_co_fed(
-                    item: tuple[str, dict],
-                ) -> tuple[str, PIFederalAwardRecord | None]:
-                    k, info = item
-                    return k, _lib_lookup_company_federal_awards(
-                        info["name"], info["uei"], rate_limiter=_usaspending_limiter
-                    )
-
-                co_fed_deadline = _stage_deadline()
-                with ThreadPoolExecutor(max_workers=4) as executor:
-                    futures = {
-                        executor.submit(_lookup_co_fed, item): item for item in co_names.items()
-                    }
-                    for future in as_completed(futures):
-                        if _past_deadline(co_fed_deadline):
-                            print(
-                                f"USAspending stage timeout ({STAGE_TIMEOUT}s) — "
-                                f"completed {len(co_fed)}/{len(co_names)}, skipping remainder",
-                                file=sys.stderr,
-                            )
-                            executor.shutdown(wait=False, cancel_futures=True)
-                            break
-                        try:
-                            key, result = future.result(timeout=10)
-                            if result:
-                                co_fed[key] = result
-                        except Exception:
-                            pass
-                print(
-                    f"Found federal awards for {len(co_fed)}/{len(co_names)} companies",
-                    file=sys.stderr,
-                )
-
-                # Supplement BEA mapping with NAICS codes from USAspending awards
-                if co_fed:
-                    usa_naics: list[str] = []
-                    for fed_rec in co_fed.values():
-                        for code in fed_rec.naics_codes or []:
-                            if code and code not in usa_naics:
-                                usa_naics.append(code)
-                    if usa_naics:
-                        extra_bea = enrichment.map_naics_to_bea_sectors(usa_naics)
-                        for code, sector in extra_bea.items():
-                            if code not in bea_sectors:
-                                bea_sectors[code] = sector
-                        _debug(f"USAspending NAICS→BEA supplement: {len(extra_bea)} codes")
-
-                # Fetch external PI data (patents, publications, ORCID).
-                # Reuse co_fed to avoid duplicate USAspending calls per company.
-                pi_ext: dict[str, dict] = {}
-                if not _pipeline_expired():
-                    print("Looking up PI patents, publications, and ORCID...", file=sys.stderr)
-                    pi_ext = enrichment.lookup_pi_external_data(awards, co_fed)
-
-                # --- Stage 6: Company + PI diligence in parallel ---
-                if not _pipeline_expired():
-                    with ThreadPoolExecutor(max_workers=2) as dilig_pool:
-                        co_dilig_future = dilig_pool.submit(
-                            llm.generate_company_diligence,
-                            api_key,
-                            awards,
-                            company_info,
-                            co_history,
-                            sam_data,
-                            co_fed,
-                            usa_recipients,
-                            congressional,
-                            bea_sectors,
-                            oc_data,
-                            press_hits,
-                        )
-                        pi_dilig_future = dilig_pool.submit(
-                            llm.generate_pi_diligence,
-                            api_key,
-                            awards,
-                            pi_history,
-                            company_info,
-                            pi_ext,
-                        )
-                        try:
-                            co_diligence = co_dilig_future.result()
-                        except Exception as e:
-                            print(f"Warning: company diligence failed: {e}", file=sys.stderr)
-                        try:
-                            pi_dilig = pi_dilig_future.result()
-                        except Exception as e:
-                            print(f"Warning: PI diligence failed: {e}", file=sys.stderr)
-
-                if _pipeline_expired():
-                    elapsed = int(time.monotonic() - pipeline_start)
-                    print(
-                        f"Pipeline timeout ({self.timeout}s) at {elapsed}s — "
-                        f"generating report with partial enrichment",
-                        file=sys.stderr,
-                    )
-        elif not api_key and not self.no_ai:
+        if not api_key and not self.no_ai:
             print(
                 "OPENAI_API_KEY not set - skipping AI summaries. "
                 "Set the env var or use --no-ai to silence this message.",
@@ -363,6 +196,249 @@ class WeeklyAwardsReportBuilder:
             inflation_data=inflation_data,
         )
 
+    def _plan_stages(
+        self,
+        scheduler: StageScheduler,
+        awards: list[dict],
+        shared_source,
+        shared_ext,
+        shared_table,
+    ) -> _StagePlan:
+        """Declare the report's stages on ``scheduler``.
+
+        Government lookups always run when there are awards. With AI enabled,
+        research, synopsis/descriptions and per-company/per-PI diligence are
+        added as per-entity stages, so e.g. one company's diligence starts as
+        soon as its research and federal-award lookup are done.
+        """
+        plan = _StagePlan()
+        if not awards:
+            return plan
+        api_key = self.api_key
+
+        # --- Batch lookups (each caps its own calls via enrichment.api_budget) ---
+        fetches = ["usa_descs", "sam_data", "oc_data", "press_hits"]
+        if not self.skip_sbir_api:
+            scheduler.add("sol_topics", lambda r: enrichment.fetch_solicitation_topics(awards))
+            fetches.append("sol_topics")
+        else:
+            print("Skipping SBIR.gov API calls (--skip-sbir-api)", file=sys.stderr)
+        # Government data APIs (USAspending, SAM.gov) are independent of AI —
+        # always fetch when awards exist so enrichment data (BEA sectors,
+        # congressional districts, recipient profiles) is available regardless
+        # of whether AI descriptions are generated.
+        scheduler.add(
+            "usa_descs", lambda r: enrichment.fetch_usaspending_contract_descriptions(awards)
+        )
+        scheduler.add("usa_recipients", lambda r: enrichment.lookup_usaspending_recipients(awards))
+        scheduler.add("sam_data", lambda r: enrichment.lookup_sam_entities(awards))
+        # OpenCorporates — state corporation filings (free tier, no key required)
+        scheduler.add("oc_data", lambda r: enrichment.lookup_opencorporates(awards))
+        # Press wire feeds — RSS polling (free, no key required)
+        scheduler.add("press_hits", lambda r: enrichment.poll_press_wire(awards))
+        # Local enrichments
+        scheduler.add("inflation", lambda r: enrichment.enrich_with_inflation(awards))
+        scheduler.add(
+            "bea_sectors", lambda r: _map_sam_naics(r.get("sam_data")), after=["sam_data"]
+        )
+
+        if not api_key or self.no_ai:
+            return plan
+        # Congressional district resolution may call Census API — only when AI is enabled
+        scheduler.add("congressional", lambda r: enrichment.resolve_congressional_districts(awards))
+
+        # --- Company research, one web search per company ---
+        if not self.no_company_research:
+            targets = llm.research_targets(awards)
+            for idx, (key, info) in enumerate(targets, 1):
+
+                def _research(r, info=info, idx=idx, total=len(targets)):
+                    research = llm.research_company(api_key, info)
+                    print(
+                        f"Completed company research {idx}/{total}: {info['name']}",
+                        file=sys.stderr,
+                    )
+                    return research
+
+                scheduler.add(f"research:{key}", _research, api="openai")
+                plan.research.append(key)
+        research_stages = [f"research:{key}" for key in plan.research]
+
+        def _research_results(r) -> dict[str, CompanyResearch]:
+            return _collect(r, "research", plan.research)
+
+        # --- Synopsis + descriptions once all research and fetches are in ---
+        scheduler.add(
+            "synopsis",
+            lambda r: llm.generate_weekly_synopsis(
+                api_key,
+                awards,
+                self.days,
+                _research_results(r) if plan.research else None,
+                r.get("sol_topics"),
+                r.get("usa_descs"),
+                r.get("sam_data"),
+                r.get("oc_data"),
+                r.get("press_hits"),
+            ),
+            after=[*research_stages, *fetches],
+            api="openai",
+        )
+        scheduler.add(
+            "descriptions",
+            lambda r: llm.generate_award_descriptions(
+                api_key,
+                awards,
+                _research_results(r) if plan.research else None,
+                r.get("sol_topics"),
+                r.get("usa_descs"),
+                r.get("sam_data"),
+                r.get("oc_data"),
+                r.get("press_hits"),
+            ),
+            after=[*research_stages, *fetches],
+            api="openai",
+        )
+
+        if self.no_diligence:
+            return plan
+
+        # Reuse the source/extractor/table from fetch_weekly_awards() to
+        # avoid re-downloading and re-importing the ~376 MB CSV. Build history
+        # in one stage — both use the same DuckDB connection, which is not
+        # thread-safe for concurrent queries.
+        def _history(r) -> tuple[dict, dict]:
+            print("Building historical context...", file=sys.stderr)
+            co_history = fetching.get_company_history(
+                awards, shared_source, shared_ext, shared_table
+            )
+            pi_history = fetching.get_pi_history(awards, shared_source, shared_ext, shared_table)
+            return co_history, pi_history
+
+        scheduler.add("history", _history)
+
+        # --- Company federal awards, one USAspending lookup per company ---
+        lookup_deadline = enrichment._stage_deadline()
+        co_names: dict[str, dict] = {}
+        for a in awards:
+            name = str(a.get("Company", "")).strip()
+            if not name:
+                continue
+            key = fetching._company_key(a)
+            if key not in co_names:
+                co_names[key] = {
+                    "name": name,
+                    "uei": str(a.get("Company UEI", a.get("UEI", ""))).strip() or None,
+                }
+        for key, info in co_names.items():
+
+            def _company_federal_awards(r: Mapping[str, Any], info: dict = info) -> Any:
+                return _lib_lookup_company_federal_awards(
+                    info["name"], info["uei"], rate_limiter=_usaspending_limiter
+                )
+
+            scheduler.add(
+                f"co_fed:{key}",
+                _company_federal_awards,
+                api="usaspending",
+                deadline=lookup_deadline,
+            )
+            plan.co_fed.append(key)
+
+        # --- Company diligence, started per company as its inputs arrive ---
+        companies = llm.diligence_companies(awards)
+        shared_inputs = [
+            "history",
+            "sam_data",
+            "usa_recipients",
+            "congressional",
+            "bea_sectors",
+            "oc_data",
+            "press_hits",
+        ]
+        for idx, (key, co_awards) in enumerate(companies, 1):
+
+            def _company_diligence(r, key=key, co_awards=co_awards, idx=idx):
+                fed = r.get(f"co_fed:{key}")
+                return llm.generate_company_diligence_for(
+                    api_key,
+                    key,
+                    co_awards,
+                    idx,
+                    len(companies),
+                    company_research=_research_results(r),
+                    company_history=r.get("history", (None, None))[0],
+                    sam_entities=r.get("sam_data"),
+                    company_federal_awards={key: fed} if fed else None,
+                    usa_recipients=r.get("usa_recipients"),
+                    congressional_districts=r.get("congressional"),
+                    bea_sectors=r.get("bea_sectors"),
+                    corporate_records=r.get("oc_data"),
+                    press_releases=r.get("press_hits"),
+                )
+
+            own = [name for name in (f"research:{key}", f"co_fed:{key}") if name in scheduler]
+            scheduler.add(
+                f"co_diligence:{key}",
+                _company_diligence,
+                after=[*own, *shared_inputs],
+                api="openai",
+            )
+            plan.co_diligence.append(key)
+
+        # --- PI external data (patents, publications, ORCID) and PI diligence ---
+        pis = llm.diligence_pis(awards)
+        pi_info = enrichment.collect_pis(awards)
+        for idx, (key, pi_awards) in enumerate(pis, 1):
+            info = pi_info[key]
+            for source, api in enrichment.PI_SOURCE_APIS.items():
+
+                def _pi_source(
+                    r: Mapping[str, Any], source: str = source, info: dict = info
+                ) -> Any:
+                    return enrichment.lookup_pi_source(source, info)
+
+                scheduler.add(
+                    f"pi_{source}:{key}",
+                    _pi_source,
+                    api=api,
+                    deadline=lookup_deadline,
+                )
+            company_key = info["company_key"]
+
+            def _pi_diligence(r, key=key, pi_awards=pi_awards, idx=idx, company_key=company_key):
+                pi_ext = None
+                sources = {source: f"pi_{source}:{key}" for source in enrichment.PI_SOURCE_APIS}
+                # Like lookup_pi_external_data: a PI has external data only if
+                # every source lookup succeeded.
+                if all(stage in r for stage in sources.values()):
+                    record = {source: r[stage] for source, stage in sources.items()}
+                    # Reuse the company's federal awards rather than re-querying.
+                    record["federal_awards"] = r.get(f"co_fed:{company_key}")
+                    pi_ext = {key: record}
+                return llm.generate_pi_diligence_for(
+                    api_key,
+                    key,
+                    pi_awards,
+                    idx,
+                    len(pis),
+                    pi_history=r.get("history", (None, None))[1],
+                    company_research=_research_results(r),
+                    pi_external_data=pi_ext,
+                )
+
+            inputs = [f"pi_{source}:{key}" for source in enrichment.PI_SOURCE_APIS]
+            inputs += [
+                name
+                for name in (f"research:{company_key}", f"co_fed:{company_key}")
+                if name in scheduler
+            ]
+            scheduler.add(
+                f"pi_diligence:{key}", _pi_diligence, after=[*inputs, "history"], api="openai"
+            )
+            plan.pi_diligence.append(key)
+        return plan
+
     @staticmethod
     def _print_debug_summary(
         awards,
@@ -0,0 +1,256 @@
+"""Dependency-driven stage scheduler for the weekly report.
+
+The report used to run its stages as a fixed sequence of thread pools, so each
+stage waited for the previous one even when it did not need its output. Here
+every unit of work (a batch lookup, one company's federal-award lookup, one
+company's diligence paragraph, ...) is a stage that names the stages it reads.
+A stage starts as soon as those have finished, so the report takes as long as
+its critical path rather than the sum of its stages.
+
+Two budgets bound the run:
+
+- ``ApiBudget`` caps concurrent calls per external API. Stages declaring an
+  ``api`` are only dispatched while that API has a free slot, and batch lookups
+  take the same slots around each call, so the cap holds across the whole run.
+- A pipeline deadline: stages that have not started by then are skipped and
+  the report is rendered from whatever finished.
+
+A failed or skipped stage simply has no result; dependents still run and see
+the missing input, matching the report's degraded modes.
+"""
+
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from sbir_etl.reporting.weekly.debug import _debug
+
+
+StageFunc = Callable[[Mapping[str, Any]], Any]
+
+
+class ApiBudget:
+    """Per-API concurrency caps shared by scheduled stages and batch lookups."""
+
+    def __init__(self, limits: Mapping[str, int]):
+        self.limits = {api: max(1, int(limit)) for api, limit in limits.items()}
+        self._semaphores = {
+            api: threading.BoundedSemaphore(limit) for api, limit in self.limits.items()
+        }
+
+    def limit(self, api: str) -> int:
+        """Maximum concurrent calls allowed for ``api``."""
+        return self.limits[api]
+
+    def try_acquire(self, api: str) -> bool:
+        return self._semaphores[api].acquire(blocking=False)
+
+    def acquire(self, api: str) -> None:
+        self._semaphores[api].acquire()
+
+    def release(self, api: str) -> None:
+        self._semaphores[api].release()
+
+    @contextmanager
+    def slot(self, api: str) -> Iterator[None]:
+        """Hold one of ``api``'s slots for the duration of a call."""
+        self.acquire(api)
+        try:
+            yield
+        finally:
+            self.release(api)
+
+
+@dataclass
+class StageTiming:
+    """Outcome and wall-clock window of one stage (seconds from scheduler start)."""
+
+    name: str
+    status: str = "pending"  # ok | failed | skipped
+    started: float | None = None
+    finished: float | None = None
+    error: str | None = None
+
+    @property
+    def seconds(self) -> float | None:
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+@dataclass
+class _Stage:
+    name: str
+    func: StageFunc
+    after: tuple[str, ...]
+    api: str | None
+    deadline: float | None
+
+
+class StageScheduler:
+    """Run a DAG of stages on a thread pool as their inputs become ready."""
+
+    def __init__(
+        self,
+        *,
+        budget: ApiBudget | None = None,
+        deadline: float | None = None,
+        max_workers: int | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            budget: Per-API concurrency caps for stages that declare an ``api``
+            deadline: ``time.monotonic()`` value after which no stage starts
+            max_workers: Thread pool size. Defaults to one thread per stage
+                without an ``api`` plus every API slot, so a stage never waits
+                for a thread while holding a slot.
+        """
+        self.budget = budget
+        self.deadline = deadline
+        self.max_workers = max_workers
+        self.results: dict[str, Any] = {}
+        self.timings: dict[str, StageTiming] = {}
+        self._stages: dict[str, _Stage] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._stages
+
+    def add(
+        self,
+        name: str,
+        func: StageFunc,
+        *,
+        after: tuple[str, ...] | list[str] = (),
+        api: str | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Declare a stage.
+
+        Args:
+            name: Unique stage name; its return value is stored under it
+            func: Called with the results mapping once every ``after`` stage is done
+            after: Stages whose results ``func`` reads
+            api: API whose concurrency slot the stage holds while it runs
+            deadline: Stage-specific start deadline (the earlier of this and the
+                scheduler deadline applies)
+        """
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        if api is not None and (self.budget is None or api not in self.budget.limits):
+            raise ValueError(f"Stage {name} uses unbudgeted API {api!r}")
+        self._stages[name] = _Stage(name, func, tuple(after), api, deadline)
+        self.timings[name] = StageTiming(name)
+
+    def _validate(self) -> None:
+        for stage in self._stages.values():
+            missing = [dep for dep in stage.after if dep not in self._stages]
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages {missing}")
+        # Kahn's algorithm: anything left over is on a cycle.
+        remaining = {name: set(stage.after) for name, stage in self._stages.items()}
+        while True:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                break
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        if remaining:
+            raise ValueError(f"Stage dependency cycle among {sorted(remaining)}")
+
+    def _expired(self, stage: _Stage, now: float) -> bool:
+        deadlines = [d for d in (self.deadline, stage.deadline) if d is not None]
+        return bool(deadlines) and now > min(deadlines)
+
+    def run(self) -> dict[str, Any]:
+        """Run every stage and return the results of those that succeeded."""
+        self._validate()
+        start = time.monotonic()
+        pending = dict(self._stages)
+        done: set[str] = set()
+        running: dict[Future, _Stage] = {}
+        # add() rejects stages naming an API without a budget, so the empty
+        # fallback is never consulted.
+        budget = self.budget or ApiBudget({})
+
+        def _execute(stage: _Stage) -> Any:
+            self.timings[stage.name].started = time.monotonic() - start
+            return stage.func(self.results)
+
+        workers = self.max_workers
+        if workers is None:
+            unbudgeted = sum(1 for stage in self._stages.values() if stage.api is None)
+            slots = sum(budget.limits.values())
+            workers = max(1, unbudgeted + slots)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while pending or running:
+                blocked: list[tuple[_Stage, str]] = []
+                for stage in list(pending.values()):
+                    if not all(dep in done for dep in stage.after):
+                        continue
+                    if self._expired(stage, time.monotonic()):
+                        del pending[stage.name]
+                        self._finish(stage, start, status="skipped")
+                        done.add(stage.name)
+                        continue
+                    if stage.api is not None and not budget.try_acquire(stage.api):
+                        blocked.append((stage, stage.api))
+                        continue
+                    del pending[stage.name]
+                    running[pool.submit(_execute, stage)] = stage
+
+                if not running:
+                    if not blocked:
+                        # Skips above may have unblocked dependents; rescan.
+                        continue
+                    # Slots are held outside this scheduler; wait for one.
+                    stage, api = blocked[0]
+                    budget.acquire(api)
+                    del pending[stage.name]
+                    running[pool.submit(_execute, stage)] = stage
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    if stage.api is not None:
+                        budget.release(stage.api)
+                    try:
+                        self.results[stage.name] = future.result()
+                    except Exception as e:
+                        print(f"Warning: {stage.name} stage failed: {e}", file=sys.stderr)
+                        self._finish(stage, start, status="failed", error=str(e))
+                    else:
+                        self._finish(stage, start, status="ok")
+                    done.add(stage.name)
+        return self.results
+
+    def _finish(
+        self, stage: _Stage, start: float, *, status: str, error: str | None = None
+    ) -> None:
+        timing = self.timings[stage.name]
+        timing.status = status
+        timing.error = error
+        timing.finished = time.monotonic() - start
+        if status == "skipped":
+            timing.started = timing.finished
+        _debug(f"Stage {stage.name}: {status} in {timing.seconds or 0.0:.2f}s")
+
+    def summary(self) -> str:
+        """One line per stage, slowest first, for debug output."""
+        lines = []
+        for timing in sorted(self.timings.values(), key=lambda t: -(t.seconds or 0.0)):
+            window = (
+                f"{timing.started:7.2f}s → {timing.finished:7.2f}s"
+                if timing.started is not None and timing.finished is not None
+                else "not run"
+            )
+            lines.append(f"{timing.name:<40} {timing.status:<8} {window}")
+        return "\n".join(lines)
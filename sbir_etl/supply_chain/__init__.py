@@ -33,12 +33,14 @@ from sbir_etl.supply_chain.subaward_network import (
     build_supplier_customer_exposure,
     build_subaward_facts,
 )
+from sbir_etl.supply_chain.subaward_stream import StreamedSubawardFacts, stream_subaward_facts
 
 
 EPISTEMIC_TIER = "pipelines"
 
 __all__ = [
     "NSFReconciliationResult",
+    "StreamedSubawardFacts",
     "aggregate_supplier_prime_edges",
     "build_defense_funding_summary",
     "build_nsf_award_defense_evidence",
@@ -56,5 +58,6 @@ __all__ = [
     "normalize_subaward_transactions",
     "reconcile_nsf_sbir_awards",
     "requested_nsf_award_ids",
+    "stream_subaward_facts",
     "validate_nsf_defense_lineage_release",
 ]
@@ -10,11 +10,13 @@ from __future__ import annotations
 import hashlib
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
 import pandas as pd
 
+from sbir_etl.utils.cache.fingerprint import file_sha256 as _file_sha256
 from sbir_etl.utils.text_normalization import normalize_name
 
 DEFENSE_FUNDING_SCHEMA_VERSION = "NSF-DEFENSE-FUNDING-2026Q3"
@@ -61,6 +63,11 @@ def _name(value: object) -> str | None:
     cleaned = _text(value)
     if cleaned is None:
         return None
+    return _normalized_name(cleaned)
+
+
+@lru_cache(maxsize=262_144)
+def _normalized_name(cleaned: str) -> str | None:
     normalized = normalize_name(cleaned, remove_suffixes=True)
     return normalized if len(normalized) >= 4 else None
 
@@ -72,14 +79,6 @@ def _first(frame: pd.DataFrame, aliases: tuple[str, ...]) -> pd.Series:
     return pd.Series(pd.NA, index=frame.index, dtype="object")
 
 
-def _file_sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _json_values(values: object) -> list[str]:
     if _missing(values):
         return []
@@ -147,7 +146,7 @@ def build_nsf_identity_registry(
             },
         )
 
-    for _, row in awardees.iterrows():
+    for row in awardees.to_dict("records"):
         item = bucket(row.get("nsf_organization_id"))
         if item is None:
             continue
@@ -181,7 +180,7 @@ def build_nsf_identity_registry(
         item["awardee_status"] = _text(row.get("nsf_awardee_status"))
 
     if reconciliation is not None and not reconciliation.empty:
-        for _, row in reconciliation.iterrows():
+        for row in reconciliation.to_dict("records"):
             item = bucket(row.get("nsf_organization_id"))
             if item is None:
                 continue
@@ -261,29 +260,40 @@ def _registry_maps(
     }
     if missing := sorted(required - set(registry.columns)):
         raise ValueError(f"NSF identity registry is missing required columns: {missing}")
-    owners: dict[str, dict[str, set[str]]] = {"uei": {}, "duns": {}, "name": {}}
-    for _, row in registry.iterrows():
-        organization_id = str(row["nsf_organization_id"])
-        for key, column in (
-            ("uei", "recipient_uei_aliases"),
-            ("duns", "recipient_duns_aliases"),
-            ("name", "normalized_name_aliases"),
-        ):
-            for value in _json_values(row[column]):
-                owners[key].setdefault(value, set()).add(organization_id)
-    if conflicts := {
-        f"{kind}:{value}": sorted(ids)
-        for kind in ("uei", "duns")
-        for value, ids in owners[kind].items()
-        if len(ids) > 1
-    }:
-        raise ValueError(
-            f"exact identity aliases are ambiguous: {dict(sorted(conflicts.items())[:5])}"
+    organization_ids = registry["nsf_organization_id"].astype(str)
+    maps: list[dict[str, str]] = []
+    conflicts: dict[str, list[str]] = {}
+    for kind, column in (
+        ("uei", "recipient_uei_aliases"),
+        ("duns", "recipient_duns_aliases"),
+        ("name", "normalized_name_aliases"),
+    ):
+        owners = (
+            pd.DataFrame(
+                {"organization_id": organization_ids, "value": registry[column].map(_json_values)}
+            )
+            .explode("value")
+            .dropna(subset=["value"])
+            .drop_duplicates()
         )
-    maps = []
-    for kind in ("uei", "duns", "name"):
+        owner_counts = owners["value"].value_counts()
+        shared = owner_counts.index[owner_counts > 1]
+        if kind != "name":
+            for value, ids in owners.loc[owners["value"].isin(shared)].groupby("value")[
+                "organization_id"
+            ]:
+                conflicts[f"{kind}:{value}"] = sorted(ids)
         maps.append(
-            {value: next(iter(ids)) for value, ids in owners[kind].items() if len(ids) == 1}
+            cast(
+                dict[str, str],
+                owners.loc[~owners["value"].isin(shared)]
+                .set_index("value")["organization_id"]
+                .to_dict(),
+            )
+        )
+    if conflicts:
+        raise ValueError(
+            f"exact identity aliases are ambiguous: {dict(sorted(conflicts.items())[:5])}"
         )
     return cast(tuple[dict[str, str], dict[str, str], dict[str, str]], tuple(maps))
 
@@ -868,18 +878,20 @@ def build_nsf_award_defense_evidence(
             validate="many_to_one",
         )
     evidence["evidence_assertion_id"] = evidence.apply(
-        lambda row: "nsf-dod-evidence:"
-        + hashlib.sha256(
-            json.dumps(
-                [
-                    _text(row.get("nsf_award_id")),
-                    _text(row.get("_dod_award_key")),
-                    _text(row.get("funding_mode")),
-                    _text(row.get("instrument_group")),
-                ],
-                separators=(",", ":"),
-            ).encode()
-        ).hexdigest()[:20],
+        lambda row: (
+            "nsf-dod-evidence:"
+            + hashlib.sha256(
+                json.dumps(
+                    [
+                        _text(row.get("nsf_award_id")),
+                        _text(row.get("_dod_award_key")),
+                        _text(row.get("funding_mode")),
+                        _text(row.get("instrument_group")),
+                    ],
+                    separators=(",", ":"),
+                ).encode()
+            ).hexdigest()[:20]
+        ),
         axis=1,
     )
     return evidence.sort_values(
@@ -931,8 +943,10 @@ def evaluate_defense_funding_quality(
     if not summary.empty:
         traceability = bool(
             summary.apply(
-                lambda row: len(_json_values(row["source_transaction_ids"]))
-                == int(row["source_transaction_count"]),
+                lambda row: (
+                    len(_json_values(row["source_transaction_ids"]))
+                    == int(row["source_transaction_count"])
+                ),
                 axis=1,
             ).all()
         )
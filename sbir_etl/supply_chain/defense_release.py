@@ -32,6 +32,7 @@ from sbir_etl.supply_chain.defense_funding import (
     normalize_subaward_transactions,
 )
 from sbir_etl.supply_chain.subaward_network import build_subaward_facts
+from sbir_etl.utils.cache.fingerprint import file_sha256 as _sha256
 
 DEFAULT_LINEAGE_DIR = Path("data/processed/nsf_sbir_defense_lineage")
 DEFAULT_PRIME_SNAPSHOT_ROOT = Path("data/raw/usaspending/nsf_awardee_prime")
@@ -80,14 +81,6 @@ _SUBAWARD_COLUMNS = {
 }
 
 
-def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _prime_snapshot_metadata(path: Path) -> dict[str, object]:
     manifest_path = path / "manifest.json"
     if not manifest_path.is_file():
@@ -14,6 +14,7 @@ from typing import Any, cast
 import pandas as pd
 
 from sbir_etl.extractors.nsf_awards import normalize_nsf_award_id
+from sbir_etl.utils.cache.fingerprint import file_sha256 as _file_sha256
 from sbir_etl.utils.text_normalization import normalize_name
 
 
@@ -87,14 +88,6 @@ def _analysis_timestamp(value: str | date | datetime | pd.Timestamp) -> pd.Times
     return result.normalize()
 
 
-def _file_sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _stable_record_ids(frame: pd.DataFrame) -> pd.Series:
     columns = [
         "sbir_gov_company_name",
@@ -21,30 +21,24 @@ from sbir_etl.supply_chain.nsf_direct import (
     reconcile_nsf_sbir_awards,
     requested_nsf_award_ids,
 )
+from sbir_etl.utils.cache.fingerprint import file_sha256 as _sha256, files_sha256
 
 DEFAULT_AWARDS = Path("data/raw/sbir/award_data.csv")
 DEFAULT_OUTPUT_DIR = Path("data/processed/nsf_sbir_defense_lineage")
 DEFAULT_SNAPSHOT_ROOT = Path("data/raw/nsf/award_api")
 
 
-def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _source_metadata(path: Path) -> dict[str, object]:
     if path.is_file():
         return {"path": str(path), "kind": "file", "sha256": _sha256(path)}
     files = sorted(child for child in path.rglob("*") if child.is_file())
+    file_digests = files_sha256(files)
     digest = hashlib.sha256()
     for child in files:
         relative = str(child.relative_to(path))
         digest.update(relative.encode())
         digest.update(b"\0")
-        digest.update(_sha256(child).encode())
+        digest.update(file_digests[child].encode())
         digest.update(b"\n")
     return {
         "path": str(path),
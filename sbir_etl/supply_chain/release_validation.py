@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 from datetime import UTC, date, datetime
 from pathlib import Path
@@ -10,6 +9,8 @@ from typing import Any
 
 import pandas as pd
 
+from sbir_etl.utils.cache.fingerprint import file_sha256 as _sha256
+
 RELEASE_PRODUCT_SCHEMAS: dict[str, tuple[str, set[str]]] = {
     "direct_awards": (
         "nsf_sbir_awards_direct.parquet",
@@ -129,14 +130,6 @@ _UNIQUE_IDS = {
 }
 
 
-def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _as_date(value: object) -> date | None:
     timestamp = pd.to_datetime(str(value), errors="coerce", utc=True)
     return None if pd.isna(timestamp) else timestamp.date()
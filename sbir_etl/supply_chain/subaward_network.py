@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import re
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any, cast
 
 import pandas as pd
@@ -58,7 +59,14 @@ def _clean_identifier(value: object) -> str | None:
 def _clean_name(value: object) -> str | None:
     if value is None or pd.isna(cast(Any, value)):
         return None
-    cleaned = normalize_name(str(value), remove_suffixes=True)
+    return _normalized_name(str(value))
+
+
+@lru_cache(maxsize=262_144)
+def _normalized_name(text: str) -> str | None:
+    # Subawardee and prime names repeat heavily across report versions and
+    # fiscal years; normalize each distinct spelling once.
+    cleaned = normalize_name(text, remove_suffixes=True)
     return cleaned if len(cleaned) >= 4 else None
 
 
@@ -320,6 +328,55 @@ def build_nsf_sbir_award_candidates(
     )
 
 
+SUBAWARDEE_UEI_COLUMNS = ("subawardee_uei", "sub_recipient_uei")
+SUBAWARDEE_DUNS_COLUMNS = ("subawardee_duns", "sub_recipient_duns")
+SUBAWARDEE_NAME_COLUMNS = ("subawardee_name", "sub_recipient_name")
+
+# Every source column ``_project_subawards`` reads, for projected scans.
+SUBAWARD_SOURCE_COLUMNS = frozenset(
+    {
+        "prime_award_unique_key",
+        "unique_award_key",
+        "prime_award_piid",
+        "prime_piid",
+        "award_id",
+        "prime_awardee_uei",
+        "prime_recipient_uei",
+        "prime_awardee_duns",
+        "prime_recipient_duns",
+        "prime_awardee_name",
+        "prime_recipient_name",
+        "prime_awardee_parent_uei",
+        "prime_parent_uei",
+        "prime_awardee_parent_name",
+        "prime_parent_name",
+        "prime_award_naics_code",
+        "naics_code",
+        "prime_award_base_transaction_description",
+        "prime_award_description",
+        "subaward_number",
+        "subaward_id",
+        "subaward_sam_report_id",
+        "sam_report_id",
+        "subaward_amount",
+        "amount",
+        "subaward_action_date",
+        "action_date",
+        *SUBAWARDEE_UEI_COLUMNS,
+        *SUBAWARDEE_DUNS_COLUMNS,
+        *SUBAWARDEE_NAME_COLUMNS,
+        "subaward_description",
+        "description",
+        "usaspending_permalink",
+        "source_url",
+        "subaward_sam_report_last_modified_date",
+        "source_last_modified",
+        "source_input_path",
+        "source_input_sha256",
+    }
+)
+
+
 def _project_subawards(subawards: pd.DataFrame) -> pd.DataFrame:
     return pd.DataFrame(
         {
@@ -358,13 +415,13 @@ def _project_subawards(subawards: pd.DataFrame) -> pd.DataFrame:
                 _first_column(subawards, ("subaward_action_date", "action_date")),
                 errors="coerce",
             ),
-            "subawardee_uei": _first_column(subawards, ("subawardee_uei", "sub_recipient_uei")).map(
+            "subawardee_uei": _first_column(subawards, SUBAWARDEE_UEI_COLUMNS).map(
                 _clean_identifier
             ),
-            "subawardee_duns": _first_column(
-                subawards, ("subawardee_duns", "sub_recipient_duns")
-            ).map(_clean_identifier),
-            "subawardee_name": _first_column(subawards, ("subawardee_name", "sub_recipient_name")),
+            "subawardee_duns": _first_column(subawards, SUBAWARDEE_DUNS_COLUMNS).map(
+                _clean_identifier
+            ),
+            "subawardee_name": _first_column(subawards, SUBAWARDEE_NAME_COLUMNS),
             "subaward_description": _first_column(
                 subawards, ("subaward_description", "description")
             ),
@@ -843,6 +900,7 @@ def network_metadata(
 
 
 __all__ = [
+    "SUBAWARD_SOURCE_COLUMNS",
     "EvidenceGrade",
     "MatchMethod",
     "aggregate_supplier_prime_edges",
@@ -0,0 +1,204 @@
+"""Bounded-memory variant of the SBIR-awardee subaward network build.
+
+``build_subaward_facts`` takes the whole DoD subaward extract as one frame,
+which does not fit for the multi-year corpus. Only rows whose subawardee
+resolves to a known SBIR awardee ever reach the facts table, so this module
+scans the extract in Arrow record batches and keeps just those rows:
+
+- only the columns ``build_subaward_facts`` reads are decoded, as strings;
+- subawardee identifiers and names are cleaned once per distinct value in a
+  batch (names also go through the shared normalization cache);
+- the UEI → DUNS → name cascade is a semi-join of each batch against the
+  registry's unambiguous keys, the same rule the in-memory builder applies.
+
+Corrected report versions of one subaward can sit in different files, so the
+version deduplication and edge aggregation run once over the matched rows
+rather than per batch. The facts are identical to building from the
+concatenated extract; peak memory is one batch plus the matched subset.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import IO, Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from loguru import logger
+
+from sbir_etl.supply_chain.subaward_network import (
+    SUBAWARD_SOURCE_COLUMNS,
+    SUBAWARDEE_DUNS_COLUMNS,
+    SUBAWARDEE_NAME_COLUMNS,
+    SUBAWARDEE_UEI_COLUMNS,
+    _clean_identifier,
+    _clean_name,
+    _first_column,
+    _unique_mapping,
+    build_subaward_facts,
+)
+
+
+DEFAULT_BATCH_ROWS = 250_000
+DEFAULT_CSV_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StreamedSubawardFacts:
+    """Facts built from a batched scan, with the scan's row counts."""
+
+    facts: pd.DataFrame
+    source_rows: int
+    matched_rows: int
+    batches: int
+
+
+def iter_subaward_batches(
+    path: Path,
+    *,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    csv_block_bytes: int = DEFAULT_CSV_BLOCK_BYTES,
+) -> Iterator[pd.DataFrame]:
+    """Yield the projected subaward columns of ``path`` one batch at a time.
+
+    Parquet files are read ``batch_rows`` rows at a time; CSV files (bare or
+    inside a zip archive) one ``csv_block_bytes`` block at a time, with every
+    column read as a string so batches never disagree on inferred types.
+    """
+    suffix = path.suffix.lower()
+    if suffix in {".parquet", ".pq"}:
+        parquet = pq.ParquetFile(path)
+        columns = [name for name in parquet.schema_arrow.names if name in SUBAWARD_SOURCE_COLUMNS]
+        for batch in parquet.iter_batches(batch_size=batch_rows, columns=columns):
+            yield batch.to_pandas()
+    elif suffix == ".csv":
+        yield from _csv_batches(lambda: path.open("rb"), csv_block_bytes)
+    elif suffix == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            csv_names = [name for name in archive.namelist() if name.lower().endswith(".csv")]
+            if not csv_names:
+                raise ValueError(f"archive contains no CSV files: {path}")
+            for name in csv_names:
+                yield from _csv_batches(partial(archive.open, name), csv_block_bytes)
+    else:
+        raise ValueError(f"unsupported input format: {path}")
+
+
+def _csv_batches(
+    open_stream: Callable[[], AbstractContextManager[IO[bytes]]], block_bytes: int
+) -> Iterator[pd.DataFrame]:
+    with open_stream() as stream:
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        header = next(csv.reader(text), [])
+    columns = [name for name in dict.fromkeys(header) if name in SUBAWARD_SOURCE_COLUMNS]
+    if not columns:
+        return
+    with open_stream() as stream:
+        reader = pacsv.open_csv(
+            stream,
+            read_options=pacsv.ReadOptions(block_size=block_bytes),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=columns,
+                column_types={name: pa.string() for name in columns},
+                strings_can_be_null=True,
+            ),
+        )
+        for batch in reader:
+            yield batch.to_pandas()
+
+
+def _map_distinct(values: pd.Series, func: Callable[[Any], str | None]) -> pd.Series:
+    codes, uniques = pd.factorize(values)
+    mapped = np.array([func(value) for value in uniques] + [None], dtype=object)
+    return pd.Series(mapped[codes], index=values.index, dtype="object")
+
+
+def _matched_rows(
+    batch: pd.DataFrame,
+    uei_keys: pd.Index,
+    duns_keys: pd.Index,
+    name_keys: pd.Index | None,
+) -> pd.DataFrame:
+    uei = _map_distinct(_first_column(batch, SUBAWARDEE_UEI_COLUMNS), _clean_identifier)
+    duns = _map_distinct(_first_column(batch, SUBAWARDEE_DUNS_COLUMNS), _clean_identifier)
+    matched = uei.isin(uei_keys) | duns.isin(duns_keys)
+    if name_keys is not None:
+        names = _map_distinct(_first_column(batch, SUBAWARDEE_NAME_COLUMNS), _clean_name)
+        matched |= names.isin(name_keys)
+    return batch.loc[matched]
+
+
+def stream_subaward_facts(
+    awardees: pd.DataFrame,
+    paths: Iterable[Path],
+    *,
+    include_name_candidates: bool = True,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    csv_block_bytes: int = DEFAULT_CSV_BLOCK_BYTES,
+) -> StreamedSubawardFacts:
+    """Build subaward facts from subaward files without loading them whole.
+
+    Args:
+        awardees: Registry from ``build_sbir_awardee_registry``
+        paths: Subaward extracts (Parquet, CSV, or zipped CSV)
+        include_name_candidates: Keep exact normalized-name matches
+        batch_rows: Rows per Parquet batch
+        csv_block_bytes: Bytes per CSV block
+
+    Returns:
+        The same facts ``build_subaward_facts`` returns for the concatenated
+        files, plus the number of source rows scanned and rows matched.
+    """
+    uei_keys = pd.Index(_unique_mapping(awardees, "sbir_uei", "sbir_organization_id"))
+    duns_keys = pd.Index(_unique_mapping(awardees, "sbir_duns", "sbir_organization_id"))
+    name_keys = (
+        pd.Index(_unique_mapping(awardees, "normalized_name", "sbir_organization_id"))
+        if include_name_candidates
+        else None
+    )
+
+    kept: list[pd.DataFrame] = []
+    source_rows = batches = 0
+    for path in paths:
+        for batch in iter_subaward_batches(
+            path, batch_rows=batch_rows, csv_block_bytes=csv_block_bytes
+        ):
+            source_rows += len(batch)
+            batches += 1
+            matched = _matched_rows(batch, uei_keys, duns_keys, name_keys)
+            if not matched.empty:
+                kept.append(matched)
+
+    subawards = pd.concat(kept, ignore_index=True) if kept else pd.DataFrame()
+    logger.info(
+        f"Scanned {source_rows:,} subaward rows in {batches:,} batches; "
+        f"{len(subawards):,} matched an SBIR awardee"
+    )
+    facts = build_subaward_facts(
+        awardees, subawards, include_name_candidates=include_name_candidates
+    )
+    return StreamedSubawardFacts(
+        facts=facts,
+        source_rows=source_rows,
+        matched_rows=len(subawards),
+        batches=batches,
+    )
+
+
+__all__ = [
+    "DEFAULT_BATCH_ROWS",
+    "DEFAULT_CSV_BLOCK_BYTES",
+    "StreamedSubawardFacts",
+    "iter_subaward_batches",
+    "stream_subaward_facts",
+]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+from collections.abc import Iterable
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 
 
@@ -21,18 +24,6 @@ def _text(value: object, fallback: str = "Unknown") -> str:
     return rendered or fallback
 
 
-def _float(value: object, default: float = 0.0) -> float:
-    if value is None or pd.isna(cast(Any, value)):
-        return default
-    return float(cast(Any, value))
-
-
-def _int(value: object, default: int = 0) -> int:
-    if value is None or pd.isna(cast(Any, value)):
-        return default
-    return int(cast(Any, value))
-
-
 def _bool(value: object, default: bool = False) -> bool:
     if value is None or pd.isna(cast(Any, value)):
         return default
@@ -47,10 +38,74 @@ def _date(value: object) -> str | None:
     return pd.Timestamp(cast(Any, value)).date().isoformat()
 
 
+# Payloads are built a column at a time. Each coercion below returns, as plain
+# Python values, exactly what coercing every cell on its own would (``_text``,
+# ``float``/``int`` with a default for missing cells, ``_bool``, ``_date``), so
+# the exported JSON is unchanged.
+
+
+def _texts(values: pd.Series, fallback: str = "Unknown") -> list[str]:
+    rendered = values.astype(object).where(values.notna().to_numpy(), "").map(str).str.strip()
+    return rendered.where(rendered.ne(""), fallback).tolist()
+
+
+def _floats(values: pd.Series, default: float = 0.0) -> list[float]:
+    numbers = pd.to_numeric(values).to_numpy(dtype="float64", na_value=np.nan)
+    return np.where(np.isnan(numbers), default, numbers).tolist()
+
+
+def _ints(values: pd.Series, default: int = 0) -> list[int]:
+    numbers = pd.to_numeric(values)
+    if numbers.dtype.kind in "iu" and not numbers.isna().any():
+        return numbers.tolist()
+    floats = numbers.to_numpy(dtype="float64", na_value=np.nan)
+    # Casting truncates toward zero, like int().
+    return np.where(np.isnan(floats), default, floats).astype("int64").tolist()
+
+
+def _bools(values: pd.Series, default: bool = False) -> list[bool]:
+    if values.dtype == bool:
+        return values.tolist()
+    return [_bool(value, default) for value in values.tolist()]
+
+
+def _dates(values: pd.Series) -> list[str | None]:
+    if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return [_date(value) for value in values.tolist()]
+    formatted = values.dt.strftime("%Y-%m-%d").tolist()
+    return [
+        text if present else None for text, present in zip(formatted, values.notna(), strict=True)
+    ]
+
+
+def _rounded(values: list[float], digits: int) -> list[float]:
+    # Python's round, not numpy's: they disagree on some halfway cases.
+    return [round(value, digits) for value in values]
+
+
+def _records(columns: dict[str, Any], count: int) -> list[dict[str, Any]]:
+    """Transpose column lists (or per-column constants) into ``count`` records."""
+    names = list(columns)
+    values = [
+        value if isinstance(value, list) else itertools.repeat(value, count)
+        for value in columns.values()
+    ]
+    return [dict(zip(names, row, strict=True)) for row in zip(*values, strict=True)]
+
+
+def _aligned(keyed: pd.DataFrame, keys: list[str]) -> tuple[pd.DataFrame, np.ndarray]:
+    """Rows of ``keyed`` (unique index) for each of ``keys``, and which keys exist.
+
+    Columns are cast to object first so missing keys do not upcast integers.
+    """
+    found = pd.Index(keys).isin(keyed.index)
+    return keyed.astype(object).reindex(keys).reset_index(drop=True), found
+
+
 def _canonical_names(frame: pd.DataFrame, id_column: str, name_column: str) -> dict[str, str]:
     """Choose the most frequently reported non-empty name for each identifier."""
     candidates = frame[[id_column, name_column]].copy()
-    candidates[name_column] = candidates[name_column].map(lambda value: _text(value, ""))
+    candidates[name_column] = _texts(candidates[name_column], "")
     candidates = candidates.loc[candidates[name_column].ne("")]
     counts = (
         candidates.groupby([id_column, name_column], as_index=False, dropna=False)
@@ -61,59 +116,83 @@ def _canonical_names(frame: pd.DataFrame, id_column: str, name_column: str) -> d
     return counts.set_index(id_column)[name_column].astype(str).to_dict()
 
 
-def _supplier_node(row: pd.Series, exposure: dict[str, dict[str, Any]]) -> dict[str, Any]:
-    organization_id = _text(row["sbir_organization_id"])
-    screen = exposure.get(organization_id, {})
-    return {
-        "id": f"supplier:{organization_id}",
-        "organization_id": organization_id,
-        "label": _text(row["sbir_awardee_name"]),
-        "kind": "supplier",
-        "tier": "tier_2",
-        "edge_count": _int(row["edge_count"]),
-        "prime_family_count": _int(row["prime_family_count"]),
-        "reported_subaward_amount": round(_float(row["reported_subaward_amount"]), 2),
-        "reported_subaward_count": _int(row["reported_subaward_count"]),
-        "max_fiscal_years": _int(row["max_fiscal_years"]),
-        "screening_status": _text(screen.get("screening_status"), "not_screened"),
-        "observed_customer_hhi": round(_float(screen.get("observed_customer_hhi")), 6),
-        "top_observed_prime_share": round(_float(screen.get("top_observed_prime_share")), 6),
-        "nsf_sbir_awardee": _bool(screen.get("nsf_sbir_awardee")),
-        "nsf_sbir_award_count": _int(screen.get("nsf_sbir_award_count")),
-        "nsf_sbir_topic_codes": _text(screen.get("nsf_sbir_topic_codes"), ""),
-        "nsf_sbir_first_award_year": _int(screen.get("nsf_sbir_first_award_year"), default=0),
-        "nsf_sbir_latest_award_year": _int(screen.get("nsf_sbir_latest_award_year"), default=0),
-        "nsf_sbir_award_amount": round(_float(screen.get("nsf_sbir_award_amount")), 2),
-        "nsf_review_priority": _text(screen.get("nsf_review_priority"), "not_nsf_sbir"),
-        "critical_supply_chain_review_candidate": _bool(
-            screen.get("critical_supply_chain_review_candidate")
-        ),
-        "critical_supply_chain_candidate_award_count": _int(
-            screen.get("critical_supply_chain_candidate_award_count")
-        ),
-        "primary_cets": _text(screen.get("primary_cets"), ""),
-        "dod_supply_chain_categories": _text(screen.get("dod_supply_chain_categories"), ""),
-        "cet_classifier_version": _text(screen.get("cet_classifier_version"), ""),
-        "defense_crosswalk_version": _text(screen.get("defense_crosswalk_version"), ""),
-        "dependency_status": "not_established",
-    }
+def _supplier_nodes(rollup: pd.DataFrame, screen: pd.DataFrame) -> list[dict[str, Any]]:
+    organization_ids = _texts(rollup["sbir_organization_id"])
+    return _records(
+        {
+            "id": [f"supplier:{value}" for value in organization_ids],
+            "organization_id": organization_ids,
+            "label": _texts(rollup["sbir_awardee_name"]),
+            "kind": "supplier",
+            "tier": "tier_2",
+            "edge_count": _ints(rollup["edge_count"]),
+            "prime_family_count": _ints(rollup["prime_family_count"]),
+            "reported_subaward_amount": _rounded(_floats(rollup["reported_subaward_amount"]), 2),
+            "reported_subaward_count": _ints(rollup["reported_subaward_count"]),
+            "max_fiscal_years": _ints(rollup["max_fiscal_years"]),
+            "screening_status": _texts(_series(screen, "screening_status"), "not_screened"),
+            "observed_customer_hhi": _rounded(_floats(_series(screen, "observed_customer_hhi")), 6),
+            "top_observed_prime_share": _rounded(
+                _floats(_series(screen, "top_observed_prime_share")), 6
+            ),
+            "nsf_sbir_awardee": _bools(_series(screen, "nsf_sbir_awardee")),
+            "nsf_sbir_award_count": _ints(_series(screen, "nsf_sbir_award_count")),
+            "nsf_sbir_topic_codes": _texts(_series(screen, "nsf_sbir_topic_codes"), ""),
+            "nsf_sbir_first_award_year": _ints(_series(screen, "nsf_sbir_first_award_year")),
+            "nsf_sbir_latest_award_year": _ints(_series(screen, "nsf_sbir_latest_award_year")),
+            "nsf_sbir_award_amount": _rounded(_floats(_series(screen, "nsf_sbir_award_amount")), 2),
+            "nsf_review_priority": _texts(_series(screen, "nsf_review_priority"), "not_nsf_sbir"),
+            "critical_supply_chain_review_candidate": _bools(
+                _series(screen, "critical_supply_chain_review_candidate")
+            ),
+            "critical_supply_chain_candidate_award_count": _ints(
+                _series(screen, "critical_supply_chain_candidate_award_count")
+            ),
+            "primary_cets": _texts(_series(screen, "primary_cets"), ""),
+            "dod_supply_chain_categories": _texts(
+                _series(screen, "dod_supply_chain_categories"), ""
+            ),
+            "cet_classifier_version": _texts(_series(screen, "cet_classifier_version"), ""),
+            "defense_crosswalk_version": _texts(_series(screen, "defense_crosswalk_version"), ""),
+            "dependency_status": "not_established",
+        },
+        len(rollup),
+    )
 
 
-def _prime_node(row: pd.Series) -> dict[str, Any]:
-    organization_id = _text(row["prime_family_id"])
-    return {
-        "id": f"prime:{organization_id}",
-        "organization_id": organization_id,
-        "label": _text(row["prime_family_name"]),
-        "kind": "prime",
-        "tier": "tier_1_prime",
-        "edge_count": _int(row["edge_count"]),
-        "supplier_count": _int(row["supplier_count"]),
-        "reported_subaward_amount": round(_float(row["reported_subaward_amount"]), 2),
-        "reported_subaward_count": _int(row["reported_subaward_count"]),
-        "max_fiscal_years": _int(row["max_fiscal_years"]),
-        "dependency_status": "not_established",
-    }
+def _prime_nodes(rollup: pd.DataFrame) -> list[dict[str, Any]]:
+    organization_ids = _texts(rollup["prime_family_id"])
+    return _records(
+        {
+            "id": [f"prime:{value}" for value in organization_ids],
+            "organization_id": organization_ids,
+            "label": _texts(rollup["prime_family_name"]),
+            "kind": "prime",
+            "tier": "tier_1_prime",
+            "edge_count": _ints(rollup["edge_count"]),
+            "supplier_count": _ints(rollup["supplier_count"]),
+            "reported_subaward_amount": _rounded(_floats(rollup["reported_subaward_amount"]), 2),
+            "reported_subaward_count": _ints(rollup["reported_subaward_count"]),
+            "max_fiscal_years": _ints(rollup["max_fiscal_years"]),
+            "dependency_status": "not_established",
+        },
+        len(rollup),
+    )
+
+
+def _exposure_by_supplier(
+    supplier_exposure: pd.DataFrame, organization_ids: list[str]
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Supplier screen rows aligned to ``organization_ids`` (last row per supplier wins)."""
+    if "sbir_organization_id" not in supplier_exposure.columns:
+        return pd.DataFrame(index=range(len(organization_ids))), np.zeros(
+            len(organization_ids), dtype=bool
+        )
+    keyed = supplier_exposure.set_axis(
+        pd.Index(_texts(supplier_exposure["sbir_organization_id"])), axis=0
+    )
+    keyed = keyed.loc[~keyed.index.duplicated(keep="last")]
+    return _aligned(keyed, organization_ids)
 
 
 def build_web_graph_payload(
@@ -229,58 +308,47 @@ def build_web_graph_payload(
         .sort_values(["supplier_count", "prime_family_name"], ascending=[False, True])
     )
 
-    exposure_by_supplier = {
-        _text(row["sbir_organization_id"]): row.to_dict()
-        for _, row in supplier_exposure.iterrows()
-        if "sbir_organization_id" in row
-    }
-    family_edges["nsf_sbir_awardee"] = [
-        _bool(
-            exposure_by_supplier.get(_text(row["sbir_organization_id"]), {}).get(
-                "nsf_sbir_awardee", row["nsf_sbir_awardee"]
-            )
-        )
-        for _, row in family_edges.iterrows()
-    ]
-    family_edges["critical_supply_chain_review_candidate"] = [
-        _bool(
-            exposure_by_supplier.get(_text(row["sbir_organization_id"]), {}).get(
-                "critical_supply_chain_review_candidate",
-                row["critical_supply_chain_review_candidate"],
-            )
-        )
-        for _, row in family_edges.iterrows()
-    ]
-    nodes = [
-        *[_supplier_node(row, exposure_by_supplier) for _, row in supplier_rollup.iterrows()],
-        *[_prime_node(row) for _, row in prime_rollup.iterrows()],
-    ]
-    edges = [
+    supplier_screen, _ = _exposure_by_supplier(
+        supplier_exposure, _texts(supplier_rollup["sbir_organization_id"])
+    )
+    edge_supplier_ids = _texts(family_edges["sbir_organization_id"])
+    edge_prime_ids = _texts(family_edges["prime_family_id"])
+    edge_screen, screened = _exposure_by_supplier(supplier_exposure, edge_supplier_ids)
+    for column in ("nsf_sbir_awardee", "critical_supply_chain_review_candidate"):
+        # A screened supplier's flag wins, even when the screen left it empty.
+        flags = family_edges[column].astype(object)
+        if column in edge_screen.columns:
+            flags = edge_screen[column].where(screened, flags.to_numpy())
+        family_edges[column] = _bools(flags)
+    nodes = [*_supplier_nodes(supplier_rollup, supplier_screen), *_prime_nodes(prime_rollup)]
+    edges = _records(
         {
-            "id": (
-                f"supplier:{_text(row['sbir_organization_id'])}=>"
-                f"prime:{_text(row['prime_family_id'])}"
+            "id": [
+                f"supplier:{supplier}=>prime:{prime}"
+                for supplier, prime in zip(edge_supplier_ids, edge_prime_ids, strict=True)
+            ],
+            "source": [f"supplier:{value}" for value in edge_supplier_ids],
+            "target": [f"prime:{value}" for value in edge_prime_ids],
+            "reported_subaward_amount": _rounded(
+                _floats(family_edges["reported_subaward_amount"]), 2
             ),
-            "source": f"supplier:{_text(row['sbir_organization_id'])}",
-            "target": f"prime:{_text(row['prime_family_id'])}",
-            "reported_subaward_amount": round(_float(row["reported_subaward_amount"]), 2),
-            "reported_subaward_count": _int(row["reported_subaward_count"]),
-            "prime_award_count": _int(row["prime_award_count"]),
-            "fiscal_years": _int(row["observed_fiscal_year_count"]),
-            "first_observed_date": _date(row["first_observed_date"]),
-            "last_observed_date": _date(row["last_observed_date"]),
-            "verified_fact_count": _int(row["identifier_verified_facts"]),
-            "prime_legal_entity_count": _int(row["prime_legal_entity_count"]),
+            "reported_subaward_count": _ints(family_edges["reported_subaward_count"]),
+            "prime_award_count": _ints(family_edges["prime_award_count"]),
+            "fiscal_years": _ints(family_edges["observed_fiscal_year_count"]),
+            "first_observed_date": _dates(family_edges["first_observed_date"]),
+            "last_observed_date": _dates(family_edges["last_observed_date"]),
+            "verified_fact_count": _ints(family_edges["identifier_verified_facts"]),
+            "prime_legal_entity_count": _ints(family_edges["prime_legal_entity_count"]),
             "evidence_grade": "verified_identifier",
             "relationship_type": "observed_sbir_supplier_to_dod_prime_family",
             "dependency_status": "not_established",
-            "nsf_supply_chain_review_candidate": bool(row["nsf_sbir_awardee"]),
-            "critical_supply_chain_review_candidate": bool(
-                row["critical_supply_chain_review_candidate"]
-            ),
-        }
-        for _, row in family_edges.iterrows()
-    ]
+            "nsf_supply_chain_review_candidate": family_edges["nsf_sbir_awardee"].tolist(),
+            "critical_supply_chain_review_candidate": family_edges[
+                "critical_supply_chain_review_candidate"
+            ].tolist(),
+        },
+        len(family_edges),
+    )
 
     source_metadata = metadata or {}
     return {
@@ -323,26 +391,44 @@ def build_web_graph_payload(
     }
 
 
-def _json_array(values: pd.Series) -> list[str]:
+def _json_items(raw: object) -> list[str]:
+    if raw is None or raw is pd.NA:
+        return []
+    parsed: object = raw
+    if isinstance(raw, str):
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            parsed = raw
+    candidates = parsed if isinstance(parsed, list) else [parsed]
+    return [str(value).strip() for value in candidates if value is not None and str(value).strip()]
+
+
+def _json_array(values: Iterable[object]) -> list[str]:
     items: set[str] = set()
     for raw in values:
-        if raw is None or raw is pd.NA:
-            continue
-        parsed: object = raw
-        if isinstance(raw, str):
-            try:
-                parsed = json.loads(raw)
-            except json.JSONDecodeError:
-                parsed = raw
-        candidates = parsed if isinstance(parsed, list) else [parsed]
-        for value in candidates:
-            if value is not None and str(value).strip():
-                items.add(str(value).strip())
+        items.update(_json_items(raw))
     return sorted(items)
 
 
-def _joined_json(values: pd.Series) -> list[str]:
-    return _json_array(values)
+def _json_arrays_by_group(
+    values: pd.Series, groups: pd.Series, group_count: int
+) -> list[list[str]]:
+    """``_json_array`` of each group's values, in one pass over the column.
+
+    ``groups`` holds each row's group number (``GroupBy.ngroup``); each distinct
+    JSON string is parsed once.
+    """
+    items: list[set[str]] = [set() for _ in range(group_count)]
+    parsed: dict[str, list[str]] = {}
+    for group, raw in zip(groups.tolist(), values.tolist(), strict=True):
+        if isinstance(raw, str):
+            if raw not in parsed:
+                parsed[raw] = _json_items(raw)
+            items[group].update(parsed[raw])
+        else:
+            items[group].update(_json_items(raw))
+    return [sorted(group_items) for group_items in items]
 
 
 def _instrument_label(value: str) -> str:
@@ -380,9 +466,6 @@ def build_nsf_defense_lineage_payload(
     screen = award_screen.copy()
     if not screen.empty and screen["nsf_award_id"].duplicated().any():
         raise ValueError("NSF award screen IDs are not unique")
-    screen_by_award = (
-        screen.set_index("nsf_award_id").to_dict(orient="index") if not screen.empty else {}
-    )
     awardee_by_id = awardees.drop_duplicates("nsf_organization_id").set_index("nsf_organization_id")
 
     transaction_frames: list[pd.DataFrame] = []
@@ -443,55 +526,71 @@ def build_nsf_defense_lineage_payload(
             ]
             .sum()
         )
-        for funding_organization_id, rows in totals.groupby("nsf_organization_id"):
-            entity_funding[str(funding_organization_id)] = {
-                str(row["instrument_group"]): float(row["signed_obligation_amount"])
-                for _, row in rows.iterrows()
-            }
+        for funding_organization_id, instrument, amount in zip(
+            totals["nsf_organization_id"],
+            totals["instrument_group"],
+            totals["signed_obligation_amount"],
+            strict=True,
+        ):
+            entity_funding.setdefault(str(funding_organization_id), {})[str(instrument)] = float(
+                amount
+            )
 
+    status_by_entity = dict(
+        zip(
+            awardee_by_id.index,
+            _texts(awardee_by_id["nsf_awardee_status"], "indeterminate"),
+            strict=True,
+        )
+    )
+    award_counts = direct_awards["nsf_organization_id"].value_counts()
+    candidate_counts = (
+        screen.groupby("nsf_organization_id")["critical_supply_chain_review_candidate"].sum()
+        if not screen.empty
+        else pd.Series(dtype="int64")
+    )
+    legal_names = _texts(_series(awardee_by_id, "nsf_awardee_legal_business_name"), "")
+    source_names = _texts(_series(awardee_by_id, "nsf_awardee_name"), "")
+    match_methods = _texts(_series(awardee_by_id, "organization_resolution_method"), "unknown")
+    match_confidences = _texts(
+        _series(awardee_by_id, "organization_resolution_confidence"), "unknown"
+    )
     nodes: list[dict[str, Any]] = []
-    for organization_id, row in awardee_by_id.iterrows():
+    for organization_id, legal_name, source_name, method, confidence in zip(
+        awardee_by_id.index,
+        legal_names,
+        source_names,
+        match_methods,
+        match_confidences,
+        strict=True,
+    ):
         organization_key = str(organization_id)
         funding = entity_funding.get(organization_key, {})
-        organization_awards = direct_awards["nsf_organization_id"].eq(organization_key)
-        candidate_count = (
-            int(
-                screen.loc[
-                    screen["nsf_organization_id"].eq(organization_key),
-                    "critical_supply_chain_review_candidate",
-                ].sum()
-            )
-            if not screen.empty
-            else 0
-        )
-        name = _text(
-            row.get("nsf_awardee_legal_business_name"),
-            _text(row.get("nsf_awardee_name"), organization_key),
-        )
+        award_count = int(award_counts.get(organization_key, 0))
+        candidate_count = int(candidate_counts.get(organization_key, 0))
+        status = status_by_entity[organization_id]
         nodes.append(
             {
                 "id": f"entity:{organization_key}",
                 "record_id": organization_key,
                 "organization_id": organization_key,
-                "label": name,
+                "label": legal_name or source_name or organization_key,
                 "kind": "legal_entity",
-                "nsf_awardee_status": _text(row.get("nsf_awardee_status"), "indeterminate"),
-                "nsf_award_count": int(organization_awards.sum()),
+                "nsf_awardee_status": status,
+                "nsf_award_count": award_count,
                 "signed_dod_funding_total": round(sum(funding.values()), 2),
                 "funding_by_instrument": funding,
                 "critical_supply_chain_review_candidate": candidate_count > 0,
                 "critical_supply_chain_candidate_award_count": candidate_count,
-                "match_method": _text(row.get("organization_resolution_method"), "unknown"),
-                "match_confidence": _text(row.get("organization_resolution_confidence"), "unknown"),
+                "match_method": method,
+                "match_confidence": confidence,
                 "specific_award_usage_status": "not_established",
                 "critical_supply_chain_status": "not_assessed",
                 "details": {
-                    "NSF status": _text(row.get("nsf_awardee_status"), "indeterminate"),
-                    "Direct NSF awards": int(organization_awards.sum()),
+                    "NSF status": status,
+                    "Direct NSF awards": award_count,
                     "Verified signed DoD funding": round(sum(funding.values()), 2),
-                    "Identity confidence": _text(
-                        row.get("organization_resolution_confidence"), "unknown"
-                    ),
+                    "Identity confidence": confidence,
                 },
             }
         )
@@ -520,57 +619,83 @@ def build_nsf_defense_lineage_payload(
 
     edges: list[dict[str, Any]] = []
     technology_ids: set[str] = set()
-    for _, row in direct_awards.iterrows():
-        award_id = _text(row["nsf_award_id"])
-        organization_id = _text(row["nsf_organization_id"], "")
+    award_ids = _texts(direct_awards["nsf_award_id"])
+    award_screen_rows, _ = _aligned(
+        screen.set_index("nsf_award_id") if not screen.empty else pd.DataFrame(), award_ids
+    )
+    amounts = _floats(
+        pd.to_numeric(_series(direct_awards, "nsf_estimated_total_amount")).fillna(
+            pd.to_numeric(_series(direct_awards, "nsf_obligated_amount"))
+        )
+    )
+    programs = _texts(_series(direct_awards, "nsf_program"), "")
+    phases = _texts(_series(direct_awards, "nsf_phase"), "")
+    source_paths = _texts(_series(direct_awards, "source_path"), "")
+    source_sha256s = _texts(_series(direct_awards, "source_record_sha256"), "")
+    for (
+        award_id,
+        organization_id,
+        title,
+        program,
+        phase,
+        start_date,
+        end_date,
+        amount,
+        performance_status,
+        source_url,
+        source_path,
+        source_sha256,
+        primary_cet,
+        review_candidate,
+        policy_mapping,
+        classifier_version,
+    ) in zip(
+        award_ids,
+        _texts(direct_awards["nsf_organization_id"], ""),
+        _texts(_series(direct_awards, "nsf_award_title"), ""),
+        programs,
+        phases,
+        _dates(_series(direct_awards, "nsf_start_date")),
+        _dates(_series(direct_awards, "nsf_end_date")),
+        amounts,
+        _texts(_series(direct_awards, "nsf_award_performance_status"), "indeterminate"),
+        _texts(_series(direct_awards, "source_url"), ""),
+        source_paths,
+        source_sha256s,
+        _texts(_series(award_screen_rows, "primary_cet"), ""),
+        _bools(_series(award_screen_rows, "critical_supply_chain_review_candidate")),
+        _texts(_series(award_screen_rows, "defense_policy_mapping_status"), "deferred"),
+        _texts(_series(award_screen_rows, "cet_classifier_version"), ""),
+        strict=True,
+    ):
         if not organization_id:
             continue
-        award_screen_row = screen_by_award.get(award_id, {})
-        primary_cet = _text(award_screen_row.get("primary_cet"), "")
-        amount = _float(
-            row.get("nsf_estimated_total_amount"),
-            _float(row.get("nsf_obligated_amount"), 0.0),
-        )
-        status = (
-            _text(awardee_by_id.loc[organization_id].get("nsf_awardee_status"), "indeterminate")
-            if organization_id in awardee_by_id.index
-            else "indeterminate"
-        )
-        performance_status = _text(row.get("nsf_award_performance_status"), "indeterminate")
+        status = status_by_entity.get(organization_id, "indeterminate")
         nodes.append(
             {
                 "id": f"nsf_award:{award_id}",
                 "record_id": award_id,
-                "label": _text(row.get("nsf_award_title"), f"NSF award {award_id}"),
+                "label": title or f"NSF award {award_id}",
                 "kind": "nsf_award",
                 "nsf_awardee_status": status,
-                "program": _text(row.get("nsf_program"), "Unknown"),
-                "phase": _text(row.get("nsf_phase"), "Unknown"),
-                "start_date": _date(row.get("nsf_start_date")),
-                "end_date": _date(row.get("nsf_end_date")),
+                "program": program or "Unknown",
+                "phase": phase or "Unknown",
+                "start_date": start_date,
+                "end_date": end_date,
                 "award_amount": round(amount, 2),
                 "primary_cet": primary_cet or None,
-                "critical_supply_chain_review_candidate": _bool(
-                    award_screen_row.get("critical_supply_chain_review_candidate")
-                ),
+                "critical_supply_chain_review_candidate": review_candidate,
                 "critical_supply_chain_status": "not_assessed",
                 "specific_award_usage_status": "not_established",
-                "source_url": _text(row.get("source_url"), ""),
-                "source_path": _text(row.get("source_path"), ""),
-                "source_sha256": _text(row.get("source_record_sha256"), ""),
+                "source_url": source_url,
+                "source_path": source_path,
+                "source_sha256": source_sha256,
                 "details": {
-                    "Program / phase": " / ".join(
-                        filter(
-                            None,
-                            [_text(row.get("nsf_program"), ""), _text(row.get("nsf_phase"), "")],
-                        )
-                    ),
+                    "Program / phase": " / ".join(filter(None, [program, phase])),
                     "Performance status": performance_status,
                     "Award amount": round(amount, 2),
                     "Primary CET": primary_cet or "Not classified",
-                    "Policy mapping": _text(
-                        award_screen_row.get("defense_policy_mapping_status"), "deferred"
-                    ),
+                    "Policy mapping": policy_mapping,
                 },
             }
         )
@@ -587,8 +712,8 @@ def build_nsf_defense_lineage_payload(
                     "signed_obligation_total": amount,
                     "nsf_awardee_status": status,
                     "source_record_ids": [award_id],
-                    "source_paths": [_text(row.get("source_path"), "")],
-                    "source_sha256s": [_text(row.get("source_record_sha256"), "")],
+                    "source_paths": [source_path],
+                    "source_sha256s": [source_sha256],
                 },
                 {
                     "id": f"entity:{organization_id}=>nsf_award:{award_id}",
@@ -601,8 +726,8 @@ def build_nsf_defense_lineage_payload(
                     "signed_obligation_total": amount,
                     "nsf_awardee_status": status,
                     "source_record_ids": [award_id],
-                    "source_paths": [_text(row.get("source_path"), "")],
-                    "source_sha256s": [_text(row.get("source_record_sha256"), "")],
+                    "source_paths": [source_path],
+                    "source_sha256s": [source_sha256],
                 },
             ]
         )
@@ -619,11 +744,21 @@ def build_nsf_defense_lineage_payload(
                     "candidate": True,
                     "fiscal_years": 1,
                     "nsf_awardee_status": status,
-                    "classifier_version": _text(award_screen_row.get("cet_classifier_version"), ""),
+                    "classifier_version": classifier_version,
                     "source_record_ids": [award_id],
                 }
             )
 
+    taxonomies: dict[object, object] = {}
+    if technology_ids:
+        first_classified = screen.drop_duplicates("primary_cet")
+        taxonomies = dict(
+            zip(
+                first_classified["primary_cet"],
+                first_classified["cet_taxonomy_version"],
+                strict=True,
+            )
+        )
     for cet_id in sorted(technology_ids):
         nodes.append(
             {
@@ -633,12 +768,7 @@ def build_nsf_defense_lineage_payload(
                 "kind": "technology",
                 "critical_supply_chain_status": "not_assessed",
                 "details": {
-                    "Taxonomy": _text(
-                        screen.loc[screen["primary_cet"].eq(cet_id), "cet_taxonomy_version"].iloc[0]
-                        if not screen.loc[screen["primary_cet"].eq(cet_id)].empty
-                        else None,
-                        "Unknown",
-                    ),
+                    "Taxonomy": _text(taxonomies.get(cet_id), "Unknown"),
                     "Policy mapping": "Deferred — no authoritative DoD-14/NDIS-8 mapping",
                 },
             }
@@ -653,7 +783,8 @@ def build_nsf_defense_lineage_payload(
             "recipient_match_method",
             "recipient_match_confidence",
         ]
-        funding_edges = transactions.groupby(group_columns, as_index=False, dropna=False).agg(
+        grouped = transactions.groupby(group_columns, dropna=False)
+        funding_edges = grouped.agg(
             dod_award_generated_id=("dod_award_generated_id", "first"),
             dod_award_id=("dod_award_id", "first"),
             award_description=("award_description", "first"),
@@ -662,41 +793,68 @@ def build_nsf_defense_lineage_payload(
             fiscal_years=("fiscal_year", "nunique"),
             first_action_date=("action_date", "min"),
             last_action_date=("action_date", "max"),
-            source_record_ids=("_source_transaction_id", _joined_json),
-            source_systems=("source_system", _joined_json),
-            source_paths=("source_transaction_path", _joined_json),
-            source_sha256s=("source_transaction_sha256", _joined_json),
-            source_urls=("source_url", _joined_json),
-        )
-        dod_nodes = funding_edges.groupby("_dod_award_key", as_index=False).agg(
+        ).reset_index()
+        edge_groups = grouped.ngroup()
+        for name, column in (
+            ("source_record_ids", "_source_transaction_id"),
+            ("source_systems", "source_system"),
+            ("source_paths", "source_transaction_path"),
+            ("source_sha256s", "source_transaction_sha256"),
+            ("source_urls", "source_url"),
+        ):
+            funding_edges[name] = _json_arrays_by_group(
+                transactions[column], edge_groups, len(funding_edges)
+            )
+        by_award = funding_edges.groupby("_dod_award_key")
+        dod_nodes = by_award.agg(
             dod_award_id=("dod_award_id", "first"),
             award_description=("award_description", "first"),
             signed_obligation_total=("signed_obligation_total", "sum"),
             transaction_count=("transaction_count", "sum"),
             first_action_date=("first_action_date", "min"),
             last_action_date=("last_action_date", "max"),
-            instrument_groups=("instrument_group", _joined_json),
+        ).reset_index()
+        dod_nodes["instrument_groups"] = _json_arrays_by_group(
+            funding_edges["instrument_group"], by_award.ngroup(), len(dod_nodes)
         )
-        for _, row in dod_nodes.iterrows():
-            award_key = _text(row["_dod_award_key"])
+        for (
+            award_key,
+            label,
+            description,
+            signed_total,
+            transaction_count,
+            first_action,
+            last_action,
+            instrument_groups,
+        ) in zip(
+            _texts(dod_nodes["_dod_award_key"]),
+            _texts(dod_nodes["dod_award_id"], ""),
+            _texts(dod_nodes["award_description"], ""),
+            _rounded(_floats(dod_nodes["signed_obligation_total"]), 2),
+            _ints(dod_nodes["transaction_count"]),
+            _dates(dod_nodes["first_action_date"]),
+            _dates(dod_nodes["last_action_date"]),
+            dod_nodes["instrument_groups"],
+            strict=True,
+        ):
             nodes.append(
                 {
                     "id": f"dod_award:{award_key}",
                     "record_id": award_key,
-                    "label": _text(row.get("dod_award_id"), award_key),
+                    "label": label or award_key,
                     "kind": "dod_award",
-                    "description": _text(row.get("award_description"), ""),
-                    "signed_obligation_total": round(_float(row["signed_obligation_total"]), 2),
-                    "transaction_count": _int(row["transaction_count"]),
-                    "first_action_date": _date(row["first_action_date"]),
-                    "last_action_date": _date(row["last_action_date"]),
-                    "instrument_groups": row["instrument_groups"],
+                    "description": description,
+                    "signed_obligation_total": signed_total,
+                    "transaction_count": transaction_count,
+                    "first_action_date": first_action,
+                    "last_action_date": last_action,
+                    "instrument_groups": instrument_groups,
                     "details": {
-                        "Signed obligations": round(_float(row["signed_obligation_total"]), 2),
-                        "Source transactions": _int(row["transaction_count"]),
-                        "First action": _date(row["first_action_date"]) or "Unknown",
-                        "Last action": _date(row["last_action_date"]) or "Unknown",
-                        "Instruments": ", ".join(row["instrument_groups"]),
+                        "Signed obligations": signed_total,
+                        "Source transactions": transaction_count,
+                        "First action": first_action or "Unknown",
+                        "Last action": last_action or "Unknown",
+                        "Instruments": ", ".join(instrument_groups),
                     },
                 }
             )
@@ -712,94 +870,108 @@ def build_nsf_defense_lineage_payload(
                     "source_record_ids": [award_key],
                 }
             )
-        for _, row in funding_edges.iterrows():
-            organization_id = _text(row["nsf_organization_id"])
-            award_key = _text(row["_dod_award_key"])
-            instrument = _text(row["instrument_group"])
-            confidence = _text(row["recipient_match_confidence"])
-            status = (
-                _text(awardee_by_id.loc[organization_id].get("nsf_awardee_status"), "indeterminate")
-                if organization_id in awardee_by_id.index
-                else "indeterminate"
-            )
-            edges.append(
+        organization_ids = _texts(funding_edges["nsf_organization_id"])
+        award_keys = _texts(funding_edges["_dod_award_key"])
+        instruments = _texts(funding_edges["instrument_group"])
+        methods = _texts(funding_edges["recipient_match_method"])
+        confidences = _texts(funding_edges["recipient_match_confidence"])
+        edges.extend(
+            _records(
                 {
-                    "id": (
-                        f"dod_award:{award_key}=>entity:{organization_id}:"
-                        f"{instrument}:{_text(row['recipient_match_method'])}"
-                    ),
-                    "source": f"dod_award:{award_key}",
-                    "target": f"entity:{organization_id}",
-                    "relationship_type": (
-                        "received_dod_prime_funding"
-                        if row["funding_mode"] == "prime"
-                        else "received_reported_dod_subaward"
+                    "id": [
+                        f"dod_award:{award_key}=>entity:{organization_id}:{instrument}:{method}"
+                        for award_key, organization_id, instrument, method in zip(
+                            award_keys, organization_ids, instruments, methods, strict=True
+                        )
+                    ],
+                    "source": [f"dod_award:{award_key}" for award_key in award_keys],
+                    "target": [f"entity:{organization_id}" for organization_id in organization_ids],
+                    "relationship_type": [
+                        "received_dod_prime_funding" if prime else "received_reported_dod_subaward"
+                        for prime in funding_edges["funding_mode"].eq("prime").tolist()
+                    ],
+                    "label": [_instrument_label(instrument) for instrument in instruments],
+                    "funding_mode": _texts(funding_edges["funding_mode"]),
+                    "instrument_group": instruments,
+                    "signed_obligation_total": _rounded(
+                        _floats(funding_edges["signed_obligation_total"]), 2
                     ),
-                    "label": _instrument_label(instrument),
-                    "funding_mode": _text(row["funding_mode"]),
-                    "instrument_group": instrument,
-                    "signed_obligation_total": round(_float(row["signed_obligation_total"]), 2),
-                    "transaction_count": _int(row["transaction_count"]),
-                    "fiscal_years": _int(row["fiscal_years"]),
-                    "first_action_date": _date(row["first_action_date"]),
-                    "last_action_date": _date(row["last_action_date"]),
-                    "match_method": _text(row["recipient_match_method"]),
-                    "match_confidence": confidence,
-                    "evidence_grade": confidence,
-                    "candidate": confidence == "candidate_name",
+                    "transaction_count": _ints(funding_edges["transaction_count"]),
+                    "fiscal_years": _ints(funding_edges["fiscal_years"]),
+                    "first_action_date": _dates(funding_edges["first_action_date"]),
+                    "last_action_date": _dates(funding_edges["last_action_date"]),
+                    "match_method": methods,
+                    "match_confidence": confidences,
+                    "evidence_grade": confidences,
+                    "candidate": [confidence == "candidate_name" for confidence in confidences],
                     "dependency_status": "not_established",
                     "specific_award_usage_status": "not_established",
                     "critical_supply_chain_status": "not_assessed",
-                    "nsf_awardee_status": status,
-                    "source_record_ids": row["source_record_ids"],
-                    "source_systems": row["source_systems"],
-                    "source_paths": row["source_paths"],
-                    "source_sha256s": row["source_sha256s"],
-                    "source_urls": row["source_urls"],
-                }
+                    "nsf_awardee_status": [
+                        status_by_entity.get(organization_id, "indeterminate")
+                        for organization_id in organization_ids
+                    ],
+                    "source_record_ids": funding_edges["source_record_ids"].tolist(),
+                    "source_systems": funding_edges["source_systems"].tolist(),
+                    "source_paths": funding_edges["source_paths"].tolist(),
+                    "source_sha256s": funding_edges["source_sha256s"].tolist(),
+                    "source_urls": funding_edges["source_urls"].tolist(),
+                },
+                len(funding_edges),
             )
+        )
 
     if not evidence.empty:
-        for _, row in evidence.iterrows():
-            nsf_award_id = _text(row.get("nsf_award_id"), "")
-            dod_award_key = _text(
-                row.get("_dod_award_key"), _text(row.get("dod_award_generated_id"), "")
-            )
+        for (
+            assertion_id,
+            nsf_award_id,
+            dod_award_key,
+            dod_award_generated_id,
+            organization_id,
+            association,
+            funding_mode,
+            instrument,
+            signed_total,
+            transaction_ids,
+            paths,
+            sha256s,
+        ) in zip(
+            _texts(_series(evidence, "evidence_assertion_id"), ""),
+            _texts(_series(evidence, "nsf_award_id"), ""),
+            _texts(_series(evidence, "_dod_award_key"), ""),
+            _texts(_series(evidence, "dod_award_generated_id"), ""),
+            _texts(_series(evidence, "nsf_organization_id"), ""),
+            _texts(_series(evidence, "temporal_association"), "Temporal association"),
+            _texts(_series(evidence, "funding_mode"), ""),
+            _texts(_series(evidence, "instrument_group"), ""),
+            _rounded(_floats(_series(evidence, "signed_obligation_total")), 2),
+            _series(evidence, "source_transaction_ids").tolist(),
+            _series(evidence, "source_paths").tolist(),
+            _series(evidence, "source_sha256s").tolist(),
+            strict=True,
+        ):
+            dod_award_key = dod_award_key or dod_award_generated_id
             if not nsf_award_id or not dod_award_key:
                 continue
             edges.append(
                 {
-                    "id": _text(
-                        row.get("evidence_assertion_id"),
-                        f"evidence:{nsf_award_id}:{dod_award_key}",
-                    ),
+                    "id": assertion_id or f"evidence:{nsf_award_id}:{dod_award_key}",
                     "source": f"nsf_award:{nsf_award_id}",
                     "target": f"dod_award:{dod_award_key}",
                     "relationship_type": "candidate_temporal_association",
-                    "label": _text(row.get("temporal_association"), "Temporal association"),
-                    "funding_mode": _text(row.get("funding_mode"), ""),
-                    "instrument_group": _text(row.get("instrument_group"), ""),
-                    "signed_obligation_total": round(_float(row.get("signed_obligation_total")), 2),
+                    "label": association,
+                    "funding_mode": funding_mode,
+                    "instrument_group": instrument,
+                    "signed_obligation_total": signed_total,
                     "fiscal_years": 1,
                     "evidence_grade": "candidate_association",
                     "candidate": True,
                     "specific_award_usage_status": "not_established",
                     "critical_supply_chain_status": "not_assessed",
-                    "nsf_awardee_status": (
-                        _text(
-                            awardee_by_id.loc[_text(row.get("nsf_organization_id"), "")].get(
-                                "nsf_awardee_status"
-                            ),
-                            "indeterminate",
-                        )
-                        if _text(row.get("nsf_organization_id"), "") in awardee_by_id.index
-                        else "indeterminate"
-                    ),
-                    "source_record_ids": _json_array(
-                        pd.Series([row.get("source_transaction_ids")])
-                    ),
-                    "source_paths": _json_array(pd.Series([row.get("source_paths")])),
-                    "source_sha256s": _json_array(pd.Series([row.get("source_sha256s")])),
+                    "nsf_awardee_status": status_by_entity.get(organization_id, "indeterminate"),
+                    "source_record_ids": _json_array([transaction_ids]),
+                    "source_paths": _json_array([paths]),
+                    "source_sha256s": _json_array([sha256s]),
                     "temporal_association_is_causal_evidence": False,
                 }
             )
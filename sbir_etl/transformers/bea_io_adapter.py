@@ -21,11 +21,7 @@ from ..config.loader import get_config
 from ..exceptions import ConfigurationError
 from .bea_api_client import BEAApiClient
 from .bea_io_functions import (
-    apply_demand_shocks,
     calculate_employment_coefficients,
-    calculate_employment_from_production,
-    calculate_leontief_inverse,
-    calculate_technical_coefficients,
     calculate_value_added_ratios,
     fetch_employment,
     fetch_industry_output,
@@ -33,6 +29,7 @@ from .bea_io_functions import (
     fetch_value_added,
 )
 from .economic_model_interface import validate_shocks_input
+from .leontief_engine import LeontiefImpactEngine
 
 
 EPISTEMIC_TIER = "exploratory"
@@ -99,6 +96,9 @@ class BEAIOAdapter:
         self._va_ratios_cache: dict[int, pd.DataFrame] = {}
         self._emp_coeff_cache: dict[int, pd.DataFrame] = {}
 
+        # Leontief factorizations cached per (year, model version)
+        self._engine = LeontiefImpactEngine()
+
     # ------------------------------------------------------------------
     # Resource management
     # ------------------------------------------------------------------
@@ -258,18 +258,23 @@ class BEAIOAdapter:
             return self._compute_placeholder_impacts(shocks_df, model_ver)
 
     def _compute_impacts_via_bea(self, shocks_df: pd.DataFrame, model_version: str) -> pd.DataFrame:
-        """Core Leontief computation using BEA Use tables."""
+        """Core Leontief computation using BEA Use tables.
+
+        Each fiscal year is solved once for all states through the batched
+        engine, reusing its cached factorization across calls.
+        """
         # Handle multi-year inputs by splitting into per-year groups
         fiscal_years = shocks_df["fiscal_year"].dropna().unique().tolist()
         if len(fiscal_years) > 1:
             yearly_results = []
             for _, year_shocks_df in shocks_df.groupby("fiscal_year", sort=False):
-                yearly_results.append(
-                    self._compute_impacts_via_bea(year_shocks_df.copy(), model_version)
-                )
+                yearly_results.append(self._compute_year_impacts(year_shocks_df, model_version))
             return pd.concat(yearly_results, ignore_index=True)
 
-        year = int(fiscal_years[0])
+        return self._compute_year_impacts(shocks_df, model_version)
+
+    def _compute_year_impacts(self, shocks_df: pd.DataFrame, model_version: str) -> pd.DataFrame:
+        year = int(shocks_df["fiscal_year"].dropna().iloc[0])
 
         # Fetch national I-O data (cached per year)
         use_table = self._get_use_table(year)
@@ -278,131 +283,16 @@ class BEAIOAdapter:
         if use_table.empty or industry_output.empty:
             raise ValueError(f"Could not fetch BEA Use table for year {year}")
 
-        # Build Leontief inverse
-        tech_coeff = calculate_technical_coefficients(use_table, industry_output)
-        leontief_inv = calculate_leontief_inverse(tech_coeff)
-
-        # Fetch VA ratios for distributing impacts
-        va_ratios_df = self._get_va_ratios(year)
+        factorization = self._engine.factorize(year, model_version, use_table, industry_output)
 
-        # Fetch employment coefficients for computing employment impacts
-        emp_coeff_df = self._get_employment_coefficients(year)
-
-        # Process each state's shocks
         # NOTE: BEA national tables are used for all states; state-level
         # scaling could be added later using Regional GDP data.
-        states = shocks_df["state"].unique().tolist()
-        all_results = []
-
-        for state in states:
-            state_shocks = shocks_df[shocks_df["state"] == state].copy()
-
-            try:
-                # BEA I-O tables are in millions of dollars; incoming shock_amount
-                # values are pipeline-standard dollars.  Normalize shocks to millions
-                # before the matrix multiplication, then convert back to dollars.
-                state_shocks_millions = state_shocks.copy()
-                state_shocks_millions["shock_amount"] = (
-                    pd.to_numeric(state_shocks_millions["shock_amount"], errors="coerce").fillna(
-                        0.0
-                    )
-                    / 1_000_000.0
-                )
-                production_by_sector = apply_demand_shocks(leontief_inv, state_shocks_millions)
-
-                # Compute employment impacts (jobs) from production vector
-                employment_by_sector = calculate_employment_from_production(
-                    production_by_sector, emp_coeff_df
-                )
-
-                for _, shock_row in state_shocks.iterrows():
-                    sector = shock_row["bea_sector"]
-
-                    if sector in production_by_sector.index:
-                        production_impact = Decimal(
-                            str(float(production_by_sector[sector]) * 1_000_000.0)
-                        )
-                    else:
-                        logger.warning(f"Sector {sector} not in production results, using zero")
-                        production_impact = Decimal("0")
-
-                    # Value-added breakdown
-                    wage_ratio = Decimal("0.4")
-                    gos_ratio = Decimal("0.3")
-                    tax_ratio = Decimal("0.15")
-                    proprietor_ratio = Decimal("0.0")
-                    used_actual_ratios = False
-
-                    if not va_ratios_df.empty:
-                        sector_ratios = va_ratios_df[va_ratios_df["sector"] == str(sector)]
-                        if not sector_ratios.empty:
-                            wage_ratio = Decimal(str(sector_ratios["wage_ratio"].iloc[0]))
-                            gos_ratio = Decimal(str(sector_ratios["gos_ratio"].iloc[0]))
-                            tax_ratio = Decimal(str(sector_ratios["tax_ratio"].iloc[0]))
-                            proprietor_ratio = Decimal(
-                                str(sector_ratios["proprietor_income_ratio"].iloc[0])
-                            )
-                            used_actual_ratios = True
-
-                    wage_impact = production_impact * wage_ratio
-                    gos_impact = production_impact * gos_ratio
-                    tax_impact = production_impact * tax_ratio
-                    proprietor_impact = production_impact * proprietor_ratio
-
-                    # Employment impact (jobs created).
-                    # employment_by_sector was computed from production in
-                    # millions, using coefficients in jobs-per-$1M.
-                    if sector in employment_by_sector.index:
-                        employment_impact = float(employment_by_sector[sector])
-                    else:
-                        # Fallback: ~10 jobs per $1M of production
-                        production_millions = float(production_impact) / 1_000_000.0
-                        employment_impact = production_millions * 10.0
-
-                    quality_flags = (
-                        "bea_api_with_ratios" if used_actual_ratios else "bea_api_default_ratios"
-                    )
-
-                    all_results.append(
-                        {
-                            "state": state,
-                            "bea_sector": sector,
-                            "fiscal_year": shock_row["fiscal_year"],
-                            "wage_impact": wage_impact,
-                            "proprietor_income_impact": proprietor_impact,
-                            "gross_operating_surplus": gos_impact,
-                            "consumption_impact": production_impact * Decimal("0.2"),
-                            "tax_impact": tax_impact,
-                            "production_impact": production_impact,
-                            "employment_impact": employment_impact,
-                            "model_version": model_version,
-                            "quality_flags": quality_flags,
-                        }
-                    )
-
-                logger.info(f"Computed impacts for {state} using BEA I-O tables")
-
-            except Exception as e:
-                logger.error(f"Failed BEA I-O computation for {state}: {e}")
-                for _, shock_row in state_shocks.iterrows():
-                    all_results.append(
-                        {
-                            "state": state,
-                            "bea_sector": shock_row["bea_sector"],
-                            "fiscal_year": shock_row["fiscal_year"],
-                            "wage_impact": Decimal("0"),
-                            "proprietor_income_impact": Decimal("0"),
-                            "gross_operating_surplus": Decimal("0"),
-                            "consumption_impact": Decimal("0"),
-                            "tax_impact": Decimal("0"),
-                            "production_impact": Decimal("0"),
-                            "employment_impact": 0.0,
-                            "model_version": model_version,
-                            "quality_flags": f"bea_api_failed:{str(e)[:50]}",
-                        }
-                    )
-
-        result_df = pd.DataFrame(all_results)
+        result_df = self._engine.compute_year_impacts(
+            shocks_df,
+            factorization,
+            va_ratios_df=self._get_va_ratios(year),
+            emp_coeff_df=self._get_employment_coefficients(year),
+        )
         return self._ensure_impact_columns(result_df, shocks_df, model_version)
 
     # ------------------------------------------------------------------
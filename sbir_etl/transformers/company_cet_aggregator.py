@@ -22,9 +22,8 @@ non-citable.
 
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Iterable, Mapping
-from typing import Any
+from typing import Any, cast
 
 
 try:
@@ -40,6 +39,47 @@ EPISTEMIC_TIER = "exploratory"
 __all__ = ["CompanyCETAggregator"]
 
 
+def _grouped_reduce(values: np.ndarray, codes: np.ndarray, n_groups: int, func: Any) -> np.ndarray:
+    """
+    Apply ``func`` (``np.mean``/``np.median``) to each group of ``values``.
+
+    Groups are reduced in row order, batched by group size into 2-D blocks so
+    each result is bit-identical to calling ``func`` on the group's list.
+    """
+    out = np.empty(n_groups, dtype=float)
+    if n_groups == 0:
+        return out
+    order = np.argsort(codes, kind="stable")
+    ordered = values[order]
+    sizes = np.bincount(codes, minlength=n_groups)
+    starts = np.cumsum(sizes) - sizes
+    for size in np.unique(sizes):
+        groups = np.flatnonzero(sizes == size)
+        block = ordered[starts[groups, None] + np.arange(size)]
+        out[groups] = func(block, axis=1)
+    return out
+
+
+def _sequential_sums(values: np.ndarray, codes: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Sum ``values`` per group left to right, like a running ``total += value`` loop.
+
+    Pairwise (numpy) summation rounds differently, so rows are added one position
+    at a time across all groups instead: the k-th row of every group is added in
+    the k-th pass.
+    """
+    totals = np.zeros(n_groups, dtype=float)
+    if len(codes) == 0:
+        return totals
+    position = pd.Series(codes).groupby(codes).cumcount().to_numpy()
+    order = np.argsort(position, kind="stable")
+    bounds = np.searchsorted(position[order], np.arange(int(position.max()) + 2))
+    for start, stop in zip(bounds[:-1], bounds[1:], strict=True):
+        rows = order[start:stop]
+        totals[codes[rows]] += values[rows]
+    return totals
+
+
 class CompanyCETAggregator:
     """
     Aggregates award-level CET classifications to company-level CET profiles.
@@ -103,6 +143,45 @@ class CompanyCETAggregator:
             # Best-effort fallback: leave as None/NaT if parsing fails
             self.df["award_date_parsed"] = pd.NaT
 
+    @staticmethod
+    def _primary_entry(primary: Any, primary_score: Any) -> tuple[str, float] | None:
+        """Return ``(cet_id, score)`` for an award's primary CET, or None if it has none."""
+        # Guard against NaN (pandas stores None as NaN in object columns, and NaN is truthy)
+        try:
+            if pd is not None and pd.isna(primary):
+                primary = None
+        except (TypeError, ValueError):
+            pass
+        if not primary:
+            return None
+        try:
+            score = float(primary_score or 0.0)
+        except Exception:
+            score = 0.0
+        return str(primary), score
+
+    @staticmethod
+    def _supporting_entry(entry: Any) -> tuple[str, float] | None:
+        """Return ``(cet_id, score)`` for one supporting CET entry, or None to skip it."""
+        if not entry:
+            return None
+        # supporting may be dict-like or simple tuple/list
+        if isinstance(entry, Mapping):
+            cet_id = entry.get("cet_id") or entry.get("cet") or None
+            score_raw = entry.get("score", 0.0)
+        elif isinstance(entry, list | tuple) and len(entry) >= 2:
+            cet_id, score_raw = entry[0], entry[1]
+        else:
+            # unsupported format; skip
+            return None
+        if not cet_id:
+            return None
+        try:
+            score = float(score_raw)
+        except Exception:
+            score = 0.0
+        return str(cet_id), score
+
     @staticmethod
     def _extract_cet_rows_from_award(row: Mapping[str, Any]) -> list[tuple[str, float, str]]:
         """
@@ -112,47 +191,30 @@ class CompanyCETAggregator:
         """
         rows: list[tuple[str, float, str]] = []
         award_id = str(row.get("award_id") or "")
-        primary = row.get("primary_cet")
-        # Guard against NaN (pandas stores None as NaN in object columns, and NaN is truthy)
-        try:
-            if pd is not None and pd.isna(primary):
-                primary = None
-        except (TypeError, ValueError):
-            pass
-        primary_score = row.get("primary_score") or 0.0
-        if primary:
-            try:
-                score = float(primary_score)
-            except Exception:
-                score = 0.0
-            rows.append((str(primary), score, award_id))
+        primary = CompanyCETAggregator._primary_entry(
+            row.get("primary_cet"), row.get("primary_score")
+        )
+        if primary is not None:
+            rows.append((*primary, award_id))
 
         supporting = row.get("supporting_cets") or []
         if isinstance(supporting, list | tuple):
             for s in supporting:
-                if not s:
-                    continue
-                # supporting may be dict-like or simple tuple/list
-                if isinstance(s, Mapping):
-                    cet_id = s.get("cet_id") or s.get("cet") or None
-                    score_raw = s.get("score", 0.0)
-                elif isinstance(s, list | tuple) and len(s) >= 2:
-                    cet_id, score_raw = s[0], s[1]
-                else:
-                    # unsupported format; skip
-                    cet_id = None
-                    score_raw = 0.0
-                if cet_id:
-                    try:
-                        sc = float(score_raw)
-                    except Exception:
-                        sc = 0.0
-                    rows.append((str(cet_id), sc, award_id))
+                entry = CompanyCETAggregator._supporting_entry(s)
+                if entry is not None:
+                    rows.append((*entry, award_id))
         return rows
 
     def _build_company_cet_matrix(self) -> pd.DataFrame:
         """
+        Explode every award's primary and supporting CETs into one long table.
+
+        Rows keep the award order, with each award's primary CET before its supporting
+        CETs; awards without any CET contribute a single placeholder row
+        (``has_cet=False``) so coverage can be computed from the same table.
+
         Return a flattened DataFrame with columns:
+        - award_row (position of the source award in ``self.df``)
         - company_id
         - company_name
         - award_id
@@ -160,46 +222,147 @@ class CompanyCETAggregator:
         - score
         - award_date_parsed
         - phase
+        - has_cet
         """
-        records = []
-        for _, row in self.df.iterrows():
-            company_id = row.get("company_id")
-            company_name = row.get("company_name")
-            award_date = row.get("award_date_parsed", pd.NaT)
-            phase = row.get("phase")
-            cet_rows = self._extract_cet_rows_from_award(row)  # type: ignore[arg-type]
-            if not cet_rows:
-                # keep a placeholder row to count awards_with_cet correctly later (no CETs)
-                records.append(
-                    {
-                        "company_id": company_id,
-                        "company_name": company_name,
-                        "award_id": row.get("award_id"),
-                        "cet_id": None,
-                        "score": None,
-                        "award_date_parsed": award_date,
-                        "phase": phase,
-                        "has_cet": False,
-                    }
-                )
-                continue
-            for cet_id, score, award_id in cet_rows:
-                records.append(
-                    {
-                        "company_id": company_id,
-                        "company_name": company_name,
-                        "award_id": award_id,
-                        "cet_id": cet_id,
-                        "score": score,
-                        "award_date_parsed": award_date,
-                        "phase": phase,
-                        "has_cet": True,
-                    }
-                )
-
-        flat = pd.DataFrame(records)
+        df = self.df
+        n_awards = len(df)
+
+        primary = [
+            self._primary_entry(cet, score)
+            for cet, score in zip(
+                df["primary_cet"].tolist(), df["primary_score"].tolist(), strict=True
+            )
+        ]
+        primary_rows = [i for i, entry in enumerate(primary) if entry is not None]
+        primary_entries = [entry for entry in primary if entry is not None]
+
+        supporting = pd.Series(
+            df["supporting_cets"].to_numpy(), index=np.arange(n_awards), dtype=object
+        ).explode()
+        supporting_parsed = [self._supporting_entry(s) for s in supporting.to_numpy()]
+        supporting_award_rows = supporting.index.to_numpy()
+        supporting_rows = [
+            supporting_award_rows[i] for i, e in enumerate(supporting_parsed) if e is not None
+        ]
+        supporting_entries = [e for e in supporting_parsed if e is not None]
+
+        entry_rows = np.asarray(primary_rows + supporting_rows, dtype=np.int64)
+        entries = primary_entries + supporting_entries
+        has_cet = np.zeros(n_awards, dtype=bool)
+        has_cet[entry_rows] = True
+        placeholder_rows = np.flatnonzero(~has_cet)
+
+        award_row = np.concatenate([entry_rows, placeholder_rows])
+        # Stable sort by award keeps primary before supporting entries per award.
+        order = np.argsort(award_row, kind="stable")
+        award_row = award_row[order]
+
+        n_entries = len(entries)
+        cet_ids = np.empty(len(award_row), dtype=object)
+        cet_ids[:n_entries] = [cet for cet, _ in entries]
+        scores = np.full(len(award_row), np.nan)
+        scores[:n_entries] = [score for _, score in entries]
+
+        # CET rows carry the normalized award id; placeholders keep the raw value.
+        raw_award_ids = df["award_id"].to_numpy(dtype=object)
+        award_ids = np.empty(len(award_row), dtype=object)
+        award_ids[:n_entries] = [str(v or "") for v in raw_award_ids[entry_rows]]
+        award_ids[n_entries:] = raw_award_ids[placeholder_rows]
+
+        flat = (
+            df[["company_id", "company_name", "award_date_parsed", "phase"]]
+            .iloc[award_row]
+            .reset_index(drop=True)
+        )
+        flat.insert(0, "award_row", award_row)
+        flat.insert(3, "award_id", award_ids[order])
+        flat.insert(4, "cet_id", cet_ids[order])
+        flat.insert(5, "score", scores[order])
+        flat["has_cet"] = np.arange(len(award_row))[order] < n_entries
         return flat
 
+    def _award_periods(self, company_codes: np.ndarray) -> np.ndarray:
+        """
+        Return each award's trend period (object array, None when it has none).
+
+        A company whose awards carry any `phase` is keyed by phase; otherwise its awards
+        are keyed by award year (as a string).
+        """
+        phase = self.df["phase"]
+        has_phase = phase.notna().to_numpy()
+        phase_companies = np.zeros(max(int(company_codes.max(initial=-1)) + 1, 0), dtype=bool)
+        phase_companies[company_codes[has_phase & (company_codes >= 0)]] = True
+        by_phase = (company_codes >= 0) & phase_companies[np.maximum(company_codes, 0)]
+
+        periods = np.full(len(phase), None, dtype=object)
+        phase_values = phase.to_numpy(dtype=object)
+        use_phase = by_phase & has_phase
+        periods[use_phase] = phase_values[use_phase]
+        try:
+            years = self.df["award_date_parsed"].dt.year
+            use_year = ~by_phase & years.notna().to_numpy()
+            periods[use_year] = [str(int(y)) for y in years.to_numpy()[use_year]]
+        except Exception:
+            # No parseable dates: year-keyed companies get no periods
+            pass
+        return periods
+
+    def _cet_trends(
+        self, flat: pd.DataFrame, company_codes: np.ndarray, n_companies: int
+    ) -> list[dict[Any, dict[str, float]]]:
+        """
+        Compute each company's CET score shares per period (phase or year).
+
+        Periods appear in order of their first award, CETs within a period in order of
+        first appearance, and per-CET totals are summed in award order so the shares
+        equal those of a per-award loop.
+        """
+        trends: list[dict[Any, dict[str, float]]] = [{} for _ in range(n_companies)]
+        periods = self._award_periods(company_codes)
+        valid = (company_codes >= 0) & pd.notna(periods)
+
+        first_seen = pd.DataFrame(
+            {"company": company_codes[valid], "period": periods[valid]}
+        ).drop_duplicates()
+        for code, period in zip(first_seen["company"], first_seen["period"], strict=True):
+            trends[code][period] = {}
+
+        cet_rows = flat.loc[flat["has_cet"].to_numpy() & valid[flat["award_row"].to_numpy()]]
+        if cet_rows.empty:
+            return trends
+        award_rows = cet_rows["award_row"].to_numpy()
+        entries = pd.DataFrame(
+            {
+                "company": company_codes[award_rows],
+                "period": periods[award_rows],
+                "cet_id": cet_rows["cet_id"].to_numpy(),
+            }
+        )
+        entry_codes = entries.groupby(["company", "period", "cet_id"], sort=False).ngroup()
+        totals_keys = entries.drop_duplicates(["company", "period", "cet_id"])
+        cet_totals = _sequential_sums(
+            cet_rows["score"].to_numpy(dtype=float),
+            entry_codes.to_numpy(),
+            len(totals_keys),
+        )
+        period_codes = totals_keys.groupby(["company", "period"], sort=False).ngroup()
+        period_totals = _sequential_sums(
+            cet_totals, period_codes.to_numpy(), int(period_codes.max()) + 1
+        )
+
+        for code, period, cet_id, value, period_code in zip(
+            totals_keys["company"],
+            totals_keys["period"],
+            totals_keys["cet_id"],
+            cet_totals,
+            period_codes,
+            strict=True,
+        ):
+            total = period_totals[period_code]
+            if total > 0:
+                trends[code][period][cet_id] = float(value / total)
+        return trends
+
     @staticmethod
     def _hhi_from_scores(score_map: Mapping[str, float]) -> float:
         """
@@ -225,6 +388,10 @@ class CompanyCETAggregator:
         """
         Performs aggregation and returns a company-level DataFrame.
 
+        The award CETs are exploded into one long table once; counts, per-CET scores,
+        dates and trends are grouped reductions over that table, and the per-company
+        dicts are only built when assembling the output rows.
+
         Parameters:
         - use_scores: aggregation method for per-company per-CET scores. Options: 'mean' (default), 'median'.
         - include_supporting: whether to include supporting CETs in aggregations (default True).
@@ -245,84 +412,72 @@ class CompanyCETAggregator:
         - last_award_date
         - cet_trend (dict mapping period -> {cet_id: share})
         """
-        flat = self._build_company_cet_matrix()
-
-        # Compute counts per company
-        # total_awards: count distinct award_id per company
-        company_award_counts = (
-            flat.groupby("company_id")["award_id"].nunique().rename("total_awards").to_frame()
-        )
-        # awards_with_cet: count distinct award_id per company where has_cet is True
+        codes, companies = pd.factorize(self.df["company_id"])
+        company_codes = np.asarray(codes, dtype=np.int64)
+        if company_codes.max(initial=-1) < 0:
+            # No award has a company id, so there is nothing to group
+            return pd.DataFrame()
+        matrix = self._build_company_cet_matrix()
+        n_companies = len(companies)
+        # Rows without a company id are dropped, as groupby would
+        matrix["company"] = company_codes[matrix["award_row"].to_numpy()]
+        flat = matrix.loc[matrix["company"] >= 0]
+
+        # total_awards / awards_with_cet: distinct award_id per company
+        total_awards = flat.groupby("company")["award_id"].nunique()
         awards_with_cet = (
             flat.loc[flat["has_cet"]]
-            .groupby("company_id")["award_id"]
+            .groupby("company")["award_id"]
             .nunique()
-            .rename("awards_with_cet")
-            .to_frame()
+            .reindex(total_awards.index, fill_value=0)
         )
-        stats = company_award_counts.join(awards_with_cet, how="left").fillna(0)
-        stats["total_awards"] = stats["total_awards"].astype(int)
-        stats["awards_with_cet"] = stats["awards_with_cet"].astype(int)
-        stats["coverage"] = stats["awards_with_cet"] / stats["total_awards"].replace({0: 1})
 
         # Filter CET rows (if including supporting is False, keep only primary rows)
+        cet_rows = flat.loc[flat["cet_id"].notnull()]
         if not include_supporting:
             # Heuristic: primary rows are those where score equals primary_score and cet matches primary_cet.
             # Since we don't have an explicit flag, attempt to keep only the highest score per award (best-effort).
             flat_primary = (
-                flat.loc[flat["cet_id"].notnull()]
+                matrix.loc[matrix["cet_id"].notnull()]
                 .sort_values(["award_id", "score"], ascending=[True, False])
                 .drop_duplicates(subset=["award_id"], keep="first")
             )
-            cet_rows = flat_primary
-        else:
-            cet_rows = flat.loc[flat["cet_id"].notnull()]
-
-        # Aggregate per company and cet
-        if use_scores == "median":
-            np.median if np is not None else lambda x: x.median()
-        else:
-            np.mean if np is not None else lambda x: x.mean()
-
-        cet_group = cet_rows.groupby(["company_id", "cet_id"])["score"].agg(list).to_frame("scores")
-
-        # compute aggregate (mean by default)
-        def _agg_list(scores: list[float]) -> float:
-            if not scores:
-                return 0.0
-            try:
-                if use_scores == "median":
-                    return (
-                        float(np.median(scores))
-                        if np is not None
-                        else float(pd.Series(scores).median())
-                    )
-                return float(np.mean(scores)) if np is not None else float(pd.Series(scores).mean())
-            except Exception:
-                # last resort
-                return float(sum(scores) / max(1, len(scores)))
-
-        cet_group["agg_score"] = cet_group["scores"].apply(_agg_list)
-        cet_group = cet_group.reset_index()  # columns: company_id, cet_id, scores, agg_score
+            cet_rows = flat_primary.loc[flat_primary["company"] >= 0]
+
+        # Aggregate per company and cet (groups sorted by cet_id within a company)
+        cet_groups = cet_rows.groupby(["company", "cet_id"], sort=True)
+        group_codes = cet_groups.ngroup().to_numpy()
+        group_keys = cet_rows.iloc[np.unique(group_codes, return_index=True)[1]]
+        reducer = np.median if use_scores == "median" else np.mean
+        agg_scores = _grouped_reduce(
+            cet_rows["score"].to_numpy(dtype=float), group_codes, len(group_keys), reducer
+        )
+        cet_scores_map: list[dict[str, float]] = [{} for _ in range(n_companies)]
+        for code, cet_id, score in zip(
+            group_keys["company"], group_keys["cet_id"], agg_scores, strict=True
+        ):
+            cet_scores_map[code][cet_id] = float(score)
 
-        # Build per-company cet_scores mapping
-        cet_scores_map: dict[Any, dict[str, float]] = defaultdict(dict)
-        for _, r in cet_group.iterrows():
-            cmp = r["company_id"]
-            cid = r["cet_id"]
-            sc = r["agg_score"]
-            cet_scores_map[cmp][cid] = float(sc)
+        awards = self.df.assign(_company=company_codes).loc[company_codes >= 0]
+        company_names = awards.groupby("_company")["company_name"].first()
+        award_dates = awards.groupby("_company")["award_date_parsed"].agg(["min", "max"])
+        trends = self._cet_trends(flat, company_codes, n_companies)
 
         # Build dominant CET and specialization
         rows: list[dict[str, Any]] = []
-        company_ids = sorted(stats.index.tolist(), key=lambda x: str(x) if x is not None else "")
-        for cid in company_ids:
-            company_row = stats.loc[cid]
-            c_name = self.df.loc[self.df["company_id"] == cid, "company_name"]
-            company_name = c_name.dropna().unique().tolist()
-            company_name = company_name[0] if company_name else None
-
-            scores_map = cet_scores_map.get(cid, {})
+        company_ids = companies.tolist()
+        present = sorted(
+            total_awards.index.tolist(),
+            key=lambda c: str(company_ids[c]) if company_ids[c] is not None else "",
+        )
+        for code in present:
+            n_total = int(total_awards[code])
+            n_with_cet = int(awards_with_cet[code])
+            company_name = company_names.get(code)
+            if company_name is not None and pd.isna(company_name):
+                company_name = None
+
+            scores_map = cet_scores_map[code]
             # Keep only top_n_cets
             if scores_map:
                 sorted_items = sorted(scores_map.items(), key=lambda x: x[1], reverse=True)[
@@ -338,72 +493,23 @@ class CompanyCETAggregator:
                 dominant_cet, dominant_score = max(trimmed_map.items(), key=lambda x: x[1])
 
             specialization = self._hhi_from_scores(trimmed_map)
-
-            # date range
-            company_awards = self.df.loc[self.df["company_id"] == cid]
-            try:
-                first_dt = pd.to_datetime(company_awards["award_date_parsed"].dropna()).min()
-                last_dt = pd.to_datetime(company_awards["award_date_parsed"].dropna()).max()
-            except Exception:
-                first_dt = pd.NaT
-                last_dt = pd.NaT
-
-            # Build CET trend by period: prefer `phase`, else use year
-            trend: dict[str, dict[str, float]] = {}
-            # choose period column
-            if company_awards["phase"].notnull().any():
-                periods = company_awards[["award_id", "phase"]].drop_duplicates()
-                # compute shares per phase by counting award-level primary CETs per phase, weighted by score
-                for p in periods["phase"].dropna().unique():
-                    part = company_awards.loc[company_awards["phase"] == p]
-                    # build local cet score sums for this period
-                    local_cet_totals: dict[str, float] = {}
-                    for _, ar in part.iterrows():
-                        for cet_id, sc, _ in self._extract_cet_rows_from_award(ar):
-                            local_cet_totals[cet_id] = local_cet_totals.get(cet_id, 0.0) + float(sc)
-                    total = sum(local_cet_totals.values()) or 0.0
-                    if total > 0:
-                        trend[p] = {k: v / total for k, v in local_cet_totals.items()}
-                    else:
-                        trend[p] = {}
-            else:
-                # use year
-                try:
-                    years = (
-                        company_awards["award_date_parsed"]
-                        .dropna()
-                        .dt.year.astype(int)
-                        .drop_duplicates()
-                        .tolist()
-                    )
-                except Exception:
-                    years = []
-                for y in years:
-                    part = company_awards.loc[company_awards["award_date_parsed"].dt.year == int(y)]
-                    year_cet_totals: dict[str, float] = {}
-                    for _, ar in part.iterrows():
-                        for cet_id, sc, _ in self._extract_cet_rows_from_award(ar):
-                            year_cet_totals[cet_id] = year_cet_totals.get(cet_id, 0.0) + float(sc)
-                    total = sum(year_cet_totals.values()) or 0.0
-                    if total > 0:
-                        trend[str(int(y))] = {k: v / total for k, v in year_cet_totals.items()}
-                    else:
-                        trend[str(int(y))] = {}
+            first_dt = cast(pd.Timestamp, award_dates.at[code, "min"])
+            last_dt = cast(pd.Timestamp, award_dates.at[code, "max"])
 
             rows.append(
                 {
-                    "company_id": cid,
+                    "company_id": company_ids[code],
                     "company_name": company_name,
-                    "total_awards": int(company_row["total_awards"]),
-                    "awards_with_cet": int(company_row["awards_with_cet"]),
-                    "coverage": float(company_row["coverage"]),
+                    "total_awards": n_total,
+                    "awards_with_cet": n_with_cet,
+                    "coverage": float(n_with_cet / (n_total or 1)),
                     "dominant_cet": dominant_cet,
                     "dominant_score": float(dominant_score) if dominant_score is not None else None,
                     "specialization_score": float(specialization),
                     "cet_scores": trimmed_map,
                     "first_award_date": pd.Timestamp(first_dt) if not pd.isna(first_dt) else None,
                     "last_award_date": pd.Timestamp(last_dt) if not pd.isna(last_dt) else None,
-                    "cet_trend": trend,
+                    "cet_trend": trends[code],
                 }
             )
 
@@ -10,6 +10,7 @@ Module Structure:
 - taxes: Federal tax estimation from economic components
 - roi: Return on investment calculation with NPV and payback period
 - sensitivity: Parameter sweep and uncertainty quantification
+- monte_carlo: Vectorized scenario evaluation of the full fiscal chain
 
 Pipeline Stages:
 1. Components: Extract tax base components from economic impacts
@@ -17,6 +18,7 @@ Pipeline Stages:
 3. Taxes: Estimate federal tax receipts from economic components
 4. ROI: Calculate ROI metrics with temporal discounting
 5. Sensitivity: Perform sensitivity analysis with uncertainty quantification
+   (scenarios re-evaluated through the fiscal chain by FiscalScenarioEngine)
 
 Exported Classes:
 - FiscalComponentCalculator: Component extraction and validation
@@ -25,6 +27,7 @@ Exported Classes:
 - FiscalROICalculator: ROI metric calculation
 - FiscalParameterSweep: Parameter sweep scenario generation
 - FiscalUncertaintyQuantifier: Uncertainty quantification
+- FiscalScenarioEngine: Blocked matrix evaluation of sensitivity scenarios
 
 Exported Functions:
 - calculate_fiscal_year: Convert award date to government fiscal year
@@ -39,6 +42,9 @@ from __future__ import annotations
 # Components module
 from .components import ComponentValidationResult, FiscalComponentCalculator
 
+# Monte Carlo module
+from .monte_carlo import FiscalScenarioEngine, ScenarioBaseline
+
 # ROI module
 from .roi import FiscalROICalculator, ROICalculationResult
 
@@ -81,4 +87,7 @@ __all__ = [
     "ParameterRange",
     "ParameterScenario",
     "UncertaintyResult",
+    # Monte Carlo
+    "FiscalScenarioEngine",
+    "ScenarioBaseline",
 ]
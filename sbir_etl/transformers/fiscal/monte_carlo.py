@@ -0,0 +1,320 @@
+"""
+Vectorized Monte Carlo scenario engine for fiscal returns analysis.
+
+This module re-evaluates the shocks → Leontief → components → taxes chain for
+every sensitivity scenario instead of rescaling a baseline total. Each stage is
+linear in the shock vector, so the chain collapses to per-row coefficients that
+are derived once from the baseline tax estimates; thousands of parameter draws
+then become a handful of matrix products per block of scenarios.
+
+Scenario parameters understood by the engine (columns of the scenario frame):
+
+- ``economic_multiplier``: total output multiplier. The indirect and induced
+  part of each row's Leontief production (production minus direct demand) is
+  scaled by ``(m - 1) / (BASE_ECONOMIC_MULTIPLIER - 1)``.
+- ``individual_income_tax_rate``: federal income tax rate applied to wages.
+- ``corporate_income_tax_rate``: federal corporate rate applied to GOS.
+- ``discount_rate``: annual rate used for ``npv_tax_receipt``, discounting
+  each row from the earliest fiscal year in the estimates.
+
+Missing parameters fall back to the per-row baseline used by
+``FiscalTaxEstimator``.
+
+Epistemic tier: exploratory. Scenario outputs are model-based estimates.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from .taxes import FiscalTaxEstimator
+
+
+# Nominal multiplier the sensitivity bands are centered on.
+BASE_ECONOMIC_MULTIPLIER = 2.0
+
+COMPONENT_COLUMNS = (
+    "wage_impact",
+    "proprietor_income_impact",
+    "gross_operating_surplus",
+    "consumption_impact",
+)
+SHOCK_AMOUNT_COLUMNS = ("shock_amount", "shock_amount_shock", "shock_amount_impact")
+RESULT_COLUMNS = (
+    "production_impact",
+    "federal_tax_total",
+    "state_local_tax_total",
+    "total_tax_receipt",
+    "npv_tax_receipt",
+)
+
+
+@dataclass(frozen=True)
+class ScenarioBaseline:
+    """Per-row linear coefficients of the fiscal chain (one row per shock).
+
+    Component and tax arrays are in dollars at the baseline multiplier.
+    ``direct_share`` is the fraction of baseline production that is direct
+    demand and therefore does not move with the multiplier.
+    """
+
+    production: np.ndarray
+    direct_share: np.ndarray
+    wages: np.ndarray
+    gross_operating_surplus: np.ndarray
+    federal_income_rate: np.ndarray
+    federal_corporate_rate: np.ndarray
+    federal_fixed_tax: np.ndarray
+    state_local_tax: np.ndarray
+    discount_years: np.ndarray
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.production)
+
+
+def _evaluate_block(baseline: ScenarioBaseline, params: np.ndarray) -> np.ndarray:
+    """Evaluate a block of scenarios.
+
+    Args:
+        baseline: Per-row coefficients.
+        params: ``(S, 4)`` array of multiplier, income rate, corporate rate and
+            discount rate; NaN means "use the baseline".
+
+    Returns:
+        ``(S, len(RESULT_COLUMNS))`` array of scenario results.
+    """
+    multiplier, income_rate, corporate_rate, discount_rate = params.T
+
+    kappa = np.where(
+        np.isnan(multiplier), 1.0, (multiplier - 1.0) / (BASE_ECONOMIC_MULTIPLIER - 1.0)
+    )
+    # (S, R) production scale relative to baseline for every row.
+    scale = baseline.direct_share[None, :] + kappa[:, None] * (1.0 - baseline.direct_share)[None, :]
+
+    income = np.where(
+        np.isnan(income_rate)[:, None], baseline.federal_income_rate[None, :], income_rate[:, None]
+    )
+    corporate = np.where(
+        np.isnan(corporate_rate)[:, None],
+        baseline.federal_corporate_rate[None, :],
+        corporate_rate[:, None],
+    )
+    federal_rows = scale * (
+        baseline.federal_fixed_tax[None, :]
+        + income * baseline.wages[None, :]
+        + corporate * baseline.gross_operating_surplus[None, :]
+    )
+    state_local = scale @ baseline.state_local_tax
+    federal = federal_rows.sum(axis=1)
+
+    rate = np.nan_to_num(discount_rate, nan=0.0)
+    discount = (1.0 + rate)[:, None] ** -baseline.discount_years[None, :]
+    row_totals = federal_rows + scale * baseline.state_local_tax[None, :]
+    npv = (row_totals * discount).sum(axis=1)
+
+    return np.column_stack(
+        [scale @ baseline.production, federal, state_local, federal + state_local, npv]
+    )
+
+
+_WORKER_BASELINE: ScenarioBaseline | None = None
+
+
+def _init_worker(baseline: ScenarioBaseline) -> None:
+    global _WORKER_BASELINE
+    _WORKER_BASELINE = baseline
+
+
+def _evaluate_block_in_worker(params: np.ndarray) -> np.ndarray:
+    assert _WORKER_BASELINE is not None
+    return _evaluate_block(_WORKER_BASELINE, params)
+
+
+class FiscalScenarioEngine:
+    """Evaluate fiscal sensitivity scenarios as blocked matrix operations.
+
+    Build the engine from the ``federal_tax_estimates`` output with
+    :meth:`from_tax_estimates`, then call :meth:`evaluate` with the scenario
+    frame from ``FiscalParameterSweep.generate_scenarios``.
+    """
+
+    PARAMETER_COLUMNS = (
+        "economic_multiplier",
+        "individual_income_tax_rate",
+        "corporate_income_tax_rate",
+        "discount_rate",
+    )
+
+    def __init__(self, baseline: ScenarioBaseline, block_size: int = 256):
+        """Initialize the scenario engine.
+
+        Args:
+            baseline: Per-row coefficients of the fiscal chain
+            block_size: Scenarios evaluated per matrix block
+        """
+        self.baseline = baseline
+        self.block_size = max(1, block_size)
+
+    @classmethod
+    def from_tax_estimates(
+        cls,
+        tax_estimates_df: pd.DataFrame,
+        estimator: FiscalTaxEstimator | None = None,
+        block_size: int = 256,
+    ) -> FiscalScenarioEngine:
+        """Derive per-row chain coefficients from baseline tax estimates.
+
+        Tax coefficients are obtained by running the estimator on unit
+        component probes with the same state and fiscal-year identifiers, so
+        scenario taxes use exactly the rates of the baseline estimate.
+
+        Args:
+            tax_estimates_df: Output of ``federal_tax_estimates``
+            estimator: Tax estimator supplying the rates (default estimator if None)
+            block_size: Scenarios evaluated per matrix block
+
+        Returns:
+            FiscalScenarioEngine for the estimates
+        """
+        n = len(tax_estimates_df)
+
+        def _numeric(col: str) -> np.ndarray:
+            if col not in tax_estimates_df.columns:
+                return np.zeros(n)
+            return pd.to_numeric(tax_estimates_df[col], errors="coerce").fillna(0.0).to_numpy(float)
+
+        components = {col: _numeric(col) for col in COMPONENT_COLUMNS}
+        production = _numeric("production_impact")
+
+        shock_col = next((c for c in SHOCK_AMOUNT_COLUMNS if c in tax_estimates_df.columns), None)
+        if shock_col is not None:
+            direct = _numeric(shock_col)
+        else:
+            logger.warning(
+                "No shock amount column in tax estimates; assuming the nominal "
+                f"{BASE_ECONOMIC_MULTIPLIER}x multiplier to split direct demand"
+            )
+            direct = production / BASE_ECONOMIC_MULTIPLIER
+        with np.errstate(divide="ignore", invalid="ignore"):
+            direct_share = np.where(production > 0, np.clip(direct / production, 0.0, 1.0), 1.0)
+
+        coefficients = cls._probe_tax_coefficients(tax_estimates_df, estimator)
+        wages = components["wage_impact"]
+        gos = components["gross_operating_surplus"]
+        federal_fixed = np.zeros(n)
+        state_local = np.zeros(n)
+        for col in COMPONENT_COLUMNS:
+            federal_fixed += components[col] * coefficients[col]["federal_fixed"]
+            state_local += components[col] * coefficients[col]["state_local"]
+
+        if "fiscal_year" in tax_estimates_df.columns and n:
+            years = pd.to_numeric(tax_estimates_df["fiscal_year"], errors="coerce")
+            discount_years = (years - years.min()).fillna(0.0).to_numpy(float)
+        else:
+            discount_years = np.zeros(n)
+
+        baseline = ScenarioBaseline(
+            production=production,
+            direct_share=direct_share,
+            wages=wages,
+            gross_operating_surplus=gos,
+            federal_income_rate=coefficients["wage_impact"]["individual_income"],
+            federal_corporate_rate=coefficients["gross_operating_surplus"]["corporate_income"],
+            federal_fixed_tax=federal_fixed,
+            state_local_tax=state_local,
+            discount_years=discount_years,
+        )
+        return cls(baseline, block_size=block_size)
+
+    @staticmethod
+    def _probe_tax_coefficients(
+        tax_estimates_df: pd.DataFrame, estimator: FiscalTaxEstimator | None
+    ) -> dict[str, dict[str, np.ndarray]]:
+        """Tax per dollar of each component, split into overridable and fixed parts."""
+        n = len(tax_estimates_df)
+        zeros = np.zeros(n)
+        empty = {
+            "individual_income": zeros,
+            "corporate_income": zeros,
+            "federal_fixed": zeros,
+            "state_local": zeros,
+        }
+        if n == 0:
+            return dict.fromkeys(COMPONENT_COLUMNS, empty)
+
+        estimator = estimator or FiscalTaxEstimator()
+        id_cols = [c for c in ("state", "fiscal_year") if c in tax_estimates_df.columns]
+        probe_base = tax_estimates_df[id_cols].reset_index(drop=True)
+
+        coefficients = {}
+        for col in COMPONENT_COLUMNS:
+            probe = probe_base.copy()
+            for other in COMPONENT_COLUMNS:
+                probe[other] = 1.0 if other == col else 0.0
+            taxes = estimator.estimate_taxes_from_components(probe)
+            individual = taxes["individual_income_tax"].to_numpy(float)
+            corporate = taxes["corporate_income_tax"].to_numpy(float)
+            coefficients[col] = {
+                "individual_income": individual,
+                "corporate_income": corporate,
+                "federal_fixed": taxes["federal_tax_total"].to_numpy(float)
+                - individual
+                - corporate,
+                "state_local": taxes["state_local_tax_total"].to_numpy(float),
+            }
+        return coefficients
+
+    def evaluate(self, scenarios_df: pd.DataFrame, max_workers: int = 1) -> pd.DataFrame:
+        """Evaluate every scenario through the fiscal chain.
+
+        Args:
+            scenarios_df: Scenario parameters (one row per scenario)
+            max_workers: Process pool size for scenario blocks; 1 runs in-process
+
+        Returns:
+            Copy of ``scenarios_df`` with result columns appended
+        """
+        result = scenarios_df.copy()
+        if scenarios_df.empty:
+            for col in RESULT_COLUMNS:
+                result[col] = pd.Series(dtype=float)
+            return result
+
+        params = np.column_stack(
+            [
+                pd.to_numeric(scenarios_df[col], errors="coerce").to_numpy(float)
+                if col in scenarios_df.columns
+                else np.full(len(scenarios_df), np.nan)
+                for col in self.PARAMETER_COLUMNS
+            ]
+        )
+        blocks = [
+            params[start : start + self.block_size]
+            for start in range(0, len(params), self.block_size)
+        ]
+
+        if max_workers > 1 and len(blocks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(blocks)),
+                initializer=_init_worker,
+                initargs=(self.baseline,),
+            ) as pool:
+                outputs = list(pool.map(_evaluate_block_in_worker, blocks))
+        else:
+            outputs = [_evaluate_block(self.baseline, block) for block in blocks]
+
+        values = np.vstack(outputs)
+        for i, col in enumerate(RESULT_COLUMNS):
+            result[col] = values[:, i]
+
+        logger.info(
+            f"Evaluated {len(result)} fiscal scenarios over {self.baseline.num_rows} shock rows "
+            f"in {len(blocks)} blocks"
+        )
+        return result
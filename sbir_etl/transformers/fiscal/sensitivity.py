@@ -18,6 +18,7 @@ import pandas as pd
 from loguru import logger
 
 from ...config.loader import get_config
+from .monte_carlo import BASE_ECONOMIC_MULTIPLIER
 from .nipa_rates import NIPARateProvider
 
 
@@ -139,7 +140,7 @@ class FiscalParameterSweep:
         if "multipliers" in uncertainty_params:
             mult_config = uncertainty_params["multipliers"]
             variation = mult_config.get("variation_percent", 0.15)
-            base_multiplier = 2.0
+            base_multiplier = BASE_ECONOMIC_MULTIPLIER
 
             ranges["economic_multiplier"] = ParameterRange(
                 name="economic_multiplier",
@@ -158,53 +159,65 @@ class FiscalParameterSweep:
 
         return ranges
 
-    def generate_monte_carlo_scenarios(
+    def generate_monte_carlo_frame(
         self, num_scenarios: int, random_seed: int | None = None
-    ) -> list[ParameterScenario]:
-        """Generate scenarios using Monte Carlo sampling.
+    ) -> pd.DataFrame:
+        """Draw Monte Carlo parameter samples as one column per parameter.
+
+        Each parameter is drawn in a single vectorized call from a seeded
+        ``numpy.random.Generator``.
 
         Args:
             num_scenarios: Number of scenarios to generate
             random_seed: Optional random seed for reproducibility
 
         Returns:
-            List of ParameterScenario objects
+            DataFrame with ``scenario_id`` and one column per parameter
         """
-        if random_seed is not None:
-            random.seed(random_seed)
-            np.random.seed(random_seed)
-
+        rng = np.random.default_rng(random_seed)
         ranges = self._get_parameter_ranges()
-        scenarios = []
 
-        for i in range(num_scenarios):
-            parameters = {}
+        columns: dict[str, np.ndarray] = {
+            "scenario_id": np.arange(1, num_scenarios + 1),
+        }
+        for param_name, param_range in ranges.items():
+            low, high = param_range.min_value, param_range.max_value
+            if param_range.distribution == "normal":
+                # Truncated normal (mean at center, std based on range)
+                mean = (low + high) / 2
+                std = (high - low) / 4
+                values = np.clip(rng.normal(mean, std, num_scenarios), low, high)
+            else:
+                # Uniform, and the default for unknown distributions
+                values = rng.uniform(low, high, num_scenarios)
+            columns[param_name] = values.astype(float)
 
-            for param_name, param_range in ranges.items():
-                if param_range.distribution == "uniform":
-                    value = random.uniform(param_range.min_value, param_range.max_value)  # nosec B311 - Monte Carlo sampling for sensitivity analysis
-                elif param_range.distribution == "normal":
-                    # Use truncated normal (mean at center, std based on range)
-                    mean = (param_range.min_value + param_range.max_value) / 2
-                    std = (param_range.max_value - param_range.min_value) / 4
-                    value = np.random.normal(mean, std)
-                    # Clip to range
-                    value = max(param_range.min_value, min(param_range.max_value, value))
-                else:
-                    # Default to uniform
-                    value = random.uniform(param_range.min_value, param_range.max_value)  # nosec B311 - Monte Carlo sampling for sensitivity analysis
+        return pd.DataFrame(columns)
 
-                parameters[param_name] = float(value)
+    def generate_monte_carlo_scenarios(
+        self, num_scenarios: int, random_seed: int | None = None
+    ) -> list[ParameterScenario]:
+        """Generate scenarios using Monte Carlo sampling.
 
-            scenario = ParameterScenario(
-                scenario_id=i + 1,
-                parameters=parameters,
-                metadata={
-                    "method": "monte_carlo",
-                    "random_seed": random_seed,
-                },
+        Args:
+            num_scenarios: Number of scenarios to generate
+            random_seed: Optional random seed for reproducibility
+
+        Returns:
+            List of ParameterScenario objects
+        """
+        frame = self.generate_monte_carlo_frame(num_scenarios, random_seed)
+        param_names = [c for c in frame.columns if c != "scenario_id"]
+        metadata = {"method": "monte_carlo", "random_seed": random_seed}
+
+        scenarios = [
+            ParameterScenario(
+                scenario_id=int(scenario_id),
+                parameters=dict(zip(param_names, map(float, values), strict=True)),
+                metadata=dict(metadata),
             )
-            scenarios.append(scenario)
+            for scenario_id, *values in frame.itertuples(index=False, name=None)
+        ]
 
         logger.info(f"Generated {num_scenarios} Monte Carlo scenarios")
         return scenarios
@@ -371,32 +384,35 @@ class FiscalParameterSweep:
         )
 
         if method == "monte_carlo":
-            scenarios = self.generate_monte_carlo_scenarios(num_scenarios, random_seed)
-        elif method == "latin_hypercube":
-            scenarios = self.generate_latin_hypercube_scenarios(num_scenarios, random_seed)
-        elif method == "grid_search":
-            ranges = self._get_parameter_ranges()
-            num_params = len(ranges)
-            if num_params > 0:
-                points_per_dim = int(np.ceil(num_scenarios ** (1.0 / num_params)))
-            else:
-                points_per_dim = 3  # Default
-            scenarios = self.generate_grid_search_scenarios(points_per_dim)
+            df = self.generate_monte_carlo_frame(num_scenarios, random_seed)
+            df["method"] = "monte_carlo"
+            df["random_seed"] = random_seed
         else:
-            logger.warning(f"Unknown method {method}, defaulting to monte_carlo")
-            scenarios = self.generate_monte_carlo_scenarios(num_scenarios, random_seed)
+            if method == "latin_hypercube":
+                scenarios = self.generate_latin_hypercube_scenarios(num_scenarios, random_seed)
+            elif method == "grid_search":
+                ranges = self._get_parameter_ranges()
+                num_params = len(ranges)
+                if num_params > 0:
+                    points_per_dim = int(np.ceil(num_scenarios ** (1.0 / num_params)))
+                else:
+                    points_per_dim = 3  # Default
+                scenarios = self.generate_grid_search_scenarios(points_per_dim)
+            else:
+                logger.warning(f"Unknown method {method}, defaulting to monte_carlo")
+                scenarios = self.generate_monte_carlo_scenarios(num_scenarios, random_seed)
 
-        # Convert to DataFrame
-        scenario_data = []
-        for scenario in scenarios:
-            row = {
-                "scenario_id": scenario.scenario_id,
-                **scenario.parameters,
-                **scenario.metadata,
-            }
-            scenario_data.append(row)
+            # Convert to DataFrame
+            scenario_data = []
+            for scenario in scenarios:
+                row = {
+                    "scenario_id": scenario.scenario_id,
+                    **scenario.parameters,
+                    **scenario.metadata,
+                }
+                scenario_data.append(row)
 
-        df = pd.DataFrame(scenario_data)
+            df = pd.DataFrame(scenario_data)
 
         logger.info(
             f"Generated {len(df)} scenarios using {method} method",
@@ -538,19 +554,9 @@ class FiscalUncertaintyQuantifier:
         if estimates.empty:
             return {level: (Decimal("0"), Decimal("0")) for level in confidence_levels}
 
-        if random_seed is not None:
-            np.random.seed(random_seed)
-
-        # Bootstrap resampling
-        n = len(estimates)
-        bootstrap_means_list: list[float] = []
-
-        for _ in range(num_samples):
-            # Resample with replacement
-            sample = np.random.choice(estimates, size=n, replace=True)
-            bootstrap_means_list.append(float(np.mean(sample)))
-
-        bootstrap_means: np.ndarray[Any, Any] = np.array(bootstrap_means_list)
+        bootstrap_means = self._bootstrap_means(
+            estimates.to_numpy(dtype=float), num_samples, random_seed
+        )
 
         intervals = {}
         for level in confidence_levels:
@@ -565,6 +571,28 @@ class FiscalUncertaintyQuantifier:
 
         return intervals
 
+    @staticmethod
+    def _bootstrap_means(
+        values: np.ndarray,
+        num_samples: int,
+        random_seed: int | None = None,
+        max_block_elements: int = 10_000_000,
+    ) -> np.ndarray:
+        """Means of ``num_samples`` resamples with replacement, drawn in blocks.
+
+        Each block draws a ``(samples, n)`` index matrix at once; the block
+        height is capped so the index matrix stays under ``max_block_elements``.
+        """
+        rng = np.random.default_rng(random_seed)
+        n = len(values)
+        block = max(1, max_block_elements // max(n, 1))
+        means = np.empty(num_samples)
+        for start in range(0, num_samples, block):
+            stop = min(start + block, num_samples)
+            idx = rng.integers(0, n, size=(stop - start, n))
+            means[start:stop] = values[idx].mean(axis=1)
+        return means
+
     def compute_sensitivity_indices(
         self,
         scenario_results_df: pd.DataFrame,
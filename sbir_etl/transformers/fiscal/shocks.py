@@ -12,6 +12,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -78,6 +79,16 @@ def calculate_fiscal_year(award_date: date | datetime | str | None) -> int | Non
         return None
 
 
+def _coerce_dates(values: pd.Series) -> pd.Series:
+    """Parse a column of award dates, leaving non-date values as NaT."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    if pd.api.types.is_numeric_dtype(values):
+        # Bare numbers are not dates for fiscal-year purposes.
+        return pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    return pd.to_datetime(values, errors="coerce", format="mixed")
+
+
 class FiscalShockAggregator:
     """Aggregate SBIR awards into state-by-sector-by-fiscal-year economic shocks.
 
@@ -86,6 +97,35 @@ class FiscalShockAggregator:
     individual awards to aggregated shocks for audit purposes.
     """
 
+    # Column precedence shared by the per-row extractors and the columnar path.
+    FISCAL_YEAR_DATE_COLUMNS = (
+        "award_date",
+        "Award_Date",
+        "proposal_award_date",
+        "Proposal Award Date",
+    )
+    STATE_COLUMNS = ("resolved_state", "company_state", "State", "state", "Company_State")
+    AMOUNT_COLUMNS = (
+        "inflation_adjusted_amount",
+        "adjusted_amount",
+        "award_amount",
+        "Award Amount",
+        "amount",
+    )
+
+    SHOCK_FRAME_COLUMNS = [
+        "state",
+        "bea_sector",
+        "fiscal_year",
+        "shock_amount",
+        "num_awards",
+        "award_ids",
+        "confidence",
+        "naics_coverage_rate",
+        "geographic_resolution_rate",
+        "base_year",
+    ]
+
     def __init__(self, config: Any | None = None):
         """Initialize the fiscal shock aggregator.
 
@@ -120,8 +160,7 @@ class FiscalShockAggregator:
                 pass
 
         # Try award_date
-        award_date_cols = ["award_date", "Award_Date", "proposal_award_date", "Proposal Award Date"]
-        for col in award_date_cols:
+        for col in self.FISCAL_YEAR_DATE_COLUMNS:
             if col in award_row.index and pd.notna(award_row[col]):
                 fy2: int | None = calculate_fiscal_year(award_row[col])
                 if fy2 is not None:
@@ -160,16 +199,7 @@ class FiscalShockAggregator:
             Two-letter state code or None
         """
         # Try geographic resolution field first
-        state_cols = [
-            "resolved_state",
-            "company_state",
-            "State",
-            "state",
-            "Company_State",
-            "company_state",
-        ]
-
-        for col in state_cols:
+        for col in self.STATE_COLUMNS:
             if col in award_row.index and pd.notna(award_row[col]):
                 state_code = str(award_row[col]).strip().upper()
                 # Validate it's a 2-letter code
@@ -194,15 +224,7 @@ class FiscalShockAggregator:
             Decimal amount or None
         """
         # Try inflation-adjusted amount first
-        amount_cols = [
-            "inflation_adjusted_amount",
-            "adjusted_amount",
-            "award_amount",
-            "Award Amount",
-            "amount",
-        ]
-
-        for col in amount_cols:
+        for col in self.AMOUNT_COLUMNS:
             if col in award_row.index and pd.notna(award_row[col]):
                 try:
                     amount = Decimal(str(award_row[col]))
@@ -213,6 +235,76 @@ class FiscalShockAggregator:
 
         return None
 
+    def resolve_fiscal_years(self, awards_df: pd.DataFrame) -> pd.Series:
+        """Columnar equivalent of :meth:`extract_fiscal_year`.
+
+        Args:
+            awards_df: Award rows
+
+        Returns:
+            Nullable ``Int64`` Series of fiscal years aligned to ``awards_df``
+        """
+        result = pd.Series(pd.NA, index=awards_df.index, dtype="Int64")
+
+        if "fiscal_year" in awards_df.columns:
+            explicit = pd.to_numeric(awards_df["fiscal_year"], errors="coerce")
+            explicit = pd.Series(np.trunc(explicit.astype("float64")), index=awards_df.index)
+            valid = explicit.between(1980, 2030)
+            result = result.mask(valid, explicit.where(valid).astype("Int64"))
+
+        for col in self.FISCAL_YEAR_DATE_COLUMNS:
+            if col not in awards_df.columns or not result.isna().any():
+                continue
+            dates = _coerce_dates(awards_df[col])
+            derived = (dates.dt.year + (dates.dt.month >= 10).astype("int64")).astype("Int64")
+            result = result.fillna(derived)
+
+        if "award_year" in awards_df.columns and result.isna().any():
+            years = pd.to_numeric(awards_df["award_year"], errors="coerce")
+            truncated = pd.Series(np.trunc(years.astype("float64")), index=awards_df.index)
+            result = result.fillna((truncated + 1).astype("Int64"))
+
+        return result
+
+    def resolve_state_codes(self, awards_df: pd.DataFrame) -> pd.Series:
+        """Columnar equivalent of :meth:`extract_state_code`.
+
+        Args:
+            awards_df: Award rows
+
+        Returns:
+            Series of two-letter state codes (missing where unresolved)
+        """
+        result = pd.Series(None, index=awards_df.index, dtype=object)
+        for col in self.STATE_COLUMNS:
+            if col not in awards_df.columns:
+                continue
+            raw = awards_df[col]
+            codes = raw[raw.notna()].astype(str).str.strip().str.upper()
+            valid = codes[(codes.str.len() == 2) & codes.str.isalpha()]
+            result = result.fillna(valid.astype(object))
+        return result
+
+    def resolve_amount_cents(self, awards_df: pd.DataFrame) -> pd.Series:
+        """Columnar equivalent of :meth:`extract_shock_amount`, in integer cents.
+
+        Amounts are rounded half-to-even to whole cents so that downstream
+        sums are exact int64 arithmetic rather than per-row ``Decimal`` math.
+
+        Args:
+            awards_df: Award rows
+
+        Returns:
+            Nullable ``Int64`` Series of non-negative amounts in cents
+        """
+        dollars = pd.Series(np.nan, index=awards_df.index, dtype="float64")
+        for col in self.AMOUNT_COLUMNS:
+            if col not in awards_df.columns:
+                continue
+            values = pd.to_numeric(awards_df[col], errors="coerce").astype("float64")
+            dollars = dollars.fillna(values.where(values >= 0))
+        return (dollars * 100).round().astype("Int64")
+
     def aggregate_shocks(
         self,
         awards_df: pd.DataFrame,
@@ -234,136 +326,138 @@ class FiscalShockAggregator:
             logger.warning("Empty awards DataFrame provided to shock aggregator")
             return []
 
-        logger.info(f"Starting shock aggregation for {len(awards_df)} award records")
+        grouped = self._aggregate_columnar(awards_df, chunk_size=chunk_size)
+        created_at = datetime.now()
+        return [
+            EconomicShock(
+                state=row["state"],
+                bea_sector=row["bea_sector"],
+                fiscal_year=int(row["fiscal_year"]),
+                shock_amount=Decimal(int(row["shock_amount_cents"])).scaleb(-2),
+                award_ids=list(row["award_ids"]),
+                confidence=float(row["confidence"]),
+                naics_coverage_rate=float(row["naics_coverage_rate"]),
+                geographic_resolution_rate=float(row["geographic_resolution_rate"]),
+                base_year=self.base_year,
+                created_at=created_at,
+            )
+            for row in grouped.to_dict("records")
+        ]
 
-        # Process in chunks if specified
-        if chunk_size and len(awards_df) > chunk_size:
-            all_shocks = []
-            for i in range(0, len(awards_df), chunk_size):
-                chunk = awards_df.iloc[i : i + chunk_size]
-                chunk_shocks = self._aggregate_chunk(chunk)
-                all_shocks.extend(chunk_shocks)
-                logger.info(f"Processed chunk {i // chunk_size + 1}: {len(chunk_shocks)} shocks")
-            return all_shocks
-        else:
-            return self._aggregate_chunk(awards_df)
+    def _aggregate_columnar(
+        self, awards_df: pd.DataFrame, chunk_size: int | None = None
+    ) -> pd.DataFrame:
+        """Group awards into shocks with one ``groupby`` over resolved columns.
 
-    def _aggregate_chunk(self, awards_df: pd.DataFrame) -> list[EconomicShock]:
-        """Aggregate a chunk of awards into shocks.
+        When ``chunk_size`` is set, each block of ``chunk_size`` rows is
+        aggregated independently (shocks are not merged across blocks and
+        coverage rates are per block), matching chunked processing.
 
         Args:
-            awards_df: DataFrame chunk with BEA-mapped awards
+            awards_df: DataFrame with BEA-mapped awards
+            chunk_size: Optional block size for independent aggregation
 
         Returns:
-            List of EconomicShock objects
+            DataFrame with one row per shock, including ``shock_amount_cents``
         """
-        shocks_dict: dict[tuple[str, str, int], dict[str, Any]] = {}
-
-        # Track statistics
-        total_awards = len(awards_df)
-        naics_coverage = 0
-        geographic_coverage = 0
-        total_confidence_sum = 0.0
-        confidence_count = 0
-
-        for _, row in awards_df.iterrows():
-            # Extract key dimensions
-            state = self.extract_state_code(row)
-            fiscal_year = self.extract_fiscal_year(row)
-            bea_sector = row.get("bea_sector_code")
-            award_id = str(row.get("award_id", "UNKNOWN"))
-
-            # Skip if missing critical dimensions
-            if not state or not fiscal_year or pd.isna(bea_sector):
-                continue
-
-            bea_sector = str(bea_sector)
+        logger.info(f"Starting shock aggregation for {len(awards_df)} award records")
 
-            # Extract amount with allocation weight
-            base_amount = self.extract_shock_amount(row)
-            if base_amount is None:
-                continue
+        positions = np.arange(len(awards_df))
+        if chunk_size and len(awards_df) > chunk_size:
+            chunk_ids = positions // chunk_size
+        else:
+            chunk_ids = np.zeros(len(awards_df), dtype="int64")
 
-            # Apply allocation weight if present (for weighted BEA sector mappings)
-            allocation_weight = float(row.get("bea_allocation_weight", 1.0))
-            shock_amount = base_amount * Decimal(str(allocation_weight))
-
-            # Create/update shock entry
-            key = (state, bea_sector, fiscal_year)
-
-            if key not in shocks_dict:
-                shocks_dict[key] = {
-                    "state": state,
-                    "bea_sector": bea_sector,
-                    "fiscal_year": fiscal_year,
-                    "shock_amount": Decimal("0"),
-                    "award_ids": [],
-                    "confidences": [],
-                    "naics_flags": [],
-                }
-
-            shocks_dict[key]["shock_amount"] += shock_amount
-            shocks_dict[key]["award_ids"].append(award_id)
-
-            # Track confidence and quality metrics
-            mapping_confidence = float(row.get("bea_mapping_confidence", 0.70))
-            shocks_dict[key]["confidences"].append(mapping_confidence)
-            total_confidence_sum += mapping_confidence
-            confidence_count += 1
-
-            # Track NAICS and geographic coverage
-            if pd.notna(row.get("fiscal_naics_code")):
-                naics_coverage += 1
-            if state:
-                geographic_coverage += 1
-
-        # Convert to EconomicShock objects
-        shocks = []
-        for key, data in shocks_dict.items():
-            state, bea_sector, fiscal_year = key
-
-            # Calculate aggregate confidence (weighted average)
-            confidences = data["confidences"]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.70
-
-            # Calculate coverage rates for this shock
-            len(data["award_ids"])
-            # For individual shock, use aggregate statistics as proxy
-            # (full coverage would require tracking per-shock)
-            naics_coverage_rate = naics_coverage / total_awards if total_awards > 0 else 0.0
-            geo_resolution_rate = geographic_coverage / total_awards if total_awards > 0 else 0.0
-
-            shock = EconomicShock(
-                state=state,
-                bea_sector=bea_sector,
-                fiscal_year=fiscal_year,
-                shock_amount=data["shock_amount"],
-                award_ids=data["award_ids"],
-                confidence=avg_confidence,
-                naics_coverage_rate=naics_coverage_rate,
-                geographic_resolution_rate=geo_resolution_rate,
-                base_year=self.base_year,
+        if "bea_sector_code" in awards_df.columns:
+            sectors = awards_df["bea_sector_code"]
+        else:
+            sectors = pd.Series(None, index=awards_df.index, dtype=object)
+        if "award_id" in awards_df.columns:
+            award_ids = awards_df["award_id"].astype(object).map(str)
+        else:
+            award_ids = pd.Series("UNKNOWN", index=awards_df.index, dtype=object)
+
+        def _numeric(col: str, default: float) -> pd.Series:
+            if col not in awards_df.columns:
+                return pd.Series(default, index=awards_df.index, dtype="float64")
+            return pd.to_numeric(awards_df[col], errors="coerce").astype("float64").fillna(default)
+
+        frame = pd.DataFrame(
+            {
+                "chunk": chunk_ids,
+                "state": self.resolve_state_codes(awards_df).to_numpy(),
+                "bea_sector": sectors.to_numpy(),
+                "fiscal_year": self.resolve_fiscal_years(awards_df).to_numpy(),
+                "amount_cents": self.resolve_amount_cents(awards_df).to_numpy(),
+                "weight": _numeric("bea_allocation_weight", 1.0).to_numpy(),
+                "confidence": _numeric("bea_mapping_confidence", 0.70).to_numpy(),
+                "has_naics": (
+                    awards_df["fiscal_naics_code"].notna().to_numpy()
+                    if "fiscal_naics_code" in awards_df.columns
+                    else np.zeros(len(awards_df), dtype=bool)
+                ),
+                "award_id": award_ids.to_numpy(),
+            }
+        )
+        chunk_totals = frame.groupby("chunk").size()
+
+        frame = frame[
+            frame["state"].notna()
+            & frame["bea_sector"].notna()
+            & frame["fiscal_year"].notna()
+            & frame["amount_cents"].notna()
+        ].copy()
+
+        if frame.empty:
+            return pd.DataFrame(columns=[*self.SHOCK_FRAME_COLUMNS, "shock_amount_cents"])
+
+        frame["bea_sector"] = frame["bea_sector"].astype(str)
+        frame["fiscal_year"] = frame["fiscal_year"].astype("int64")
+        frame["weighted_cents"] = np.round(
+            frame["amount_cents"].astype("int64").to_numpy() * frame["weight"].to_numpy()
+        ).astype("int64")
+
+        invalid_years = ~frame["fiscal_year"].between(1980, 2030)
+        if invalid_years.any():
+            raise ValueError(
+                f"{int(invalid_years.sum())} award rows resolved to a fiscal year outside 1980-2030"
             )
 
-            shocks.append(shock)
+        # Coverage rates are chunk-level proxies: included rows over all rows.
+        totals = chunk_totals.reindex(frame["chunk"]).to_numpy()
+        included = frame.groupby("chunk")["chunk"].transform("size").to_numpy()
+        naics = frame.groupby("chunk")["has_naics"].transform("sum").to_numpy()
+        frame["naics_coverage_rate"] = naics / totals
+        frame["geographic_resolution_rate"] = included / totals
+
+        grouped = frame.groupby(["chunk", "state", "bea_sector", "fiscal_year"], sort=False).agg(
+            shock_amount_cents=("weighted_cents", "sum"),
+            award_ids=("award_id", list),
+            confidence=("confidence", "mean"),
+            naics_coverage_rate=("naics_coverage_rate", "first"),
+            geographic_resolution_rate=("geographic_resolution_rate", "first"),
+        )
+        grouped = grouped.reset_index().drop(columns="chunk")
+        grouped["shock_amount"] = grouped["shock_amount_cents"] / 100
+        grouped["num_awards"] = grouped["award_ids"].map(len)
+        grouped["base_year"] = self.base_year
 
         logger.info(
-            f"Aggregated {len(shocks)} shocks from {total_awards} awards",
+            f"Aggregated {len(grouped)} shocks from {len(awards_df)} awards",
             extra={
-                "unique_states": len({s.state for s in shocks}),
-                "unique_sectors": len({s.bea_sector for s in shocks}),
-                "unique_fiscal_years": len({s.fiscal_year for s in shocks}),
+                "unique_states": grouped["state"].nunique(),
+                "unique_sectors": grouped["bea_sector"].nunique(),
+                "unique_fiscal_years": grouped["fiscal_year"].nunique(),
             },
         )
-
-        return shocks
+        return grouped[[*self.SHOCK_FRAME_COLUMNS, "shock_amount_cents"]]
 
     def aggregate_shocks_to_dataframe(
         self, awards_df: pd.DataFrame, chunk_size: int | None = None
     ) -> pd.DataFrame:
         """Aggregate shocks and return as DataFrame.
 
-        Convenience method that converts EconomicShock objects to DataFrame format.
+        Uses the columnar path directly; no EconomicShock objects are built.
 
         Args:
             awards_df: DataFrame with BEA-mapped awards
@@ -372,45 +466,63 @@ class FiscalShockAggregator:
         Returns:
             DataFrame with shock aggregation results
         """
-        shocks = self.aggregate_shocks(awards_df, chunk_size=chunk_size)
+        if awards_df.empty:
+            logger.warning("Empty awards DataFrame provided to shock aggregator")
+            return pd.DataFrame(columns=self.SHOCK_FRAME_COLUMNS)
 
-        if not shocks:
-            # Return empty DataFrame with expected columns
-            return pd.DataFrame(
-                columns=[
-                    "state",
-                    "bea_sector",
-                    "fiscal_year",
-                    "shock_amount",
-                    "num_awards",
-                    "award_ids",
-                    "confidence",
-                    "naics_coverage_rate",
-                    "geographic_resolution_rate",
-                    "base_year",
-                ]
-            )
+        grouped = self._aggregate_columnar(awards_df, chunk_size=chunk_size)
+        if grouped.empty:
+            return pd.DataFrame(columns=self.SHOCK_FRAME_COLUMNS)
+
+        shocks_df = grouped.drop(columns="shock_amount_cents").reset_index(drop=True)
+        shocks_df["created_at"] = datetime.now().isoformat()
+        return shocks_df
+
+    def get_frame_aggregation_statistics(self, shocks_df: pd.DataFrame) -> ShockAggregationStats:
+        """Calculate aggregation statistics from a shocks DataFrame.
+
+        Columnar counterpart of :meth:`get_aggregation_statistics` for the
+        output of :meth:`aggregate_shocks_to_dataframe`.
+
+        Args:
+            shocks_df: Shock aggregation DataFrame
 
-        # Convert to dict list
-        shock_dicts = []
-        for shock in shocks:
-            shock_dicts.append(
-                {
-                    "state": shock.state,
-                    "bea_sector": shock.bea_sector,
-                    "fiscal_year": shock.fiscal_year,
-                    "shock_amount": float(shock.shock_amount),
-                    "num_awards": len(shock.award_ids),
-                    "award_ids": shock.award_ids,
-                    "confidence": shock.confidence,
-                    "naics_coverage_rate": shock.naics_coverage_rate,
-                    "geographic_resolution_rate": shock.geographic_resolution_rate,
-                    "base_year": shock.base_year,
-                    "created_at": shock.created_at.isoformat(),
-                }
+        Returns:
+            ShockAggregationStats with quality metrics
+        """
+        if shocks_df.empty:
+            return self.get_aggregation_statistics([])
+
+        amounts = shocks_df["shock_amount"].astype("float64")
+        cents = np.round(amounts * 100).astype("int64").sum()
+        total_amount = float(amounts.sum())
+        if total_amount > 0:
+            weighted_naics = float(
+                (amounts * shocks_df["naics_coverage_rate"]).sum() / total_amount
             )
+            weighted_geo = float(
+                (amounts * shocks_df["geographic_resolution_rate"]).sum() / total_amount
+            )
+        else:
+            weighted_naics = 0.0
+            weighted_geo = 0.0
 
-        return pd.DataFrame(shock_dicts)
+        if "num_awards" in shocks_df.columns:
+            total_awards = int(shocks_df["num_awards"].sum())
+        else:
+            total_awards = int(shocks_df["award_ids"].map(len).sum())
+        return ShockAggregationStats(
+            total_shocks=len(shocks_df),
+            total_awards_aggregated=total_awards,
+            unique_states=int(shocks_df["state"].nunique()),
+            unique_sectors=int(shocks_df["bea_sector"].nunique()),
+            unique_fiscal_years=int(shocks_df["fiscal_year"].nunique()),
+            total_shock_amount=Decimal(int(cents)).scaleb(-2),
+            avg_confidence=float(shocks_df["confidence"].mean()),
+            naics_coverage_rate=weighted_naics,
+            geographic_resolution_rate=weighted_geo,
+            awards_per_shock_avg=total_awards / len(shocks_df),
+        )
 
     def get_aggregation_statistics(self, shocks: list[EconomicShock]) -> ShockAggregationStats:
         """Calculate aggregation statistics.
@@ -0,0 +1,208 @@
+"""Shared SHA-256 fingerprints for provenance hashing.
+
+Manifests across the pipeline record the SHA-256 of their inputs and outputs,
+and each module used to re-read multi-GB dumps end to end on every run to do
+so. ``file_sha256`` routes all of those call sites through one
+``FingerprintCache``: digests are stored in a small SQLite file keyed by
+``(path, device, inode, size, mtime_ns)``, so an unchanged input costs a
+``stat`` instead of a full read.
+
+Like git's index, a file modified within ``RACY_WINDOW_NS`` of being hashed is
+not cached, because a same-size rewrite inside the filesystem's timestamp
+granularity would otherwise keep a stale digest. The cache is best effort: a
+locked or unreadable store only means the digest is recomputed.
+
+Set ``SBIR_ETL__FINGERPRINT_CACHE`` to a file path to relocate the store, or to
+``off`` to always hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from loguru import logger
+
+from sbir_etl.utils.cloud_storage import get_data_root
+
+__all__ = [
+    "FINGERPRINT_CACHE_ENV",
+    "FingerprintCache",
+    "compute_sha256",
+    "default_fingerprint_cache",
+    "file_sha256",
+    "files_sha256",
+]
+
+FINGERPRINT_CACHE_ENV = "SBIR_ETL__FINGERPRINT_CACHE"
+DEFAULT_CACHE_NAME = "file_fingerprints.sqlite"
+
+# Files modified this recently are hashed but not cached (see module docstring).
+RACY_WINDOW_NS = 2_000_000_000
+# hashlib releases the GIL for large updates, so big reads also let threads
+# hash several files in parallel.
+READ_BUFFER_BYTES = 8 * 1024 * 1024
+
+_DISABLED_VALUES = {"", "0", "off", "false", "none"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    path TEXT PRIMARY KEY,
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+)
+"""
+
+
+def compute_sha256(path: Path) -> str:
+    """Hash a file with large buffered reads, bypassing any cache."""
+    digest = hashlib.sha256()
+    buffer = bytearray(READ_BUFFER_BYTES)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as handle:
+        while read := handle.readinto(buffer):
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, int, int, int]:
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class FingerprintCache:
+    """SQLite-backed map of file identity -> SHA-256 digest."""
+
+    def __init__(self, db_path: Path | str | None):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file backing the cache (created on first store), or
+                None to disable caching and always hash
+        """
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        assert self.db_path is not None
+        with self._lock:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                with connection:
+                    connection.execute(_SCHEMA)
+                    yield connection
+            finally:
+                connection.close()
+
+    def _lookup(self, path: str, key: tuple[int, int, int, int]) -> str | None:
+        if self.db_path is None or not self.db_path.exists():
+            return None
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT device, inode, size, mtime_ns, sha256 FROM fingerprints WHERE path = ?",
+                    (path,),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.debug(f"Fingerprint cache lookup failed for {path}: {exc}")
+            return None
+        if row is None or tuple(row[:4]) != key:
+            return None
+        return str(row[4])
+
+    def _store(self, path: str, key: tuple[int, int, int, int], sha256: str) -> None:
+        if self.db_path is None:
+            return
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO fingerprints "
+                    "(path, device, inode, size, mtime_ns, sha256) VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, *key, sha256),
+                )
+        except sqlite3.Error as exc:
+            logger.debug(f"Fingerprint cache store failed for {path}: {exc}")
+
+    def sha256(self, path: Path | str) -> str:
+        """Return the SHA-256 of a file, reusing the cached digest if it is unchanged.
+
+        Raises:
+            FileNotFoundError: If ``path`` does not exist
+        """
+        resolved = Path(path).resolve()
+        before = resolved.stat()
+        key = _stat_key(before)
+        cached = self._lookup(str(resolved), key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        sha256 = compute_sha256(resolved)
+        after = resolved.stat()
+        stable = _stat_key(after) == key
+        settled = time.time_ns() - after.st_mtime_ns > RACY_WINDOW_NS
+        if stable and settled:
+            self._store(str(resolved), key, sha256)
+        return sha256
+
+    def sha256_many(
+        self, paths: Iterable[Path | str], *, max_workers: int | None = None
+    ) -> dict[Path, str]:
+        """Hash several files, in parallel threads when more than one needs reading.
+
+        Args:
+            paths: Files to hash
+            max_workers: Thread count (defaults to ``min(8, number of files)``)
+
+        Returns:
+            Mapping of each input path (as given, wrapped in ``Path``) to its digest
+        """
+        unique = list(dict.fromkeys(Path(p) for p in paths))
+        if len(unique) <= 1 or max_workers == 1:
+            return {path: self.sha256(path) for path in unique}
+        workers = max_workers or min(8, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests = list(pool.map(self.sha256, unique))
+        return dict(zip(unique, digests, strict=True))
+
+
+_default_cache: FingerprintCache | None = None
+
+
+def default_fingerprint_cache() -> FingerprintCache:
+    """Process-wide cache at ``SBIR_ETL__FINGERPRINT_CACHE`` or ``<data root>/cache``."""
+    global _default_cache
+    setting = os.environ.get(FINGERPRINT_CACHE_ENV)
+    if setting is None:
+        db_path: Path | None = get_data_root() / "cache" / DEFAULT_CACHE_NAME
+    elif setting.strip().lower() in _DISABLED_VALUES:
+        db_path = None
+    else:
+        db_path = Path(setting)
+    if _default_cache is None or _default_cache.db_path != db_path:
+        _default_cache = FingerprintCache(db_path)
+    return _default_cache
+
+
+def file_sha256(path: Path | str) -> str:
+    """SHA-256 hex digest of a file, served from the shared fingerprint cache."""
+    return default_fingerprint_cache().sha256(path)
+
+
+def files_sha256(paths: Iterable[Path | str], *, max_workers: int | None = None) -> dict[Path, str]:
+    """Batch form of :func:`file_sha256` that hashes uncached files in parallel."""
+    return default_fingerprint_cache().sha256_many(paths, max_workers=max_workers)
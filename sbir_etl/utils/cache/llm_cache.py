@@ -0,0 +1,295 @@
+"""Content-addressed cache of LLM responses.
+
+The weekly and procurement reports re-issue the same OpenAI calls every run for
+companies and awards whose inputs have not changed. ``LLMResponseCache`` stores
+each successful response under a SHA-256 of ``(kind, model, prompt template
+version, normalized request payload)``, so a rerun only pays for new or changed
+prompts:
+
+- the payload is the full request (system prompt, user prompt, temperature,
+  ...), with line endings and trailing whitespace normalized, so any change to
+  what the model would see is a miss;
+- ``template_version`` lets callers invalidate entries when response handling
+  changes without the prompt text changing;
+- entries expire after a TTL (shorter for web search, whose answers age), and
+  the store is trimmed to ``max_bytes`` by evicting least-recently-used entries.
+
+Failed calls are never cached. Like the fingerprint cache, the store is best
+effort: a locked or unreadable SQLite file only means the call goes to the API.
+
+Set ``SBIR_ETL__LLM_CACHE`` to a file path to relocate the store, or to ``off``
+to disable it; ``SBIR_ETL__LLM_CACHE_MAX_MB`` caps its size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from sbir_etl.utils.cloud_storage import get_data_root
+
+__all__ = [
+    "LLM_CACHE_ENV",
+    "LLM_CACHE_MAX_MB_ENV",
+    "LLMResponseCache",
+    "default_llm_cache",
+    "request_key",
+]
+
+LLM_CACHE_ENV = "SBIR_ETL__LLM_CACHE"
+LLM_CACHE_MAX_MB_ENV = "SBIR_ETL__LLM_CACHE_MAX_MB"
+DEFAULT_CACHE_NAME = "llm_responses.sqlite"
+
+DEFAULT_TTL_SECONDS = 90 * 24 * 3600
+# Web search answers describe the live web, so they age faster than completions.
+DEFAULT_WEB_SEARCH_TTL_SECONDS = 14 * 24 * 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_DISABLED_VALUES = {"", "0", "off", "false", "none"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    model TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size INTEGER NOT NULL,
+    payload TEXT NOT NULL
+)
+"""
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        lines = value.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        return "\n".join(line.rstrip() for line in lines).strip()
+    if isinstance(value, Mapping):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def request_key(kind: str, model: str, template_version: str, payload: Mapping[str, Any]) -> str:
+    """SHA-256 identifying an LLM request by what the model would actually see."""
+    encoded = json.dumps(
+        {
+            "kind": kind,
+            "model": model,
+            "template_version": template_version,
+            "payload": _normalize(payload),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed, TTL- and size-bounded map of request hash -> response."""
+
+    def __init__(
+        self,
+        db_path: Path | str | None,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        web_search_ttl_seconds: float = DEFAULT_WEB_SEARCH_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file backing the cache (created on first store), or
+                None to disable caching
+            ttl_seconds: Lifetime of chat completions
+            web_search_ttl_seconds: Lifetime of ``web_search`` responses
+            max_bytes: Total payload size kept before LRU eviction
+            clock: Time source (seconds since the epoch), for tests
+        """
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.ttl_seconds = ttl_seconds
+        self.web_search_ttl_seconds = web_search_ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.db_path is not None
+
+    def _ttl(self, kind: str) -> float:
+        return self.web_search_ttl_seconds if kind == "web_search" else self.ttl_seconds
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        assert self.db_path is not None
+        with self._lock:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                with connection:
+                    connection.execute(_SCHEMA)
+                    yield connection
+            finally:
+                connection.close()
+
+    def get(self, key: str, kind: str) -> Any | None:
+        """Return the cached response for ``key``, or None if absent or expired."""
+        if self.db_path is None or not self.db_path.exists():
+            self.misses += 1
+            return None
+        now = self._clock()
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT created_at, payload FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[0] > self._ttl(kind):
+                    connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    row = None
+                elif row is not None:
+                    connection.execute(
+                        "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+                    )
+        except sqlite3.Error as exc:
+            logger.debug(f"LLM cache lookup failed: {exc}")
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[1])
+
+    def put(self, key: str, kind: str, model: str, response: Any) -> None:
+        """Store a successful response, then evict LRU entries beyond ``max_bytes``."""
+        if self.db_path is None:
+            return
+        payload = json.dumps(response, ensure_ascii=False)
+        now = self._clock()
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, kind, model, created_at, last_access, size, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, kind, model, now, now, len(payload.encode("utf-8")), payload),
+                )
+                self.stores += 1
+                self.evictions += self._evict(connection)
+        except sqlite3.Error as exc:
+            logger.debug(f"LLM cache store failed: {exc}")
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        (total,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return 0
+        victims = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", victims)
+        return len(victims)
+
+    def get_or_call(
+        self,
+        kind: str,
+        model: str,
+        template_version: str,
+        payload: Mapping[str, Any],
+        call: Callable[[], Any],
+    ) -> Any:
+        """Return the cached response for a request, or make ``call`` and cache it.
+
+        ``call`` returning None (a failed request) is passed through uncached.
+        """
+        if not self.enabled:
+            return call()
+        key = request_key(kind, model, template_version, payload)
+        cached = self.get(key, kind)
+        if cached is not None:
+            return cached
+        response = call()
+        if response is not None:
+            self.put(key, kind, model, response)
+        return response
+
+    def purge_expired(self) -> int:
+        """Delete expired entries of every kind; returns the number removed."""
+        if self.db_path is None or not self.db_path.exists():
+            return 0
+        now = self._clock()
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "DELETE FROM responses WHERE "
+                "(kind = 'web_search' AND created_at < ?) OR "
+                "(kind != 'web_search' AND created_at < ?)",
+                (now - self.web_search_ttl_seconds, now - self.ttl_seconds),
+            )
+            return cursor.rowcount
+
+    def stats(self) -> dict[str, Any]:
+        """Hit-rate metrics for this process plus the store's current size."""
+        lookups = self.hits + self.misses
+        entries = size = 0
+        if self.db_path is not None and self.db_path.exists():
+            try:
+                with self._connect() as connection:
+                    entries, size = connection.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                    ).fetchone()
+            except sqlite3.Error as exc:
+                logger.debug(f"LLM cache stats failed: {exc}")
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_mb": round(size / (1024 * 1024), 2),
+        }
+
+
+_default_cache: LLMResponseCache | None = None
+
+
+def default_llm_cache() -> LLMResponseCache:
+    """Process-wide cache at ``SBIR_ETL__LLM_CACHE`` or ``<data root>/cache``."""
+    global _default_cache
+    setting = os.environ.get(LLM_CACHE_ENV)
+    if setting is None:
+        db_path: Path | None = get_data_root() / "cache" / DEFAULT_CACHE_NAME
+    elif setting.strip().lower() in _DISABLED_VALUES:
+        db_path = None
+    else:
+        db_path = Path(setting)
+    max_bytes = int(float(os.environ.get(LLM_CACHE_MAX_MB_ENV, "256")) * 1024 * 1024)
+    if (
+        _default_cache is None
+        or _default_cache.db_path != db_path
+        or _default_cache.max_bytes != max_bytes
+    ):
+        _default_cache = LLMResponseCache(db_path, max_bytes=max_bytes)
+    return _default_cache
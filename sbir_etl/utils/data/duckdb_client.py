@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import csv
+import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from pandas._libs.parsers import STR_NA_VALUES
 
 from sbir_etl.config.loader import get_config
 from sbir_etl.exceptions import DependencyError, FileSystemError
@@ -24,6 +28,10 @@ except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
     _DUCKDB_IMPORT_ERROR = exc
 
 
+# Bytes of CSV text the Arrow engine of ``import_csv_incremental`` parses at once.
+DEFAULT_CSV_BLOCK_BYTES = 4 * 1024 * 1024
+
+
 def _require_duckdb(operation: str | None = None) -> None:
     """Ensure duckdb dependency is installed before executing client operations."""
     if duckdb is not None:
@@ -61,6 +69,8 @@ class DuckDBClient:
         # For in-memory databases, maintain a persistent connection
         self._persistent_conn: Any = None
         self._identifier_cache: dict[str, str] = {}
+        # Rows, duration, rows/sec and peak memory of the last incremental CSV import
+        self.last_import_stats: dict[str, Any] = {}
 
     @staticmethod
     def escape_identifier(identifier: str) -> str:
@@ -288,8 +298,6 @@ class DuckDBClient:
                     # `preserve_index=False` matches the pre-Arrow behavior of
                     # `conn.register(name, df)` — non-RangeIndex frames would
                     # otherwise materialize an extra `__index_level_0__` column.
-                    import pyarrow as pa
-
                     conn.register("temp_df", pa.Table.from_pandas(df, preserve_index=False))
                     table_identifier = self.escape_identifier(table_name)
                     conn.execute(f"CREATE TABLE {table_identifier} AS SELECT * FROM temp_df")  # nosec B608
@@ -408,31 +416,53 @@ class DuckDBClient:
         header: bool = True,
         encoding: str = "utf-8",
         create_table_if_missing: bool = True,
+        engine: str = "pandas",
+        block_size: int = DEFAULT_CSV_BLOCK_BYTES,
     ) -> bool:
         """
-        Import a CSV into DuckDB incrementally using pandas chunking.
+        Import a CSV into DuckDB incrementally, holding one block in memory at a time.
 
         This method is intended for very large CSVs where importing the entire
-        file in one shot may be memory-heavy. It reads the CSV in pandas
-        chunks and writes each chunk into DuckDB. The first chunk creates the
-        table (or overwrites if it already exists and `create_table_if_missing` is False).
-        Subsequent chunks are appended.
+        file in one shot may be memory-heavy. Every column is imported as text.
+        The first block creates the table (or, when the table already exists and
+        `create_table_if_missing` is False, is appended to it). Subsequent blocks
+        are appended.
+
+        Two engines are available:
+         - ``"pandas"`` reads ``batch_size``-row chunks with ``pandas.read_csv``
+           and inserts each through a registered DataFrame
+         - ``"arrow"`` streams ``block_size``-byte blocks through
+           ``pyarrow.csv.open_csv`` with the string schema pinned from the first
+           block, and DuckDB scans the record batches directly (no pandas
+           conversion, no per-chunk type inference); a file with a row whose
+           field count differs from the header is re-read with the pandas
+           engine, which pads short rows with nulls
+
+        Row count, duration, rows/sec and (for the Arrow engine) the peak bytes
+        held by Arrow buffers are logged and kept in ``last_import_stats``.
 
         Args:
             csv_path: Path to CSV file
             table_name: Destination DuckDB table name
-            batch_size: pandas chunk size
+            batch_size: pandas chunk size (rows)
             delimiter: CSV delimiter
             header: Whether CSV has header row (True uses header=0)
             encoding: File encoding
             create_table_if_missing: If True and table does not exist, create it from first chunk
+            engine: ``"pandas"`` or ``"arrow"``
+            block_size: Arrow read block size (bytes)
 
         Returns:
             True if import completed successfully, False on error
         """
+        if engine not in {"pandas", "arrow"}:
+            raise ValueError(f"engine must be 'pandas' or 'arrow', got {engine!r}")
+
         with log_with_context(stage="extract", run_id="csv_import_incremental") as logger:
             logger.info(
-                f"Starting incremental CSV import into {table_name}", csv_path=str(csv_path)
+                f"Starting incremental CSV import into {table_name}",
+                csv_path=str(csv_path),
+                engine=engine,
             )
             table_identifier = self.escape_identifier(table_name)
 
@@ -445,57 +475,64 @@ class DuckDBClient:
                 )
 
             try:
+                start_time = time.perf_counter()
                 with self.connection() as conn:  # type: Any
-                    first_chunk = True
-                    total_rows = 0
-                    # pandas.read_csv will raise if CSV can't be parsed; let that bubble
-                    for chunk in pd.read_csv(
-                        csv_path,
-                        delimiter=delimiter,
-                        header=0 if header else None,
-                        encoding=encoding,
-                        chunksize=batch_size,
-                        # Use numpy `object` rather than `str`: under pandas 3 the
-                        # latter resolves to StringDtype, which DuckDB doesn't
-                        # know how to ingest via register().
-                        dtype=object,
-                        low_memory=False,
-                        quoting=csv.QUOTE_MINIMAL,
-                        quotechar='"',
-                    ):
-                        # Normalize column names (strip whitespace) to reduce surprises
-                        chunk.columns = [str(col).strip() for col in chunk.columns]
-
-                        if first_chunk:
-                            if create_table_if_missing or not self.table_exists(table_name):
-                                # Create table from first chunk
-                                conn.register("temp_df", chunk)
-                                conn.execute(
-                                    f"CREATE TABLE {table_identifier} AS SELECT * FROM temp_df"
-                                )  # nosec B608
-                            else:
-                                # Table exists: append first chunk
-                                conn.register("temp_chunk", chunk)
-                                conn.execute(
-                                    f"INSERT INTO {table_identifier} SELECT * FROM temp_chunk"
-                                )  # nosec B608
-                            first_chunk = False
-                        else:
-                            # Append subsequent chunks
-                            conn.register("temp_chunk", chunk)
-                            conn.execute(f"INSERT INTO {table_identifier} SELECT * FROM temp_chunk")  # nosec B608
-
-                        total_rows += len(chunk)
-                        logger.info("Imported chunk", rows=len(chunk), total_rows=total_rows)
+                    arrow_result = None
+                    if engine == "arrow":
+                        arrow_result = self._import_csv_arrow(
+                            conn,
+                            csv_path,
+                            table_name,
+                            delimiter=delimiter,
+                            header=header,
+                            encoding=encoding,
+                            create_table_if_missing=create_table_if_missing,
+                            block_size=block_size,
+                        )
+                        if arrow_result is None:
+                            logger.warning(
+                                "CSV has rows with a different field count than the header; "
+                                "re-reading with the pandas engine",
+                                csv_path=str(csv_path),
+                            )
+                            engine = "pandas"
+                    if arrow_result is not None:
+                        total_rows, peak_bytes = arrow_result
+                    else:
+                        total_rows = self._import_csv_pandas(
+                            conn,
+                            csv_path,
+                            table_name,
+                            batch_size=batch_size,
+                            delimiter=delimiter,
+                            header=header,
+                            encoding=encoding,
+                            create_table_if_missing=create_table_if_missing,
+                            logger=logger,
+                        )
+                        peak_bytes = None
 
                     # Get final row count
                     count_result = conn.execute(
                         f"SELECT COUNT(*) as count FROM {table_identifier}"
                     ).fetchall()  # nosec B608
                     final_count = count_result[0][0] if count_result else 0
-
+                duration = time.perf_counter() - start_time
+
+                self.last_import_stats = {
+                    "engine": engine,
+                    "rows_imported": total_rows,
+                    "duration_seconds": round(duration, 3),
+                    "rows_per_second": round(total_rows / duration) if duration > 0 else 0,
+                    "peak_arrow_memory_mb": (
+                        round(peak_bytes / (1024 * 1024), 2) if peak_bytes is not None else None
+                    ),
+                }
                 logger.info(
-                    "Incremental CSV import complete", table_name=table_name, total_rows=final_count
+                    "Incremental CSV import complete",
+                    table_name=table_name,
+                    total_rows=final_count,
+                    **self.last_import_stats,
                 )
                 return True
 
@@ -503,6 +540,181 @@ class DuckDBClient:
                 logger.error(f"Incremental CSV import failed: {e}")
                 return False
 
+    def _import_csv_pandas(
+        self,
+        conn: Any,
+        csv_path: Path | str,
+        table_name: str,
+        *,
+        batch_size: int,
+        delimiter: str,
+        header: bool,
+        encoding: str,
+        create_table_if_missing: bool,
+        logger: Any,
+    ) -> int:
+        table_identifier = self.escape_identifier(table_name)
+        first_chunk = True
+        total_rows = 0
+        # pandas.read_csv will raise if CSV can't be parsed; let that bubble
+        for chunk in pd.read_csv(
+            csv_path,
+            delimiter=delimiter,
+            header=0 if header else None,
+            encoding=encoding,
+            chunksize=batch_size,
+            # Use numpy `object` rather than `str`: under pandas 3 the
+            # latter resolves to StringDtype, which DuckDB doesn't
+            # know how to ingest via register().
+            dtype=object,
+            low_memory=False,
+            quoting=csv.QUOTE_MINIMAL,
+            quotechar='"',
+        ):
+            # Normalize column names (strip whitespace) to reduce surprises
+            chunk.columns = [str(col).strip() for col in chunk.columns]
+
+            if first_chunk:
+                if create_table_if_missing or not self.table_exists(table_name):
+                    # Create table from first chunk
+                    conn.register("temp_df", chunk)
+                    conn.execute(f"CREATE TABLE {table_identifier} AS SELECT * FROM temp_df")  # nosec B608
+                else:
+                    # Table exists: append first chunk
+                    conn.register("temp_chunk", chunk)
+                    conn.execute(f"INSERT INTO {table_identifier} SELECT * FROM temp_chunk")  # nosec B608
+                first_chunk = False
+            else:
+                # Append subsequent chunks
+                conn.register("temp_chunk", chunk)
+                conn.execute(f"INSERT INTO {table_identifier} SELECT * FROM temp_chunk")  # nosec B608
+
+            total_rows += len(chunk)
+            logger.info("Imported chunk", rows=len(chunk), total_rows=total_rows)
+        return total_rows
+
+    def _import_csv_arrow(
+        self,
+        conn: Any,
+        csv_path: Path | str,
+        table_name: str,
+        *,
+        delimiter: str,
+        header: bool,
+        encoding: str,
+        create_table_if_missing: bool,
+        block_size: int,
+    ) -> tuple[int, int] | None:
+        """Stream the CSV into ``table_name``; returns (rows, peak Arrow bytes).
+
+        Returns None, with nothing written, when a row's field count differs
+        from the header's, since pyarrow cannot pad short rows as pandas does.
+        """
+        table_identifier = self.escape_identifier(table_name)
+        # A pool of its own so the peak reflects this import, not the process.
+        pool = pa.proxy_memory_pool(pa.default_memory_pool())
+        read_options = pacsv.ReadOptions(
+            encoding=encoding,
+            block_size=block_size,
+            autogenerate_column_names=not header,
+        )
+        ragged_rows: list[pacsv.InvalidRow] = []
+
+        def on_invalid_row(row: pacsv.InvalidRow) -> str:
+            ragged_rows.append(row)
+            return "error"
+
+        parse_options = pacsv.ParseOptions(
+            delimiter=delimiter,
+            quote_char='"',
+            newlines_in_values=True,
+            invalid_row_handler=on_invalid_row,
+        )
+
+        def open_reader(convert_options: pacsv.ConvertOptions) -> pacsv.CSVStreamingReader:
+            return pacsv.open_csv(
+                csv_path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+                memory_pool=pool,
+            )
+
+        # Pin every column the first block names as text, as the pandas engine
+        # does with dtype=object, so a late block cannot disagree on a type.
+        try:
+            probe = open_reader(pacsv.ConvertOptions())
+        except pa.ArrowInvalid:
+            if ragged_rows:
+                return None
+            raise
+        source_names = probe.schema.names
+        probe.close()
+        if header:
+            # Repeated headers would make the name-keyed column types
+            # ambiguous; name the columns explicitly, mangled as pandas does.
+            source_names = _mangle_duplicate_names(source_names)
+            read_options = pacsv.ReadOptions(
+                encoding=encoding,
+                block_size=block_size,
+                skip_rows=1,
+                column_names=source_names,
+            )
+        reader = open_reader(
+            pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in source_names},
+                # pandas' default NA markers, so "None" or "<NA>" become NULL too.
+                null_values=sorted(STR_NA_VALUES),
+                strings_can_be_null=True,
+            )
+        )
+        # Same names as the pandas engine: stripped headers, or 0..n-1 without one.
+        names = (
+            [name.strip() for name in source_names]
+            if header
+            else [str(index) for index in range(len(source_names))]
+        )
+        schema = pa.schema([(name, pa.string()) for name in names])
+        total_rows = 0
+
+        def batches() -> Iterator[pa.RecordBatch]:
+            nonlocal total_rows
+            for batch in reader:
+                total_rows += batch.num_rows
+                yield pa.RecordBatch.from_arrays(batch.columns, schema=schema)
+
+        conn.register("csv_stream", pa.RecordBatchReader.from_batches(schema, batches()))
+        try:
+            if create_table_if_missing or not self.table_exists(table_name):
+                conn.execute(f"CREATE TABLE {table_identifier} AS SELECT * FROM csv_stream")  # nosec B608
+            else:
+                conn.execute(f"INSERT INTO {table_identifier} SELECT * FROM csv_stream")  # nosec B608
+        except duckdb.Error:
+            # The failed statement wrote nothing, so the caller can re-read the file.
+            if ragged_rows:
+                return None
+            raise
+        finally:
+            conn.unregister("csv_stream")
+        return total_rows, pool.max_memory()
+
+
+def _mangle_duplicate_names(names: list[str]) -> list[str]:
+    """Rename repeated CSV headers the way ``pandas.read_csv`` does (``x``, ``x.1``, ...)."""
+    mangled = list(names)
+    counts: dict[str, int] = {}
+    for index, name in enumerate(mangled):
+        count = counts.get(name, 0)
+        candidate = name
+        while count > 0:
+            counts[name] = count + 1
+            candidate = f"{name}.{count}"
+            # Skip suffixes another header already uses.
+            count = count + 1 if candidate in mangled else counts.get(candidate, 0)
+        mangled[index] = candidate
+        counts[candidate] = count + 1
+    return mangled
+
 
 def get_duckdb_client(config=None) -> DuckDBClient:
     """Get configured DuckDB client instance.
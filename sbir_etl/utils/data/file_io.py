@@ -280,3 +280,33 @@ def read_parquet_or_ndjson(parquet_path: Path, json_path: Path | None = None) ->
     raise FileNotFoundError(
         f"Neither Parquet ({parquet_path}) nor NDJSON ({json_path}) file exists"
     )
+
+
+def parquet_or_ndjson_signature(
+    parquet_path: Path, json_path: Path | None = None
+) -> tuple[tuple[int, int] | None, ...]:
+    """Return a cheap change signature for a Parquet file and its NDJSON fallback.
+
+    Each entry is ``(size, mtime_ns)`` for a file that exists and ``None`` for
+    one that does not, so callers can tell whether ``read_parquet_or_ndjson``
+    would see different data without reading it.
+
+    Args:
+        parquet_path: Path to Parquet file
+        json_path: Optional path to NDJSON fallback file. If None, uses parquet_path with .ndjson suffix.
+
+    Returns:
+        Tuple of per-file signatures, Parquet first
+    """
+    if json_path is None:
+        json_path = parquet_path.with_suffix(".ndjson")
+
+    signature: list[tuple[int, int] | None] = []
+    for path in (parquet_path, json_path):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            signature.append(None)
+        else:
+            signature.append((stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
@@ -6,14 +6,18 @@ when refresh runs are interrupted.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+from urllib.parse import quote
 
 import pandas as pd
 from loguru import logger
 
+from sbir_etl.utils.data.file_io import parquet_or_ndjson_signature
+
 
 @dataclass
 class EnrichmentCheckpoint:
@@ -64,7 +68,16 @@ class EnrichmentCheckpoint:
 
 
 class CheckpointStore:
-    """Store for managing enrichment refresh checkpoints."""
+    """Store for managing enrichment refresh checkpoints.
+
+    The Parquet file holds one row per ``(partition_id, source)``; the store
+    keeps those rows in an in-memory index, so lookups are dictionary reads
+    and a save rewrites only the handful of checkpoint rows, however long the
+    pass. Awards a pass has finished are not kept in the row: runners append
+    them to a per-checkpoint set file (``<stem>.processed/``) with
+    ``record_processed``, which grows by the IDs written rather than being
+    re-serialized at every checkpoint.
+    """
 
     def __init__(self, parquet_path: Path | str | None = None):
         """Initialize checkpoint store.
@@ -76,9 +89,32 @@ class CheckpointStore:
         if parquet_path is None:
             parquet_path = Path("data/state/enrichment_checkpoints.parquet")
         self.parquet_path = Path(parquet_path)
+        self.processed_dir = self.parquet_path.with_name(f"{self.parquet_path.stem}.processed")
         from sbir_etl.utils.path_utils import ensure_parent_dir
 
         ensure_parent_dir(self.parquet_path)
+        self._index: dict[tuple[str, str], dict[str, Any]] | None = None
+        self._signature: tuple[tuple[int, int] | None, ...] | None = None
+
+    def _ensure_index(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """Return the keyed checkpoint rows, reloading if the file changed on disk."""
+        signature = parquet_or_ndjson_signature(self.parquet_path)
+        if self._index is None or signature != self._signature:
+            df = self.load_all()
+            self._index = {
+                (row["partition_id"], row["source"]): row
+                for row in cast(list[dict[str, Any]], df.to_dict("records"))
+            }
+            self._signature = signature
+        return self._index
+
+    def _write_index(self) -> None:
+        index = self._index
+        assert index is not None
+        self.save_all(pd.DataFrame(list(index.values())))
+        # The file now matches the index; keep it rather than re-reading.
+        self._index = index
+        self._signature = parquet_or_ndjson_signature(self.parquet_path)
 
     def save_checkpoint(self, checkpoint: EnrichmentCheckpoint) -> None:
         """Save or update a checkpoint.
@@ -86,38 +122,54 @@ class CheckpointStore:
         Args:
             checkpoint: Checkpoint to save
         """
-        df = self.load_all()
-
-        # Create DataFrame from checkpoint
-        checkpoint_dict = checkpoint.to_dict()
-        new_row = pd.DataFrame([checkpoint_dict])
-
-        # Convert datetime string columns back to datetime objects for proper Parquet storage
+        row = checkpoint.to_dict()
+        # Store datetimes as timestamps for proper Parquet typing
         for col in ["last_success_timestamp", "checkpoint_timestamp"]:
-            if col in new_row.columns and not pd.api.types.is_datetime64_any_dtype(new_row[col]):
-                new_row[col] = pd.to_datetime(new_row[col], errors="coerce")
-
-        # Check if checkpoint exists (by partition_id + source)
-        if not df.empty:
-            mask = (df["partition_id"] == checkpoint.partition_id) & (
-                df["source"] == checkpoint.source
-            )
-            if mask.any():
-                # Update existing checkpoint - replace the entire row
-                # Find the index of the matching row
-                idx = df[mask].index[0]
-                # Update all columns from new_row
-                for col in new_row.columns:
-                    df.loc[idx, col] = new_row[col].iloc[0]
-            else:
-                # Append new checkpoint
-                df = pd.concat([df, new_row], ignore_index=True)
-        else:
-            df = new_row
-
-        self.save_all(df)
+            row[col] = pd.to_datetime(row[col], errors="coerce")
+
+        index = self._ensure_index()
+        index[(checkpoint.partition_id, checkpoint.source)] = row
+        self._write_index()
         logger.debug(f"Saved checkpoint: {checkpoint.partition_id} ({checkpoint.source})")
 
+    def _processed_path(self, partition_id: str, source: str) -> Path:
+        name = f"{quote(partition_id, safe='')}__{quote(source, safe='')}.ids"
+        return self.processed_dir / name
+
+    def record_processed(self, partition_id: str, source: str, award_ids: Iterable[str]) -> None:
+        """Append award IDs to the checkpoint's processed set.
+
+        Args:
+            partition_id: Partition identifier
+            source: Enrichment source name
+            award_ids: IDs finished since the last call
+        """
+        payload = "".join(f"{award_id}\n" for award_id in award_ids)
+        if not payload:
+            return
+        path = self._processed_path(partition_id, source)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write(payload)
+
+    def load_processed(self, partition_id: str, source: str) -> set[str]:
+        """Return every award ID recorded for a checkpoint.
+
+        Args:
+            partition_id: Partition identifier
+            source: Enrichment source name
+
+        Returns:
+            Set of processed award IDs (empty when none were recorded)
+        """
+        try:
+            data = self._processed_path(partition_id, source).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return set()
+        # A torn final line (crash mid-append) was never acknowledged; drop it.
+        complete = data[: data.rfind("\n") + 1]
+        return set(complete.splitlines())
+
     def load_checkpoint(self, partition_id: str, source: str) -> EnrichmentCheckpoint | None:
         """Load a specific checkpoint.
 
@@ -128,21 +180,18 @@ class CheckpointStore:
         Returns:
             Checkpoint or None if not found
         """
-        df = self.load_all()
-        if df.empty:
+        row = self._ensure_index().get((partition_id, source))
+        if row is None:
             return None
 
-        mask = (df["partition_id"] == partition_id) & (df["source"] == source)
-        if not mask.any():
-            return None
-
-        row = df[mask].iloc[0]
-        checkpoint_dict = row.to_dict()
+        checkpoint_dict = dict(row)
         # Convert datetime objects to ISO strings for from_dict
         import json
 
         for col in ["last_success_timestamp", "checkpoint_timestamp"]:
-            if col in checkpoint_dict and isinstance(checkpoint_dict[col], datetime):
+            if col in checkpoint_dict and pd.isna(checkpoint_dict[col]):
+                checkpoint_dict[col] = None
+            elif col in checkpoint_dict and isinstance(checkpoint_dict[col], datetime):
                 checkpoint_dict[col] = checkpoint_dict[col].isoformat()
         # Ensure metadata is handled correctly (it's stored as JSON string)
         if "metadata" in checkpoint_dict:
@@ -191,18 +240,17 @@ class CheckpointStore:
         except Exception as e:
             logger.error(f"Failed to save checkpoints: {e}")
             raise
+        self._index = None
 
     def delete_checkpoint(self, partition_id: str, source: str) -> None:
-        """Delete a checkpoint.
+        """Delete a checkpoint and its processed set.
 
         Args:
             partition_id: Partition identifier
             source: Enrichment source name
         """
-        df = self.load_all()
-        if df.empty:
+        self._processed_path(partition_id, source).unlink(missing_ok=True)
+        index = self._ensure_index()
+        if index.pop((partition_id, source), None) is None:
             return
-
-        mask = ~((df["partition_id"] == partition_id) & (df["source"] == source))
-        df = df[mask]
-        self.save_all(df)
+        self._write_index()
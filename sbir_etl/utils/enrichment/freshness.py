@@ -1,14 +1,17 @@
 """Utilities for managing enrichment freshness records.
 
-Provides persistence layer for freshness records to Parquet/DuckDB and Neo4j,
-along with utilities for querying stale records and updating freshness state.
+Provides persistence layer for freshness records to Parquet (with an
+append-only upsert journal) and Neo4j, along with utilities for querying stale
+records and updating freshness state.
 """
 
 from __future__ import annotations
 
+import json
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import pandas as pd
 from loguru import logger
@@ -18,42 +21,200 @@ from sbir_etl.models.enrichment import (
     EnrichmentFreshnessRecordModel,
     EnrichmentStatus,
 )
+from sbir_etl.utils.data.file_io import parquet_or_ndjson_signature
+
+
+FRESHNESS_COLUMNS = (
+    "award_id",
+    "source",
+    "last_attempt_at",
+    "last_success_at",
+    "payload_hash",
+    "status",
+    "error_message",
+    "metadata",
+    "attempt_count",
+    "success_count",
+)
+_DATETIME_COLUMNS = ("last_attempt_at", "last_success_at")
+
+
+def _record_row(record: EnrichmentFreshnessRecord) -> dict[str, Any]:
+    """Ledger row for a record: model fields with metadata as a JSON string."""
+    row = EnrichmentFreshnessRecordModel.from_dataclass(record).model_dump()
+    row["metadata"] = json.dumps(row["metadata"]) if row["metadata"] else "{}"
+    return row
+
+
+def _native_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Replace NaN/NaT with None and Timestamps with datetimes (Parquet/NDJSON roundtrip)."""
+    native: dict[str, Any] = {}
+    for key, value in row.items():
+        try:
+            if pd.isna(value):
+                value = None
+        except (TypeError, ValueError):
+            pass
+        if isinstance(value, pd.Timestamp):
+            value = value.to_pydatetime()
+        native[key] = value
+    return native
+
+
+def _row_record(row: dict[str, Any]) -> EnrichmentFreshnessRecord:
+    row = dict(row)
+    if isinstance(row.get("metadata"), str):
+        row["metadata"] = json.loads(row["metadata"]) if row["metadata"] else {}
+    return EnrichmentFreshnessRecordModel(**row).to_dataclass()
 
 
 class FreshnessStore:
-    """Store for managing enrichment freshness records."""
+    """Store for managing enrichment freshness records.
+
+    The ledger is a compacted Parquet file plus an append-only journal of
+    upserts (``<stem>.journal.jsonl``). The store keeps an in-memory index keyed
+    by ``(award_id, source)``, so lookups are dictionary reads and each
+    ``save_record`` appends one journal line instead of rewriting the file.
+    Journal lines are written every ``commit_every`` records (``flush`` writes
+    the rest) and folded into the Parquet file once ``compact_every`` have
+    accumulated, or on ``compact``. ``load_all`` always returns the merged
+    ledger, and other stores on the same path see appended lines on their next
+    read. Callables registered with ``add_flush_hook`` run before every journal
+    write, so data a ledger entry describes can be made durable first.
+    """
 
-    def __init__(self, parquet_path: Path | str | None = None):
+    def __init__(
+        self,
+        parquet_path: Path | str | None = None,
+        *,
+        commit_every: int = 1,
+        compact_every: int = 10_000,
+    ):
         """Initialize freshness store.
 
         Args:
             parquet_path: Path to Parquet file for persistence. Defaults to data/derived/enrichment_freshness.parquet
+            commit_every: Upserts buffered in memory before they are appended to the journal
+            compact_every: Journal lines that trigger a rewrite of the Parquet file
         """
         if parquet_path is None:
             parquet_path = Path("data/derived/enrichment_freshness.parquet")
         self.parquet_path = Path(parquet_path)
+        self.journal_path = self.parquet_path.with_name(f"{self.parquet_path.stem}.journal.jsonl")
+        self.commit_every = max(1, commit_every)
+        self.compact_every = max(1, compact_every)
         from sbir_etl.utils.path_utils import ensure_parent_dir
 
         ensure_parent_dir(self.parquet_path)
+        self._index: dict[tuple[str, str], dict[str, Any]] | None = None
+        self._base_signature: tuple[tuple[int, int] | None, ...] | None = None
+        self._journal_offset = 0
+        self._journal_lines = 0
+        self._pending: list[dict[str, Any]] = []
+        self._flush_hooks: list[Callable[[], None]] = []
 
-    def load_all(self) -> pd.DataFrame:
-        """Load all freshness records from Parquet.
+    # -- index maintenance -------------------------------------------------
 
-        Returns:
-            DataFrame with freshness records
-        """
+    def _load_base(self) -> pd.DataFrame:
         try:
             from sbir_etl.utils.data.file_io import read_parquet_or_ndjson
 
-            df = read_parquet_or_ndjson(self.parquet_path)
+            return read_parquet_or_ndjson(self.parquet_path)
         except FileNotFoundError:
             return pd.DataFrame()
         except Exception as e:
             logger.error(f"Failed to load freshness records: {e}")
             return pd.DataFrame()
 
+    def _ensure_index(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """Return the current index, reloading or replaying what changed on disk."""
+        signature = parquet_or_ndjson_signature(self.parquet_path)
+        if self._index is None or signature != self._base_signature:
+            base = self._load_base()
+            self._index = {}
+            for record in cast(list[dict[str, Any]], base.to_dict("records")):
+                row = _native_row(record)
+                self._index[(row["award_id"], row["source"])] = row
+            self._base_signature = signature
+            self._journal_offset = 0
+            self._journal_lines = 0
+            # Re-apply upserts not yet written anywhere.
+            for row in self._pending:
+                self._index[(row["award_id"], row["source"])] = row
+        self._replay_journal()
+        return self._index
+
+    def _replay_journal(self) -> None:
+        assert self._index is not None
+        try:
+            with self.journal_path.open("rb") as fh:
+                fh.seek(self._journal_offset)
+                data = fh.read()
+        except FileNotFoundError:
+            return
+        # Only complete lines; a torn final line is retried on the next read.
+        complete = data[: data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            for column in _DATETIME_COLUMNS:
+                if row.get(column):
+                    row[column] = datetime.fromisoformat(row[column])
+            self._index[(row["award_id"], row["source"])] = row
+            self._journal_lines += 1
+        self._journal_offset += len(complete)
+
+    def _upsert(self, rows: list[dict[str, Any]]) -> None:
+        index = self._ensure_index()
+        for row in rows:
+            index[(row["award_id"], row["source"])] = row
+        self._pending.extend(rows)
+        if len(self._pending) >= self.commit_every:
+            self.flush()
+
+    # -- public API --------------------------------------------------------
+
+    def add_flush_hook(self, hook: Callable[[], None]) -> None:
+        """Run ``hook`` at the start of every ``flush``, before the journal is written."""
+        self._flush_hooks.append(hook)
+
+    def flush(self) -> None:
+        """Append buffered upserts to the journal, compacting when it is long."""
+        for hook in self._flush_hooks:
+            hook()
+        if not self._pending:
+            return
+        self._ensure_index()
+        payload = "".join(
+            json.dumps(row, default=lambda value: value.isoformat()) + "\n" for row in self._pending
+        ).encode("utf-8")
+        with self.journal_path.open("ab") as fh:
+            fh.write(payload)
+        self._journal_offset += len(payload)
+        self._journal_lines += len(self._pending)
+        self._pending = []
+        if self._journal_lines >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the journal into the Parquet file and truncate it."""
+        self.flush()
+        self.save_all(self.load_all())
+
+    def load_all(self) -> pd.DataFrame:
+        """Load all freshness records (compacted Parquet plus journal).
+
+        Returns:
+            DataFrame with freshness records
+        """
+        rows = list(self._ensure_index().values())
+        if not rows:
+            return pd.DataFrame()
+        df = pd.DataFrame(rows)
+
         # Ensure datetime columns are properly typed
-        for col in ["last_attempt_at", "last_success_at"]:
+        for col in _DATETIME_COLUMNS:
             if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
                 df[col] = pd.to_datetime(df[col], errors="coerce")
         return df
@@ -64,38 +225,7 @@ class FreshnessStore:
         Args:
             record: Freshness record to save
         """
-        df = self.load_all()
-
-        # Convert to Pydantic model for serialization
-        model = EnrichmentFreshnessRecordModel.from_dataclass(record)
-
-        # Convert metadata dict to JSON string for Parquet compatibility (handles empty dicts)
-        import json
-
-        model_dict = model.model_dump()
-        if "metadata" in model_dict and isinstance(model_dict["metadata"], dict):
-            model_dict["metadata"] = (
-                json.dumps(model_dict["metadata"]) if model_dict["metadata"] else "{}"
-            )
-
-        # Create DataFrame from single record
-        new_row = pd.DataFrame([model_dict])
-
-        # Check if record exists (by award_id + source)
-        if not df.empty:
-            mask = (df["award_id"] == record.award_id) & (df["source"] == record.source)
-            if mask.any():
-                # Update existing record - replace the entire row
-                idx = df[mask].index[0]
-                for col in new_row.columns:
-                    df.loc[idx, col] = new_row[col].iloc[0]
-            else:
-                # Append new record
-                df = pd.concat([df, new_row], ignore_index=True)
-        else:
-            df = new_row
-
-        self.save_all(df)
+        self._upsert([_record_row(record)])
 
     def save_records(self, records: list[EnrichmentFreshnessRecord]) -> None:
         """Save multiple freshness records in batch.
@@ -105,40 +235,11 @@ class FreshnessStore:
         """
         if not records:
             return
-
-        df = self.load_all()
-
-        # Convert all records to Pydantic models
-        import json
-
-        models = [EnrichmentFreshnessRecordModel.from_dataclass(r) for r in records]
-        # Convert metadata dicts to JSON strings for Parquet compatibility
-        model_dicts = []
-        for m in models:
-            d = m.model_dump()
-            if "metadata" in d and isinstance(d["metadata"], dict):
-                d["metadata"] = json.dumps(d["metadata"]) if d["metadata"] else "{}"
-            model_dicts.append(d)
-        new_rows = pd.DataFrame(model_dicts)
-
-        if not df.empty:
-            # Update existing records and append new ones
-            for _idx, new_row in new_rows.iterrows():
-                mask = (df["award_id"] == new_row["award_id"]) & (df["source"] == new_row["source"])
-                if mask.any():
-                    # Update existing record - replace the entire row
-                    idx = df[mask].index[0]
-                    for col in new_row.index:
-                        df.loc[idx, col] = new_row[col]
-                else:
-                    df = pd.concat([df, new_row.to_frame().T], ignore_index=True)
-        else:
-            df = new_rows
-
-        self.save_all(df)
+        self._upsert([_record_row(record) for record in records])
+        self.flush()
 
     def save_all(self, df: pd.DataFrame) -> None:
-        """Save all freshness records to Parquet.
+        """Replace the ledger with ``df`` (written to Parquet, journal cleared).
 
         Args:
             df: DataFrame with all freshness records
@@ -151,6 +252,11 @@ class FreshnessStore:
         except Exception as e:
             logger.error(f"Failed to save freshness records: {e}")
             raise
+        # The Parquet file now holds every journaled upsert; replaying the old
+        # journal over it would be idempotent, so a crash here loses nothing.
+        self.journal_path.unlink(missing_ok=True)
+        self._pending = []
+        self._index = None
 
     def get_record(self, award_id: str, source: str) -> EnrichmentFreshnessRecord | None:
         """Get a specific freshness record.
@@ -162,30 +268,17 @@ class FreshnessStore:
         Returns:
             Freshness record or None if not found
         """
+        row = self._ensure_index().get((award_id, source))
+        return _row_record(row) if row is not None else None
+
+    def _stale_frame(self, source: str, sla_days: int) -> pd.DataFrame:
         df = self.load_all()
         if df.empty:
-            return None
-
-        mask = (df["award_id"] == award_id) & (df["source"] == source)
-        if not mask.any():
-            return None
-
-        row = df[mask].iloc[0]
-        row_dict = row.to_dict()
-        # Replace NaN with None for Pydantic compatibility (NDJSON roundtrip produces NaN)
-        for k, v in row_dict.items():
-            try:
-                if pd.isna(v):
-                    row_dict[k] = None
-            except (TypeError, ValueError):
-                pass
-        # Convert metadata JSON string back to dict if present
-        import json
-
-        if "metadata" in row_dict and isinstance(row_dict["metadata"], str):
-            row_dict["metadata"] = json.loads(row_dict["metadata"]) if row_dict["metadata"] else {}
-        model = EnrichmentFreshnessRecordModel(**row_dict)
-        return model.to_dataclass()
+            return df
+        df = df[df["source"] == source]
+        cutoff = datetime.now() - timedelta(days=sla_days)
+        last_success = df["last_success_at"]
+        return df[last_success.isna() | (last_success < cutoff)]
 
     def get_stale_records(self, source: str, sla_days: int) -> list[EnrichmentFreshnessRecord]:
         """Get all stale records for a source.
@@ -197,48 +290,13 @@ class FreshnessStore:
         Returns:
             List of stale freshness records
         """
-        df = self.load_all()
-        if df.empty:
-            return []
-
-        # Filter by source
-        df_source = df[df["source"] == source].copy()
-        if df_source.empty:
+        stale = self._stale_frame(source, sla_days)
+        if stale.empty:
             return []
-
-        # Filter by staleness
-        now = datetime.now()
-        cutoff = now - timedelta(days=sla_days)
-
-        import json
-
-        stale_records = []
-        for _, row in df_source.iterrows():
-            last_success = row.get("last_success_at")
-            row_dict = row.to_dict()
-            # Replace NaN with None for Pydantic compatibility (NDJSON roundtrip produces NaN)
-            for k, v in row_dict.items():
-                try:
-                    if pd.isna(v):
-                        row_dict[k] = None
-                except (TypeError, ValueError):
-                    pass
-            # Convert metadata JSON string back to dict if present
-            if "metadata" in row_dict and isinstance(row_dict["metadata"], str):
-                row_dict["metadata"] = (
-                    json.loads(row_dict["metadata"]) if row_dict["metadata"] else {}
-                )
-            if pd.isna(last_success):
-                # No successful enrichment yet
-                stale_records.append(EnrichmentFreshnessRecordModel(**row_dict).to_dataclass())
-            else:
-                # Check if last success is before cutoff
-                if isinstance(last_success, pd.Timestamp):
-                    last_success = last_success.to_pydatetime()
-                if last_success < cutoff:
-                    stale_records.append(EnrichmentFreshnessRecordModel(**row_dict).to_dataclass())
-
-        return stale_records
+        index = self._ensure_index()
+        return [
+            _row_record(index[key]) for key in zip(stale["award_id"], stale["source"], strict=True)
+        ]
 
     def get_awards_needing_refresh(
         self, source: str, sla_days: int, award_ids: list[str] | None = None
@@ -253,8 +311,8 @@ class FreshnessStore:
         Returns:
             List of award IDs that need refresh
         """
-        stale_records = self.get_stale_records(source, sla_days)
-        stale_award_ids = {r.award_id for r in stale_records}
+        stale = self._stale_frame(source, sla_days)
+        stale_award_ids = set(stale["award_id"]) if not stale.empty else set()
 
         if award_ids is None:
             return list(stale_award_ids)
@@ -14,6 +14,7 @@ from .core import (
 )
 from .metrics import MetricComparison, PerformanceMetrics
 from .reporting import PerformanceReporter, analyze_performance_trend, load_historical_metrics
+from .sampler import ResourceSample, ResourceSampler
 
 
 __all__ = [
@@ -23,6 +24,8 @@ __all__ = [
     "monitor_memory",
     "time_block",
     "monitor_block",
+    "ResourceSampler",
+    "ResourceSample",
     "PerformanceMetrics",
     "MetricComparison",
     "PerformanceReporter",
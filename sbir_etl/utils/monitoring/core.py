@@ -5,11 +5,18 @@ from __future__ import annotations
 import contextlib
 import functools
 import json
+import math
+import os
+import threading
 import time
+from collections import deque
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any, TypeVar
 
+from .sampler import ResourceSampler, read_io_counters
+
 
 # psutil is optional; when available we record memory usage
 try:
@@ -20,18 +27,135 @@ except Exception:
     psutil = None  # type: ignore[assignment, unused-ignore]
     _PSUTIL_AVAILABLE = False
 
+# resource is POSIX-only; used for the process high-water mark on Linux/macOS
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
 
 T = TypeVar("T")
 
+_MB = 1024 * 1024
+DEFAULT_MAX_ENTRIES_PER_METRIC = 1000
+OPENMETRICS_PREFIX = "sbir_etl_block"
+
+
+@dataclass
+class _MetricAggregate:
+    """Streaming aggregate of every entry recorded under one metric name.
+
+    Entries are evicted from the per-name ring buffer, so summaries are
+    computed from these running totals rather than from the retained entries.
+    """
+
+    count: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    min_duration: float = math.inf
+    memory_delta_count: int = 0
+    total_memory_delta_mb: float = 0.0
+    max_peak_memory_mb: float = 0.0
+    cpu_seconds: float = 0.0
+    io_read_bytes: int = 0
+    io_write_bytes: int = 0
+    has_resources: bool = False
+
+    def add(self, entry: dict[str, Any]) -> None:
+        self.count += 1
+        if "duration" in entry:
+            duration = float(entry["duration"])
+            self.total_duration += duration
+            self.max_duration = max(self.max_duration, duration)
+            self.min_duration = min(self.min_duration, duration)
+        if "memory_delta_mb" in entry:
+            self.memory_delta_count += 1
+            self.total_memory_delta_mb += float(entry["memory_delta_mb"])
+            self.has_resources = True
+        if "peak_memory_mb" in entry:
+            self.max_peak_memory_mb = max(self.max_peak_memory_mb, float(entry["peak_memory_mb"]))
+        self.cpu_seconds += float(entry.get("cpu_seconds", 0.0))
+        self.io_read_bytes += int(entry.get("io_read_bytes", 0))
+        self.io_write_bytes += int(entry.get("io_write_bytes", 0))
+
+    def summary(self, latest: dict[str, Any] | None) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_duration": self.total_duration,
+            "avg_duration": (self.total_duration / self.count) if self.count else 0.0,
+            "max_duration": self.max_duration,
+            "min_duration": self.min_duration if self.count else 0.0,
+            "total_memory_delta_mb": self.total_memory_delta_mb,
+            "avg_memory_delta_mb": (self.total_memory_delta_mb / self.memory_delta_count)
+            if self.memory_delta_count
+            else 0.0,
+            "max_peak_memory_mb": self.max_peak_memory_mb,
+            "total_cpu_seconds": self.cpu_seconds,
+            "total_io_read_bytes": self.io_read_bytes,
+            "total_io_write_bytes": self.io_write_bytes,
+            "latest": latest,
+        }
+
+
+def _openmetrics_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
 
 class PerformanceMonitor:
     """Performance monitoring utility for tracking resource usage and timing."""
 
-    def __init__(self) -> None:
-        """Initialize performance monitor."""
-        # metrics: name -> list of measurement dicts
-        self.metrics: dict[str, list[dict[str, Any]]] = {}
+    def __init__(
+        self,
+        max_entries_per_metric: int | None = DEFAULT_MAX_ENTRIES_PER_METRIC,
+        sample_interval: float | None = None,
+    ) -> None:
+        """Initialize performance monitor.
+
+        Args:
+            max_entries_per_metric: Raw entries retained per metric name; older
+                entries are dropped but still counted in summaries. None keeps
+                every entry.
+            sample_interval: If set (seconds), start the background resource
+                sampler so monitored blocks report their true peak RSS.
+        """
+        self.max_entries_per_metric = max_entries_per_metric
+        # metrics: name -> ring buffer of measurement dicts
+        self.metrics: dict[str, deque[dict[str, Any]]] = {}
+        self._aggregates: dict[str, _MetricAggregate] = {}
+        self._lock = threading.Lock()
         self._process = psutil.Process() if _PSUTIL_AVAILABLE else None
+        self._sampler: ResourceSampler | None = None
+        if sample_interval is not None:
+            self.start_sampler(sample_interval)
+
+    # -----------------------
+    # Background sampling
+    # -----------------------
+    def start_sampler(self, interval: float = 0.05, max_samples: int = 10_000) -> bool:
+        """Start the background resource sampler.
+
+        Args:
+            interval: Seconds between process samples
+            max_samples: Samples retained for the trace timeline
+
+        Returns:
+            True if the sampler is running, False when psutil is unavailable
+        """
+        if not _PSUTIL_AVAILABLE or self._process is None:
+            return False
+        if self._sampler is None or not self._sampler.running:
+            self._sampler = ResourceSampler(self._process, interval, max_samples)
+            self._sampler.start()
+        return True
+
+    def stop_sampler(self) -> None:
+        """Stop the background resource sampler, keeping its samples for export."""
+        if self._sampler is not None:
+            self._sampler.stop()
+
+    @property
+    def sampler_running(self) -> bool:
+        return self._sampler is not None and self._sampler.running
 
     # -----------------------
     # Decorators
@@ -74,28 +198,8 @@ class PerformanceMonitor:
                 # Fallback to timing-only
                 return self.time_function(func)(*args, **kwargs)
 
-            start_time = time.time()
-            start_mem = self._get_memory_mb()
-            try:
+            with self._resource_block(f"{func.__name__}_memory", "memory_monitor"):
                 return func(*args, **kwargs)
-            finally:
-                end_time = time.time()
-                end_mem = self._get_memory_mb()
-                # peak memory best-effort if available via memory_info (platform dependent)
-                peak_mem = self._get_peak_memory_mb()
-                self._record(
-                    f"{func.__name__}_memory",
-                    {
-                        "operation": "memory_monitor",
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "duration": end_time - start_time,
-                        "start_memory_mb": start_mem,
-                        "end_memory_mb": end_mem,
-                        "peak_memory_mb": peak_mem,
-                        "memory_delta_mb": end_mem - start_mem,
-                    },
-                )
 
         return wrapper
 
@@ -128,7 +232,7 @@ class PerformanceMonitor:
 
     @contextmanager
     def monitor_block(self, name: str) -> Iterator[None]:
-        """Context manager to measure time and memory for a block of code.
+        """Context manager to measure time, memory, CPU and I/O for a block of code.
 
         If psutil is unavailable, falls back to time_block behavior.
         """
@@ -137,25 +241,52 @@ class PerformanceMonitor:
                 yield
             return
 
+        with self._resource_block(name, "monitor_block"):
+            yield
+
+    @contextmanager
+    def _resource_block(self, name: str, operation: str) -> Iterator[None]:
+        """Record timing plus process resource deltas for a block.
+
+        With the sampler running, ``peak_memory_mb`` is the highest RSS sampled
+        while the block was open; otherwise it is the larger of the entry and
+        exit RSS. CPU time and I/O bytes are exact deltas of the process
+        counters and include work done by other threads during the block.
+        """
         start_time = time.time()
         start_mem = self._get_memory_mb()
+        start_cpu = self._get_cpu_seconds()
+        start_read, start_write = read_io_counters(self._process)
+        sampler = self._sampler if self.sampler_running else None
+        window = sampler.open_window(int(start_mem * _MB)) if sampler else None
         try:
             yield
         finally:
             end_time = time.time()
             end_mem = self._get_memory_mb()
-            peak_mem = self._get_peak_memory_mb()
+            end_read, end_write = read_io_counters(self._process)
+            duration = end_time - start_time
+            cpu_seconds = max(0.0, self._get_cpu_seconds() - start_cpu)
+            peak_mem = max(start_mem, end_mem)
+            if sampler is not None and window is not None:
+                sampler.close_window(window)
+                peak_mem = max(peak_mem, window.peak_rss_bytes / _MB)
             self._record(
                 name,
                 {
-                    "operation": "monitor_block",
+                    "operation": operation,
                     "start_time": start_time,
                     "end_time": end_time,
-                    "duration": end_time - start_time,
+                    "duration": duration,
                     "start_memory_mb": start_mem,
                     "end_memory_mb": end_mem,
                     "peak_memory_mb": peak_mem,
+                    "peak_memory_sampled": window is not None,
                     "memory_delta_mb": end_mem - start_mem,
+                    "cpu_seconds": cpu_seconds,
+                    "cpu_percent": (100.0 * cpu_seconds / duration) if duration > 0 else 0.0,
+                    "io_read_bytes": max(0, end_read - start_read),
+                    "io_write_bytes": max(0, end_write - start_write),
                 },
             )
 
@@ -167,31 +298,53 @@ class PerformanceMonitor:
         if not self._process:
             return 0.0
         try:
-            return float(self._process.memory_info().rss) / (1024 * 1024)
+            return float(self._process.memory_info().rss) / _MB
+        except Exception:
+            return 0.0
+
+    def _get_cpu_seconds(self) -> float:
+        """Return user + system CPU seconds consumed by the process so far."""
+        if not self._process:
+            return 0.0
+        try:
+            times = self._process.cpu_times()
+            return float(times.user + times.system)
         except Exception:
             return 0.0
 
     def _get_peak_memory_mb(self) -> float:
-        """Return a best-effort peak memory usage (MB). Implementation is platform dependent."""
+        """Return the process-lifetime peak RSS (MB), not the peak of any block.
+
+        Windows exposes ``peak_wset`` through psutil; on POSIX the high-water
+        mark comes from ``getrusage`` (KiB on Linux, bytes on macOS).
+        """
         if not self._process:
             return 0.0
         try:
-            # Some platforms expose peak_wset/peak_rss; fall back to rss if not available
             info = self._process.memory_info()
-            peak = getattr(info, "peak_wset", None) or getattr(info, "peak_rss", None) or info.rss
-            return float(peak) / (1024 * 1024)
+            peak = getattr(info, "peak_wset", None) or getattr(info, "peak_rss", None)
+            if peak:
+                return float(peak) / _MB
+            if resource is not None:
+                maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                scale = 1 if os.uname().sysname == "Darwin" else 1024
+                return max(float(maxrss) * scale, float(info.rss)) / _MB
+            return float(info.rss) / _MB
         except Exception:
-            try:
-                return float(self._process.memory_info().rss) / (1024 * 1024)
-            except Exception:
-                return 0.0
+            return self._get_memory_mb()
 
     def _record(self, name: str, data: dict[str, Any]) -> None:
         """Record a metric entry for a named operation."""
-        bucket = self.metrics.setdefault(name, [])
-        # enrich with timestamp
+        # enrich with timestamp and thread for trace export
         data.setdefault("timestamp", time.time())
-        bucket.append(data)
+        data.setdefault("thread_id", threading.get_ident())
+        with self._lock:
+            bucket = self.metrics.get(name)
+            if bucket is None:
+                bucket = self.metrics[name] = deque(maxlen=self.max_entries_per_metric)
+                self._aggregates[name] = _MetricAggregate()
+            bucket.append(data)
+            self._aggregates[name].add(data)
 
     def get_latest_metric(self, name: str) -> dict[str, Any] | None:
         """Return the most recent metric entry for a given name, or None."""
@@ -203,28 +356,15 @@ class PerformanceMonitor:
     def get_metrics_summary(self) -> dict[str, dict[str, Any]]:
         """Return a summarized view of collected metrics.
 
-        Summary includes count, total/avg/max duration, memory stats where available.
+        Summary includes count, total/avg/min/max duration, memory, CPU and I/O
+        stats where available. Totals cover every recorded entry, including
+        entries already evicted from the ring buffers.
         """
-        summary: dict[str, dict[str, Any]] = {}
-        for name, entries in self.metrics.items():
-            durations = [e.get("duration", 0.0) for e in entries if "duration" in e]
-            memory_deltas = [
-                e.get("memory_delta_mb", 0.0) for e in entries if "memory_delta_mb" in e
-            ]
-            peak_memories = [e.get("peak_memory_mb", 0.0) for e in entries if "peak_memory_mb" in e]
-            summary[name] = {
-                "count": len(entries),
-                "total_duration": sum(durations),
-                "avg_duration": (sum(durations) / len(durations)) if durations else 0.0,
-                "max_duration": max(durations) if durations else 0.0,
-                "total_memory_delta_mb": sum(memory_deltas),
-                "avg_memory_delta_mb": (sum(memory_deltas) / len(memory_deltas))
-                if memory_deltas
-                else 0.0,
-                "max_peak_memory_mb": max(peak_memories) if peak_memories else 0.0,
-                "latest": entries[-1] if entries else None,
+        with self._lock:
+            return {
+                name: aggregate.summary(self.metrics[name][-1] if self.metrics[name] else None)
+                for name, aggregate in self._aggregates.items()
             }
-        return summary
 
     def _aggregate_metrics(self, summary: dict[str, dict[str, Any]]) -> dict[str, float]:
         """Compute aggregate metrics shared across reporting paths."""
@@ -250,13 +390,161 @@ class PerformanceMonitor:
         }
 
     def reset_metrics(self) -> None:
-        """Clear all collected metrics."""
-        self.metrics.clear()
+        """Clear all collected metrics and sampler history."""
+        with self._lock:
+            self.metrics.clear()
+            self._aggregates.clear()
+        if self._sampler is not None:
+            self._sampler.samples.clear()
 
     def export_metrics(self, filepath: str) -> None:
         """Export raw metrics to a JSON file."""
+        with self._lock:
+            data = {name: list(entries) for name, entries in self.metrics.items()}
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+
+    # -----------------------
+    # Trace / metrics exporters
+    # -----------------------
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return retained entries and sampler history as Chrome trace events.
+
+        Every entry becomes a complete (``"ph": "X"``) event on its recording
+        thread, so nested blocks stack on the timeline. Sampler history becomes
+        counter tracks for RSS, CPU% and cumulative I/O. The result loads in
+        ``chrome://tracing`` and ui.perfetto.dev.
+        """
+        pid = os.getpid()
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        with self._lock:
+            entries = [(name, e) for name, bucket in self.metrics.items() for e in bucket]
+        samples = list(self._sampler.samples) if self._sampler is not None else []
+
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "sbir-etl"}}
+        ]
+        for tid in sorted({e["thread_id"] for _, e in entries}):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": thread_names.get(tid, f"thread-{tid}")},
+                }
+            )
+
+        for name, entry in sorted(entries, key=lambda item: item[1].get("start_time", 0.0)):
+            if "start_time" not in entry:
+                continue
+            args = {
+                key: value
+                for key, value in entry.items()
+                if key not in ("operation", "start_time", "end_time", "timestamp", "thread_id")
+            }
+            events.append(
+                {
+                    "name": name,
+                    "cat": entry.get("operation", "block"),
+                    "ph": "X",
+                    "ts": entry["start_time"] * 1e6,
+                    "dur": entry.get("duration", 0.0) * 1e6,
+                    "pid": pid,
+                    "tid": entry["thread_id"],
+                    "args": args,
+                }
+            )
+
+        for sample in samples:
+            ts = sample.timestamp * 1e6
+            events.append(
+                {
+                    "name": "rss_mb",
+                    "ph": "C",
+                    "ts": ts,
+                    "pid": pid,
+                    "args": {"rss_mb": sample.rss_bytes / _MB},
+                }
+            )
+            events.append(
+                {
+                    "name": "cpu_percent",
+                    "ph": "C",
+                    "ts": ts,
+                    "pid": pid,
+                    "args": {"cpu_percent": sample.cpu_percent},
+                }
+            )
+            events.append(
+                {
+                    "name": "io_mb",
+                    "ph": "C",
+                    "ts": ts,
+                    "pid": pid,
+                    "args": {
+                        "read_mb": sample.read_bytes / _MB,
+                        "write_mb": sample.write_bytes / _MB,
+                    },
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, filepath: str) -> None:
+        """Write :meth:`to_chrome_trace` output to a JSON file."""
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+
+    def to_openmetrics(self) -> str:
+        """Return the streaming summaries in OpenMetrics text exposition format."""
+        summary = self.get_metrics_summary()
+        prefix = OPENMETRICS_PREFIX
+        families: list[tuple[str, str, str | None, str, str]] = [
+            ("duration_seconds", "summary", "seconds", "Wall time of monitored blocks", ""),
+            ("max_duration_seconds", "gauge", "seconds", "Longest single block", "max_duration"),
+            ("peak_memory_bytes", "gauge", "bytes", "Highest RSS seen in a block", "peak"),
+            ("cpu_seconds", "counter", "seconds", "Process CPU time during blocks", "cpu"),
+            ("io_read_bytes", "counter", "bytes", "Bytes read during blocks", "read"),
+            ("io_write_bytes", "counter", "bytes", "Bytes written during blocks", "write"),
+        ]
+
+        lines: list[str] = []
+        for suffix, metric_type, unit, help_text, field in families:
+            family = f"{prefix}_{suffix}"
+            samples: list[str] = []
+            for name, stats in sorted(summary.items()):
+                label = f'{{operation="{_openmetrics_label(name)}"}}'
+                aggregate = self._aggregates.get(name)
+                if metric_type == "summary":
+                    samples.append(f"{family}_count{label} {stats['count']}")
+                    samples.append(f"{family}_sum{label} {stats['total_duration']!r}")
+                elif field == "max_duration":
+                    samples.append(f"{family}{label} {stats['max_duration']!r}")
+                elif aggregate is None or not aggregate.has_resources:
+                    continue
+                elif field == "peak":
+                    samples.append(f"{family}{label} {int(stats['max_peak_memory_mb'] * _MB)}")
+                elif field == "cpu":
+                    samples.append(f"{family}_total{label} {stats['total_cpu_seconds']!r}")
+                elif field == "read":
+                    samples.append(f"{family}_total{label} {stats['total_io_read_bytes']}")
+                else:
+                    samples.append(f"{family}_total{label} {stats['total_io_write_bytes']}")
+            if not samples:
+                continue
+            lines.append(f"# TYPE {family} {metric_type}")
+            if unit:
+                lines.append(f"# UNIT {family} {unit}")
+            lines.append(f"# HELP {family} {help_text}.")
+            lines.extend(samples)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def export_openmetrics(self, filepath: str) -> None:
+        """Write :meth:`to_openmetrics` output to a text file."""
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(self.metrics, f, indent=2, default=str)
+            f.write(self.to_openmetrics())
 
     def get_performance_report(self) -> dict[str, Any]:
         """Return a comprehensive performance report with summary and overall stats."""
@@ -268,6 +556,7 @@ class PerformanceMonitor:
                 "total_operations": aggregates["total_operations"],
                 "total_duration": aggregates["total_duration"],
                 "avg_operation_duration": aggregates["avg_operation_duration"],
+                "process_peak_memory_mb": self._get_peak_memory_mb(),
             },
             "psutil_available": _PSUTIL_AVAILABLE,
             "timestamp": time.time(),
@@ -0,0 +1,133 @@
+"""Background resource sampler for block-level peak memory, CPU and I/O.
+
+``PerformanceMonitor`` only sees the process at block entry and exit. A
+``ResourceSampler`` polls the process from a daemon thread at a fixed interval,
+keeps the most recent samples in a ring buffer for timeline export, and folds
+every sample into the windows of the blocks that are open at that moment, so a
+block reports the highest RSS observed while it ran rather than the RSS at its
+boundaries.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    """A single process snapshot taken by the sampler."""
+
+    timestamp: float
+    rss_bytes: int
+    cpu_percent: float
+    read_bytes: int
+    write_bytes: int
+
+
+@dataclass
+class BlockWindow:
+    """Running peak RSS of one open block, updated by the sampler thread."""
+
+    peak_rss_bytes: int
+    samples: int = 0
+
+
+def read_io_counters(process: Any) -> tuple[int, int]:
+    """Return cumulative (read_bytes, write_bytes) for a psutil process.
+
+    ``io_counters`` is unavailable on macOS and in some containers; those
+    platforms report zero I/O.
+    """
+    try:
+        counters = process.io_counters()
+        return int(counters.read_bytes), int(counters.write_bytes)
+    except Exception:
+        return 0, 0
+
+
+class ResourceSampler:
+    """Poll a psutil process from a daemon thread.
+
+    The sampler is cheap enough to leave running for a whole Dagster run: one
+    ``memory_info``/``cpu_percent``/``io_counters`` call per interval, with
+    samples held in a bounded deque.
+    """
+
+    def __init__(self, process: Any, interval: float = 0.05, max_samples: int = 10_000):
+        """Initialize the sampler.
+
+        Args:
+            process: ``psutil.Process`` to sample
+            interval: Seconds between samples
+            max_samples: Samples retained for timeline export (oldest are dropped)
+        """
+        self.process = process
+        self.interval = max(0.001, interval)
+        self.samples: deque[ResourceSample] = deque(maxlen=max_samples)
+        self._windows: dict[int, BlockWindow] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the sampling thread (no-op if it is already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        # Prime cpu_percent so the first real sample measures an interval.
+        try:
+            self.process.cpu_percent(None)
+        except Exception:
+            pass
+        self._thread = threading.Thread(target=self._run, name="perf-resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(1.0, self.interval * 5))
+        self._thread = None
+
+    def open_window(self, rss_bytes: int) -> BlockWindow:
+        """Register an open block whose peak should track future samples."""
+        window = BlockWindow(peak_rss_bytes=rss_bytes)
+        with self._lock:
+            self._windows[id(window)] = window
+        return window
+
+    def close_window(self, window: BlockWindow) -> BlockWindow:
+        """Stop updating a block window and return it."""
+        with self._lock:
+            self._windows.pop(id(window), None)
+        return window
+
+    def sample(self) -> ResourceSample | None:
+        """Take one sample and fold it into every open block window."""
+        try:
+            rss = int(self.process.memory_info().rss)
+            cpu = float(self.process.cpu_percent(None))
+        except Exception:
+            return None
+        read_bytes, write_bytes = read_io_counters(self.process)
+        snapshot = ResourceSample(time.time(), rss, cpu, read_bytes, write_bytes)
+        with self._lock:
+            self.samples.append(snapshot)
+            for window in self._windows.values():
+                window.samples += 1
+                if rss > window.peak_rss_bytes:
+                    window.peak_rss_bytes = rss
+        return snapshot
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
@@ -0,0 +1,352 @@
+"""Persistent token and n-gram index over procurement report texts.
+
+``MonthlyReportBuilder`` looks for shared phrases between every award abstract
+and each notice paired with it, then ranks those phrases by document frequency
+over the run's corpus. Most abstracts and notices come back month after month.
+``ProcurementTextIndex`` therefore tokenizes each distinct text only once and
+keys what it finds by a SHA-256 of the normalized text:
+
+- the document's content tokens, stored as integer token IDs; corpus document
+  frequencies are sums over these postings;
+- its candidate 3- and 2-grams in first-appearance order, so finding the
+  phrases two documents share is a set intersection of their grams.
+
+With a ``db_path`` the index persists in SQLite, and a later run only
+tokenizes texts it has not seen before. Without one the index lasts only as
+long as the process. Its results match :func:`shared_technical_phrases` and
+:func:`document_token_frequencies` exactly. As with the LLM response cache,
+the store is best effort: an unreadable or locked file only means texts are
+tokenized again.
+
+Set ``SBIR_ETL__TEXT_INDEX`` to a file path to relocate the store, or to
+``off`` to keep the index in memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from sbir_etl.utils.cloud_storage import get_data_root
+from sbir_etl.utils.procurement_text import (
+    _STOPWORDS,
+    _candidate_grams,
+    _coerce_text,
+    _ordered_tokens,
+)
+
+__all__ = [
+    "TEXT_INDEX_ENV",
+    "ProcurementTextIndex",
+    "default_text_index",
+]
+
+TEXT_INDEX_ENV = "SBIR_ETL__TEXT_INDEX"
+DEFAULT_INDEX_NAME = "procurement_text_index.sqlite"
+
+# Part of every content hash: bump it when tokenization or n-gram candidacy
+# changes so postings built by the old rules are never reused.
+INDEX_VERSION = "1"
+
+_GRAM_SIZES = (3, 2)
+_LOOKUP_CHUNK = 500
+_DISABLED_VALUES = {"", "0", "off", "false", "none"}
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS tokens (
+        token_id INTEGER PRIMARY KEY,
+        token TEXT NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS documents (
+        content_hash TEXT PRIMARY KEY,
+        token_ids TEXT NOT NULL,
+        grams TEXT NOT NULL
+    )
+    """,
+)
+
+
+@dataclass(frozen=True)
+class _Document:
+    token_ids: frozenset[int]
+    # Distinct candidate grams per size in ``_GRAM_SIZES``, first appearance first.
+    grams: tuple[tuple[tuple[int, ...], ...], ...]
+
+
+def _content_hash(normalized: str) -> str:
+    return hashlib.sha256(f"{INDEX_VERSION}\0{normalized}".encode()).hexdigest()
+
+
+def _contains(outer: tuple[int, ...], inner: tuple[int, ...]) -> bool:
+    width = len(inner)
+    return any(outer[start : start + width] == inner for start in range(len(outer) - width + 1))
+
+
+def _chunks(values: list[Any]) -> Iterator[list[Any]]:
+    for start in range(0, len(values), _LOOKUP_CHUNK):
+        yield values[start : start + _LOOKUP_CHUNK]
+
+
+class ProcurementTextIndex:
+    """Content-hash-keyed token postings and n-gram sets for report texts."""
+
+    def __init__(self, db_path: Path | str | None = None):
+        """Initialize the index.
+
+        Args:
+            db_path: SQLite file persisting the index (created on first write),
+                or None to keep it in memory for this process only
+        """
+        self.db_path = Path(db_path) if db_path is not None else None
+        self._documents: dict[str, _Document] = {}
+        self._token_ids: dict[str, int] = {}
+        self._tokens: dict[int, str] = {}
+        self.indexed = 0
+        self.reused = 0
+
+    @property
+    def persistent(self) -> bool:
+        return self.db_path is not None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        assert self.db_path is not None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with connection:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                yield connection
+        finally:
+            connection.close()
+
+    def _disable(self, action: str, exc: sqlite3.Error) -> None:
+        # Token IDs assigned from here on are local to this process, so the
+        # store must not be written again by this instance.
+        logger.debug(f"Procurement text index {action} failed: {exc}")
+        self.db_path = None
+
+    def _remember(self, token_id: int, token: str) -> None:
+        self._token_ids[token] = token_id
+        self._tokens[token_id] = token
+
+    def add(self, texts: Iterable[Any]) -> list[str | None]:
+        """Index every text not already known.
+
+        Returns:
+            Each text's content hash, or None for a missing or blank text.
+        """
+        normalized = [_coerce_text(text) for text in texts]
+        hashes = [_content_hash(text) if text is not None else None for text in normalized]
+        pending = {
+            key: text
+            for key, text in zip(hashes, normalized, strict=True)
+            if key is not None and text is not None and key not in self._documents
+        }
+        if pending and self.db_path is not None and self.db_path.exists():
+            self._load(pending)
+        if pending:
+            self._index(pending)
+        return hashes
+
+    def _load(self, pending: dict[str, str]) -> None:
+        """Move documents already in the store from ``pending`` into memory."""
+        try:
+            with self._connect() as connection:
+                rows = [
+                    row
+                    for chunk in _chunks(list(pending))
+                    for row in connection.execute(
+                        "SELECT content_hash, token_ids, grams FROM documents "
+                        f"WHERE content_hash IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                ]
+                decoded = [
+                    (key, json.loads(token_ids), json.loads(grams))
+                    for key, token_ids, grams in rows
+                ]
+                unknown = sorted(
+                    {
+                        token_id
+                        for _, token_ids, grams in decoded
+                        for token_id in (
+                            *token_ids,
+                            *(token for sized in grams for gram in sized for token in gram),
+                        )
+                    }
+                    - self._tokens.keys()
+                )
+                for chunk in _chunks(unknown):
+                    for token_id, token in connection.execute(
+                        "SELECT token_id, token FROM tokens "
+                        f"WHERE token_id IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ):
+                        self._remember(token_id, token)
+        except sqlite3.Error as exc:
+            self._disable("lookup", exc)
+            return
+        for key, token_ids, grams in decoded:
+            self._documents[key] = _Document(
+                token_ids=frozenset(token_ids),
+                grams=tuple(tuple(tuple(gram) for gram in sized) for sized in grams),
+            )
+            del pending[key]
+        self.reused += len(decoded)
+
+    def _index(self, pending: dict[str, str]) -> None:
+        """Tokenize ``pending`` texts, assign token IDs, and store the postings."""
+        tokenized = {key: _ordered_tokens(text) for key, text in pending.items()}
+        new_tokens = list(
+            dict.fromkeys(
+                token
+                for tokens in tokenized.values()
+                for token in tokens
+                if token not in self._token_ids
+            )
+        )
+        if new_tokens:
+            self._assign_ids(new_tokens)
+
+        rows = []
+        for key, tokens in tokenized.items():
+            document = _Document(
+                token_ids=frozenset(
+                    self._token_ids[token]
+                    for token in tokens
+                    if token not in _STOPWORDS and len(token) > 2
+                ),
+                grams=tuple(
+                    tuple(
+                        dict.fromkeys(
+                            tuple(self._token_ids[token] for token in gram)
+                            for gram in _candidate_grams(tokens, size)
+                        )
+                    )
+                    for size in _GRAM_SIZES
+                ),
+            )
+            self._documents[key] = document
+            rows.append(
+                (
+                    key,
+                    json.dumps(sorted(document.token_ids)),
+                    json.dumps(document.grams, separators=(",", ":")),
+                )
+            )
+        self.indexed += len(rows)
+
+        if self.db_path is None:
+            return
+        try:
+            with self._connect() as connection:
+                connection.executemany(
+                    "INSERT OR IGNORE INTO documents (content_hash, token_ids, grams) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as exc:
+            self._disable("store", exc)
+
+    def _assign_ids(self, tokens: list[str]) -> None:
+        if self.db_path is not None:
+            try:
+                with self._connect() as connection:
+                    # IDs come from the store so concurrent writers agree on them.
+                    connection.executemany(
+                        "INSERT OR IGNORE INTO tokens (token) VALUES (?)",
+                        [(token,) for token in tokens],
+                    )
+                    for chunk in _chunks(tokens):
+                        for token_id, token in connection.execute(
+                            "SELECT token_id, token FROM tokens "
+                            f"WHERE token IN ({','.join('?' * len(chunk))})",
+                            chunk,
+                        ):
+                            self._remember(token_id, token)
+                return
+            except sqlite3.Error as exc:
+                self._disable("token assignment", exc)
+        next_id = max(self._tokens, default=0) + 1
+        for token in tokens:
+            if token not in self._token_ids:
+                self._remember(next_id, token)
+                next_id += 1
+
+    def document_frequencies(self, texts: Iterable[Any]) -> dict[str, int]:
+        """Document frequency per content token across ``texts``.
+
+        Equal to :func:`document_token_frequencies`; a text listed twice counts
+        twice.
+        """
+        hashes = self.add(texts)
+        counts: Counter[int] = Counter()
+        for key, multiplicity in Counter(key for key in hashes if key is not None).items():
+            counts.update(dict.fromkeys(self._documents[key].token_ids, multiplicity))
+        return {self._tokens[token_id]: count for token_id, count in counts.items()}
+
+    def shared_phrases(self, left_text: Any, right_text: Any, *, max_phrases: int = 6) -> list[str]:
+        """Multi-word technical phrases present in both texts.
+
+        Equal to :func:`shared_technical_phrases`: trigrams first, bigrams
+        inside a selected trigram dropped, right-text order preserved.
+        """
+        left_key, right_key = self.add([left_text, right_text])
+        if left_key is None or right_key is None:
+            return []
+        left, right = self._documents[left_key], self._documents[right_key]
+
+        selected: list[tuple[int, ...]] = []
+        for left_grams, right_grams in zip(left.grams, right.grams, strict=True):
+            available = set(left_grams)
+            for gram in right_grams:
+                if gram not in available:
+                    continue
+                if any(_contains(chosen, gram) for chosen in selected):
+                    continue
+                selected.append(gram)
+        return [
+            " ".join(self._tokens[token_id] for token_id in gram) for gram in selected[:max_phrases]
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """Documents tokenized and reused by this process, plus the store's size."""
+        stored = 0
+        if self.db_path is not None and self.db_path.exists():
+            try:
+                with self._connect() as connection:
+                    (stored,) = connection.execute("SELECT COUNT(*) FROM documents").fetchone()
+            except sqlite3.Error as exc:
+                logger.debug(f"Procurement text index stats failed: {exc}")
+        return {
+            "persistent": self.persistent,
+            "indexed": self.indexed,
+            "reused": self.reused,
+            "stored_documents": stored,
+            "tokens": len(self._tokens),
+        }
+
+
+def default_text_index() -> ProcurementTextIndex:
+    """Index at ``SBIR_ETL__TEXT_INDEX`` or ``<data root>/cache``."""
+    setting = os.environ.get(TEXT_INDEX_ENV)
+    if setting is None:
+        return ProcurementTextIndex(get_data_root() / "cache" / DEFAULT_INDEX_NAME)
+    if setting.strip().lower() in _DISABLED_VALUES:
+        return ProcurementTextIndex()
+    return ProcurementTextIndex(Path(setting))
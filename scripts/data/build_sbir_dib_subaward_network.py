@@ -14,6 +14,7 @@ from pathlib import Path
 import pandas as pd
 
 from sbir_etl.supply_chain.subaward_network import (
+    SUBAWARD_SOURCE_COLUMNS,
     EvidenceGrade,
     aggregate_supplier_prime_edges,
     build_nsf_sbir_award_candidates,
@@ -26,48 +27,7 @@ from sbir_etl.supply_chain.nsf_screen import (
     aggregate_nsf_supplier_screen,
     screen_nsf_sbir_award_candidates,
 )
-
-_NETWORK_COLUMNS = {
-    "prime_award_unique_key",
-    "unique_award_key",
-    "prime_award_piid",
-    "prime_piid",
-    "award_id",
-    "prime_awardee_uei",
-    "prime_recipient_uei",
-    "prime_awardee_duns",
-    "prime_recipient_duns",
-    "prime_awardee_name",
-    "prime_recipient_name",
-    "prime_awardee_parent_uei",
-    "prime_parent_uei",
-    "prime_awardee_parent_name",
-    "prime_parent_name",
-    "prime_award_naics_code",
-    "naics_code",
-    "prime_award_base_transaction_description",
-    "prime_award_description",
-    "subaward_number",
-    "subaward_id",
-    "subaward_sam_report_id",
-    "sam_report_id",
-    "subaward_amount",
-    "amount",
-    "subaward_action_date",
-    "action_date",
-    "subawardee_uei",
-    "sub_recipient_uei",
-    "subawardee_duns",
-    "sub_recipient_duns",
-    "subawardee_name",
-    "sub_recipient_name",
-    "subaward_description",
-    "description",
-    "usaspending_permalink",
-    "source_url",
-    "subaward_sam_report_last_modified_date",
-    "source_last_modified",
-}
+from sbir_etl.supply_chain.subaward_stream import DEFAULT_BATCH_ROWS, stream_subaward_facts
 
 _AWARD_COLUMNS = {
     "company_name",
@@ -130,13 +90,13 @@ def _read_frame(
             path,
             low_memory=False,
             usecols=(
-                (lambda column: column in _NETWORK_COLUMNS)
+                (lambda column: column in SUBAWARD_SOURCE_COLUMNS)
                 if subaward_projection
                 else (lambda column: column in _AWARD_COLUMNS)
                 if award_projection
                 else None
             ),
-            dtype=str if award_projection else None,
+            dtype=str if subaward_projection or award_projection else None,
         )
     if path.suffix.lower() == ".zip":
         with tempfile.TemporaryDirectory() as temporary_directory:
@@ -149,12 +109,12 @@ def _read_frame(
                 pd.read_csv(
                     Path(temporary_directory) / name,
                     low_memory=False,
-                    usecols=(lambda column: column in _NETWORK_COLUMNS)
+                    usecols=(lambda column: column in SUBAWARD_SOURCE_COLUMNS)
                     if subaward_projection
                     else (lambda column: column in _AWARD_COLUMNS)
                     if award_projection
                     else None,
-                    dtype=str if award_projection else None,
+                    dtype=str if subaward_projection or award_projection else None,
                 )
                 for name in csv_names
             ]
@@ -180,22 +140,39 @@ def _parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Keep only exact UEI or DUNS matches.",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Scan subawards in batches, keeping only rows that match an SBIR awardee.",
+    )
+    parser.add_argument("--batch-rows", type=int, default=DEFAULT_BATCH_ROWS)
     return parser
 
 
 def main() -> int:
     args = _parser().parse_args()
     awards = _read_frame(args.awards, award_projection=True)
-    subawards = pd.concat(
-        [_read_frame(path, subaward_projection=True) for path in args.subawards],
-        ignore_index=True,
-    )
     registry = build_sbir_awardee_registry(awards)
-    facts = build_subaward_facts(
-        registry,
-        subawards,
-        include_name_candidates=not args.exclude_name_candidates,
-    )
+    if args.stream:
+        streamed = stream_subaward_facts(
+            registry,
+            args.subawards,
+            include_name_candidates=not args.exclude_name_candidates,
+            batch_rows=args.batch_rows,
+        )
+        facts = streamed.facts
+        source_subaward_rows = streamed.source_rows
+    else:
+        subawards = pd.concat(
+            [_read_frame(path, subaward_projection=True) for path in args.subawards],
+            ignore_index=True,
+        )
+        facts = build_subaward_facts(
+            registry,
+            subawards,
+            include_name_candidates=not args.exclude_name_candidates,
+        )
+        source_subaward_rows = len(subawards)
     verified_facts = facts.loc[
         facts["evidence_grade"] == EvidenceGrade.VERIFIED_IDENTIFIER.value
     ].copy()
@@ -253,7 +230,7 @@ def main() -> int:
                 if len(registry)
                 else 0.0
             ),
-            "source_subaward_rows": int(len(subawards)),
+            "source_subaward_rows": int(source_subaward_rows),
             "nsf_sbir_registry_awardees": int(registry["nsf_sbir_awardee"].sum()),
             "identifier_verified_nsf_sbir_awardees": int(len(nsf_candidates)),
             "identifier_verified_nsf_sbir_supplier_prime_edges": int(len(nsf_edges)),
@@ -9,6 +9,7 @@ import pandas as pd
 
 from sbir_etl.reporting.procurement_transition import MonthlyReportBuilder, build_award_cohorts
 from sbir_etl.reporting.procurement_transition.ai import build_public_evidence_summarizer
+from sbir_etl.utils.procurement_text_index import default_text_index
 from sbir_ml.transition.detection.fusion_scoring import score_pairs_with_fusion
 
 
@@ -57,6 +58,7 @@ def main() -> int:
         summarizer=summarizer,
         max_summaries=args.ai_max_summaries,
         fusion_scorer=score_pairs_with_fusion,
+        text_index=default_text_index(),
     ).write(
         award_cohorts=cohorts,
         candidates=_read(args.candidates, required=True),
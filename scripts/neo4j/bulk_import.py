@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""CLI for offline Neo4j full rebuilds with neo4j-admin.
+
+Materialize the Neo4j loading assets with ``NEO4J_LOAD_MODE=bulk`` first; they
+stage their writes under the import directory instead of running MERGE
+batches. This script replays the stages, writes deduplicated node and
+relationship CSV files, and runs ``neo4j-admin database import full``. The
+replayed stages are deleted after a successful import unless ``--keep-stages``
+is given. Stop the database before importing and run ``migrate.py upgrade``
+afterwards.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Support running this script directly from a source checkout.
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "packages" / "sbir-graph"))
+
+from sbir_graph.loaders.neo4j.bulk_import import Neo4jBulkImporter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Neo4j offline bulk import tool")
+    parser.add_argument(
+        "--import-dir",
+        type=Path,
+        help="Bulk import directory (default: $NEO4J_BULK_IMPORT_DIR or data/neo4j_import)",
+    )
+    parser.add_argument("--database", default="neo4j", help="Target database name")
+    parser.add_argument("--neo4j-admin", default="neo4j-admin", help="neo4j-admin executable")
+    parser.add_argument("--neo4j-home", type=Path, help="NEO4J_HOME of the local installation")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Write CSV files and print the command only"
+    )
+    parser.add_argument(
+        "--keep-stages",
+        action="store_true",
+        help="Keep staged loads after a successful import (deleted by default)",
+    )
+
+    args = parser.parse_args()
+
+    importer = Neo4jBulkImporter(args.import_dir)
+    try:
+        manifest = importer.run(
+            database=args.database,
+            neo4j_admin=args.neo4j_admin,
+            neo4j_home=args.neo4j_home,
+            dry_run=args.dry_run,
+            keep_stages=args.keep_stages,
+        )
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    for label, count in sorted(manifest.node_counts.items()):
+        print(f"  :{label:<28} {count:>12,}")
+    for rel_type, count in sorted(manifest.relationship_counts.items()):
+        print(f"  [:{rel_type}]{'':<{max(0, 25 - len(rel_type))}} {count:>12,}")
+    if args.dry_run:
+        print(" ".join(importer.build_command(manifest, args.database, args.neo4j_admin)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark the graph explorer export against a previously written payload.
+
+Runs the NSF lineage exporter (or, with ``--legacy-subaward-only``, the
+supplier-to-prime-family exporter) on a materialized release, reports how long
+it takes, and checks the JSON it writes is byte-identical to a baseline written
+by an earlier version of the exporter.
+
+Usage:
+    # Write the baseline with the exporter version to compare against:
+    python scripts/data/export_sbir_dib_network_web.py --output /tmp/baseline/network.json
+    python scripts/performance/benchmark_web_export.py --baseline /tmp/baseline/network.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure workspace root is importable
+_workspace_root = str(Path(__file__).resolve().parent.parent.parent)
+if _workspace_root not in sys.path:
+    sys.path.insert(0, _workspace_root)
+
+from sbir_etl.supply_chain.web_export import build_web_graph_payload
+from sbir_etl.supply_chain.web_release import export_lineage
+
+
+def _export(args: argparse.Namespace, output: Path) -> None:
+    if not args.legacy_subaward_only:
+        export_lineage(args.lineage_dir, output, allow_failed_quality=True)
+        return
+    metadata_path = args.network_dir / "sbir_dib_subaward_network.metadata.json"
+    payload = build_web_graph_payload(
+        pd.read_parquet(args.network_dir / "sbir_dib_supplier_prime_edges.parquet"),
+        pd.read_parquet(args.network_dir / "sbir_supplier_customer_exposure.parquet"),
+        metadata=json.loads(metadata_path.read_text()) if metadata_path.exists() else {},
+    )
+    output.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--lineage-dir", type=Path, default=Path("data/processed/nsf_sbir_defense_lineage")
+    )
+    parser.add_argument(
+        "--network-dir", type=Path, default=Path("data/processed/sbir_dib_subaward_network")
+    )
+    parser.add_argument("--legacy-subaward-only", action="store_true")
+    parser.add_argument("--baseline", type=Path, help="network.json from the version to compare")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    timings = []
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        output = Path(temporary_directory) / "network.json"
+        for _ in range(max(1, args.repeat)):
+            start = time.perf_counter()
+            _export(args, output)
+            timings.append(time.perf_counter() - start)
+        written = output.read_bytes()
+
+    result = {
+        "export": "legacy_subaward" if args.legacy_subaward_only else "nsf_lineage",
+        "best_seconds": round(min(timings), 3),
+        "mean_seconds": round(sum(timings) / len(timings), 3),
+        "payload_bytes": len(written),
+        "payload_sha256": hashlib.sha256(written).hexdigest(),
+    }
+    if args.baseline:
+        result["byte_identical_to_baseline"] = written == args.baseline.read_bytes()
+    print(json.dumps(result, indent=2))
+    return 0 if result.get("byte_identical_to_baseline", True) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
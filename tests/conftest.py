@@ -213,6 +213,25 @@ def sbir_csv_path(
     return sbir_award_data_csv_path if use_real_sbir_data else sbir_sample_csv_path
 
 
+# Persistent Cache Isolation
+# ==========================
+
+
+@pytest.fixture(autouse=True)
+def _isolate_persistent_caches(monkeypatch):
+    """Keep the on-disk caches that default to ``<data root>/cache`` out of the repo.
+
+    Tests that exercise a cache point its environment variable at ``tmp_path``
+    themselves, which overrides this default.
+    """
+    for env_var in (
+        "SBIR_ETL__FINGERPRINT_CACHE",
+        "SBIR_ETL__LLM_CACHE",
+        "SBIR_ETL__TEXT_INDEX",
+    ):
+        monkeypatch.setenv(env_var, "off")
+
+
 # Neo4j Test Fixtures
 # ===================
 
@@ -86,7 +86,7 @@ def test_usaspending_enrichment_job_smoke(tmp_path, monkeypatch):
     )
 
     monkeypatch.setenv("SBIR_ETL__PATHS__DATA_ROOT", str(data_root))
-    monkeypatch.setattr(enrichment_assets, "FreshnessStore", lambda: store)
+    monkeypatch.setattr(enrichment_assets, "FreshnessStore", lambda **kwargs: store)
     monkeypatch.setattr(
         enrichment_assets,
         "CheckpointStore",
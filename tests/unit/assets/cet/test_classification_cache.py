@@ -0,0 +1,110 @@
+"""Tests for the content-hash keyed CET classification cache."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sbir_analytics.assets.cet.classification_cache import (
+    CETClassificationCache,
+    config_digest,
+    content_hash,
+)
+from sbir_analytics.assets.cet.classifications import enriched_cet_patent_classifications
+
+
+pytestmark = pytest.mark.fast
+
+
+def test_cache_round_trips_and_invalidates_on_version_change(tmp_path):
+    cache = CETClassificationCache.for_kind(
+        "awards", model_version="m1", taxonomy_version="t1", cache_dir=tmp_path
+    )
+    key = content_hash("Title", "Abstract", "kw")
+    assert key == content_hash("Title", "Abstract", "kw")
+    assert key != content_hash("Title", "Abstract", "kw2")
+
+    cached, missing = cache.split([key])
+    assert cached == {} and missing == [0]
+    cache.put(key, {"primary_cet": "ai", "supporting_cets": [{"cet_id": "q", "score": 1.5}]})
+    cache.save()
+
+    reopened = CETClassificationCache(
+        tmp_path / "awards.parquet", model_version="m1", taxonomy_version="t1"
+    )
+    cached, missing = reopened.split([content_hash("new"), key])
+    assert missing == [0]
+    assert cached == {1: {"primary_cet": "ai", "supporting_cets": [{"cet_id": "q", "score": 1.5}]}}
+
+    retrained = CETClassificationCache(
+        tmp_path / "awards.parquet", model_version="m2", taxonomy_version="t1"
+    )
+    assert len(retrained) == 0
+    retrained.save()
+    assert (
+        len(CETClassificationCache(reopened.path, model_version="m1", taxonomy_version="t1")) == 0
+    )
+
+    assert config_digest({"a": 1, "b": 2}) == config_digest({"b": 2, "a": 1})
+
+
+@patch("sbir_ml.ml.models.patent_classifier.PatentFeatureExtractor")
+@patch("sbir_ml.ml.models.patent_classifier.PatentCETClassifier.load")
+@patch("sbir_analytics.assets.cet.classifications.TaxonomyLoader")
+def test_patent_asset_classifies_only_uncached_documents(
+    mock_taxonomy_loader, mock_model_load, mock_extractor_class, monkeypatch, tmp_path
+):
+    mock_loader = Mock()
+    mock_loader.load_taxonomy.return_value = Mock(version="v1")
+    mock_loader.load_classification_config.return_value = {"batch": {"size": 10}}
+    mock_taxonomy_loader.return_value = mock_loader
+    mock_extractor_class.return_value.transform.side_effect = lambda records: [
+        {"normalized_title": r["title"].lower()} for r in records
+    ]
+    classifier = Mock(taxonomy_version="v1", model_version="m1")
+    classifier.classify_batch.side_effect = lambda titles, assignees, batch_size: [
+        [Mock(cet_id=f"cet:{title}", score=90.0, taxonomy_version="v1", classified_at=None)]
+        for title in titles
+    ]
+    mock_model_load.return_value = classifier
+    monkeypatch.chdir(tmp_path)
+    input_path = tmp_path / "data/processed/transformed_patents.ndjson"
+    input_path.parent.mkdir(parents=True)
+    model_path = tmp_path / "artifacts/models/patent_classifier_v1.pkl"
+    model_path.parent.mkdir(parents=True)
+    model_path.write_bytes(b"model-1")
+
+    def run(titles):
+        input_path.write_text(
+            "\n".join(
+                json.dumps({"patent_id": f"P-{i}", "title": title})
+                for i, title in enumerate(titles)
+            )
+            + "\n"
+        )
+        classifier.classify_batch.reset_mock()
+        output = enriched_cet_patent_classifications()
+        called = [c.args[0] for c in classifier.classify_batch.call_args_list]
+        return output.metadata, called
+
+    metadata, called = run(["Quantum sensor", "Neural chip"])
+    assert called == [["quantum sensor", "neural chip"]]
+    assert metadata["classified_rows"].value == 2
+
+    metadata, called = run(["Quantum sensor", "Neural chip", "Hypersonic inlet"])
+    assert called == [["hypersonic inlet"]]
+    assert metadata["cache_hits"].value == 2
+
+    import pandas as pd
+
+    out = pd.read_parquet(tmp_path / "data/processed/cet_patent_classifications.parquet")
+    assert out["primary_cet"].tolist() == [
+        "cet:quantum sensor",
+        "cet:neural chip",
+        "cet:hypersonic inlet",
+    ]
+
+    # A retrained artifact invalidates every cached row.
+    model_path.write_bytes(b"model-2")
+    _, called = run(["Quantum sensor"])
+    assert called == [["quantum sensor"]]
@@ -101,7 +101,7 @@ def test_no_nih_reporter_sensor_is_registered() -> None:
 
 
 def _patch_stores(monkeypatch, tmp_path, store: FreshnessStore, adapter: _HermeticAdapter) -> None:
-    monkeypatch.setattr(nih_assets, "FreshnessStore", lambda: store)
+    monkeypatch.setattr(nih_assets, "FreshnessStore", lambda **kwargs: store)
     monkeypatch.setattr(
         nih_assets,
         "CheckpointStore",
@@ -149,7 +149,7 @@ def test_disabled_source_skips_adapter(tmp_path, monkeypatch) -> None:
 def test_missing_sbir_frame_fails_closed(tmp_path, monkeypatch) -> None:
     store = FreshnessStore(tmp_path / "freshness.parquet")
     adapter = _HermeticAdapter()
-    monkeypatch.setattr(nih_assets, "FreshnessStore", lambda: store)
+    monkeypatch.setattr(nih_assets, "FreshnessStore", lambda **kwargs: store)
     monkeypatch.setattr(
         nih_assets,
         "load_sbir_award_frame",
@@ -454,6 +454,48 @@ class TestSensitivityUncertainty:
         assert isinstance(result.value, pd.DataFrame)
         assert "mean_estimate" in result.value.columns
 
+    @patch("sbir_analytics.assets.fiscal_assets.get_config")
+    @patch("sbir_analytics.assets.fiscal_assets.FiscalScenarioEngine")
+    @patch("sbir_analytics.assets.fiscal_assets.FiscalTaxEstimator")
+    @patch("sbir_analytics.assets.fiscal_assets.FiscalUncertaintyQuantifier")
+    @patch("sbir_analytics.assets.fiscal_assets.performance_monitor")
+    def test_uncertainty_analysis_uses_configured_estimator(
+        self,
+        mock_perf_monitor,
+        mock_quantifier_class,
+        mock_tax_estimator_class,
+        mock_engine_class,
+        mock_get_config,
+        mock_context,
+        mock_config,
+    ):
+        """Scenario coefficients are probed with the config-driven tax estimator."""
+        from decimal import Decimal
+        from sbir_etl.transformers.fiscal.sensitivity import UncertaintyResult
+
+        mock_get_config.return_value = mock_config
+        mock_quantifier = Mock()
+        mock_quantifier.quantify_uncertainty.return_value = UncertaintyResult(
+            min_estimate=Decimal("1"),
+            mean_estimate=Decimal("2"),
+            max_estimate=Decimal("3"),
+            confidence_intervals={},
+            sensitivity_indices={},
+            quality_flags=[],
+        )
+        mock_quantifier.flag_high_uncertainty.return_value = False
+        mock_quantifier_class.return_value = mock_quantifier
+
+        scenarios_df = pd.DataFrame({"scenario_id": [1], "economic_multiplier": [2.0]})
+        tax_df = pd.DataFrame({"fiscal_year": [2021], "total_tax_receipt": [100.0]})
+
+        uncertainty_analysis(mock_context, scenarios_df, tax_df)
+
+        mock_tax_estimator_class.assert_called_once_with(config=mock_config.fiscal_analysis)
+        mock_engine_class.from_tax_estimates.assert_called_once_with(
+            tax_df, estimator=mock_tax_estimator_class.return_value
+        )
+
 
 # ==================== Reporting Tests ====================
 
@@ -66,6 +66,7 @@ def test_adapter_lookup_and_persist(tmp_path: Path) -> None:
     records = adapter.normalize(raw)
     quality = adapter.validate(records)
     proven = adapter.provenance(raw)
+    adapter.flush()
 
     assert quality.ok
     assert records[0]["success"] is True
@@ -115,6 +116,7 @@ def test_empty_lookup_is_success_and_does_not_wipe_table(tmp_path: Path) -> None
         {"award_id": "AW-1", "project_num": "1R43AI123456-01", "award_year": 2024},
         None,
     )
+    first.flush()
     empty = NIHReporterSourceAdapter(
         client=_FakeClient(records=[]),
         persist_path=dest,
@@ -124,6 +126,7 @@ def test_empty_lookup_is_success_and_does_not_wipe_table(tmp_path: Path) -> None
         None,
     )
     records = empty.normalize(raw)
+    empty.flush()
     assert records[0]["success"] is True
     assert records[0]["metadata"]["match_count"] == 0
     assert list(pd.read_parquet(dest)["appl_id"]) == ["10824314"]
@@ -151,3 +154,38 @@ def test_delta_compares_freshness_hash(tmp_path: Path) -> None:
         None,
     )
     assert adapter.normalize(raw)[0]["delta_detected"] is False
+
+
+def test_records_are_buffered_until_persist_every_awards(tmp_path: Path) -> None:
+    dest = tmp_path / "nih_reporter_awards.parquet"
+    adapter = NIHReporterSourceAdapter(client=_FakeClient(), persist_path=dest, persist_every=2)
+
+    adapter.fetch_page(
+        {"award_id": "AW-1", "project_num": "1R43AI123456-01", "award_year": 2024}, None
+    )
+    assert not dest.exists()
+
+    adapter.fetch_page(
+        {"award_id": "AW-2", "project_num": "1R43AI123456-01", "award_year": 2024}, None
+    )
+    assert list(pd.read_parquet(dest)["award_id"]) == ["AW-2"]
+
+
+def test_buffer_is_written_before_the_ledger_is_flushed(tmp_path: Path) -> None:
+    dest = tmp_path / "nih_reporter_awards.parquet"
+    store = FreshnessStore(tmp_path / "freshness.parquet", commit_every=100)
+    adapter = NIHReporterSourceAdapter(
+        _FakeClient(), freshness=store, persist_path=dest, persist_every=100
+    )
+    seen_at_flush: list[bool] = []
+    store.add_flush_hook(lambda: seen_at_flush.append(dest.exists()))
+
+    adapter.fetch_page(
+        {"award_id": "AW-1", "project_num": "1R43AI123456-01", "award_year": 2024}, None
+    )
+    assert not dest.exists()
+
+    store.flush()
+
+    assert seen_at_flush == [True]
+    assert list(pd.read_parquet(dest)["award_id"]) == ["AW-1"]
@@ -7,7 +7,13 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from sbir_etl.enrichers.nih_reporter.persist import upsert_nih_reporter_awards
+from sbir_etl.enrichers.nih_reporter.persist import (
+    compact_nih_reporter_awards,
+    read_nih_reporter_awards,
+    upsert_key_bucket,
+    upsert_nih_reporter_award_batches,
+    upsert_nih_reporter_awards,
+)
 from sbir_etl.enrichers.nih_reporter.schema import NIHReporterRecord
 
 
@@ -58,3 +64,92 @@ def test_unreadable_existing_file_raises_instead_of_silently_wiping(tmp_path: Pa
     dest.write_text("not a parquet file")
     with pytest.raises(Exception):  # noqa: B017 - pandas' parquet engine error type
         upsert_nih_reporter_awards([_record("99")], award_id="AW-1", path=dest)
+
+
+def _parts(dest: Path) -> dict[str, float]:
+    return {
+        str(part.relative_to(dest)): part.stat().st_mtime_ns for part in dest.rglob("*.parquet")
+    }
+
+
+def _project(index: int) -> str:
+    return f"1R43AI{index:06d}-01"
+
+
+def test_upsert_rewrites_only_the_touched_bucket(tmp_path: Path) -> None:
+    dest = tmp_path / "nih_reporter_awards.parquet"
+    upsert_nih_reporter_award_batches(
+        [(f"AW-{i}", [_record(str(i), project_num=_project(i))]) for i in range(40)],
+        path=dest,
+    )
+    before = _parts(dest)
+
+    upsert_nih_reporter_awards(
+        [_record("500", project_num=_project(3))], award_id="AW-3", path=dest
+    )
+
+    after = _parts(dest)
+    bucket = f"bucket={upsert_key_bucket(f'{_project(3)}|2024'):02d}"
+    untouched = {name: mtime for name, mtime in before.items() if not name.startswith(bucket)}
+    assert {name: after[name] for name in untouched} == untouched
+    stored = read_nih_reporter_awards(dest)
+    assert len(stored) == 40
+    assert stored.loc[stored["award_id"] == "AW-3", "appl_id"].tolist() == ["500"]
+
+
+def test_compaction_merges_parts_and_keeps_the_logical_table(tmp_path: Path) -> None:
+    dest = tmp_path / "nih_reporter_awards.parquet"
+    for i in range(12):
+        upsert_nih_reporter_awards(
+            [_record(str(i), project_num=_project(i % 6))], award_id=f"AW-{i}", path=dest
+        )
+    expected = read_nih_reporter_awards(dest).sort_values("appl_id", ignore_index=True)
+
+    stats = compact_nih_reporter_awards(dest)
+
+    compacted = read_nih_reporter_awards(dest).sort_values("appl_id", ignore_index=True)
+    pd.testing.assert_frame_equal(compacted, expected)
+    assert set(compacted["appl_id"]) == {str(i) for i in range(6, 12)}
+    assert stats["rows"] == 6
+    buckets = [path for path in dest.iterdir() if path.is_dir()]
+    assert all(len(list(bucket.glob("*.parquet"))) == 1 for bucket in buckets)
+
+
+def test_bucket_past_max_parts_is_compacted_on_upsert(tmp_path: Path) -> None:
+    dest = tmp_path / "nih_reporter_awards.parquet"
+    for i in range(5):
+        upsert_nih_reporter_award_batches(
+            [(f"AW-{i}", [_record(str(i), project_num=_project(i))])],
+            path=dest,
+            buckets=1,
+            max_parts=3,
+        )
+        assert len(list(dest.rglob("*.parquet"))) <= 3
+
+    stored = read_nih_reporter_awards(dest)
+    assert sorted(stored["appl_id"]) == [str(i) for i in range(5)]
+
+
+def test_single_file_table_is_migrated_on_first_upsert(tmp_path: Path) -> None:
+    dest = tmp_path / "nih_reporter_awards.parquet"
+    pd.DataFrame(
+        [
+            {
+                "appl_id": "10",
+                "fy": 2024,
+                "project_num": "1R43AI123456-01",
+                "award_id": "AW-1",
+                "project_num_canonical": "1R43AI123456-01",
+                "upsert_key": "1R43AI123456-01|2024",
+            }
+        ]
+    ).to_parquet(dest, index=False)
+
+    upsert_nih_reporter_awards(
+        [_record("20", project_num="1R44CA000001-01")], award_id="AW-2", path=dest
+    )
+
+    assert dest.is_dir()
+    stored = read_nih_reporter_awards(dest)
+    assert sorted(stored["appl_id"]) == ["10", "20"]
+    assert set(pd.read_parquet(dest)["upsert_key"]) == set(stored["upsert_key"])
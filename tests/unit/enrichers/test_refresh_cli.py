@@ -78,7 +78,7 @@ def _stale_store(tmp_path, award_id: str = "AW-CLI") -> FreshnessStore:
 
 
 def _patch_cli(monkeypatch, store: FreshnessStore, enriched: pd.DataFrame | None) -> None:
-    monkeypatch.setattr("sbir_etl.enrichers.refresh_cli.FreshnessStore", lambda: store)
+    monkeypatch.setattr("sbir_etl.enrichers.refresh_cli.FreshnessStore", lambda **kwargs: store)
     monkeypatch.setattr(
         "sbir_etl.enrichers.refresh_cli.load_enriched_awards", lambda *a, **k: enriched
     )
@@ -263,7 +263,7 @@ def _enable_nih(monkeypatch) -> None:
 
 def _patch_nih_cli(monkeypatch, store: FreshnessStore, awards: pd.DataFrame) -> None:
     _enable_nih(monkeypatch)
-    monkeypatch.setattr("sbir_etl.enrichers.refresh_cli.FreshnessStore", lambda: store)
+    monkeypatch.setattr("sbir_etl.enrichers.refresh_cli.FreshnessStore", lambda **kwargs: store)
     monkeypatch.setattr(
         "sbir_etl.enrichers.refresh_cli.load_sbir_award_frame", lambda *a, **k: awards
     )
@@ -275,7 +275,7 @@ def _patch_nih_cli(monkeypatch, store: FreshnessStore, awards: pd.DataFrame) ->
 
 def test_nih_help_and_disabled_source_exits(tmp_path, monkeypatch) -> None:
     store = FreshnessStore(tmp_path / "freshness.parquet")
-    monkeypatch.setattr("sbir_etl.enrichers.refresh_cli.FreshnessStore", lambda: store)
+    monkeypatch.setattr("sbir_etl.enrichers.refresh_cli.FreshnessStore", lambda **kwargs: store)
     with pytest.raises(SystemExit, match="disabled"):
         run_refresh(source="nih_reporter", adapter=_NIHAdapter(), runner=_runner(tmp_path, store))
 
@@ -310,7 +310,7 @@ def test_nih_date_window_is_criteria_not_a_local_date_filter(tmp_path, monkeypat
 def test_nih_missing_sbir_frame_fails_fast(tmp_path, monkeypatch) -> None:
     store = FreshnessStore(tmp_path / "freshness.parquet")
     _enable_nih(monkeypatch)
-    monkeypatch.setattr("sbir_etl.enrichers.refresh_cli.FreshnessStore", lambda: store)
+    monkeypatch.setattr("sbir_etl.enrichers.refresh_cli.FreshnessStore", lambda **kwargs: store)
 
     def _missing(*_args, **_kwargs):
         raise FileNotFoundError("SBIR.gov award CSV is unavailable")
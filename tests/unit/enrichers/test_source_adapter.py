@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
 from typing import Any
@@ -15,7 +16,7 @@ from sbir_etl.enrichers.source_adapter import (
     SourceRefreshRunner,
 )
 from sbir_etl.enrichers.usaspending.adapter import USAspendingSourceAdapter
-from sbir_etl.utils.enrichment.checkpoints import CheckpointStore
+from sbir_etl.utils.enrichment.checkpoints import CheckpointStore, EnrichmentCheckpoint
 from sbir_etl.utils.enrichment.freshness import FreshnessStore
 
 
@@ -139,7 +140,7 @@ def test_resume_skips_succeeded_and_retries_failed(tmp_path) -> None:
     checkpoint = checkpoints.load_checkpoint("part-1", "usaspending")
     assert checkpoint is not None
     # A1 succeeded; A2 failed and must not be recorded as processed.
-    assert set(checkpoint.metadata["processed_ids"]) == {"A1"}
+    assert checkpoints.load_processed("part-1", "usaspending") == {"A1"}
 
     resumed = FakeAdapter()
     stats = runner.refresh_records(resumed, records)
@@ -171,6 +172,149 @@ def test_checkpoint_interval_limits_writes(tmp_path) -> None:
     assert saves == ["A4", "A9"]
 
 
+class SlowAsyncAdapter(FakeAdapter):
+    """Async fetches that hold until ``width`` of them overlap."""
+
+    def __init__(self, failing: frozenset[str] = frozenset(), width: int = 1) -> None:
+        super().__init__()
+        self.failing = failing
+        self.width = width
+        self.active = 0
+        self.peak = 0
+        self.completed = 0
+        self._overlapped = asyncio.Event()
+
+    def fetch_page(self, request: Mapping[str, Any], cursor: str | None) -> RawPage:
+        if request["award_id"] in self.failing:
+            raise RuntimeError("upstream 503")
+        return super().fetch_page(request, cursor)
+
+    async def afetch_page(self, request: Mapping[str, Any], cursor: str | None) -> RawPage:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        if self.active >= self.width:
+            self._overlapped.set()
+        try:
+            await self._overlapped.wait()
+            return self.fetch_page(request, cursor)
+        finally:
+            self.active -= 1
+            self.completed += 1
+
+
+def test_concurrent_pass_bounds_in_flight_and_matches_sequential(tmp_path) -> None:
+    records = [{"award_id": f"A{i}"} for i in range(20)]
+    results = {}
+    for concurrency in (1, 4):
+        freshness = FreshnessStore(tmp_path / f"freshness-{concurrency}.parquet")
+        checkpoints = CheckpointStore(tmp_path / f"checkpoints-{concurrency}.parquet")
+        adapter = SlowAsyncAdapter(failing=frozenset({"A7"}), width=4)
+        runner = SourceRefreshRunner(
+            freshness=freshness,
+            checkpoints=checkpoints,
+            partition_id="part-1",
+            checkpoint_interval=5,
+            concurrency=concurrency,
+        )
+        stats = runner.refresh_records(adapter, records)
+        results[concurrency] = stats
+        assert checkpoints.load_checkpoint("part-1", "usaspending") is None
+        assert freshness.get_record("A7", "usaspending").status.value == "failed"
+
+    sequential, concurrent = results[1], results[4]
+    assert (concurrent.success, concurrent.failed) == (sequential.success, sequential.failed)
+    assert (concurrent.success, concurrent.failed) == (19, 1)
+    assert concurrent.peak_in_flight == adapter.peak == 4
+    assert concurrent.as_dict()["records_per_second"] > 0
+
+
+def test_concurrent_resume_skips_succeeded_and_retries_failed(tmp_path) -> None:
+    freshness = FreshnessStore(tmp_path / "freshness.parquet")
+    checkpoints = CheckpointStore(tmp_path / "checkpoints.parquet")
+    runner = SourceRefreshRunner(
+        freshness=freshness,
+        checkpoints=checkpoints,
+        partition_id="part-1",
+        checkpoint_interval=1,
+        concurrency=3,
+    )
+    records = [{"award_id": f"A{i}"} for i in range(6)]
+
+    class _Stop(BaseException):
+        pass
+
+    class _CrashingAdapter(SlowAsyncAdapter):
+        async def afetch_page(self, request, cursor):
+            if request["award_id"] == "A5":
+                # Crash once every other award has finished.
+                while self.completed < 5:
+                    await asyncio.sleep(0)
+                raise _Stop
+            return await super().afetch_page(request, cursor)
+
+    with pytest.raises(_Stop):
+        runner.refresh_records(_CrashingAdapter(failing=frozenset({"A1"})), records)
+
+    checkpoint = checkpoints.load_checkpoint("part-1", "usaspending")
+    assert checkpoint is not None
+    assert checkpoints.load_processed("part-1", "usaspending") == {"A0", "A2", "A3", "A4"}
+
+    resumed = SlowAsyncAdapter()
+    stats = runner.refresh_records(resumed, records)
+    assert stats.skipped == 4
+    assert sorted(resumed.fetched) == ["A1", "A5"]
+
+
+def test_checkpoints_append_only_newly_processed_ids(tmp_path) -> None:
+    checkpoints = CheckpointStore(tmp_path / "checkpoints.parquet")
+    appended: list[list[str]] = []
+    original = checkpoints.record_processed
+
+    def _recording(partition_id, source, award_ids):
+        appended.append(list(award_ids))
+        return original(partition_id, source, award_ids)
+
+    checkpoints.record_processed = _recording  # type: ignore[method-assign]
+    runner = SourceRefreshRunner(
+        freshness=FreshnessStore(tmp_path / "freshness.parquet"),
+        checkpoints=checkpoints,
+        partition_id="part-1",
+        checkpoint_interval=3,
+    )
+
+    runner.refresh_records(FakeAdapter(), [{"award_id": f"A{i}"} for i in range(7)])
+
+    assert appended == [["A0", "A1", "A2"], ["A3", "A4", "A5"]]
+
+
+def test_resume_reads_inline_ids_from_older_checkpoints(tmp_path) -> None:
+    checkpoints = CheckpointStore(tmp_path / "checkpoints.parquet")
+    checkpoints.save_checkpoint(
+        EnrichmentCheckpoint(
+            partition_id="part-1",
+            source="usaspending",
+            last_processed_award_id="A1",
+            last_success_timestamp=None,
+            records_processed=1,
+            records_failed=0,
+            records_total=3,
+            checkpoint_timestamp=datetime.now(UTC),
+            metadata={"processed_ids": ["A1"]},
+        )
+    )
+    adapter = FakeAdapter()
+    runner = SourceRefreshRunner(
+        freshness=FreshnessStore(tmp_path / "freshness.parquet"),
+        checkpoints=checkpoints,
+        partition_id="part-1",
+    )
+
+    stats = runner.refresh_records(adapter, [{"award_id": f"A{i}"} for i in range(3)])
+
+    assert stats.skipped == 1
+    assert adapter.fetched == ["A0", "A2"]
+
+
 class _FakeClient:
     def __init__(self) -> None:
         self.calls: list[str] = []
@@ -198,3 +342,20 @@ def test_usaspending_adapter_uses_client_without_network() -> None:
     assert records[0]["success"] is True
     assert proven.content_hash == "deadbeef"
     assert client.calls == ["AW-1"]
+
+
+def test_runner_drives_usaspending_adapter_concurrently(tmp_path) -> None:
+    client = _FakeClient()
+    runner = SourceRefreshRunner(
+        freshness=FreshnessStore(tmp_path / "freshness.parquet"),
+        checkpoints=CheckpointStore(tmp_path / "checkpoints.parquet"),
+        concurrency=2,
+        requests_per_minute=6000,
+    )
+
+    stats = runner.refresh_records(
+        USAspendingSourceAdapter(client=client), [{"award_id": "AW-1"}, {"award_id": "AW-2"}]
+    )
+
+    assert stats.success == 2
+    assert sorted(client.calls) == ["AW-1", "AW-2"]
@@ -399,3 +399,75 @@ def test_multiple_batches_fail_instead_of_dropping_unknown_metadata(tmp_path) ->
 
     assert output.read_bytes() == b"stale"
     assert not (tmp_path / ".contracts.tmp.parquet").exists()
+
+
+def _columnar_parity_rows(fixture_rows: list[dict[str, str | None]]) -> list[dict]:
+    rows = [dict(row) for row in fixture_rows]
+    rows.append(
+        _row(
+            transaction_unique_id="TX-IDV",
+            piid="",
+            contract_award_type=" bpa ",
+            recipient_uei=None,
+            recipient_unique_id="XYZ123456789",  # pragma: allowlist secret
+            period_of_performance_current_end_date="2024-01-01",
+        )
+    )
+    rows.append(
+        _row(
+            transaction_unique_id="TX-SPARSE",
+            action_date=None,
+            federal_action_obligation="not-a-number",
+            extent_competed="LIMITED SOURCES",
+        )
+    )
+    return rows
+
+
+def test_columnar_frame_matches_model_dump_frame_and_statistics(
+    sample_child_contract_row, sample_malformed_date_row, sample_negative_amount_row
+) -> None:
+    rows = _columnar_parity_rows(
+        [sample_child_contract_row, sample_malformed_date_row, sample_negative_amount_row]
+    )
+    model_extractor = ContractExtractor()
+    columnar_extractor = ContractExtractor()
+    expected = pd.DataFrame.from_records(
+        [model_extractor._parse_contract_row(row).model_dump() for row in rows]
+    )
+
+    frame = columnar_extractor._contract_frame(rows)
+
+    pd.testing.assert_frame_equal(frame, expected)
+    assert frame["metadata"].tolist() == expected["metadata"].tolist()
+    assert columnar_extractor.stats == model_extractor.stats
+    assert columnar_extractor._parent_ids_seen == model_extractor._parent_ids_seen
+    assert columnar_extractor._idv_parent_ids_seen == model_extractor._idv_parent_ids_seen
+
+
+@pytest.mark.parametrize("batch_size", [1, 100])
+def test_columnar_writer_output_matches_model_writer(
+    tmp_path, batch_size, sample_child_contract_row, sample_negative_amount_row
+) -> None:
+    rows = _columnar_parity_rows([sample_child_contract_row, sample_negative_amount_row])
+    model_extractor = ContractExtractor(batch_size=batch_size)
+    contracts = [model_extractor._parse_contract_row(row) for row in rows]
+
+    model_count = model_extractor._collect_and_write(contracts, tmp_path / "model.parquet")
+    row_count = ContractExtractor(batch_size=batch_size)._collect_and_write(
+        iter(rows), tmp_path / "columnar.parquet"
+    )
+
+    assert row_count == model_count == len(rows)
+    assert pq.read_table(tmp_path / "columnar.parquet").equals(
+        pq.read_table(tmp_path / "model.parquet"), check_metadata=True
+    )
+
+
+def test_columnar_writer_requires_both_stable_keys(tmp_path) -> None:
+    output = tmp_path / "contracts.parquet"
+    with pytest.raises(SourceDataError, match="missing generated_unique_award_id"):
+        ContractExtractor()._collect_and_write(
+            [_row(), _row(transaction_unique_id="TX-2", generated_unique_award_id="")], output
+        )
+    assert not output.exists()
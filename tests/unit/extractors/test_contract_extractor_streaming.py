@@ -13,6 +13,7 @@ from unittest.mock import patch
 
 import pytest
 
+from sbir_etl.extractors import contract_extractor
 from sbir_etl.extractors.contract_extractor import (
     ArchiveSchemaError,
     ContractExtractor,
@@ -222,6 +223,85 @@ def test_remote_awk_prefilter_preserves_full_scan_statistics(
     assert extractor.stats["records_extracted"] == 1
 
 
+def _stream_member(extractor: ContractExtractor, payload: bytes, columns, *, fpds_only: bool):
+    member_name = "archive/9247.dat.gz"
+    with patch.dict(
+        sys.modules,
+        {"remotezip": _fake_remotezip_module({member_name: gzip.compress(payload)})},
+    ):
+        return list(
+            extractor.stream_remote_zip_member(
+                "https://example.test/archive.zip",
+                member_name,
+                columns,
+                fpds_only=fpds_only,
+            )
+        )
+
+
+def test_parallel_scan_matches_serial_contracts_and_statistics(
+    monkeypatch,
+    sample_vendor_filters,
+    sample_contract_row_full,
+    sample_grant_row,
+    contract_copy_columns,
+) -> None:
+    unmatched = dict(sample_contract_row_full)
+    unmatched.update(
+        {
+            "recipient_uei": "NOPE00000001",
+            "recipient_unique_id": "000000000",
+            "recipient_name": "UNMATCHED COMPANY",
+        }
+    )
+    rows = []
+    for index in range(12):
+        matched = dict(sample_contract_row_full)
+        matched["piid"] = f"PIID{index:04d}"
+        rows.extend([matched, unmatched, sample_grant_row])
+    text = _row_text(rows, contract_copy_columns).replace("\n", "\r\n", 5)
+    payload = f"{text}\r\n\\.\n\n".encode()
+    # Small blocks split the stream across many workers and line endings.
+    monkeypatch.setattr(contract_extractor, "PARALLEL_SCAN_BLOCK_BYTES", 700)
+
+    serial = ContractExtractor(vendor_filter_file=sample_vendor_filters)
+    parallel = ContractExtractor(vendor_filter_file=sample_vendor_filters, scan_workers=2)
+    expected = _stream_member(serial, payload, contract_copy_columns, fpds_only=False)
+    actual = _stream_member(parallel, payload, contract_copy_columns, fpds_only=False)
+
+    assert [c.contract_id for c in actual] == [c.contract_id for c in expected]
+    assert len(actual) == 12
+    assert parallel.stats == serial.stats
+    assert parallel.source_provenance == serial.source_provenance
+
+
+@pytest.mark.parametrize(
+    ("tail", "error"),
+    [
+        ("bad\tdata\n", r"row 26 has 2 fields; COPY declares"),
+        ("\\.\n\n{row}\n", r"line 28 contains non-empty data after COPY terminator"),
+    ],
+)
+def test_parallel_scan_fails_closed_at_the_serial_position(
+    monkeypatch,
+    sample_vendor_filters,
+    sample_contract_row_full,
+    contract_copy_columns,
+    tail,
+    error,
+) -> None:
+    row = _row_text([sample_contract_row_full], contract_copy_columns)
+    payload = ("".join(f"{row}\n" for _ in range(25)) + tail.format(row=row)).encode()
+    monkeypatch.setattr(contract_extractor, "PARALLEL_SCAN_BLOCK_BYTES", 500)
+    extractor = ContractExtractor(vendor_filter_file=sample_vendor_filters, scan_workers=3)
+
+    with pytest.raises(SourceDataError, match=error):
+        _stream_member(extractor, payload, contract_copy_columns, fpds_only=True)
+
+    # Every row before the failure was still extracted, as in the serial scan.
+    assert extractor.stats["records_extracted"] == 25
+
+
 def test_remote_awk_prefilter_decodes_copy_escaped_vendor_name(
     tmp_path,
     sample_contract_row_full,
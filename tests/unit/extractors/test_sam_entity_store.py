@@ -0,0 +1,118 @@
+"""Tests for the key-indexed SAM.gov entity store."""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from sbir_etl.extractors.sam_entity_store import SAMEntityStore, extract_source_date
+from sbir_etl.extractors.sam_gov import SAMGovExtractor
+
+
+pytestmark = pytest.mark.fast
+
+
+def _extract(n: int = 40) -> pd.DataFrame:
+    # Shuffled UEIs with one duplicate registration, so lookups must honour
+    # source order and keys spill across row-group boundaries.
+    ueis = [f"UEI{(i * 7) % n:05d}" for i in range(n)]
+    ueis[-1] = ueis[3]
+    return pd.DataFrame(
+        {
+            "unique_entity_id": ueis,
+            "cage_code": [f"C{i % 15:04d}" if i % 5 else None for i in range(n)],
+            "duns_number": [f"{i % 10:09d}" for i in range(n)],
+            "legal_business_name": [f"Company {i}" for i in range(n)],
+        }
+    )
+
+
+def _write(path, df, source_date=None):
+    df.to_parquet(path, index=False)
+    if source_date is not None:
+        path.with_name(f"{path.stem}.meta.json").write_text(
+            json.dumps({"source_date": source_date})
+        )
+    return path
+
+
+@pytest.fixture
+def extract(tmp_path):
+    return _write(tmp_path / "sam_entity_records.parquet", _extract(), "20250101")
+
+
+@pytest.fixture
+def store(extract, tmp_path):
+    return SAMEntityStore.build(extract, tmp_path / "store", row_group_size=4)
+
+
+def _first(df, column, value):
+    matches = df[df[column] == value]
+    return matches.iloc[0] if len(matches) else None
+
+
+def test_lookups_match_dataframe_scan(store, extract):
+    df = pd.read_parquet(extract)
+    assert len(store) == len(df)
+
+    for uei in df["unique_entity_id"].unique():
+        assert store.get(uei).to_dict() == _first(df, "unique_entity_id", uei).to_dict()
+    assert store.get("UEI00021")["legal_business_name"] == "Company 3"
+    assert store.get("MISSING") is None
+
+    for cage in df["cage_code"].dropna().unique():
+        assert store.get_by_cage(cage).to_dict() == _first(df, "cage_code", cage).to_dict()
+    assert store.get_by_cage("NOPE") is None
+
+    duns = store.get_by_duns("000000003")
+    expected = df[df["duns_number"] == "000000003"].reset_index(drop=True)
+    pd.testing.assert_frame_equal(duns, expected)
+
+
+def test_get_many_returns_request_order_and_columns(store):
+    frame = store.get_many(
+        ["UEI00021", "MISSING", "UEI00003", "UEI00021", ""],
+        columns=["legal_business_name"],
+    )
+    assert frame.columns.tolist() == ["unique_entity_id", "legal_business_name"]
+    assert frame["unique_entity_id"].tolist() == ["UEI00021", "UEI00003"]
+    assert frame["legal_business_name"].tolist() == ["Company 3", "Company 29"]
+
+    by_cage = store.get_many_by_cage(["C0014", "C0001"])
+    assert by_cage["cage_code"].tolist() == ["C0014", "C0001"]
+    assert store.get_many([]).empty
+
+
+def test_refresh_rebuilds_only_for_newer_extract(store, extract, tmp_path):
+    store_dir = tmp_path / "store"
+    version = store.manifest.version
+    assert SAMEntityStore.refresh(extract, store_dir).manifest.version == version
+
+    older = _write(tmp_path / "sam_entity_records_20241201.parquet", _extract(10))
+    assert extract_source_date(older) == "20241201"
+    assert SAMEntityStore.refresh(older, store_dir).manifest.version == version
+
+    newer_df = _extract().assign(legal_business_name="Renamed")
+    _write(extract, newer_df, "20250201")
+    os.utime(extract, ns=(0, store.manifest.source_mtime_ns + 1_000_000))
+    refreshed = SAMEntityStore.refresh(extract, store_dir)
+    assert refreshed.manifest.source_date == "20250201"
+    assert refreshed.get("UEI00003")["legal_business_name"] == "Renamed"
+    assert [p.name for p in store_dir.iterdir() if p.is_dir()] == [refreshed.manifest.version]
+
+    # A reader opened on the previous version keeps answering from its maps.
+    assert store.get("UEI00021")["legal_business_name"] == "Company 3"
+
+
+def test_extractor_opens_store_and_dispatches_lookups(extract, tmp_path):
+    config = MagicMock()
+    config.extraction.sam_gov.parquet_path = str(extract)
+    with patch("sbir_etl.extractors.sam_gov.get_config", return_value=config):
+        extractor = SAMGovExtractor()
+
+    store = extractor.open_entity_store(store_dir=tmp_path / "store")
+    assert extractor.get_entity_by_uei(store, "UEI00007")["legal_business_name"] == "Company 1"
+    assert extractor.get_entity_by_cage(store, "C0002")["unique_entity_id"] == "UEI00014"
+    assert len(extractor.get_entities_by_duns(store, "000000001")) == 4
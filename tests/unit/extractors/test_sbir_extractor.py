@@ -130,6 +130,7 @@ class TestSbirDuckDBExtractorImport:
         mock_duckdb_client.import_csv_incremental.assert_called_once()
         call_args = mock_duckdb_client.import_csv_incremental.call_args
         assert call_args.kwargs.get("batch_size") == 1000
+        assert call_args.kwargs.get("engine") == "arrow"
 
     @patch("sbir_etl.extractors.sbir.resolve_data_path")
     @patch("sbir_etl.extractors.sbir.DuckDBClient")
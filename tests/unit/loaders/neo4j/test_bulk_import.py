@@ -0,0 +1,277 @@
+"""Tests for the offline Neo4j bulk-import mode."""
+
+import csv
+import json
+import subprocess
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbir_graph.loaders.neo4j.bulk_import import (
+    ARRAY_DELIMITER,
+    BulkImportClient,
+    Neo4jBulkImporter,
+    bulk_import_client_from_env,
+)
+from sbir_graph.loaders.neo4j.organizations import OrganizationLoader
+from sbir_graph.loaders.neo4j.transitions import TransitionLoader
+
+
+pytestmark = pytest.mark.fast
+
+
+def _read(path):
+    with path.open(newline="", encoding="utf-8") as handle:
+        return list(csv.reader(handle))
+
+
+def _records(manifest, kind, name):
+    files = manifest.node_files if kind == "nodes" else manifest.relationship_files
+    header_path, data_path = next((h, d) for n, h, d in files if n == name)
+    header = _read(header_path)[0]
+    return header, [dict(zip(header, row, strict=True)) for row in _read(data_path)]
+
+
+@pytest.fixture
+def import_dir(tmp_path):
+    return tmp_path / "neo4j_import"
+
+
+def test_stages_replay_with_merge_semantics(import_dir):
+    with BulkImportClient(import_dir, "awards") as client:
+        metrics = client.batch_upsert_nodes(
+            "FinancialTransaction",
+            "transaction_id",
+            [
+                {"transaction_id": "txn_award_1", "award_id": "1", "amount": 100, "agency": "DOD"},
+                {"transaction_id": "txn_award_2", "award_id": "2", "amount": 50.5},
+                {"transaction_id": None, "award_id": "3"},
+            ],
+        )
+        client.batch_upsert_organizations_with_multi_key(
+            [
+                {"organization_id": "org_company_A", "uei": "UEI1", "name": "Acme"},
+                {"organization_id": "org_company_NAME:ACME", "uei": "UEI1", "city": "Reno"},
+            ]
+        )
+        client.batch_create_relationships(
+            [
+                (
+                    "FinancialTransaction",
+                    "transaction_id",
+                    "txn_award_1",
+                    "Organization",
+                    "organization_id",
+                    "org_company_NAME:ACME",
+                    "RECIPIENT_OF",
+                    None,
+                ),
+                (
+                    "FinancialTransaction",
+                    "transaction_id",
+                    "txn_award_1",
+                    "Organization",
+                    "organization_id",
+                    "org_company_A",
+                    "RECIPIENT_OF",
+                    {"weight": 1},
+                ),
+                (
+                    "FinancialTransaction",
+                    "transaction_id",
+                    "txn_award_9",
+                    "Organization",
+                    "organization_id",
+                    "org_company_A",
+                    "RECIPIENT_OF",
+                    None,
+                ),
+            ]
+        )
+    assert metrics.errors == 1
+
+    with BulkImportClient(import_dir, "enrichment") as client:
+        client.batch_upsert_nodes(
+            "FinancialTransaction",
+            "transaction_id",
+            [{"transaction_id": "txn_award_1", "amount": 125, "tags": ["a;b", "c"]}],
+        )
+        client.batch_set_existing_node_properties(
+            "FinancialTransaction",
+            "award_id",
+            [{"award_id": "2", "cet_primary": "ai"}, {"award_id": "404", "cet_primary": "x"}],
+        )
+
+    manifest = Neo4jBulkImporter(import_dir).write_import_files()
+
+    header, awards = _records(manifest, "nodes", "FinancialTransaction")
+    assert header[0] == ":ID(FinancialTransaction)"
+    assert "amount:double" in header and "tags:string[]" in header
+    by_id = {row["transaction_id:string"]: row for row in awards}
+    assert by_id["txn_award_1"]["amount:double"] == "125.0"
+    assert by_id["txn_award_1"]["agency:string"] == "DOD"
+    assert by_id["txn_award_1"]["tags:string[]"] == f"a;b{ARRAY_DELIMITER}c"
+    assert by_id["txn_award_2"]["cet_primary:string"] == "ai"
+
+    _, orgs = _records(manifest, "nodes", "Organization")
+    assert len(orgs) == 1
+    assert orgs[0]["organization_id:string"] == "org_company_A"
+    assert orgs[0]["city:string"] == "Reno"
+    assert orgs[0]["__merged_from:string[]"] == "org_company_NAME:ACME"
+
+    rel_header, rels = _records(manifest, "relationships", "RECIPIENT_OF")
+    assert rel_header == [
+        ":START_ID(FinancialTransaction)",
+        "weight:long",
+        ":END_ID(Organization)",
+    ]
+    assert len(rels) == 1 and rels[0]["weight:long"] == "1"
+    assert manifest.unresolved_relationships == 1
+    assert manifest.node_counts == {"FinancialTransaction": 2, "Organization": 1}
+
+
+def test_organization_loader_and_transitions_stage_through_client(import_dir):
+    with BulkImportClient(import_dir, "graph") as client:
+        client.batch_upsert_nodes(
+            "FinancialTransaction", "transaction_id", [{"transaction_id": "txn_award_a1"}]
+        )
+        client.batch_upsert_nodes("CETArea", "cet_id", [{"cet_id": "ai"}])
+        client.batch_upsert_nodes(
+            "Organization",
+            "organization_id",
+            [{"organization_id": "org_agency_DOD"}, {"organization_id": "org_agency_DOD_AF"}],
+        )
+        OrganizationLoader(client).create_subsidiary_relationships(
+            [("organization_id", "org_agency_DOD_AF", "organization_id", "org_agency_DOD")],
+            source="AGENCY_HIERARCHY",
+        )
+
+        loader = TransitionLoader(client)
+        assert loader.bulk_import
+        stats = loader.load_transitions(
+            pd.DataFrame(
+                {
+                    "transition_id": ["t1"],
+                    "award_id": ["a1"],
+                    "contract_id": [" C9 "],
+                    "likelihood_score": [0.8],
+                    "confidence": ["high"],
+                    "signals": ["[]"],
+                    "evidence": ["{}"],
+                    "detected_at": ["2024-01-02T03:04:05"],
+                    "vendor_match_score": [0.9],
+                    "cet_area": ["ai"],
+                }
+            )
+        )
+    assert stats["transitions_created"] == 1
+
+    manifest = Neo4jBulkImporter(import_dir).write_import_files()
+
+    header, transitions = _records(manifest, "nodes", "Transition")
+    assert "detected_at:datetime" in header
+    assert transitions[0]["detected_at:datetime"] == "2024-01-02T03:04:05+00:00"
+    _, contracts = _records(manifest, "nodes", "FinancialTransaction")
+    assert {row["transaction_id:string"] for row in contracts} == {
+        "txn_award_a1",
+        "txn_contract_C9",
+    }
+    assert manifest.relationship_counts == {
+        "SUBSIDIARY_OF": 1,
+        "TRANSITIONED_TO": 1,
+        "RESULTED_IN": 1,
+        "INVOLVES_TECHNOLOGY": 1,
+    }
+
+
+def test_run_invokes_neo4j_admin_import_full(import_dir, tmp_path):
+    with BulkImportClient(import_dir, "patents") as client:
+        client.batch_upsert_nodes(
+            "Patent", "grant_doc_num", [{"grant_doc_num": "1", "grant_date": date(2020, 1, 2)}]
+        )
+
+    importer = Neo4jBulkImporter(import_dir)
+    with patch("sbir_graph.loaders.neo4j.bulk_import.subprocess.run") as run:
+        manifest = importer.run(database="graph", neo4j_home=tmp_path / "neo4j")
+
+    command = run.call_args.args[0]
+    assert command[:5] == ["neo4j-admin", "database", "import", "full", "graph"]
+    header, data = manifest.node_files[0][1:]
+    assert f"--nodes=Patent={header},{data}" in command
+    assert "--overwrite-destination=true" in command
+    assert run.call_args.kwargs["env"]["NEO4J_HOME"] == str(tmp_path / "neo4j")
+    assert _read(header) == [[":ID(Patent)", "grant_doc_num:string", "grant_date:date"]]
+    assert _read(data) == [["0", "1", "2020-01-02"]]
+    assert importer.stage_paths() == []
+
+
+def test_stages_are_json_lines_that_keep_value_types(import_dir):
+    with BulkImportClient(import_dir, "typed") as client:
+        client.batch_upsert_nodes(
+            "Award",
+            "award_id",
+            [
+                {
+                    "award_id": "a1",
+                    "amount": np.int64(7),
+                    "active": np.bool_(True),
+                    "score": np.float64(0.5),
+                    "awarded_at": pd.Timestamp("2024-01-02T03:04:05", tz="UTC"),
+                    "missing": pd.NaT,
+                }
+            ],
+        )
+    stage_lines = client.stage_path.read_text(encoding="utf-8").splitlines()
+    assert client.stage_path.suffix == ".jsonl"
+    assert json.loads(stage_lines[0])[0] == "upsert_nodes"
+
+    manifest = Neo4jBulkImporter(import_dir).write_import_files()
+
+    header, rows = _records(manifest, "nodes", "Award")
+    assert header[1:] == [
+        "award_id:string",
+        "amount:long",
+        "active:boolean",
+        "score:double",
+        "awarded_at:datetime",
+    ]
+    assert rows[0]["awarded_at:datetime"] == "2024-01-02T03:04:05+00:00"
+    assert rows[0]["amount:long"] == "7" and rows[0]["active:boolean"] == "true"
+
+
+def test_run_keeps_stages_on_request_and_on_dry_run(import_dir):
+    with BulkImportClient(import_dir, "patents") as client:
+        client.batch_upsert_nodes("Patent", "grant_doc_num", [{"grant_doc_num": "1"}])
+    importer = Neo4jBulkImporter(import_dir)
+
+    importer.run(dry_run=True)
+    assert importer.stage_paths() == [client.stage_path]
+
+    with patch("sbir_graph.loaders.neo4j.bulk_import.subprocess.run"):
+        importer.run(keep_stages=True)
+    assert importer.stage_paths() == [client.stage_path]
+
+    with patch("sbir_graph.loaders.neo4j.bulk_import.subprocess.run") as run:
+        run.side_effect = subprocess.CalledProcessError(1, "neo4j-admin")
+        with pytest.raises(subprocess.CalledProcessError):
+            importer.run()
+    assert importer.stage_paths() == [client.stage_path]
+
+
+def test_client_from_env_only_in_bulk_mode(monkeypatch, import_dir):
+    monkeypatch.delenv("NEO4J_LOAD_MODE", raising=False)
+    assert bulk_import_client_from_env("awards") is None
+
+    monkeypatch.setenv("NEO4J_LOAD_MODE", "bulk")
+    monkeypatch.setenv("NEO4J_BULK_IMPORT_DIR", str(import_dir))
+    client = bulk_import_client_from_env("awards")
+    client.close()
+    assert client.stage_path.parent == import_dir / "stages"
+    with pytest.raises(RuntimeError):
+        client.session()
+
+    with pytest.raises(FileNotFoundError):
+        Neo4jBulkImporter(import_dir / "empty").write_import_files()
@@ -8,6 +8,7 @@ from sbir_analytics.assets.phase_iii_candidates.pairing import (
     PAIR_COLUMNS,
     PAIR_S1_COLUMNS,
     build_uei_pairs,
+    build_uei_pairs_partitioned,
     pair_filter_s1,
 )
 
@@ -434,3 +435,62 @@ def test_legacy_s1_collapses_duplicate_target_rows_but_shared_pairs_do_not() ->
     assert len(shared) == 2
     assert len(legacy) == 1
     assert legacy.loc[0, "target_id"] == "CONT_AWD_DUPLICATE"
+
+
+def _canonical_pairs(frame: pd.DataFrame) -> list[tuple[str, ...]]:
+    return sorted(
+        tuple("" if pd.isna(value) else str(value) for value in row)
+        for row in frame.itertuples(index=False)
+    )
+
+
+def test_partitioned_build_writes_the_same_pair_universe(tmp_path) -> None:
+    agencies = ["DEPARTMENT OF DEFENSE", " department of defense", "NASA", None]
+    priors = pd.DataFrame(
+        [
+            _prior(
+                award_id=f"P-{i}",
+                recipient_uei=f" uei-{i % 5} " if i % 7 else "  ",
+                agency=agencies[i % 4],
+                title=None if i % 3 == 0 else f"Title {i % 4}",
+                abstract="Shared abstract",
+            )
+            for i in range(30)
+        ]
+    )
+    contracts = pd.DataFrame(
+        [
+            _contract(
+                contract_id=f"PIID-{j}",
+                vendor_uei=f"UEI-{j % 6}",
+                awarding_agency_name=agencies[(j + 1) % 4],
+                awarding_office_name="NAVAIR" if j % 2 else "OTHER",
+                transaction_description=None if j % 4 == 0 else f"Desc {j % 3}",
+                transaction_unique_id=f"TX-{j}",
+            )
+            for j in range(24)
+        ]
+    )
+    expected = build_uei_pairs(priors, contracts)
+    stale = tmp_path / "pairs" / "partition=99999"
+    stale.mkdir(parents=True)
+
+    result = build_uei_pairs_partitioned(
+        priors, contracts, tmp_path / "pairs", partitions=3, batch_rows=7
+    )
+
+    assert not stale.exists()
+    assert result.row_count == len(expected) > 0
+    assert all(path.parent.name.startswith("partition=") for path in result.files)
+    written = pd.concat([pd.read_parquet(path) for path in result.files], ignore_index=True)
+    assert list(written.columns) == PAIR_COLUMNS
+    assert _canonical_pairs(written) == _canonical_pairs(expected)
+
+    projected = build_uei_pairs_partitioned(
+        priors,
+        contracts,
+        tmp_path / "projected",
+        columns=["prior_award_id", "target_description", "agency_match_level"],
+    )
+    assert projected.row_count == len(expected)
+    assert build_uei_pairs_partitioned(pd.DataFrame(), contracts, tmp_path / "empty").files == []
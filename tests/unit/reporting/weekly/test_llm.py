@@ -0,0 +1,38 @@
+"""Unit tests for the weekly report's per-company / per-PI diligence generators."""
+
+import pytest
+
+from sbir_etl.reporting.weekly import llm
+
+
+pytestmark = pytest.mark.fast
+
+
+AWARDS = [
+    {"Company": "Acme Inc", "PI Name": "Jane Doe", "Award Title": "Widget"},
+    {"Company": "Beta LLC", "PI Name": "John Roe", "Award Title": "Gadget"},
+]
+
+
+@pytest.fixture
+def paragraph(monkeypatch):
+    monkeypatch.setattr(llm, "_openai_chat", lambda *args, **kwargs: "PARAGRAPH")
+
+
+def test_single_company_diligence_returns_the_paragraph(paragraph):
+    assert llm.generate_company_diligence_for("key", "ACME INC", [AWARDS[0]]) == "PARAGRAPH"
+
+
+def test_company_diligence_maps_keys_to_strings(paragraph):
+    result = llm.generate_company_diligence("key", AWARDS)
+
+    assert set(result) == {key for key, _ in llm.diligence_companies(AWARDS)}
+    assert all(isinstance(text, str) for text in result.values())
+    assert set(result.values()) == {"PARAGRAPH"}
+
+
+def test_pi_diligence_maps_keys_to_strings(paragraph):
+    result = llm.generate_pi_diligence("key", AWARDS)
+
+    assert result == {"JANE DOE": "PARAGRAPH", "JOHN ROE": "PARAGRAPH"}
+    assert llm.generate_pi_diligence_for("key", "JANE DOE", [AWARDS[0]]) == "PARAGRAPH"
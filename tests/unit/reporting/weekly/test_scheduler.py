@@ -0,0 +1,176 @@
+"""Tests for the weekly report's dependency-driven stage scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from sbir_etl.reporting.weekly import enrichment, fetching, llm, orchestrator
+from sbir_etl.reporting.weekly.scheduler import ApiBudget, StageScheduler
+
+
+pytestmark = pytest.mark.fast
+
+
+def test_stage_starts_when_its_inputs_finish():
+    order: list[str] = []
+    release_slow = threading.Event()
+    scheduler = StageScheduler()
+
+    def _slow(r):
+        release_slow.wait(5)
+        order.append("slow")
+        return "slow"
+
+    def _fast(r):
+        order.append("fast")
+        return 1
+
+    def _dependent(r):
+        order.append("dependent")
+        # Runs while "slow" is still blocked: it only depends on "fast".
+        release_slow.set()
+        return r["fast"] + 1
+
+    scheduler.add("slow", _slow)
+    scheduler.add("fast", _fast)
+    scheduler.add("dependent", _dependent, after=["fast"])
+    scheduler.add("final", lambda r: (r["slow"], r["dependent"]), after=["slow", "dependent"])
+
+    results = scheduler.run()
+
+    assert order == ["fast", "dependent", "slow"]
+    assert results["final"] == ("slow", 2)
+    assert all(t.status == "ok" for t in scheduler.timings.values())
+    assert "final" in scheduler.summary()
+
+
+def test_api_budget_caps_concurrent_stages():
+    budget = ApiBudget({"lens": 2})
+    scheduler = StageScheduler(budget=budget)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _call(r):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    for index in range(6):
+        scheduler.add(f"lookup:{index}", _call, api="lens")
+    scheduler.run()
+
+    assert peak == 2
+    # Every slot is returned once the run completes.
+    assert budget.try_acquire("lens") and budget.try_acquire("lens")
+
+
+def test_failed_and_expired_stages_leave_no_result_but_dependents_run(capsys):
+    scheduler = StageScheduler()
+
+    def _broken(r):
+        raise RuntimeError("boom")
+
+    scheduler.add("broken", _broken)
+    scheduler.add("late", lambda r: "never", deadline=time.monotonic() - 1)
+    scheduler.add("report", lambda r: sorted(r), after=["broken", "late"])
+
+    results = scheduler.run()
+
+    assert results["report"] == []
+    assert scheduler.timings["broken"].status == "failed"
+    assert scheduler.timings["late"].status == "skipped"
+    assert "broken stage failed: boom" in capsys.readouterr().err
+
+
+def test_invalid_graphs_are_rejected():
+    scheduler = StageScheduler()
+    scheduler.add("a", lambda r: None, after=["b"])
+    scheduler.add("b", lambda r: None, after=["a"])
+    with pytest.raises(ValueError, match="cycle"):
+        scheduler.run()
+
+    with pytest.raises(ValueError, match="Duplicate"):
+        scheduler.add("a", lambda r: None)
+    with pytest.raises(ValueError, match="unbudgeted"):
+        scheduler.add("c", lambda r: None, api="openai")
+
+
+def test_builder_runs_per_company_diligence_from_its_own_inputs(monkeypatch):
+    awards = [
+        {"Company": "Acme Corp", "PI Name": "Jane Doe", "Award Title": "Widget"},
+        {"Company": "Beta LLC", "PI Name": "John Roe", "Award Title": "Gadget"},
+    ]
+    monkeypatch.setattr(
+        fetching, "fetch_weekly_awards", lambda days: (list(awards), [], None, None, None)
+    )
+    monkeypatch.setattr(fetching, "clean_and_dedup_awards", lambda a: (a, {}))
+    monkeypatch.setattr(fetching, "get_company_history", lambda *args: {"ACME CORP": {}})
+    monkeypatch.setattr(fetching, "get_pi_history", lambda *args: {})
+    for name in (
+        "fetch_solicitation_topics",
+        "fetch_usaspending_contract_descriptions",
+        "lookup_usaspending_recipients",
+        "lookup_sam_entities",
+        "lookup_opencorporates",
+        "poll_press_wire",
+        "enrich_with_inflation",
+        "resolve_congressional_districts",
+    ):
+        monkeypatch.setattr(enrichment, name, lambda awards: {})
+    monkeypatch.setattr(enrichment, "lookup_pi_source", lambda source, info: f"{source}-record")
+    monkeypatch.setattr(
+        orchestrator,
+        "_lib_lookup_company_federal_awards",
+        lambda name, uei, rate_limiter: f"fed:{name}",
+    )
+    monkeypatch.setattr(llm, "research_company", lambda api_key, info: f"research:{info['name']}")
+    monkeypatch.setattr(llm, "generate_weekly_synopsis", lambda *args: "synopsis")
+    monkeypatch.setattr(llm, "generate_award_descriptions", lambda *args: {0: "desc"})
+
+    company_calls = {}
+    pi_calls = {}
+
+    def _company(api_key, key, co_awards, idx, total, **inputs):
+        company_calls[key] = inputs
+        return f"diligence:{key}"
+
+    def _pi(api_key, key, pi_awards, idx, total, **inputs):
+        pi_calls[key] = inputs
+        return f"pi:{key}"
+
+    monkeypatch.setattr(llm, "generate_company_diligence_for", _company)
+    monkeypatch.setattr(llm, "generate_pi_diligence_for", _pi)
+    rendered = {}
+    monkeypatch.setattr(
+        orchestrator.rendering, "generate_markdown", lambda awards, **kw: rendered.update(kw)
+    )
+
+    builder = orchestrator.WeeklyAwardsReportBuilder(api_key="test-key")
+    builder.run()
+
+    assert rendered["synopsis"] == "synopsis"
+    assert rendered["company_diligence"] == {
+        "ACME CORP": "diligence:ACME CORP",
+        "BETA LLC": "diligence:BETA LLC",
+    }
+    assert set(rendered["pi_diligence"]) == {"JANE DOE", "JOHN ROE"}
+    acme = company_calls["ACME CORP"]
+    assert acme["company_federal_awards"] == {"ACME CORP": "fed:Acme Corp"}
+    assert acme["company_history"] == {"ACME CORP": {}}
+    assert acme["company_research"]["ACME CORP"] == "research:Acme Corp"
+    assert pi_calls["JANE DOE"]["pi_external_data"] == {
+        "JANE DOE": {
+            "patents": "patents-record",
+            "publications": "publications-record",
+            "orcid": "orcid-record",
+            "federal_awards": "fed:Acme Corp",
+        }
+    }
+    assert all(t.status == "ok" for t in builder.stage_timings.values())
+    assert "co_diligence:ACME CORP" in builder.stage_timings
@@ -0,0 +1,102 @@
+"""Tests for the batched subaward network scan."""
+
+from __future__ import annotations
+
+import importlib.util
+import zipfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sbir_etl.supply_chain.subaward_network import (
+    build_sbir_awardee_registry,
+    build_subaward_facts,
+)
+from sbir_etl.supply_chain.subaward_stream import iter_subaward_batches, stream_subaward_facts
+from tests.unit.supply_chain.test_subaward_network import _awards, _subawards
+
+
+pytestmark = pytest.mark.fast
+
+SCRIPT = Path(__file__).parents[3] / "scripts/data/build_sbir_dib_subaward_network.py"
+SPEC = importlib.util.spec_from_file_location(
+    "build_sbir_dib_subaward_network",
+    SCRIPT,
+)
+assert SPEC and SPEC.loader
+BUILD_SCRIPT = importlib.util.module_from_spec(SPEC)
+SPEC.loader.exec_module(BUILD_SCRIPT)
+
+
+def _write_split_extract(tmp_path):
+    subawards = _subawards()
+    corrected = subawards.iloc[[0]].assign(
+        subaward_sam_report_id="REPORT-1B",
+        subaward_amount=120_000,
+        subaward_sam_report_last_modified_date="2025-04-01",
+        unrelated_column="ignored",
+    )
+    parquet_path = tmp_path / "fy2025.parquet"
+    subawards.iloc[:2].to_parquet(parquet_path, index=False)
+    csv_path = tmp_path / "fy2025_corrections.csv"
+    pd.concat([subawards.iloc[2:], corrected]).to_csv(csv_path, index=False)
+    zip_path = tmp_path / "fy2025_corrections.zip"
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        archive.write(csv_path, arcname="corrections.csv")
+    return parquet_path, zip_path, csv_path
+
+
+def test_streamed_facts_match_in_memory_build(tmp_path) -> None:
+    registry = build_sbir_awardee_registry(_awards())
+    parquet_path, zip_path, csv_path = _write_split_extract(tmp_path)
+
+    streamed = stream_subaward_facts(registry, [parquet_path, zip_path], batch_rows=1)
+
+    expected = build_subaward_facts(
+        registry,
+        pd.concat(
+            [
+                BUILD_SCRIPT._read_frame(parquet_path, subaward_projection=True),
+                BUILD_SCRIPT._read_frame(csv_path, subaward_projection=True),
+            ],
+            ignore_index=True,
+        ),
+    )
+    pd.testing.assert_frame_equal(streamed.facts, expected)
+    # The corrected report replaces the original across files.
+    sub_1 = streamed.facts.loc[streamed.facts["subaward_number"] == "SUB-1"].iloc[0]
+    assert sub_1["subaward_amount"] == 120_000
+    assert sub_1["source_report_version_count"] == 2
+    assert (streamed.source_rows, streamed.matched_rows) == (4, 3)
+    assert streamed.batches >= 3
+
+
+def test_csv_duns_with_gaps_match_the_same_way_in_both_modes(tmp_path) -> None:
+    registry = build_sbir_awardee_registry(_awards())
+    subawards = _subawards().assign(subawardee_uei=None)
+    subawards.loc[subawards.index[-1], "subawardee_duns"] = None
+    csv_path = tmp_path / "duns_gaps.csv"
+    subawards.to_csv(csv_path, index=False)
+
+    streamed = stream_subaward_facts(registry, [csv_path])
+    in_memory = build_subaward_facts(
+        registry, BUILD_SCRIPT._read_frame(csv_path, subaward_projection=True)
+    )
+
+    pd.testing.assert_frame_equal(streamed.facts, in_memory)
+    # A gap would make an inferred DUNS column float and break the exact match.
+    assert "exact_duns" in set(in_memory["match_method"])
+
+
+def test_unmatched_rows_and_unused_columns_are_not_kept(tmp_path) -> None:
+    registry = build_sbir_awardee_registry(_awards())
+    _, zip_path, _ = _write_split_extract(tmp_path)
+
+    batch = next(iter_subaward_batches(zip_path))
+    assert "unrelated_column" not in batch.columns
+    assert batch["subaward_amount"].tolist() == ["25000", "120000"]
+
+    streamed = stream_subaward_facts(registry, [zip_path], include_name_candidates=False)
+    assert (streamed.source_rows, streamed.matched_rows) == (2, 1)
+    assert streamed.facts["match_method"].tolist() == ["exact_uei"]
@@ -145,7 +145,7 @@ def test_web_export_rejects_incomplete_edge_schema() -> None:
         raise AssertionError("missing required edge columns should fail")
 
 
-def test_lineage_export_builds_distinct_traceable_node_and_edge_types() -> None:
+def _lineage_frames() -> tuple[pd.DataFrame, ...]:
     direct = pd.DataFrame(
         [
             {
@@ -266,6 +266,11 @@ def test_lineage_export_builds_distinct_traceable_node_and_edge_types() -> None:
             }
         ]
     )
+    return direct, awardees, prime, subawards, screen, evidence
+
+
+def test_lineage_export_builds_distinct_traceable_node_and_edge_types() -> None:
+    direct, awardees, prime, subawards, screen, evidence = _lineage_frames()
 
     payload = build_nsf_defense_lineage_payload(
         direct,
@@ -310,3 +315,75 @@ def test_lineage_export_builds_distinct_traceable_node_and_edge_types() -> None:
     assert all(
         edge["source"] in node_ids and edge["target"] in node_ids for edge in payload["edges"]
     )
+
+
+def test_lineage_evidence_edges_render_null_source_cells_like_row_values() -> None:
+    direct, awardees, prime, subawards, screen, evidence = _lineage_frames()
+    evidence = pd.concat(
+        [
+            evidence.assign(source_paths=None, source_sha256s=None),
+            evidence.assign(
+                evidence_assertion_id="evidence:2",
+                source_paths=float("nan"),
+                source_sha256s=float("nan"),
+            ),
+        ],
+        ignore_index=True,
+    )
+
+    payload = build_nsf_defense_lineage_payload(
+        direct, awardees, prime, subawards, screen, evidence, metadata={}, downloads={}
+    )
+
+    edges = {edge["id"]: edge for edge in payload["edges"]}
+    # Missing cells are dropped, while a float NaN still renders as its text, as it
+    # did when the evidence edges were built row by row.
+    assert edges["evidence:1"]["source_paths"] == []
+    assert edges["evidence:1"]["source_sha256s"] == []
+    assert edges["evidence:2"]["source_paths"] == ["nan"]
+    assert edges["evidence:2"]["source_sha256s"] == ["nan"]
+    assert edges["evidence:2"]["source_record_ids"] == ["CONT_TX_1", "CONT_TX_2"]
+
+
+def test_web_export_coerces_mixed_screen_columns_like_single_values() -> None:
+    exposure = pd.concat(
+        [
+            _exposure(),
+            pd.DataFrame(
+                [
+                    {
+                        "sbir_organization_id": " uei:SUPPLIER2 ",
+                        "screening_status": "  ",
+                        "observed_customer_hhi": None,
+                        "nsf_sbir_awardee": "Yes",
+                        "nsf_sbir_award_count": 2.0,
+                        "nsf_sbir_first_award_year": 2021.0,
+                        "critical_supply_chain_review_candidate": "no",
+                    }
+                ]
+            ),
+        ],
+        ignore_index=True,
+    ).astype(object)
+    edges = _edges()
+    edges.loc[2, "first_observed_date"] = None
+
+    payload = build_web_graph_payload(edges, exposure)
+
+    supplier = next(node for node in payload["nodes"] if node["id"] == "supplier:uei:SUPPLIER2")
+    assert supplier["screening_status"] == "not_screened"
+    assert supplier["observed_customer_hhi"] == 0.0
+    assert supplier["nsf_sbir_awardee"] is True
+    assert supplier["nsf_sbir_award_count"] == 2
+    assert supplier["nsf_sbir_first_award_year"] == 2021
+    assert supplier["nsf_sbir_latest_award_year"] == 0
+    assert supplier["critical_supply_chain_review_candidate"] is False
+    assert supplier["nsf_review_priority"] == "not_nsf_sbir"
+    edge = next(edge for edge in payload["edges"] if edge["source"] == supplier["id"])
+    assert edge["first_observed_date"] is None
+    assert edge["last_observed_date"] == "2024-02-01"
+    assert all(
+        type(value) in {str, int, float, bool, type(None)}
+        for node in payload["nodes"]
+        for value in node.values()
+    )
@@ -0,0 +1,116 @@
+"""Tests for the vectorized fiscal scenario engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytestmark = pytest.mark.fast
+
+from sbir_etl.transformers.fiscal.monte_carlo import FiscalScenarioEngine
+from sbir_etl.transformers.fiscal.taxes import FiscalTaxEstimator
+
+
+@pytest.fixture
+def estimator():
+    return FiscalTaxEstimator()
+
+
+@pytest.fixture
+def tax_estimates(estimator):
+    impacts = pd.DataFrame(
+        {
+            "state": ["CA", "TX", "NY"],
+            "bea_sector": ["11", "21", "31"],
+            "fiscal_year": [2022, 2023, 2023],
+            "shock_amount": [1_000_000.0, 500_000.0, 250_000.0],
+            "production_impact": [2_100_000.0, 900_000.0, 600_000.0],
+            "wage_impact": [800_000.0, 300_000.0, 250_000.0],
+            "proprietor_income_impact": [50_000.0, 20_000.0, 10_000.0],
+            "gross_operating_surplus": [400_000.0, 250_000.0, 100_000.0],
+            "consumption_impact": [420_000.0, 180_000.0, 120_000.0],
+        }
+    )
+    return estimator.estimate_taxes_from_components(impacts)
+
+
+def _scenarios(**columns):
+    n = len(next(iter(columns.values())))
+    return pd.DataFrame({"scenario_id": np.arange(1, n + 1), **columns})
+
+
+def test_baseline_scenario_reproduces_tax_estimates(tax_estimates, estimator):
+    engine = FiscalScenarioEngine.from_tax_estimates(tax_estimates, estimator=estimator)
+
+    result = engine.evaluate(_scenarios(economic_multiplier=[2.0], discount_rate=[0.0]))
+
+    row = result.iloc[0]
+    assert row["total_tax_receipt"] == pytest.approx(tax_estimates["total_tax_receipt"].sum())
+    assert row["federal_tax_total"] == pytest.approx(tax_estimates["federal_tax_total"].sum())
+    assert row["production_impact"] == pytest.approx(tax_estimates["production_impact"].sum())
+    assert row["npv_tax_receipt"] == pytest.approx(row["total_tax_receipt"])
+
+
+def test_multiplier_scales_only_indirect_production(tax_estimates, estimator):
+    engine = FiscalScenarioEngine.from_tax_estimates(tax_estimates, estimator=estimator)
+
+    result = engine.evaluate(_scenarios(economic_multiplier=[1.0, 3.0]))
+
+    # At m=1 only direct demand remains; at m=3 the indirect part doubles.
+    direct = tax_estimates["shock_amount"].sum()
+    indirect = tax_estimates["production_impact"].sum() - direct
+    assert result["production_impact"].tolist() == pytest.approx([direct, direct + 2 * indirect])
+
+
+def test_tax_rate_overrides_match_estimator(tax_estimates, estimator):
+    engine = FiscalScenarioEngine.from_tax_estimates(tax_estimates, estimator=estimator)
+    baseline = engine.evaluate(_scenarios(discount_rate=[0.0]))["federal_tax_total"].iloc[0]
+
+    result = engine.evaluate(
+        _scenarios(individual_income_tax_rate=[0.2], corporate_income_tax_rate=[0.1])
+    )
+
+    expected = (
+        baseline
+        - tax_estimates["individual_income_tax"].sum()
+        - tax_estimates["corporate_income_tax"].sum()
+        + 0.2 * tax_estimates["wage_impact"].sum()
+        + 0.1 * tax_estimates["gross_operating_surplus"].sum()
+    )
+    assert result["federal_tax_total"].iloc[0] == pytest.approx(expected)
+
+
+def test_discount_rate_discounts_later_fiscal_years(tax_estimates, estimator):
+    engine = FiscalScenarioEngine.from_tax_estimates(tax_estimates, estimator=estimator)
+
+    row = engine.evaluate(_scenarios(discount_rate=[0.05])).iloc[0]
+
+    later = tax_estimates.loc[tax_estimates["fiscal_year"] == 2023, "total_tax_receipt"].sum()
+    assert row["total_tax_receipt"] - row["npv_tax_receipt"] == pytest.approx(
+        later * (1 - 1 / 1.05)
+    )
+
+
+def test_process_pool_matches_in_process(tax_estimates, estimator):
+    engine = FiscalScenarioEngine.from_tax_estimates(
+        tax_estimates, estimator=estimator, block_size=16
+    )
+    rng = np.random.default_rng(0)
+    scenarios = _scenarios(
+        economic_multiplier=rng.uniform(1.7, 2.3, 64),
+        individual_income_tax_rate=rng.uniform(0.08, 0.12, 64),
+        discount_rate=rng.uniform(0.01, 0.07, 64),
+    )
+
+    serial = engine.evaluate(scenarios)
+    pooled = engine.evaluate(scenarios, max_workers=2)
+
+    pd.testing.assert_frame_equal(serial, pooled)
+
+
+def test_empty_scenarios(tax_estimates, estimator):
+    engine = FiscalScenarioEngine.from_tax_estimates(tax_estimates, estimator=estimator)
+
+    result = engine.evaluate(pd.DataFrame(columns=["scenario_id", "economic_multiplier"]))
+
+    assert result.empty
+    assert "total_tax_receipt" in result.columns
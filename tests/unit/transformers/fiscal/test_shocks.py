@@ -0,0 +1,121 @@
+"""Tests for columnar economic shock aggregation."""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+pytestmark = pytest.mark.fast
+
+from sbir_etl.transformers.fiscal.shocks import FiscalShockAggregator
+
+
+@pytest.fixture
+def aggregator():
+    return FiscalShockAggregator(config=SimpleNamespace(base_year=2023))
+
+
+@pytest.fixture
+def awards_df():
+    return pd.DataFrame(
+        {
+            "award_id": ["A1", "A2", "A3", "A4", "A5", "A6", "A7"],
+            "resolved_state": ["ca", None, "California", "TX", "TX", None, "NY"],
+            "company_state": [None, "CA", "CA", None, "TX", None, "NY"],
+            "fiscal_year": [2024, None, None, 1900, None, 2024, 2022],
+            "award_date": [None, "2023-10-15", "2023-03-01", "2021-11-30", None, None, None],
+            "award_year": [None, None, None, None, 2020, None, None],
+            "inflation_adjusted_amount": [1000.10, None, 250.0, -5.0, 333.33, 10.0, None],
+            "award_amount": [900.0, 500.55, 200.0, 800.0, 300.0, 10.0, None],
+            "bea_sector_code": ["11", "11", "21", "21", "21", "11", "11"],
+            "bea_allocation_weight": [1.0, 0.5, 1.0, 1.0, 0.25, 1.0, 1.0],
+            "bea_mapping_confidence": [0.9, 0.8, 0.7, 0.6, None, 0.9, 0.9],
+            "fiscal_naics_code": ["541712", None, "334", "334", None, None, "541"],
+        }
+    )
+
+
+def test_columnar_resolvers_match_row_extractors(aggregator, awards_df):
+    years = aggregator.resolve_fiscal_years(awards_df)
+    states = aggregator.resolve_state_codes(awards_df)
+    cents = aggregator.resolve_amount_cents(awards_df)
+
+    for idx, row in awards_df.iterrows():
+        expected_year = aggregator.extract_fiscal_year(row)
+        expected_state = aggregator.extract_state_code(row)
+        expected_amount = aggregator.extract_shock_amount(row)
+
+        assert (None if pd.isna(years[idx]) else int(years[idx])) == expected_year
+        assert (None if pd.isna(states[idx]) else states[idx]) == expected_state
+        if expected_amount is None:
+            assert pd.isna(cents[idx])
+        else:
+            assert Decimal(int(cents[idx])).scaleb(-2) == expected_amount.quantize(Decimal("0.01"))
+
+
+def test_aggregate_groups_by_state_sector_year(aggregator, awards_df):
+    shocks_df = aggregator.aggregate_shocks_to_dataframe(awards_df)
+
+    # A6 has no state and A7 has no amount, so five awards remain.
+    keyed = shocks_df.set_index(["state", "bea_sector", "fiscal_year"])
+    assert list(keyed.index) == [
+        ("CA", "11", 2024),
+        ("CA", "21", 2023),
+        ("TX", "21", 2022),
+        ("TX", "21", 2021),
+    ]
+    assert keyed.loc[("CA", "11", 2024), "award_ids"] == ["A1", "A2"]
+    assert keyed.loc[("CA", "11", 2024), "shock_amount"] == pytest.approx(1000.10 + 250.28)
+    assert keyed.loc[("TX", "21", 2021), "shock_amount"] == pytest.approx(83.33)
+    assert keyed.loc[("TX", "21", 2021), "confidence"] == pytest.approx(0.70)
+    assert shocks_df["naics_coverage_rate"].tolist() == pytest.approx([3 / 7] * 4)
+    assert shocks_df["geographic_resolution_rate"].tolist() == pytest.approx([5 / 7] * 4)
+    assert shocks_df["num_awards"].sum() == 5
+
+
+def test_models_match_frame(aggregator, awards_df):
+    shocks = aggregator.aggregate_shocks(awards_df)
+    shocks_df = aggregator.aggregate_shocks_to_dataframe(awards_df)
+
+    assert len(shocks) == len(shocks_df)
+    for shock, row in zip(shocks, shocks_df.itertuples(index=False), strict=True):
+        assert (shock.state, shock.bea_sector, shock.fiscal_year) == (
+            row.state,
+            row.bea_sector,
+            row.fiscal_year,
+        )
+        assert float(shock.shock_amount) == pytest.approx(row.shock_amount)
+        assert shock.award_ids == row.award_ids
+
+    model_stats = aggregator.get_aggregation_statistics(shocks)
+    frame_stats = aggregator.get_frame_aggregation_statistics(shocks_df)
+    assert frame_stats.total_shock_amount == model_stats.total_shock_amount
+    assert frame_stats.total_awards_aggregated == model_stats.total_awards_aggregated
+    assert frame_stats.avg_confidence == pytest.approx(model_stats.avg_confidence)
+
+
+def test_chunks_aggregate_independently(aggregator):
+    df = pd.DataFrame(
+        {
+            "award_id": ["A1", "A2", "A3"],
+            "state": ["CA", "CA", "CA"],
+            "fiscal_year": [2024, 2024, 2024],
+            "award_amount": [100.0, 200.0, 300.0],
+            "bea_sector_code": ["11", "11", "11"],
+        }
+    )
+
+    shocks_df = aggregator.aggregate_shocks_to_dataframe(df, chunk_size=2)
+
+    assert shocks_df["award_ids"].tolist() == [["A1", "A2"], ["A3"]]
+    assert shocks_df["shock_amount"].tolist() == [300.0, 300.0]
+
+
+def test_empty_and_unresolvable_inputs(aggregator):
+    assert aggregator.aggregate_shocks(pd.DataFrame()) == []
+    unresolved = pd.DataFrame({"award_id": ["A1"], "award_amount": [10.0]})
+    shocks_df = aggregator.aggregate_shocks_to_dataframe(unresolved)
+    assert shocks_df.empty
+    assert "shock_amount" in shocks_df.columns
+    assert aggregator.get_frame_aggregation_statistics(shocks_df).total_shocks == 0
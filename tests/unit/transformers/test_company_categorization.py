@@ -14,6 +14,7 @@ import pytest
 
 from sbir_etl.enrichers.company_categorization import (
     _extract_sbir_phase,
+    batch_retrieve_company_contracts,
     retrieve_company_contracts,
 )
 from sbir_etl.transformers.company_categorization import (
@@ -482,3 +483,83 @@ class TestRetrieveCompanyContracts:
         result = retrieve_company_contracts(mock_extractor, uei="NONEXISTENT")
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 0
+
+
+def _canonical(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.sort_values("award_id").reset_index(drop=True).astype(object)
+    return df.where(df.notna(), None)
+
+
+class TestBatchRetrieveCompanyContracts:
+    """Batch retrieval against a real in-memory DuckDB table."""
+
+    @pytest.fixture
+    def extractor(self):
+        from sbir_etl.extractors.usaspending import DuckDBUSAspendingExtractor
+
+        extractor = DuckDBUSAspendingExtractor()
+        rows = [
+            # piid, description, amount, recipient_uei, awardee_uei, duns, duns_alt, cage
+            ("A1", "Widget delivery", 100.0, "UEI1", None, None, None, None),
+            ("A2", "SBIR Phase II research", 200.0, "UEI1", None, None, None, None),
+            ("A3", "Consulting", 300.0, None, "UEI1", "111", None, None),
+            ("A4", "Phase II follow-on research", 50.0, None, None, None, "222", None),
+            ("A5", "Zero dollars", 0.0, "UEI1", None, None, None, None),
+            ("A6", "Engines", 75.0, None, None, None, None, "CAGE9"),
+            ("A7", None, 10.0, "UEI2", None, "111", None, None),
+            ("A8", "Other company", 20.0, "UEI3", None, None, None, None),
+        ]
+        conn = extractor.connect()
+        conn.execute(
+            """
+            CREATE TABLE usaspending_awards (
+                award_id_piid VARCHAR, piid VARCHAR, fain VARCHAR, uri VARCHAR,
+                award_id VARCHAR, product_or_service_code VARCHAR,
+                type_of_contract_pricing VARCHAR, award_description VARCHAR,
+                federal_action_obligation DOUBLE, recipient_uei VARCHAR,
+                awardee_or_recipient_uei VARCHAR, recipient_duns VARCHAR,
+                awardee_or_recipient_uniqu VARCHAR, cage_code VARCHAR,
+                vendor_doing_as_business_n VARCHAR, action_date DATE, fiscal_year INTEGER
+            )
+            """
+        )
+        for piid, desc, amount, uei, alt_uei, duns, alt_duns, cage in rows:
+            conn.execute(
+                "INSERT INTO usaspending_awards VALUES "
+                "(?, NULL, NULL, NULL, NULL, 'R425', 'FFP', ?, ?, ?, ?, ?, ?, ?, NULL, "
+                "DATE '2024-01-01', 2024)",
+                [piid, desc, amount, uei, alt_uei, duns, alt_duns, cage],
+            )
+        yield extractor
+        extractor.close()
+
+    def test_single_scan_matches_per_company_queries(self, extractor):
+        companies = pd.DataFrame(
+            {
+                "company_uei": ["UEI1", None, "nan", "UEI2", None],
+                "company_duns": ["111", "222", None, None, None],
+                "company_cage": [None, None, "CAGE9", None, None],
+            }
+        )
+
+        results = batch_retrieve_company_contracts(extractor, companies)
+
+        assert list(results) == ["UEI1", "222", "CAGE9", "UEI2"]
+        for key, (uei, duns, cage) in {
+            "UEI1": ("UEI1", "111", None),
+            "222": (None, "222", None),
+            "CAGE9": (None, None, "CAGE9"),
+            "UEI2": ("UEI2", None, None),
+        }.items():
+            expected = retrieve_company_contracts(extractor, uei=uei, duns=duns, cage=cage)
+            pd.testing.assert_frame_equal(_canonical(results[key]), _canonical(expected))
+        assert sorted(results["UEI1"]["award_id"]) == ["A1", "A3", "A7"]
+        assert results["222"]["sbir_phase"].tolist() == ["II"]
+
+    def test_companies_without_contracts_map_to_empty_frames(self, extractor):
+        companies = pd.DataFrame({"company_uei": ["NOPE", None]})
+
+        results = batch_retrieve_company_contracts(extractor, companies)
+
+        assert list(results) == ["NOPE"]
+        assert results["NOPE"].empty
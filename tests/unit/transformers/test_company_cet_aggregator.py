@@ -455,6 +455,14 @@ class TestCompanyCETAggregatorDataQuality:
 
         assert len(aggregator.df) == 1
 
+    def test_no_company_ids_aggregates_to_empty_frame(self):
+        """Awards without any company_id produce an empty result, not an error."""
+        df = pd.DataFrame([{"company_id": None, "primary_cet": "ai", "primary_score": 80.0}])
+
+        result = CompanyCETAggregator(df).aggregate_by_company()
+
+        assert result.empty
+
     def test_missing_award_id(self):
         """Test handling of missing award_id."""
         df = pd.DataFrame(
@@ -679,3 +687,44 @@ class TestToDataframe:
         phase_ii = row["cet_trend"]["II"]
         assert pytest.approx(sum(phase_ii.values()), rel=1e-6) == pytest.approx(1.0, rel=1e-6)
         assert "cet_n" in phase_ii
+
+    def test_grouped_reductions_match_per_award_loop(self):
+        """Scores, trends and counts equal a plain per-award loop, bit for bit."""
+        import numpy as np
+
+        rng = np.random.default_rng(7)
+        data = []
+        for i in range(60):
+            data.append(
+                {
+                    "award_id": f"E{i}",
+                    "company_id": "C5" if i % 3 else "C6",
+                    "primary_cet": f"cet_{i % 2}",
+                    "primary_score": float(rng.random() * 100),
+                    "supporting_cets": [("cet_1", float(rng.random() * 100))],
+                    "award_date": f"{2015 + i % 4}-01-01",
+                }
+            )
+        data.append({"award_id": "E99", "company_id": None, "primary_cet": "cet_9"})
+        df_comp = CompanyCETAggregator(pd.DataFrame(data)).to_dataframe()
+
+        assert df_comp["company_id"].tolist() == ["C5", "C6"]
+        for _, row in df_comp.iterrows():
+            awards = [d for d in data if d["company_id"] == row["company_id"]]
+            scores: dict[str, list[float]] = {}
+            years: dict[str, dict[str, float]] = {}
+            for award in awards:
+                year = award["award_date"][:4]
+                entries = [(award["primary_cet"], award["primary_score"])]
+                entries += award["supporting_cets"]
+                for cet_id, score in entries:
+                    scores.setdefault(cet_id, []).append(score)
+                    totals = years.setdefault(year, {})
+                    totals[cet_id] = totals.get(cet_id, 0.0) + score
+
+            assert row["total_awards"] == len(awards)
+            assert row["cet_scores"] == {k: float(np.mean(v)) for k, v in scores.items()}
+            assert row["cet_trend"] == {
+                year: {k: v / sum(totals.values()) for k, v in totals.items()}
+                for year, totals in years.items()
+            }
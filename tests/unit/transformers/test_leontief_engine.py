@@ -0,0 +1,142 @@
+"""Unit tests for the batched Leontief impact engine."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from sbir_etl.transformers import bea_io_functions as bea_io
+from sbir_etl.transformers.leontief_engine import LeontiefImpactEngine
+
+
+pytestmark = pytest.mark.fast
+
+
+@pytest.fixture
+def use_table():
+    return pd.DataFrame(
+        [[10, 5, 3, 1], [5, 10, 2, 4], [3, 2, 10, 2], [1, 3, 2, 9]],
+        index=["11", "21", "31", "42"],
+        columns=["11", "21", "31", "42"],
+        dtype=float,
+    )
+
+
+@pytest.fixture
+def shocks():
+    return pd.DataFrame(
+        {
+            "state": ["CA", "TX", "CA", "NY", "TX", "CA"],
+            "bea_sector": ["11", "21", "31", "11", "999", "11"],
+            "fiscal_year": [2023] * 6,
+            "shock_amount": [
+                Decimal("1000000"),
+                Decimal("500000.25"),
+                Decimal("750000"),
+                Decimal("125000.50"),
+                Decimal("90000"),
+                Decimal("40000"),
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def va_ratios():
+    return pd.DataFrame(
+        {
+            "sector": ["11", "21"],
+            "wage_ratio": [0.45, 0.35],
+            "gos_ratio": [0.25, 0.4],
+            "tax_ratio": [0.1, 0.05],
+            "proprietor_income_ratio": [0.05, 0.02],
+        }
+    )
+
+
+@pytest.fixture
+def emp_coeffs():
+    return pd.DataFrame(
+        {"sector": ["11", "31"], "employment": [100.0, 50.0], "employment_coefficient": [7.5, 3.2]}
+    )
+
+
+def _reference_rows(use_table, shocks, va_ratios, emp_coeffs):
+    """Per-state reference built from the public bea_io_functions helpers."""
+    output = bea_io.fetch_industry_output(use_table)
+    leontief = bea_io.calculate_leontief_inverse(
+        bea_io.calculate_technical_coefficients(use_table, output)
+    )
+    rows = []
+    for state in shocks["state"].unique():
+        state_shocks = shocks[shocks["state"] == state].copy()
+        millions = state_shocks.copy()
+        millions["shock_amount"] = pd.to_numeric(millions["shock_amount"]) / 1_000_000.0
+        production = bea_io.apply_demand_shocks(leontief, millions)
+        jobs = bea_io.calculate_employment_from_production(production, emp_coeffs)
+        for _, shock in state_shocks.iterrows():
+            sector = shock["bea_sector"]
+            if sector in production.index:
+                impact = Decimal(str(float(production[sector]) * 1_000_000.0))
+                employment = float(jobs[sector])
+            else:
+                impact, employment = Decimal("0"), 0.0
+            match = va_ratios[va_ratios["sector"] == sector]
+            wage = Decimal(str(match["wage_ratio"].iloc[0])) if not match.empty else Decimal("0.4")
+            rows.append((state, sector, impact, impact * wage, employment, not match.empty))
+    return rows
+
+
+def test_matches_per_state_reference(use_table, shocks, va_ratios, emp_coeffs):
+    engine = LeontiefImpactEngine()
+    factorization = engine.factorize(
+        2023, "v2.1", use_table, bea_io.fetch_industry_output(use_table)
+    )
+
+    result = engine.compute_year_impacts(shocks, factorization, va_ratios, emp_coeffs)
+
+    expected = _reference_rows(use_table, shocks, va_ratios, emp_coeffs)
+    actual = [
+        (
+            row.state,
+            row.bea_sector,
+            row.production_impact,
+            row.wage_impact,
+            row.employment_impact,
+            row.quality_flags == "bea_api_with_ratios",
+        )
+        for row in result.itertuples(index=False)
+    ]
+    assert actual == expected
+    assert (result["model_version"] == "v2.1").all()
+
+
+def test_factorization_cached_per_year_and_version(use_table):
+    engine = LeontiefImpactEngine()
+    output = bea_io.fetch_industry_output(use_table)
+
+    with patch(
+        "sbir_etl.transformers.leontief_engine.calculate_leontief_inverse",
+        wraps=bea_io.calculate_leontief_inverse,
+    ) as inverse:
+        first = engine.factorize(2023, "v2.1", use_table, output)
+        assert engine.factorize(2023, "v2.1", use_table, output) is first
+        engine.factorize(2023, "v2.2", use_table, output)
+        engine.factorize(2022, "v2.1", use_table, output)
+
+    assert inverse.call_count == 3
+
+
+def test_failure_yields_flagged_zero_rows(use_table, shocks):
+    engine = LeontiefImpactEngine()
+    factorization = engine.factorize(
+        2023, "v2.1", use_table, bea_io.fetch_industry_output(use_table)
+    )
+    broken = shocks.drop(columns=["shock_amount"])
+
+    result = engine.compute_year_impacts(broken, factorization, pd.DataFrame(), pd.DataFrame())
+
+    assert len(result) == len(shocks)
+    assert result["quality_flags"].str.startswith("bea_api_failed:").all()
+    assert (result["production_impact"] == Decimal("0")).all()
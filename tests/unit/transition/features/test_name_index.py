@@ -0,0 +1,57 @@
+"""Tests for the shared fuzzy name candidate index."""
+
+import pytest
+
+from sbir_etl.identity import CompanyNameMetric, company_name_similarity
+from sbir_ml.transition.features import name_index
+from sbir_ml.transition.features.name_index import NameCandidateIndex
+
+
+pytestmark = pytest.mark.fast
+
+
+KEYS = ["acme corp", "acme corporation", "beta tech", "corp acme", "   ", "gamma labs"]
+
+
+def _loop_best(query, keys, cutoff):
+    best_key, best_score = None, 0.0
+    for key in keys:
+        score = company_name_similarity(query, key, metric=CompanyNameMetric.TOKEN_SORT)
+        if score > best_score:
+            best_key, best_score = key, score
+    return (best_key, best_score) if best_key and best_score >= cutoff else (None, 0.0)
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_best_matches_agree_with_scoring_loop(monkeypatch, use_rapidfuzz):
+    if not use_rapidfuzz:
+        monkeypatch.setattr(name_index, "process", None)
+    index = NameCandidateIndex(KEYS)
+    queries = ["acme corp", "corp acme", "acme corpration", "beta", "", "zzz", "gamma lab"]
+
+    for cutoff in (0.0, 0.8, 0.9):
+        assert index.best_matches(queries, score_cutoff=cutoff) == [
+            _loop_best(q, KEYS, cutoff) if q.strip() else (None, 0.0) for q in queries
+        ]
+
+
+def test_ties_go_to_first_indexed_key():
+    # token-sort scoring makes these two keys identical to the query
+    index = NameCandidateIndex(["corp acme", "acme corp"])
+
+    assert index.best_match("acme corp") == ("corp acme", 1.0)
+
+
+def test_discard_and_re_add_moves_key_to_end():
+    index = NameCandidateIndex(["corp acme", "acme corp", "beta"])
+
+    index.discard("corp acme")
+    assert "corp acme" not in index
+    assert index.best_match("acme corp") == ("acme corp", 1.0)
+
+    index.discard("acme corp")
+    index.add("corp acme")
+    index.add("acme corp")
+    assert len(index) == 3
+    assert index.best_match("acme corp") == ("corp acme", 1.0)
+    assert index.best_match("beta") == ("beta", 1.0)
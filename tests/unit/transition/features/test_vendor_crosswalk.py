@@ -523,6 +523,20 @@ class TestLookupMethods:
 
         assert result is None
 
+    def test_find_by_name_fuzzy_tracks_aliases_and_removals(self):
+        """Fuzzy candidates follow add_alias and remove."""
+        cw = VendorCrosswalk()
+        cw.add_or_merge(CrosswalkRecord(canonical_id="co-1", canonical_name="Acme Corporation"))
+        cw.add_or_merge(CrosswalkRecord(canonical_id="co-2", canonical_name="Beta Labs"))
+        assert cw.find_by_name("Zeta Widget Labs", fuzzy_threshold=0.9) is None
+
+        cw.add_alias("co-1", "Zeta Widgets Labs")
+        result = cw.find_by_name("Zeta Widget Labs", fuzzy_threshold=0.9)
+        assert result is not None and result[0].canonical_id == "co-1"
+
+        cw.remove("co-2")
+        assert cw.find_by_name("Beta Lab", fuzzy_threshold=0.8) is None
+
     def test_find_by_any_tries_uei_first(self):
         """Test find_by_any tries UEI first."""
         cw = VendorCrosswalk()
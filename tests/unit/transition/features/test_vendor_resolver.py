@@ -701,6 +701,48 @@ class TestBuildResolverFromIterable:
         assert resolver.fuzzy_threshold == 0.85
 
 
+class TestResolveMany:
+    """Tests for batched name resolution."""
+
+    def test_resolve_many_matches_single_lookups(self, sample_vendors):
+        """Batch results equal per-name results, including exact, fuzzy and misses."""
+        names = ["Acme Corporation", "Beta Technologies", "Acme Corporation", "", "Zeta Widgets"]
+        batch = VendorResolver(records=sample_vendors, fuzzy_secondary_threshold=0.7)
+        single = VendorResolver(records=sample_vendors, fuzzy_secondary_threshold=0.7)
+
+        matches = batch.resolve_many(names)
+
+        expected = [single.resolve_by_name(name) for name in names]
+        assert [(m.method, m.score, m.record) for m in matches] == [
+            (m.method, m.score, m.record) for m in expected
+        ]
+        assert matches[1].method == "name_fuzzy_secondary"
+        assert matches[4].record is None
+        assert batch.stats()["cache_entries"] == 4
+
+    def test_added_record_is_fuzzy_candidate(self, sample_vendors):
+        """Records added after construction are found by fuzzy lookup."""
+        resolver = VendorResolver(records=sample_vendors)
+        assert resolver.resolve_by_name("Zeta Widget Labs").record is None
+
+        resolver.add_record(VendorRecord(uei=None, cage=None, duns=None, name="Zeta Widgets Labs"))
+
+        match = resolver.resolve_by_name("Zeta Widget Labs")
+        assert match.method == "name_fuzzy"
+        assert match.record.name == "Zeta Widgets Labs"
+
+    def test_removed_record_is_not_fuzzy_candidate(self):
+        """Removing the only record for a name drops it from fuzzy candidates."""
+        resolver = VendorResolver(
+            records=[VendorRecord(uei="UEI001", cage=None, duns=None, name="Zeta Widgets Labs")]
+        )
+
+        assert resolver.remove_record_by_uei("UEI001")
+
+        assert resolver.resolve_by_name("Zeta Widget Labs").record is None
+        assert resolver.stats()["unique_names"] == 0
+
+
 class TestFuzzyScore:
     """Tests for fuzzy scoring logic."""
 
@@ -216,6 +216,68 @@ def test_vendor_resolution_exact_and_fuzzy(monkeypatch, tmp_path):
     assert float(row_c2["confidence"]) >= 0.7  # per threshold override
 
 
+def test_vendor_resolution_resolves_distinct_vendors_once(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SBIR_ETL__TRANSITION__FUZZY__THRESHOLD", "0.7")
+
+    from sbir_analytics.assets.transition import enriched_vendor_resolution
+    from sbir_ml.transition.features.vendor_resolver import VendorResolver
+
+    contracts_df = pd.DataFrame(
+        {
+            "contract_id": ["C1", "C2", None, "C4", "C5", "C6"],
+            "piid": ["P1", "P2", "P3", "P4", "P5", "P6"],
+            "vendor_uei": ["uei123 ", None, None, None, None, None],
+            "vendor_duns": [None, "555", None, None, None, None],
+            "vendor_name": ["X", "Y", "Acme Innovations", "Acme Innovations", None, "Zzz"],
+        }
+    )
+    awards_df = pd.DataFrame(
+        [
+            {"Company": "UEI Vendor Inc", "UEI": "UEI123", "Duns": "555"},
+            {"Company": "Duns Vendor", "UEI": None, "Duns": "555"},
+            {"Company": "Acme Innovation", "UEI": None, "Duns": None},
+            {"Company": "Acme Innovation", "UEI": None, "Duns": None},
+        ]
+    )
+
+    calls = []
+    resolve_many = VendorResolver.resolve_many
+
+    def spy(self, names, **kwargs):
+        calls.append(list(names))
+        return resolve_many(self, names, **kwargs)
+
+    monkeypatch.setattr(VendorResolver, "resolve_many", spy)
+
+    result = enriched_vendor_resolution(
+        context=build_asset_context(),
+        validated_contracts_sample=contracts_df,
+        enriched_sbir_awards=awards_df,
+    )
+    resolved_df, _ = _unwrap_output(result)
+
+    assert resolved_df["contract_id"].tolist() == ["C1", "C2", "P3", "C4", "C5", "C6"]
+    assert resolved_df["match_method"].tolist() == [
+        "uei",
+        "duns",
+        "name_fuzzy",
+        "name_fuzzy",
+        "unresolved",
+        "unresolved",
+    ]
+    # The last award carrying DUNS 555 wins, as in the resolver's DUNS index.
+    assert resolved_df["matched_vendor_id"].tolist()[:4] == [
+        "uei:UEI123",
+        "duns:555",
+        "name:acme innovation",
+        "name:acme innovation",
+    ]
+    assert pd.isna(resolved_df["matched_vendor_id"].iloc[4])
+    # Only distinct names left unresolved by identifiers reach the fuzzy resolver.
+    assert calls == [["Acme Innovations", "Zzz"]]
+
+
 def test_transition_scores_and_evidence(monkeypatch, tmp_path):
     # Run all outputs into a temp working directory
     monkeypatch.chdir(tmp_path)
@@ -515,3 +577,46 @@ def test_transition_detections_reports_ndjson_fallback_path(monkeypatch, tmp_pat
     assert output_path.suffix == ".ndjson"
     assert output_path.exists()
     assert not output_path.with_suffix(".parquet").exists()
+
+
+def test_transition_profiles_stage_in_bulk_import_mode(monkeypatch, tmp_path):
+    import_dir = tmp_path / "neo4j_import"
+    monkeypatch.setenv("NEO4J_LOAD_MODE", "bulk")
+    monkeypatch.setenv("NEO4J_BULK_IMPORT_DIR", str(import_dir))
+
+    from sbir_analytics.assets.transition import loaded_transition_profiles  # type: ignore
+    from sbir_graph.loaders.neo4j import BulkImportClient, Neo4jBulkImporter
+
+    with BulkImportClient(import_dir, "organizations") as client:
+        client.batch_upsert_nodes(
+            "Organization", "organization_id", [{"organization_id": "org_company_ACME"}]
+        )
+
+    detections = pd.DataFrame(
+        {
+            "transition_id": ["t1", "t2"],
+            "award_id": ["A-1", "A-2"],
+            "likelihood_score": [0.9, 0.5],
+            "confidence": ["high", "likely"],
+            "detected_at": pd.to_datetime(["2024-01-02", "2024-03-04"]),
+        }
+    )
+    awards = pd.DataFrame(
+        {"award_id": ["A-1", "A-2"], "company_id": ["org_company_ACME", "org_company_ACME"]}
+    )
+
+    result = loaded_transition_profiles(
+        context=build_asset_context(),
+        loaded_transition_relationships={},
+        transformed_transition_detections=detections,
+        enriched_sbir_awards=awards,
+    )
+    stats, _ = _unwrap_output(result)
+
+    assert stats["profiles_created"] == 1
+    assert stats["achieved_relationships"] == 1
+    assert stats["errors"] == 0
+
+    manifest = Neo4jBulkImporter(import_dir).write_import_files()
+    assert manifest.node_counts["TransitionProfile"] == 1
+    assert manifest.relationship_counts == {"ACHIEVED": 1}
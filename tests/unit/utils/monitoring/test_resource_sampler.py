@@ -0,0 +1,152 @@
+"""Unit tests for the background resource sampler and trace/metrics exporters."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+pytestmark = pytest.mark.fast
+
+from sbir_etl.utils.monitoring import PerformanceMonitor, ResourceSampler
+
+
+MB = 1024 * 1024
+
+
+def _fake_process(rss_values, io_values=((100, 10), (1100, 60))):
+    process = Mock()
+    process.memory_info.side_effect = [SimpleNamespace(rss=v * MB) for v in rss_values]
+    process.cpu_percent.return_value = 50.0
+    process.cpu_times.side_effect = [
+        SimpleNamespace(user=1.0, system=0.5),
+        SimpleNamespace(user=1.5, system=0.5),
+    ]
+    process.io_counters.side_effect = [
+        SimpleNamespace(read_bytes=r, write_bytes=w) for r, w in io_values
+    ]
+    return process
+
+
+@patch("sbir_etl.utils.monitoring.core._PSUTIL_AVAILABLE", True)
+@patch("sbir_etl.utils.monitoring.core.psutil")
+def test_monitor_block_reports_sampled_peak_cpu_and_io(mock_psutil):
+    # entry rss, sampled spike, exit rss
+    process = _fake_process([100, 400, 120], io_values=[(100, 10), (600, 30), (1100, 60)])
+    mock_psutil.Process.return_value = process
+    monitor = PerformanceMonitor()
+    monitor._sampler = ResourceSampler(process)
+    with patch.object(ResourceSampler, "running", True):
+        with monitor.monitor_block("load"):
+            monitor._sampler.sample()
+
+    entry = monitor.metrics["load"][0]
+    assert entry["peak_memory_mb"] == pytest.approx(400)
+    assert entry["peak_memory_sampled"] is True
+    assert entry["end_memory_mb"] == pytest.approx(120)
+    assert entry["cpu_seconds"] == pytest.approx(0.5)
+    assert entry["io_read_bytes"] == 1000
+    assert entry["io_write_bytes"] == 50
+
+
+@patch("sbir_etl.utils.monitoring.core._PSUTIL_AVAILABLE", True)
+@patch("sbir_etl.utils.monitoring.core.psutil")
+def test_peak_without_sampler_is_max_of_block_endpoints(mock_psutil):
+    mock_psutil.Process.return_value = _fake_process([300, 120])
+    monitor = PerformanceMonitor()
+
+    with monitor.monitor_block("load"):
+        pass
+
+    entry = monitor.metrics["load"][0]
+    assert entry["peak_memory_mb"] == pytest.approx(300)
+    assert entry["peak_memory_sampled"] is False
+
+
+def test_real_sampler_thread_collects_samples():
+    pytest.importorskip("psutil")
+    monitor = PerformanceMonitor(sample_interval=0.005)
+    try:
+        assert monitor.sampler_running
+        with monitor.monitor_block("work"):
+            buffer = bytearray(8 * MB)
+            for _ in range(50):
+                if len(monitor._sampler.samples) >= 3:
+                    break
+                monitor._sampler._stop.wait(0.01)
+            del buffer
+    finally:
+        monitor.stop_sampler()
+
+    assert not monitor.sampler_running
+    assert len(monitor._sampler.samples) >= 3
+    entry = monitor.metrics["work"][0]
+    assert entry["peak_memory_mb"] >= entry["start_memory_mb"]
+
+
+def test_ring_buffer_bounds_entries_but_summary_streams():
+    monitor = PerformanceMonitor(max_entries_per_metric=3)
+
+    for i in range(10):
+        monitor._record("step", {"operation": "time_block", "duration": float(i)})
+
+    assert [e["duration"] for e in monitor.metrics["step"]] == [7.0, 8.0, 9.0]
+    summary = monitor.get_metrics_summary()["step"]
+    assert summary["count"] == 10
+    assert summary["total_duration"] == pytest.approx(45.0)
+    assert summary["min_duration"] == 0.0
+    assert summary["max_duration"] == 9.0
+
+    monitor.reset_metrics()
+    assert monitor.get_metrics_summary() == {}
+
+
+def test_chrome_trace_nests_blocks_on_thread(tmp_path):
+    monitor = PerformanceMonitor()
+    with monitor.time_block("outer"):
+        with monitor.time_block("inner"):
+            pass
+
+    path = tmp_path / "trace.json"
+    monitor.export_chrome_trace(str(path))
+    trace = json.loads(path.read_text())
+
+    spans = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert set(spans) == {"outer", "inner"}
+    assert spans["outer"]["tid"] == spans["inner"]["tid"]
+    assert spans["outer"]["ts"] <= spans["inner"]["ts"]
+    assert spans["inner"]["ts"] + spans["inner"]["dur"] <= (
+        spans["outer"]["ts"] + spans["outer"]["dur"] + 1
+    )
+    assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in trace["traceEvents"])
+
+
+def test_openmetrics_exposition():
+    monitor = PerformanceMonitor()
+    monitor._record("fast", {"operation": "time_block", "duration": 0.5})
+    monitor._record(
+        'load "x"',
+        {
+            "operation": "monitor_block",
+            "duration": 2.0,
+            "memory_delta_mb": 1.0,
+            "peak_memory_mb": 2.0,
+            "cpu_seconds": 1.5,
+            "io_read_bytes": 10,
+            "io_write_bytes": 20,
+        },
+    )
+
+    text = monitor.to_openmetrics()
+
+    lines = text.splitlines()
+    assert lines[-1] == "# EOF"
+    assert "# TYPE sbir_etl_block_duration_seconds summary" in lines
+    assert 'sbir_etl_block_duration_seconds_count{operation="fast"} 1' in lines
+    assert 'sbir_etl_block_peak_memory_bytes{operation="load \\"x\\""} 2097152' in lines
+    assert 'sbir_etl_block_cpu_seconds_total{operation="load \\"x\\""} 1.5' in lines
+    assert 'sbir_etl_block_io_write_bytes_total{operation="load \\"x\\""} 20' in lines
+    assert not any(
+        line.startswith('sbir_etl_block_peak_memory_bytes{operation="fast"') for line in lines
+    )
@@ -516,6 +516,116 @@ class TestDuckDBClientPagination:
         # Now there should be twice the original rows
         assert int(info2["row_count"]) == single_rows * 2
 
+    def test_import_csv_incremental_arrow_matches_pandas_engine(self, tmp_path):
+        """
+        The Arrow engine streams blocks into DuckDB and yields the same all-text table as the
+        pandas engine, including quoted delimiters, embedded newlines, and empty cells.
+        """
+        csv_path = tmp_path / "awards.csv"
+        rows = [[" Company ", "Award Amount", "Abstract"]] + [
+            [f"Firm {i}, Inc.", str(1000 * i), f"Line one\nline two {i}" if i % 3 else ""]
+            for i in range(200)
+        ]
+        with csv_path.open("w", newline="") as handle:
+            csv.writer(handle).writerows(rows)
+
+        client = DuckDBClient(database_path=str(tmp_path / "engines.duckdb"))
+        assert client.import_csv_incremental(csv_path, "by_pandas", batch_size=30) is True
+        assert client.last_import_stats["peak_arrow_memory_mb"] is None
+        assert (
+            client.import_csv_incremental(csv_path, "by_arrow", engine="arrow", block_size=1024)
+            is True
+        )
+
+        stats = client.last_import_stats
+        assert stats["engine"] == "arrow"
+        assert stats["rows_imported"] == 200
+        assert stats["rows_per_second"] > 0
+        assert stats["peak_arrow_memory_mb"] > 0
+        by_pandas = client.execute_query_df("SELECT * FROM by_pandas")
+        by_arrow = client.execute_query_df("SELECT * FROM by_arrow")
+        assert list(by_arrow.columns) == ["Company", "Award Amount", "Abstract"]
+        assert by_arrow.equals(by_pandas)
+        assert (
+            client.get_table_info("by_arrow")["columns"]
+            == client.get_table_info("by_pandas")["columns"]
+        )
+
+    def test_import_csv_incremental_arrow_appends_and_rejects_unknown_engine(self, tmp_path):
+        csv_path = tmp_path / "append.csv"
+        csv_path.write_text("id,value\n1,a\n2,b\n")
+        client = DuckDBClient(database_path=str(tmp_path / "append.duckdb"))
+
+        assert client.import_csv_incremental(csv_path, "appended", engine="arrow") is True
+        assert (
+            client.import_csv_incremental(
+                csv_path, "appended", engine="arrow", create_table_if_missing=False
+            )
+            is True
+        )
+        assert int(client.get_table_info("appended")["row_count"]) == 4
+        with pytest.raises(ValueError, match="engine"):
+            client.import_csv_incremental(csv_path, "appended", engine="polars")
+
+    def test_import_csv_incremental_arrow_renames_duplicate_headers_like_pandas(self, tmp_path):
+        csv_path = tmp_path / "duplicates.csv"
+        csv_path.write_text("Amount,Name,Amount,Amount.1\n1,Acme,2,3\n4,Beta,5,6\n")
+        client = DuckDBClient(database_path=str(tmp_path / "duplicates.duckdb"))
+
+        assert client.import_csv_incremental(csv_path, "by_pandas") is True
+        assert client.import_csv_incremental(csv_path, "by_arrow", engine="arrow") is True
+
+        by_pandas = client.execute_query_df("SELECT * FROM by_pandas")
+        by_arrow = client.execute_query_df("SELECT * FROM by_arrow")
+        assert list(by_arrow.columns) == ["Amount", "Name", "Amount.2", "Amount.1"]
+        assert by_arrow.equals(by_pandas)
+
+    def test_import_csv_incremental_arrow_falls_back_to_pandas_for_short_rows(self, tmp_path):
+        short_path = tmp_path / "short.csv"
+        short_path.write_text("Company,Amount,Phase\nA,1\nB,2,II\n")
+        late_path = tmp_path / "late_short.csv"
+        late_path.write_text(
+            "Company,Amount,Phase\n" + "".join(f"C{i},{i},II\n" for i in range(500)) + "A,1\n"
+        )
+        client = DuckDBClient(database_path=str(tmp_path / "short.duckdb"))
+
+        assert client.import_csv_incremental(short_path, "by_arrow", engine="arrow") is True
+        assert client.last_import_stats["engine"] == "pandas"
+        rows = client.execute_query("SELECT * FROM by_arrow")
+        assert rows == [
+            {"Company": "A", "Amount": "1", "Phase": None},
+            {"Company": "B", "Amount": "2", "Phase": "II"},
+        ]
+
+        # A short row past the first block fails mid-stream; nothing is kept twice.
+        assert (
+            client.import_csv_incremental(
+                late_path,
+                "by_arrow",
+                engine="arrow",
+                create_table_if_missing=False,
+                block_size=1024,
+            )
+            is True
+        )
+        assert int(client.get_table_info("by_arrow")["row_count"]) == 2 + 501
+
+    def test_import_csv_incremental_arrow_reads_pandas_null_markers_as_null(self, tmp_path):
+        csv_path = tmp_path / "nulls.csv"
+        csv_path.write_text("Company,Note\nNone,NA\n<NA>,null\nAcme,n/a\nBeta,Nanotech\n")
+        client = DuckDBClient(database_path=str(tmp_path / "nulls.duckdb"))
+
+        assert client.import_csv_incremental(csv_path, "by_pandas") is True
+        assert client.import_csv_incremental(csv_path, "by_arrow", engine="arrow") is True
+
+        by_pandas = client.execute_query_df("SELECT * FROM by_pandas")
+        by_arrow = client.execute_query_df("SELECT * FROM by_arrow")
+        assert by_arrow["Company"].tolist()[2:] == ["Acme", "Beta"]
+        assert by_arrow["Company"].iloc[:2].isna().all()
+        assert by_arrow["Note"].tolist()[3] == "Nanotech"
+        assert by_arrow["Note"].iloc[:3].isna().all()
+        assert by_arrow.equals(by_pandas)
+
 
 class TestDuckDBClientErrorHandling:
     """Tests for error handling."""
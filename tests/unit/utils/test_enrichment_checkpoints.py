@@ -479,3 +479,56 @@ class TestCheckpointStoreWorkflow:
             loaded = checkpoint_store.load_checkpoint("partition_001", source)
             assert loaded is not None
             assert loaded.source == source
+
+
+class TestCheckpointStoreProcessedSet:
+    """Tests for the append-only processed-ID set and keyed row index."""
+
+    def test_record_and_load_processed(self, checkpoint_store):
+        checkpoint_store.record_processed("partition/1", "usaspending", ["A1", "A2"])
+        checkpoint_store.record_processed("partition/1", "usaspending", ["A3"])
+        checkpoint_store.record_processed("partition/1", "sam_gov", ["B1"])
+
+        assert checkpoint_store.load_processed("partition/1", "usaspending") == {"A1", "A2", "A3"}
+        assert checkpoint_store.load_processed("partition/1", "sam_gov") == {"B1"}
+        assert checkpoint_store.load_processed("partition/2", "usaspending") == set()
+
+    def test_torn_final_line_is_ignored(self, checkpoint_store):
+        checkpoint_store.record_processed("partition_001", "usaspending", ["A1"])
+        path = checkpoint_store._processed_path("partition_001", "usaspending")
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write("A2-partial")
+
+        assert checkpoint_store.load_processed("partition_001", "usaspending") == {"A1"}
+
+    def test_delete_checkpoint_clears_processed_set(self, checkpoint_store, sample_checkpoint):
+        checkpoint_store.save_checkpoint(sample_checkpoint)
+        checkpoint_store.record_processed("partition_001", "usaspending", ["A1"])
+
+        checkpoint_store.delete_checkpoint("partition_001", "usaspending")
+
+        assert checkpoint_store.load_checkpoint("partition_001", "usaspending") is None
+        assert checkpoint_store.load_processed("partition_001", "usaspending") == set()
+
+    def test_saves_and_loads_do_not_reread_the_file(
+        self, checkpoint_store, sample_checkpoint, monkeypatch
+    ):
+        checkpoint_store.save_checkpoint(sample_checkpoint)
+        monkeypatch.setattr(
+            checkpoint_store, "load_all", lambda: pytest.fail("re-read checkpoint file")
+        )
+
+        sample_checkpoint.records_processed = 2000
+        checkpoint_store.save_checkpoint(sample_checkpoint)
+        loaded = checkpoint_store.load_checkpoint("partition_001", "usaspending")
+
+        assert loaded.records_processed == 2000
+        assert loaded.metadata == {"version": "1.0", "mode": "incremental"}
+
+    def test_other_stores_see_saved_checkpoints(self, checkpoint_store, sample_checkpoint):
+        other = CheckpointStore(parquet_path=checkpoint_store.parquet_path)
+        assert other.load_checkpoint("partition_001", "usaspending") is None
+
+        checkpoint_store.save_checkpoint(sample_checkpoint)
+
+        assert other.load_checkpoint("partition_001", "usaspending") is not None
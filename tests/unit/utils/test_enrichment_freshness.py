@@ -194,6 +194,56 @@ class TestFreshnessStore:
         assert "AWARD-999" not in award_ids
 
 
+class TestFreshnessJournal:
+    """Append-only journal and compaction behaviour."""
+
+    def test_updates_append_to_journal_without_rewriting_parquet(self, tmp_path, monkeypatch):
+        store = FreshnessStore(parquet_path=tmp_path / "freshness.parquet", compact_every=1000)
+        writes = []
+        monkeypatch.setattr(
+            "sbir_etl.utils.data.file_io.save_dataframe_parquet",
+            lambda df, path, **kwargs: writes.append(len(df)),
+        )
+
+        for i in range(50):
+            update_freshness_ledger(store, f"AWARD-{i % 10:03d}", "usaspending", success=True)
+
+        assert writes == []
+        assert len(store.journal_path.read_text().splitlines()) == 50
+        reader = FreshnessStore(parquet_path=tmp_path / "freshness.parquet")
+        assert len(reader.load_all()) == 10
+        assert reader.get_record("AWARD-003", "usaspending").attempt_count == 5
+
+    def test_compaction_folds_journal_into_parquet(self, tmp_path):
+        path = tmp_path / "freshness.parquet"
+        store = FreshnessStore(parquet_path=path, compact_every=4)
+        for i in range(3):
+            update_freshness_ledger(store, f"AWARD-{i}", "usaspending", success=True)
+        assert not path.exists()
+
+        update_freshness_ledger(store, "AWARD-0", "usaspending", success=False, error_message="x")
+
+        assert path.exists() and not store.journal_path.exists()
+        df = FreshnessStore(parquet_path=path).load_all()
+        assert sorted(df["award_id"]) == ["AWARD-0", "AWARD-1", "AWARD-2"]
+        record = FreshnessStore(parquet_path=path).get_record("AWARD-0", "usaspending")
+        assert record.attempt_count == 2
+        assert record.status == EnrichmentStatus.FAILED
+
+    def test_commit_every_buffers_until_flush(self, tmp_path):
+        path = tmp_path / "freshness.parquet"
+        store = FreshnessStore(parquet_path=path, commit_every=10)
+        for i in range(3):
+            update_freshness_ledger(store, f"AWARD-{i}", "nih_reporter", success=False)
+
+        # Visible to the writing store immediately, to other readers after flush.
+        assert len(store.load_all()) == 3
+        assert FreshnessStore(parquet_path=path).load_all().empty
+        store.flush()
+        stale = FreshnessStore(parquet_path=path).get_awards_needing_refresh("nih_reporter", 1)
+        assert sorted(stale) == ["AWARD-0", "AWARD-1", "AWARD-2"]
+
+
 class TestUpdateFreshnessLedger:
     """Test update_freshness_ledger function."""
 
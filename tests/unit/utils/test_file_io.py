@@ -11,6 +11,7 @@ import pytest
 pytestmark = pytest.mark.fast
 
 from sbir_etl.utils.data.file_io import (
+    parquet_or_ndjson_signature,
     read_parquet_or_ndjson,
     save_dataframe_parquet,
     write_json,
@@ -168,3 +169,19 @@ def test_read_parquet_or_ndjson_not_found(temp_dir):
 
     with pytest.raises(FileNotFoundError):
         read_parquet_or_ndjson(parquet_path)
+
+
+def test_parquet_or_ndjson_signature_tracks_both_files(temp_dir, sample_dataframe):
+    """Test signature is None per missing file and changes when either file is written."""
+    parquet_path = temp_dir / "data.parquet"
+    assert parquet_or_ndjson_signature(parquet_path) == (None, None)
+
+    sample_dataframe.to_parquet(parquet_path)
+    after_parquet = parquet_or_ndjson_signature(parquet_path)
+    assert after_parquet[0] is not None
+    assert after_parquet[1] is None
+
+    write_ndjson(parquet_path.with_suffix(".ndjson"), [{"a": 1}])
+    after_ndjson = parquet_or_ndjson_signature(parquet_path)
+    assert after_ndjson[0] == after_parquet[0]
+    assert after_ndjson[1] is not None
@@ -0,0 +1,93 @@
+"""Tests for the shared file fingerprint cache."""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from sbir_etl.utils.cache import fingerprint
+from sbir_etl.utils.cache.fingerprint import (
+    FINGERPRINT_CACHE_ENV,
+    FingerprintCache,
+    default_fingerprint_cache,
+    file_sha256,
+)
+
+
+pytestmark = pytest.mark.fast
+
+
+def _write_settled(path, content: bytes) -> None:
+    """Write a file and backdate it past the racy window."""
+    path.write_bytes(content)
+    old = time.time_ns() - 10 * fingerprint.RACY_WINDOW_NS
+    os.utime(path, ns=(old, old))
+
+
+def test_sha256_matches_hashlib_and_hits_cache(tmp_path, monkeypatch):
+    source = tmp_path / "dump.bin"
+    _write_settled(source, b"x" * 3_000_000)
+    cache = FingerprintCache(tmp_path / "fingerprints.sqlite")
+
+    expected = hashlib.sha256(b"x" * 3_000_000).hexdigest()
+    assert cache.sha256(source) == expected
+
+    monkeypatch.setattr(fingerprint, "compute_sha256", lambda path: pytest.fail("re-read"))
+    assert FingerprintCache(cache.db_path).sha256(source) == expected
+
+
+def test_changed_file_is_rehashed(tmp_path):
+    source = tmp_path / "input.csv"
+    _write_settled(source, b"a,b\n1,2\n")
+    cache = FingerprintCache(tmp_path / "fingerprints.sqlite")
+    cache.sha256(source)
+
+    _write_settled(source, b"a,b\n1,3\n")
+    # Same size, but the rewrite moves mtime_ns (and may reuse the inode).
+    os.utime(source, ns=(time.time_ns() - 5 * fingerprint.RACY_WINDOW_NS,) * 2)
+
+    assert cache.sha256(source) == hashlib.sha256(b"a,b\n1,3\n").hexdigest()
+    assert cache.misses == 2
+
+
+def test_recently_modified_file_is_not_cached(tmp_path):
+    source = tmp_path / "fresh.json"
+    source.write_bytes(b"{}")
+    cache = FingerprintCache(tmp_path / "fingerprints.sqlite")
+
+    cache.sha256(source)
+    cache.sha256(source)
+
+    assert cache.hits == 0
+    assert cache.misses == 2
+
+
+def test_sha256_many_hashes_each_file_once(tmp_path):
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"part-{index}.parquet"
+        _write_settled(path, f"part {index}".encode())
+        paths.append(path)
+    cache = FingerprintCache(None)
+
+    digests = cache.sha256_many([*paths, paths[0]], max_workers=3)
+
+    assert list(digests) == paths
+    assert digests[paths[2]] == hashlib.sha256(b"part 2").hexdigest()
+
+
+def test_default_cache_follows_environment(tmp_path, monkeypatch):
+    source = tmp_path / "input.txt"
+    _write_settled(source, b"payload")
+    store = tmp_path / "store" / "fingerprints.sqlite"
+    monkeypatch.setenv(FINGERPRINT_CACHE_ENV, str(store))
+
+    assert file_sha256(source) == hashlib.sha256(b"payload").hexdigest()
+    assert default_fingerprint_cache().db_path == store
+    assert store.exists()
+
+    monkeypatch.setenv(FINGERPRINT_CACHE_ENV, "off")
+    assert default_fingerprint_cache().db_path is None
+    with pytest.raises(FileNotFoundError):
+        file_sha256(tmp_path / "missing.txt")
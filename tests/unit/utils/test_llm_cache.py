@@ -0,0 +1,160 @@
+"""Tests for the content-addressed LLM response cache."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from sbir_etl.enrichers.openai_client import OpenAIClient, WebSearchResult
+from sbir_etl.utils.cache.llm_cache import (
+    LLM_CACHE_ENV,
+    LLMResponseCache,
+    default_llm_cache,
+    request_key,
+)
+
+
+pytestmark = pytest.mark.fast
+
+
+class FakeLLM:
+    """Deterministic stand-in for the API that counts calls."""
+
+    def __init__(self, reply="answer"):
+        self.reply = reply
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.reply
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _payload(user="Describe Acme Corp."):
+    return {"model": "m", "temperature": 0.3, "messages": [{"role": "user", "content": user}]}
+
+
+def test_repeated_request_is_served_from_cache(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite")
+    llm = FakeLLM()
+
+    first = cache.get_or_call("chat", "m", "v1", _payload(), llm)
+    # Line endings and trailing whitespace do not change what the model sees.
+    second = cache.get_or_call("chat", "m", "v1", _payload("Describe Acme Corp.  \r\n"), llm)
+
+    assert first == second == "answer"
+    assert llm.calls == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+    assert stats["entries"] == 1
+
+
+def test_key_covers_model_template_version_and_payload():
+    base = request_key("chat", "m", "v1", _payload())
+    assert request_key("chat", "other", "v1", _payload()) != base
+    assert request_key("chat", "m", "v2", _payload()) != base
+    assert request_key("chat", "m", "v1", _payload("Describe Beta LLC.")) != base
+    assert request_key("web_search", "m", "v1", _payload()) != base
+
+
+def test_failed_calls_are_not_cached(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite")
+    llm = FakeLLM(reply=None)
+
+    assert cache.get_or_call("chat", "m", "v1", _payload(), llm) is None
+    assert cache.get_or_call("chat", "m", "v1", _payload(), llm) is None
+    assert llm.calls == 2
+    assert cache.stats()["stores"] == 0
+
+
+def test_entries_expire_after_their_kind_ttl(tmp_path):
+    clock = Clock()
+    cache = LLMResponseCache(
+        tmp_path / "llm.sqlite", ttl_seconds=100, web_search_ttl_seconds=10, clock=clock
+    )
+    chat, search = FakeLLM(), FakeLLM({"summary": "s", "source_urls": []})
+    cache.get_or_call("chat", "m", "v1", _payload(), chat)
+    cache.get_or_call("web_search", "m", "v1", _payload(), search)
+
+    clock.now += 50
+    cache.get_or_call("chat", "m", "v1", _payload(), chat)
+    cache.get_or_call("web_search", "m", "v1", _payload(), search)
+
+    assert (chat.calls, search.calls) == (1, 2)
+    clock.now += 200
+    assert cache.purge_expired() == 2
+
+
+def test_store_is_trimmed_least_recently_used_first(tmp_path):
+    clock = Clock()
+    cache = LLMResponseCache(tmp_path / "llm.sqlite", max_bytes=30, clock=clock)
+    # Each response is stored as a 10-byte JSON string.
+    for name in ("a", "b", "c"):
+        clock.now += 1
+        cache.get_or_call("chat", "m", "v1", _payload(name), FakeLLM("x" * 8))
+    assert cache.evictions == 0
+    # Touch "a" so "b" is the least recently used entry.
+    clock.now += 1
+    cache.get_or_call("chat", "m", "v1", _payload("a"), FakeLLM())
+
+    clock.now += 1
+    cache.get_or_call("chat", "m", "v1", _payload("d"), FakeLLM("x" * 8))
+
+    assert cache.evictions == 1
+    refetch = FakeLLM("x" * 8)
+    cache.get_or_call("chat", "m", "v1", _payload("a"), refetch)
+    assert refetch.calls == 0
+    cache.get_or_call("chat", "m", "v1", _payload("b"), refetch)
+    assert refetch.calls == 1
+
+
+def test_openai_client_reuses_cached_chat_and_web_search(tmp_path):
+    mock_http = Mock()
+    chat_resp = Mock(status_code=200)
+    chat_resp.json.return_value = {"choices": [{"message": {"content": "Hello"}}]}
+    search_resp = Mock(status_code=200)
+    search_resp.json.return_value = {
+        "output": [
+            {
+                "type": "message",
+                "content": [
+                    {
+                        "type": "output_text",
+                        "text": "Acme builds sensors.",
+                        "annotations": [{"url": "https://example.com"}],
+                    }
+                ],
+            }
+        ]
+    }
+    mock_http.request.side_effect = [chat_resp, search_resp]
+
+    client = OpenAIClient(api_key="test-key", cache=LLMResponseCache(tmp_path / "llm.sqlite"))
+    client._client = mock_http
+    for _ in range(2):
+        assert client.chat("sys", "usr", cache_version="v1") == "Hello"
+        assert client.web_search("Acme", cache_version="v1") == WebSearchResult(
+            summary="Acme builds sensors.", source_urls=["https://example.com"]
+        )
+
+    assert mock_http.request.call_count == 2
+
+
+def test_default_cache_follows_environment(tmp_path, monkeypatch):
+    store = tmp_path / "store" / "llm.sqlite"
+    monkeypatch.setenv(LLM_CACHE_ENV, str(store))
+    assert default_llm_cache().db_path == store
+
+    monkeypatch.setenv(LLM_CACHE_ENV, "off")
+    cache = default_llm_cache()
+    assert not cache.enabled
+    llm = FakeLLM()
+    cache.get_or_call("chat", "m", "v1", _payload(), llm)
+    cache.get_or_call("chat", "m", "v1", _payload(), llm)
+    assert llm.calls == 2
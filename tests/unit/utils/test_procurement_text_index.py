@@ -0,0 +1,70 @@
+"""Tests for the persistent procurement text index."""
+
+import pytest
+
+from sbir_etl.utils.procurement_text import document_token_frequencies, shared_technical_phrases
+from sbir_etl.utils.procurement_text_index import (
+    TEXT_INDEX_ENV,
+    ProcurementTextIndex,
+    default_text_index,
+)
+from tests.unit.utils.test_procurement_text import ABSTRACT, NOTICE
+
+
+pytestmark = pytest.mark.fast
+
+CORPUS = [
+    ABSTRACT,
+    NOTICE,
+    NOTICE,
+    None,
+    "   ",
+    "Autonomous ground vehicles map obstacles. Ground robots share lidar data.",
+    "Quantum error correction for superconducting qubit control electronics.",
+]
+
+
+def test_queries_match_the_stateless_helpers():
+    index = ProcurementTextIndex()
+
+    assert index.document_frequencies(CORPUS) == document_token_frequencies(CORPUS)
+    for left in CORPUS:
+        for right in CORPUS:
+            assert index.shared_phrases(left, right) == shared_technical_phrases(left, right)
+    assert index.shared_phrases(ABSTRACT, NOTICE, max_phrases=2) == shared_technical_phrases(
+        ABSTRACT, NOTICE, max_phrases=2
+    )
+    # Whitespace-only and missing texts are not documents; repeats are indexed once.
+    assert index.indexed == 4
+
+
+def test_later_runs_only_tokenize_new_documents(tmp_path):
+    store = tmp_path / "index.sqlite"
+    first = ProcurementTextIndex(store)
+    first.document_frequencies(CORPUS[:3])
+
+    second = ProcurementTextIndex(store)
+    frequencies = second.document_frequencies(CORPUS)
+
+    assert frequencies == document_token_frequencies(CORPUS)
+    assert (second.reused, second.indexed) == (2, 2)
+    assert second.shared_phrases(ABSTRACT, NOTICE) == shared_technical_phrases(ABSTRACT, NOTICE)
+    assert second.stats()["stored_documents"] == 4
+
+
+def test_unreadable_store_falls_back_to_memory(tmp_path):
+    store = tmp_path / "index.sqlite"
+    store.write_bytes(b"not a sqlite database" * 100)
+    index = ProcurementTextIndex(store)
+
+    assert index.document_frequencies(CORPUS) == document_token_frequencies(CORPUS)
+    assert not index.persistent
+
+
+def test_default_index_follows_environment(tmp_path, monkeypatch):
+    store = tmp_path / "store" / "index.sqlite"
+    monkeypatch.setenv(TEXT_INDEX_ENV, str(store))
+    assert default_text_index().db_path == store
+
+    monkeypatch.setenv(TEXT_INDEX_ENV, "off")
+    assert not default_text_index().persistent